@@ -0,0 +1,311 @@
+import heapq
+from array import array
+
+from VEXLib.Algorithms.GridSearchStorage import GridSearchStorage, unpack_obstacles
+from VEXLib.Geometry.GeometryUtil import hypotenuse
+
+# Plain A*, expanding every valid move of every node
+ASTAR = "astar"
+# Jump point search, only valid for uniform cost 8-connected grids
+JUMP_POINT = "jump_point"
+
+MODES = (ASTAR, JUMP_POINT)
+
+EIGHT_CONNECTED_MOVES = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+SQRT_2_MINUS_1 = 2 ** 0.5 - 1
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+class AStarPathfinding:
+    """
+    A* and jump point search on the grid of a PathfindingEnvironment.
+
+    The obstacle bitmap is unpacked once into a bytearray and all per-node search state is kept in
+    a GridSearchStorage, so a search allocates nothing per node apart from open heap entries and
+    repeated replanning on the same map reuses the same buffers.
+
+    Moves follow the same rules as DijkstraPathfinding: a move is allowed when the destination tile
+    is free, so diagonal moves may cut past the corner of an obstacle. If the environment has an
+    inflated obstacle map (see PathfindingEnvironment.build_clearance) it is searched instead of the
+    raw obstacles, and its distance field can add a cost for passing close to obstacles.
+
+    Attributes:
+        nodes_expanded (int): The number of nodes taken off the open heap by the last search.
+    """
+
+    def __init__(
+        self,
+        pathfinding_environment,
+        valid_moves=EIGHT_CONNECTED_MOVES,
+        mode=ASTAR,
+        clearance_weight=0.0,
+        clearance_distance=0.0,
+    ):
+        """
+        Args:
+            pathfinding_environment (PathfindingEnvironment): A loaded environment to search.
+            valid_moves (list of tuples): The (dx, dy) moves an agent can make from a tile.
+            mode (str): ASTAR or JUMP_POINT.
+            clearance_weight (float): The extra cost per tile of clearance missing when moving onto
+                a tile closer than clearance_distance to an obstacle.
+            clearance_distance (float): The clearance in tiles below which the extra cost applies.
+        """
+        if mode not in MODES:
+            raise ValueError("Invalid pathfinding mode: " + str(mode))
+        if mode == JUMP_POINT and set(valid_moves) != set(EIGHT_CONNECTED_MOVES):
+            raise ValueError("Jump point search requires the 8-connected moves")
+        if mode == JUMP_POINT and clearance_weight:
+            raise ValueError("Jump point search requires uniform move costs, so no clearance cost")
+
+        self.mode = mode
+        self.clearance_weight = clearance_weight
+        self.clearance_distance = clearance_distance
+        self._moves = [(move[0], move[1], hypotenuse(*move)) for move in valid_moves]
+
+        unit_moves = all(max(abs(move[0]), abs(move[1])) == 1 for move in valid_moves)
+        has_diagonals = any(move[0] and move[1] for move in valid_moves)
+        if unit_moves and has_diagonals:
+            self._heuristic_kind = "octile"
+        elif unit_moves:
+            self._heuristic_kind = "manhattan"
+        else:
+            # The straight line distance never overestimates, whatever the moves are
+            self._heuristic_kind = "euclidean"
+
+        self.nodes_expanded = 0
+        self._goal = (0, 0)
+        self.load_environment(pathfinding_environment)
+
+    def load_environment(self, pathfinding_environment):
+        """
+        Unpack the obstacle bitmap of an environment and allocate the search arrays for its size.
+
+        Args:
+            pathfinding_environment (PathfindingEnvironment): A loaded environment to search.
+        """
+        self.width = pathfinding_environment.width
+        self.height = pathfinding_environment.height
+        self._blocked = unpack_obstacles(pathfinding_environment)
+        self.storage = GridSearchStorage(self.width, self.height)
+
+        self._clearance_costs = None
+        if self.clearance_weight and self.clearance_distance > 0:
+            if pathfinding_environment.distance_list is None:
+                raise ValueError("A clearance cost needs the distance field from build_clearance")
+            # Turn the distance field into a per tile cost once, so a search only does a lookup
+            scale = pathfinding_environment.distance_scale
+            costs = array("f", [0.0] * len(pathfinding_environment.distance_list))
+            for index, stored_distance in enumerate(pathfinding_environment.distance_list):
+                missing = self.clearance_distance - stored_distance / scale
+                if missing > 0:
+                    costs[index] = self.clearance_weight * missing
+            self._clearance_costs = costs
+
+    def _is_free(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and not self._blocked[y * self.width + x]
+
+    def _heuristic(self, x, y):
+        dx = abs(x - self._goal[0])
+        dy = abs(y - self._goal[1])
+        if self._heuristic_kind == "octile":
+            if dx > dy:
+                return dx + SQRT_2_MINUS_1 * dy
+            return dy + SQRT_2_MINUS_1 * dx
+        if self._heuristic_kind == "manhattan":
+            return dx + dy
+        return (dx * dx + dy * dy) ** 0.5
+
+    def find_path(self, start_pos, goal_pos):
+        """
+        Find the shortest path from the start position to the goal position.
+
+        Args:
+            start_pos (tuple[int, int]): An (x, y) point representing the starting point.
+            goal_pos (tuple[int, int]): An (x, y) point representing the goal point.
+
+        Returns:
+            list of tuples: Every tile of the path from the start position to the goal position.
+        """
+        assert self._is_free(*start_pos), 'Tile "start_position" is not in accessible_tiles'
+        assert self._is_free(*goal_pos), 'Tile "target_position" is not in accessible_tiles'
+
+        self._goal = goal_pos
+        self.nodes_expanded = 0
+
+        width = self.width
+        height = self.height
+        blocked = self._blocked
+        moves = self._moves
+        heuristic = self._heuristic
+        clearance_costs = self._clearance_costs
+        storage = self.storage
+        g_values = storage.g_values
+        closed = storage.closed
+        jump_point = self.mode == JUMP_POINT
+
+        start = start_pos[1] * width + start_pos[0]
+        goal = goal_pos[1] * width + goal_pos[0]
+        storage.start(start)
+        open_heap = [(heuristic(*start_pos), start)]
+
+        while open_heap:
+            _, current = heapq.heappop(open_heap)
+            if closed[current]:
+                # A stale entry for a node that was already reached more cheaply
+                continue
+            closed[current] = 1
+            self.nodes_expanded += 1
+
+            if current == goal:
+                return self._extract_path(start, goal)
+
+            y, x = divmod(current, width)
+            current_cost = g_values[current]
+            if jump_point:
+                for neighbor, neighbor_x, neighbor_y, move_cost in self._jump_successors(x, y, current):
+                    if closed[neighbor]:
+                        continue
+                    new_cost = current_cost + move_cost
+                    if storage.relax(neighbor, new_cost, current):
+                        heapq.heappush(open_heap, (new_cost + heuristic(neighbor_x, neighbor_y), neighbor))
+                continue
+
+            for dx, dy, move_cost in moves:
+                neighbor_x = x + dx
+                neighbor_y = y + dy
+                if not (0 <= neighbor_x < width and 0 <= neighbor_y < height):
+                    continue
+                neighbor = neighbor_y * width + neighbor_x
+                if blocked[neighbor] or closed[neighbor]:
+                    continue
+                new_cost = current_cost + move_cost
+                if clearance_costs is not None:
+                    new_cost += clearance_costs[neighbor]
+                if storage.relax(neighbor, new_cost, current):
+                    heapq.heappush(open_heap, (new_cost + heuristic(neighbor_x, neighbor_y), neighbor))
+
+        raise AssertionError("Heap exhausted: No Path to target")
+
+    def _pruned_directions(self, x, y, current):
+        """
+        Get the directions worth searching from a jump point, given the direction it was reached in.
+        """
+        parent = self.storage.parents[current]
+        if parent == current:
+            return EIGHT_CONNECTED_MOVES
+
+        parent_y, parent_x = divmod(parent, self.width)
+        dx = _sign(x - parent_x)
+        dy = _sign(y - parent_y)
+        is_free = self._is_free
+
+        if dx and dy:
+            directions = [(dx, 0), (0, dy), (dx, dy)]
+            if not is_free(x - dx, y):
+                directions.append((-dx, dy))
+            if not is_free(x, y - dy):
+                directions.append((dx, -dy))
+        elif dx:
+            directions = [(dx, 0)]
+            if not is_free(x, y + 1):
+                directions.append((dx, 1))
+            if not is_free(x, y - 1):
+                directions.append((dx, -1))
+        else:
+            directions = [(0, dy)]
+            if not is_free(x + 1, y):
+                directions.append((1, dy))
+            if not is_free(x - 1, y):
+                directions.append((-1, dy))
+        return directions
+
+    def _jump_successors(self, x, y, current):
+        successors = []
+        for dx, dy in self._pruned_directions(x, y, current):
+            jump = self._jump(x, y, dx, dy)
+            if jump is None:
+                continue
+            jump_x, jump_y = jump
+            distance_x = abs(jump_x - x)
+            distance_y = abs(jump_y - y)
+            # A jump is either straight or purely diagonal, so its cost is the octile distance
+            if distance_x > distance_y:
+                cost = distance_x + SQRT_2_MINUS_1 * distance_y
+            else:
+                cost = distance_y + SQRT_2_MINUS_1 * distance_x
+            successors.append((jump_y * self.width + jump_x, jump_x, jump_y, cost))
+        return successors
+
+    def _jump(self, x, y, dx, dy):
+        """
+        Step from (x, y) in the direction (dx, dy) until reaching a jump point.
+
+        Returns:
+            tuple[int, int] or None: The jump point, or None if the step runs into an obstacle.
+        """
+        is_free = self._is_free
+        goal_x, goal_y = self._goal
+        while True:
+            x += dx
+            y += dy
+            if not is_free(x, y):
+                return None
+            if x == goal_x and y == goal_y:
+                return x, y
+
+            if dx and dy:
+                if (not is_free(x - dx, y) and is_free(x - dx, y + dy)) or (
+                    not is_free(x, y - dy) and is_free(x + dx, y - dy)
+                ):
+                    return x, y
+                # A diagonal step is a jump point if either straight scan from it finds one
+                if self._jump(x, y, dx, 0) is not None or self._jump(x, y, 0, dy) is not None:
+                    return x, y
+            elif dx:
+                if (not is_free(x, y + 1) and is_free(x + dx, y + 1)) or (
+                    not is_free(x, y - 1) and is_free(x + dx, y - 1)
+                ):
+                    return x, y
+            else:
+                if (not is_free(x + 1, y) and is_free(x + 1, y + dy)) or (
+                    not is_free(x - 1, y) and is_free(x - 1, y + dy)
+                ):
+                    return x, y
+
+    def _extract_path(self, start, goal):
+        width = self.width
+        points = self.storage.extract_indices(start, goal)
+
+        path = [(points[0] % width, points[0] // width)]
+        for index in points[1:]:
+            y, x = divmod(index, width)
+            if self.mode == JUMP_POINT:
+                # Fill in the tiles skipped over between consecutive jump points
+                last_x, last_y = path[-1]
+                dx = _sign(x - last_x)
+                dy = _sign(y - last_y)
+                while (last_x + dx, last_y + dy) != (x, y):
+                    last_x += dx
+                    last_y += dy
+                    path.append((last_x, last_y))
+            path.append((x, y))
+        return path
+
+    def get_cost(self, position):
+        """
+        Get the cost from the start of the last search to a tile, or infinity if it was not reached.
+        """
+        return self.storage.g_values[position[1] * self.width + position[0]]
+
+    def get_visited(self):
+        """
+        Get the tiles expanded by the last search, for visualization.
+
+        Returns:
+            list of tuples: The (x, y) positions of the expanded tiles.
+        """
+        return self.storage.visited_positions()
@@ -1,8 +1,7 @@
-import gc
 import heapq
 
-import sys
-from VEXLib.Geometry.GeometryUtil import distance, hypotenuse
+from VEXLib.Algorithms.GridSearchStorage import GridSearchStorage, unpack_obstacles
+from VEXLib.Geometry.GeometryUtil import hypotenuse
 from VEXLib.Util.PathfindingEnvironment import PathfindingEnvironment
 
 
@@ -10,14 +9,16 @@ class DijkstraPathfinding:
     """
     Dijkstra's algorithm implementation to find the shortest path between two points on a 2D grid.
 
+    Costs, parents and visited flags are kept in a GridSearchStorage indexed by y * width + x
+    instead of dicts and sets keyed by position tuples, so a search allocates nothing per node apart
+    from open heap entries. The storage is reused when find_path is called again with new positions.
+
     Attributes:
         _start_position (tuple): The starting position as a tuple (x, y).
         _target_position (tuple): The goal position as a tuple (x, y).
         _valid_moves (list of tuples): A list of valid moves that an agent can make in the environment.
-        _open_heap (list): A list to store nodes to be explored, ordered by cost.
-        _closed_set (list): A list to store nodes that have been explored.
-        _parent_dict (dict): A dictionary that maps child nodes to their parent nodes in the path.
-        _g_values (dict): A dictionary that stores the cost from the start position to each node.
+        _open_heap (list): A heap of (cost, index) entries for nodes to be explored, ordered by cost.
+        _storage (GridSearchStorage): The cost, parent and closed flag of every node.
     """
 
     def __init__(self, start_pos, goal_pos, accessible_tiles_file_object, valid_moves):
@@ -31,153 +32,110 @@ class DijkstraPathfinding:
         self._start_position = start_pos
         self._target_position = goal_pos
         self._valid_moves = valid_moves
-        self._move_costs = {
-            move: hypotenuse(*move) for move in valid_moves
-        }
+        self._moves = [(move[0], move[1], hypotenuse(*move)) for move in valid_moves]
         self.pathfinding_environment = PathfindingEnvironment()
         self.pathfinding_environment.load_from_file(accessible_tiles_file_object)
 
-        # self._open_heap = BinaryHeap()
+        self._width = self.pathfinding_environment.width
+        self._height = self.pathfinding_environment.height
+        self._blocked = unpack_obstacles(self.pathfinding_environment)
+        self._storage = GridSearchStorage(self._width, self._height)
         self._open_heap = []
-        self._closed_set = set()
-        self._parent_dict = {}
-        self._g_values = {}
 
     def _insert_to_open_list(self, item):
         """
         Insert a node into the open_list while maintaining the sorted order based on the cost.
 
         Args:
-            item (tuple[float, tuple[int, int]]): (cost, position) to be inserted into the open_list.
+            item (tuple[float, int]): (cost, index) to be inserted into the open_list.
         """
         heapq.heappush(self._open_heap, item)
-        # self._open_heap.push(item)
 
     def _pop_lowest_cost_node(self):
         """
         Remove and return the node with the lowest cost from the open_list.
 
         Returns:
-            lowest_cost_node (tuple[float, tuple[int, int]]): The (cost, position) of the lowest cost node.
+            lowest_cost_node (tuple[float, int]): The (cost, index) of the lowest cost node.
         """
         return heapq.heappop(self._open_heap)
-        # return self._open_heap.pop()
 
-    def find_path(self):
+    def find_path(self, start_pos=None, goal_pos=None):
         """
         Find the shortest path from the start position to the goal position using Dijkstra's algorithm.
 
+        Args:
+            start_pos (tuple[int, int]): A new starting point to search from, if given.
+            goal_pos (tuple[int, int]): A new goal point to search to, if given.
+
         Returns:
-             Tuple containing the path as a list of positions and the list of visited positions.
+             Tuple containing the path as a list of positions and a VisitedTiles view of the visited positions.
         """
-        self._parent_dict[self._start_position] = self._start_position
-        self._g_values[self._start_position] = 0
-        self._g_values[self._target_position] = float("inf")
-        self._insert_to_open_list((0, self._start_position))
+        if start_pos is not None:
+            self._start_position = start_pos
+        if goal_pos is not None:
+            self._target_position = goal_pos
 
         # Sanity checks
 
-        assert (
-            self.pathfinding_environment.is_available(self._start_position)
-        ), 'Tile "start_position" is not in accessible_tiles'
-        assert (
-            self.pathfinding_environment.is_available(self._target_position)
-        ), 'Tile "target_position" is not in accessible_tiles'
-
-        while self._open_heap:
-            _, current_pos = self._pop_lowest_cost_node()
-
-            self._closed_set.add(current_pos)
-
-            if current_pos == self._target_position:
-                break
-
-            for neighbor_pos in self._get_valid_neighbors(current_pos):
-                # new_cost = self._g_values[current_pos] + self._calculate_cost(
-                #     current_pos, neighbor_pos
-                # )
-                if self._is_collision(current_pos, neighbor_pos):
-                    move_cost = float("inf")
-                else:
-                    move_cost = self._move_costs[abs(current_pos[0] - neighbor_pos[0]), abs(current_pos[1] - neighbor_pos[1])]
-
-                # print(f"Additional cost: {move_cost}")
-                # print(f"Total node cost: {self._g_values[current_pos] + move_cost}")
-                new_cost = self._g_values[current_pos] + move_cost
-
-                if neighbor_pos not in self._g_values:
-                    self._g_values[neighbor_pos] = float("inf")
-
-                if new_cost < self._g_values[neighbor_pos]:
-                    self._g_values[neighbor_pos] = new_cost
-                    self._parent_dict[neighbor_pos] = current_pos
-                    self._insert_to_open_list((new_cost, neighbor_pos))
-
-        gc.collect()
+        assert self._is_free(*self._start_position), 'Tile "start_position" is not in accessible_tiles'
+        assert self._is_free(*self._target_position), 'Tile "target_position" is not in accessible_tiles'
 
-        # print(self._open_heap)
-        # print(self._closed_set)
-        # print(self._g_values)
-        # print(self._parent_dict)
+        width = self._width
+        height = self._height
+        blocked = self._blocked
+        storage = self._storage
+        g_values = storage.g_values
+        closed = storage.closed
 
-        print(f"Open heap: {sys.getsizeof(self._open_heap)}")
-        print(f"Closed heap: {sys.getsizeof(self._closed_set.copy())}")
-        print(f"G values: {sys.getsizeof(self._g_values.copy())}")
-        print(f"Parent dict: {sys.getsizeof(self._parent_dict.copy())}")
+        start = self._start_position[1] * width + self._start_position[0]
+        goal = self._target_position[1] * width + self._target_position[0]
+        storage.start(start)
+        self._open_heap = []
+        self._insert_to_open_list((0, start))
 
-        # print("Time taken: " + str(round((time.perf_counter() - start_time) * 1000)) + "ms")
-        return self._extract_path(self._parent_dict), self._closed_set
+        while self._open_heap:
+            _, current = self._pop_lowest_cost_node()
+            if closed[current]:
+                continue
+            closed[current] = 1
 
-    def _get_valid_neighbors(self, pos):
-        """
-        Get valid neighboring positions from the given position.
+            if current == goal:
+                return self._extract_path(start, goal), storage.visited()
 
-        :param pos: Tuple (x, y) representing the current position.
-        :return: List of tuples representing the valid neighboring positions.
-        """
-        return {(pos[0] + move[0], pos[1] + move[1]) for move in self._valid_moves}
+            y, x = divmod(current, width)
+            current_cost = g_values[current]
+            for dx, dy, move_cost in self._moves:
+                neighbor_x = x + dx
+                neighbor_y = y + dy
+                if not (0 <= neighbor_x < width and 0 <= neighbor_y < height):
+                    continue
+                neighbor = neighbor_y * width + neighbor_x
+                if blocked[neighbor] or closed[neighbor]:
+                    continue
 
-    def _calculate_cost(self, start_pos, end_pos):
-        """
-        Calculate the cost from the start position to the end position.
+                new_cost = current_cost + move_cost
+                if storage.relax(neighbor, new_cost, current):
+                    self._insert_to_open_list((new_cost, neighbor))
 
-        :param start_pos: Tuple (x, y) representing the start position.
-        :param end_pos: Tuple (x, y) representing the end position.
-        :return: Float value representing the cost from the start position to the end position.
-        """
-        if self._is_collision(start_pos, end_pos):
-            return float("inf")
+        raise AssertionError("Heap exhausted: No Path to target")
 
-        return distance(start_pos, end_pos)
-
-    def _is_collision(self, start_pos, end_pos):
+    def _is_free(self, x, y):
         """
-        Check if there is a collision between the start and end positions with obstacles.
+        Check if a position is inside the grid and not an obstacle.
 
-        :param start_pos: Tuple (x, y) representing the start position.
-        :param end_pos: Tuple (x, y) representing the end position.
-        :return: True if there is a collision, False otherwise.
+        :param x: The x coordinate of the position.
+        :param y: The y coordinate of the position.
+        :return: True if the position can be moved to, False otherwise.
         """
-        return self.pathfinding_environment.is_collision(end_pos) or self.pathfinding_environment.is_collision(start_pos)
+        return 0 <= x < self._width and 0 <= y < self._height and not self._blocked[y * self._width + x]
 
-    def _extract_path(self, parent_dict):
+    def _extract_path(self, start, goal):
         """
-        Extract the path from the parent_dict starting from the goal position to the start position.
+        Extract the path by following the parents from the goal index back to the start index.
 
-        :param parent_dict: Dictionary mapping child positions to their parent positions.
+        :param start: The index of the start position.
+        :param goal: The index of the goal position.
         :return: List of tuples representing the path from the start position to the goal position.
         """
-        path = [self._target_position]
-        current_pos = self._target_position
-
-        while True:
-            assert current_pos in parent_dict, "Heap exhausted: No Path to target"
-
-            current_pos = parent_dict[current_pos]
-            path.append(current_pos)
-
-            if current_pos == self._start_position:
-                break
-
-        path.reverse()
-        return path
+        return [self._storage.to_position(index) for index in self._storage.extract_indices(start, goal)]
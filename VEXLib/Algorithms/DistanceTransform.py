@@ -0,0 +1,70 @@
+def _transform_1d(values, length, output, vertices, boundaries):
+    """
+    Lower envelope of the parabolas rooted at each sample, from Felzenszwalb and Huttenlocher.
+    """
+    infinity = float("inf")
+    k = 0
+    vertices[0] = 0
+    boundaries[0] = -infinity
+    boundaries[1] = infinity
+    for q in range(1, length):
+        while True:
+            vertex = vertices[k]
+            s = ((values[q] + q * q) - (values[vertex] + vertex * vertex)) / (2 * q - 2 * vertex)
+            if s > boundaries[k]:
+                break
+            k -= 1
+        k += 1
+        vertices[k] = q
+        boundaries[k] = s
+        boundaries[k + 1] = infinity
+
+    k = 0
+    for q in range(length):
+        while boundaries[k + 1] < q:
+            k += 1
+        vertex = vertices[k]
+        output[q] = (q - vertex) * (q - vertex) + values[vertex]
+
+
+def squared_distance_transform(blocked, width, height):
+    """
+    Compute the exact squared Euclidean distance from every tile to the nearest blocked tile.
+
+    Runs in time linear in the number of tiles, by transforming every column and then every row.
+
+    Args:
+        blocked: A sequence of width * height values indexed by y * width + x, truthy for blocked tiles
+        width: The number of tiles in a row
+        height: The number of rows
+
+    Returns:
+        list: Squared distances in tiles indexed by y * width + x. If nothing is blocked, every
+        distance is larger than any distance on the grid.
+    """
+    # A finite stand in for infinity keeps the parabola intersections well defined
+    far = float((width + height) ** 2)
+    size = max(width, height)
+    column = [0.0] * size
+    transformed = [0.0] * size
+    vertices = [0] * size
+    boundaries = [0.0] * (size + 1)
+
+    distances = [far if not value else 0.0 for value in blocked]
+
+    for x in range(width):
+        for y in range(height):
+            column[y] = distances[y * width + x]
+        _transform_1d(column, height, transformed, vertices, boundaries)
+        for y in range(height):
+            distances[y * width + x] = transformed[y]
+
+    for y in range(height):
+        row_start = y * width
+        for x in range(width):
+            column[x] = distances[row_start + x]
+        _transform_1d(column, width, transformed, vertices, boundaries)
+        for x in range(width):
+            distances[row_start + x] = transformed[x]
+
+    return distances
@@ -1,7 +1,9 @@
 """
 A lightweight FFT module implementing:
-- Cooley-Tukey FFT (recursive)
+- Cooley-Tukey FFT (iterative, in place, with cached twiddle factors)
 - Inverse FFT
+- Real-input FFT using a half size complex transform
+- The original recursive FFT, for reference
 - Notch filtering in the frequency domain
 - Signal generation utilities
 - Relies only on builtin math library
@@ -32,9 +34,101 @@ def pad_to_power_of_2(signal):
     return list(signal) + [0] * (target_size - n)
 
 
+# Twiddle factors e^(-2*pi*i*k/n) for k < n / 2, and bit reversal swaps, keyed by transform size
+_twiddle_cache = {}
+_bit_reversal_cache = {}
+
+
+def _get_twiddles(n):
+    """
+    Get the forward twiddle factors for a transform of size n, computing them on first use.
+
+    :param n: Transform size (a power of 2)
+    :return: List of e^(-2*pi*i*k/n) for k in range(n // 2)
+    """
+    twiddles = _twiddle_cache.get(n)
+    if twiddles is None:
+        twiddles = [
+            complex(math.cos(-2 * math.pi * k / n), math.sin(-2 * math.pi * k / n))
+            for k in range(n // 2)
+        ]
+        _twiddle_cache[n] = twiddles
+    return twiddles
+
+
+def _get_bit_reversal_swaps(n):
+    """
+    Get the index pairs to swap to put a signal of size n into bit reversed order.
+
+    :param n: Transform size (a power of 2)
+    :return: Flat list [i0, j0, i1, j1, ...] of indices with i < j
+    """
+    swaps = _bit_reversal_cache.get(n)
+    if swaps is None:
+        swaps = []
+        j = 0
+        for i in range(1, n):
+            bit = n >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                swaps.append(i)
+                swaps.append(j)
+        _bit_reversal_cache[n] = swaps
+    return swaps
+
+
+def clear_caches():
+    """
+    Free the cached twiddle factors and bit reversal tables, for example after analysing a
+    one-off large buffer on the brain.
+    """
+    _twiddle_cache.clear()
+    _bit_reversal_cache.clear()
+
+
+def fft_in_place(data):
+    """
+    Compute the Fast Fourier Transform of a list in place using the iterative
+    radix-2 Cooley-Tukey algorithm with cached twiddle factors.
+
+    :param data: List of complex values whose length is a power of 2, overwritten with its transform
+    :return: The same list
+    """
+    n = len(data)
+    if n <= 1:
+        return data
+    if (n & (n - 1)) != 0:
+        raise ValueError("fft_in_place needs a power of 2 length, got " + str(n))
+
+    swaps = _get_bit_reversal_swaps(n)
+    for s in range(0, len(swaps), 2):
+        i = swaps[s]
+        j = swaps[s + 1]
+        data[i], data[j] = data[j], data[i]
+
+    twiddles = _get_twiddles(n)
+    half_size = 1
+    while half_size < n:
+        size = half_size * 2
+        stride = n // size
+        for start in range(0, n, size):
+            twiddle_index = 0
+            for k in range(start, start + half_size):
+                t = twiddles[twiddle_index] * data[k + half_size]
+                u = data[k]
+                data[k] = u + t
+                data[k + half_size] = u - t
+                twiddle_index += stride
+        half_size = size
+    return data
+
+
 def fft(signal):
     """
-    Compute the Fast Fourier Transform using the recursive
+    Compute the Fast Fourier Transform using the iterative
     Cooley-Tukey radix-2 algorithm.
 
     Automatically pads input to next power of 2 if needed.
@@ -44,6 +138,127 @@ def fft(signal):
     """
     n = len(signal)
 
+    if n <= 1:
+        return list(signal)
+
+    if (n & (n - 1)) != 0:
+        signal = pad_to_power_of_2(signal)
+
+    return fft_in_place([complex(value) for value in signal])
+
+
+def ifft(freq_data):
+    """
+    Compute the Inverse Fast Fourier Transform.
+
+    Automatically pads input to next power of 2 if needed.
+
+    :param freq_data: Frequency-domain data
+    :return: Reconstructed time-domain signal
+    """
+    n = len(freq_data)
+
+    if n <= 1:
+        return list(freq_data)
+
+    if (n & (n - 1)) != 0:
+        freq_data = pad_to_power_of_2(freq_data)
+        n = len(freq_data)
+
+    # ifft(X) = conj(fft(conj(X))) / n, which reuses the forward twiddle factors
+    data = fft_in_place([complex(value).conjugate() for value in freq_data])
+    for k in range(n):
+        data[k] = data[k].conjugate() / n
+    return data
+
+
+def rfft(signal):
+    """
+    Compute the FFT of a real signal, returning only the non-negative frequency bins.
+
+    The n real samples are packed into an n / 2 point complex FFT, which is then split
+    into the spectrum of the real signal, so this does about half the work of fft.
+
+    Automatically pads input to next power of 2 if needed.
+
+    :param signal: Real time-domain signal
+    :return: The first n / 2 + 1 bins of fft(signal)
+    """
+    n = len(signal)
+
+    if n <= 2:
+        return fft(signal)[: n // 2 + 1]
+
+    if (n & (n - 1)) != 0:
+        signal = pad_to_power_of_2(signal)
+        n = len(signal)
+
+    half = n // 2
+    packed = fft_in_place([complex(signal[2 * k], signal[2 * k + 1]) for k in range(half)])
+    twiddles = _get_twiddles(n)
+
+    result = [0j] * (half + 1)
+    result[0] = complex(packed[0].real + packed[0].imag, 0)
+    result[half] = complex(packed[0].real - packed[0].imag, 0)
+    for k in range(1, half):
+        z = packed[k]
+        z_mirror = packed[half - k].conjugate()
+        even = (z + z_mirror) * 0.5
+        odd = (z - z_mirror) * -0.5j
+        result[k] = even + twiddles[k] * odd
+    return result
+
+
+def irfft(half_spectrum, n=None):
+    """
+    Invert rfft, reconstructing a real signal from its non-negative frequency bins.
+
+    :param half_spectrum: The n / 2 + 1 bins returned by rfft
+    :param n: Length of the output signal, a power of 2 like the padded length rfft transforms,
+        2 * (len(half_spectrum) - 1) by default
+    :return: Reconstructed real time-domain signal
+    :raises ValueError: If n is not a power of 2
+    """
+    if n is None:
+        n = 2 * (len(half_spectrum) - 1)
+    if n < 1 or (n & (n - 1)) != 0:
+        raise ValueError("irfft needs a power of 2 length, got " + str(n))
+    if n <= 2:
+        spectrum = list(half_spectrum[: n // 2 + 1])
+        spectrum += [value.conjugate() for value in reversed(spectrum[1:(n + 1) // 2])]
+        return [value.real for value in ifft(spectrum)]
+
+    half = n // 2
+    twiddles = _get_twiddles(n)
+    packed = [0j] * half
+    for k in range(half):
+        x = half_spectrum[k]
+        x_mirror = half_spectrum[half - k].conjugate()
+        even = (x + x_mirror) * 0.5
+        odd = (x - x_mirror) * 0.5 * twiddles[k].conjugate()
+        packed[k] = even + odd * 1j
+
+    data = ifft(packed)
+    signal = [0.0] * n
+    for k in range(half):
+        signal[2 * k] = data[k].real
+        signal[2 * k + 1] = data[k].imag
+    return signal
+
+
+def fft_recursive(signal):
+    """
+    Compute the Fast Fourier Transform using the recursive
+    Cooley-Tukey radix-2 algorithm.
+
+    This is the original implementation, kept as a reference for tests
+    and benchmarks. Prefer fft.
+
+    :param signal: Real or complex time-domain signal
+    :return: Frequency-domain representation (complex list)
+    """
+    n = len(signal)
+
     if n <= 1:
         return list(signal)
 
@@ -51,8 +266,8 @@ def fft(signal):
         signal = pad_to_power_of_2(signal)
         n = len(signal)
 
-    even_fft = fft(signal[0::2])
-    odd_fft = fft(signal[1::2])
+    even_fft = fft_recursive(signal[0::2])
+    odd_fft = fft_recursive(signal[1::2])
 
     result = [0j] * n
     for k in range(n // 2):
@@ -67,9 +282,12 @@ def fft(signal):
     return result
 
 
-def ifft(freq_data):
+def ifft_recursive(freq_data):
     """
-    Compute the Inverse Fast Fourier Transform.
+    Compute the Inverse Fast Fourier Transform recursively.
+
+    This is the original implementation, kept as a reference for tests
+    and benchmarks. Prefer ifft.
 
     :param freq_data: Frequency-domain data
     :return: Reconstructed time-domain signal
@@ -79,8 +297,8 @@ def ifft(freq_data):
     if n <= 1:
         return list(freq_data)
 
-    even_ifft = ifft(freq_data[0::2])
-    odd_ifft = ifft(freq_data[1::2])
+    even_ifft = ifft_recursive(freq_data[0::2])
+    odd_ifft = ifft_recursive(freq_data[1::2])
 
     result = [0j] * n
     for k in range(n // 2):
@@ -0,0 +1,179 @@
+from array import array
+
+INFINITY = float("inf")
+
+
+def unpack_obstacles(pathfinding_environment, inflated=True):
+    """
+    Unpack the bit-packed obstacle list of a PathfindingEnvironment into one byte per tile.
+
+    Args:
+        pathfinding_environment (PathfindingEnvironment): A loaded environment.
+        inflated (bool): Whether to use the map inflated by the robot radius, when the environment has one.
+
+    Returns:
+        bytearray: 1 for blocked tiles and 0 for free tiles, indexed by y * width + x.
+    """
+    node_count = pathfinding_environment.width * pathfinding_environment.height
+    obstacle_list = pathfinding_environment.obstacle_list
+    if inflated and pathfinding_environment.inflated_list is not None:
+        obstacle_list = pathfinding_environment.inflated_list
+    blocked = bytearray(node_count)
+    for index in range(node_count):
+        if obstacle_list[index >> 3] & (0x80 >> (index & 7)):
+            blocked[index] = 1
+    return blocked
+
+
+class VisitedTiles:
+    """
+    A read-only view of the tiles expanded by the last search of a GridSearchStorage.
+
+    Positions are only turned into tuples while iterating, so returning this from a search costs no
+    allocation per visited tile. The view reflects the storage, so it changes when the next search runs.
+    """
+
+    def __init__(self, storage):
+        self._storage = storage
+
+    def __iter__(self):
+        storage = self._storage
+        width = storage.width
+        closed = storage.closed
+        touched = storage.touched
+        for i in range(storage.touched_count):
+            index = touched[i]
+            if closed[index]:
+                yield index % width, index // width
+
+    def __contains__(self, position):
+        x, y = position
+        storage = self._storage
+        if not (0 <= x < storage.width and 0 <= y < storage.height):
+            return False
+        return bool(storage.closed[y * storage.width + x])
+
+    def __len__(self):
+        count = 0
+        for _ in self:
+            count += 1
+        return count
+
+
+class GridSearchStorage:
+    """
+    Preallocated per-node state for searches on a grid, indexed by y * width + x.
+
+    Costs are kept in an array('f'), parents in an array('H') (or array('L') for grids with more
+    than 65536 tiles) and closed flags in a bytearray, so a search does not allocate a tuple, dict
+    entry or set entry per node. The indices written by a search are remembered in another
+    preallocated array, and only those are cleared by reset, so the same storage can be reused for
+    every search on a map.
+
+    Attributes:
+        g_values (array): The cost from the start to each node, infinity if it has not been reached.
+        parents (array): The index of the node each node was reached from.
+        closed (bytearray): 1 for nodes that have been expanded.
+        touched (array): The indices of every node reached since the last reset, in its first touched_count entries.
+        touched_count (int): The number of nodes reached since the last reset.
+    """
+
+    def __init__(self, width, height):
+        """
+        Args:
+            width (int): The number of tiles in a row of the grid.
+            height (int): The number of rows in the grid.
+        """
+        self.width = width
+        self.height = height
+        node_count = width * height
+
+        # Track item sizes here, MicroPython arrays have no itemsize attribute
+        self._parent_size = 2 if node_count <= 0x10000 else 4
+        self.g_values = array("f", [INFINITY] * node_count)
+        index_type = "H" if self._parent_size == 2 else "L"
+        self.parents = array(index_type, [0] * node_count)
+        self.closed = bytearray(node_count)
+        self.touched = array(index_type, [0] * node_count)
+        self.touched_count = 0
+
+    def reset(self):
+        """
+        Clear the state written by the last search.
+        """
+        g_values = self.g_values
+        closed = self.closed
+        touched = self.touched
+        for i in range(self.touched_count):
+            index = touched[i]
+            g_values[index] = INFINITY
+            closed[index] = 0
+        self.touched_count = 0
+
+    def start(self, index):
+        """
+        Reset the storage and mark a node as the start of a new search.
+        """
+        self.reset()
+        self.g_values[index] = 0
+        self.parents[index] = index
+        self.touched[0] = index
+        self.touched_count = 1
+
+    def relax(self, index, cost, parent):
+        """
+        Record a new route to a node if it is cheaper than the best one found so far.
+
+        Returns:
+            bool: Whether the route was recorded, meaning the node needs to be (re)queued.
+        """
+        g_values = self.g_values
+        if cost < g_values[index]:
+            if g_values[index] == INFINITY:
+                # Every node is touched at most once per search, so this never overflows
+                self.touched[self.touched_count] = index
+                self.touched_count += 1
+            g_values[index] = cost
+            self.parents[index] = parent
+            return True
+        return False
+
+    def extract_indices(self, start, goal):
+        """
+        Follow the parents back from the goal.
+
+        Returns:
+            list of int: The node indices from the start to the goal.
+        """
+        parents = self.parents
+        indices = [goal]
+        current = goal
+        while current != start:
+            current = parents[current]
+            indices.append(current)
+        indices.reverse()
+        return indices
+
+    def to_position(self, index):
+        return index % self.width, index // self.width
+
+    def visited_positions(self):
+        """
+        Returns:
+            list of tuples: The (x, y) positions of the nodes expanded since the last reset.
+        """
+        return list(self.visited())
+
+    def visited(self):
+        """
+        Returns:
+            VisitedTiles: A view of the nodes expanded since the last reset.
+        """
+        return VisitedTiles(self)
+
+    def memory_usage(self):
+        """
+        Returns:
+            int: The number of bytes used by the preallocated buffers.
+        """
+        return len(self.closed) * (4 + 2 * self._parent_size + 1)
@@ -1,9 +1,12 @@
-from VEXLib.Math import MathUtil
+from VEXLib.Algorithms.RunningStatistics import RunningStatistics
 
 
 class MovingWindowAverage:
     """
     A class to handle moving window average operations.
+
+    The average is kept up to date incrementally by a RunningStatistics, so adding a value costs the
+    same for any window size. Values should only be added through add_value, not to the buffer directly.
     """
 
     def __init__(self, buffer):
@@ -11,6 +14,7 @@ class MovingWindowAverage:
         Initializes the MovingWindowAverage with a buffer to hold the values.
         """
         self.buffer = buffer
+        self.statistics = RunningStatistics(buffer)
 
     def add_value(self, value):
         """
@@ -19,7 +23,7 @@ class MovingWindowAverage:
         :param value: The new value to add to the window.
         :return: The current smoothed average based on the window.
         """
-        self.buffer.add(value)
+        self.statistics.add(value)
         return self.get_average()
 
     def get_average(self):
@@ -28,10 +32,10 @@ class MovingWindowAverage:
 
         :return: The average of the current window
         """
-        return MathUtil.average_iterable(self.buffer.get())
+        return self.statistics.get_mean()
 
     def reset(self):
         """
         Resets the values in the window for reuse.
         """
-        self.buffer.clear()
+        self.statistics.reset()
@@ -1,5 +1,7 @@
 from VEXLib.Algorithms.TrapezoidProfile import *
+from VEXLib.Algorithms.SCurveProfile import SCurveConstraints, SCurveProfile, SCurveState
 from VEXLib.Algorithms.PIDF import PIDController
+from VEXLib.Algorithms.PID import PIDGains
 from VEXLib.Util import time
 
 
@@ -12,31 +14,57 @@ class ProfiledPIDController(PIDController):
         t: float = 0.05,
         integral_limit: float = 1.0,
         max_acceleration: float = 1.0,
-        max_velocity: float = 1.0
+        max_velocity: float = 1.0,
+        max_jerk: float = None
     ):
-        super().__init__(kp, ki, kd, t, integral_limit)
-        self.constraints = Constraints(max_velocity, max_acceleration)
-        self.profile = TrapezoidProfile(self.constraints)
+        """
+        Args:
+            max_jerk: If given, the setpoint follows a jerk-limited SCurveProfile planned once per
+                target instead of a TrapezoidProfile.
+        """
+        super().__init__(PIDGains(kp, ki, kd), t, integral_limit)
+        if max_jerk is None:
+            self.constraints = Constraints(max_velocity, max_acceleration)
+            self.profile = TrapezoidProfile(self.constraints)
+        else:
+            self.constraints = SCurveConstraints(max_velocity, max_acceleration, max_jerk)
+            self.profile = SCurveProfile(self.constraints)
         self.last_time = None
+        # Start time of the current SCurveProfile plan
+        self.plan_start_time = None
         self.target_state = State()
         self.current_state = State()
 
     def set_target_state(self, target_position, target_velocity):
         self.target_state = State(target_position, target_velocity)
+        if isinstance(self.profile, SCurveProfile):
+            # Re-plan from where the setpoint is now, so changing the target mid-motion stays smooth
+            current_time = time.time()
+            if self.plan_start_time is None:
+                self.profile.plan(SCurveState(), self.target_state)
+            else:
+                self.profile.replan(current_time - self.plan_start_time, self.target_state)
+            self.plan_start_time = current_time
+            return
         self.last_time = None  # Reset the time when a new target is set
         self.profile.goal = self.target_state
         self.current_state = State()
 
     def update(self, current_value: float) -> float:
         current_time = time.time()
-        if self.last_time is None:
-            self.last_time = current_time
+        if isinstance(self.profile, SCurveProfile):
+            if self.plan_start_time is None:
+                self.set_target_state(self.target_state.position, self.target_state.velocity)
+            self.current_state = self.profile.sample(current_time - self.plan_start_time)
+        else:
+            if self.last_time is None:
+                self.last_time = current_time
 
-        elapsed_time = current_time - self.last_time
-        self.last_time = current_time
+            elapsed_time = current_time - self.last_time
+            self.last_time = current_time
 
-        # Calculate the current state using the trapezoid profile
-        self.current_state = self.profile.calculate(elapsed_time, self.current_state, self.target_state)
+            # Calculate the current state using the trapezoid profile
+            self.current_state = self.profile.calculate(elapsed_time, self.current_state, self.target_state)
 
         # Update the PIDF target value to the current position
         self.setpoint = self.current_state.position
@@ -48,5 +76,7 @@ class ProfiledPIDController(PIDController):
 
     def is_finished(self):
         current_time = time.time()
+        if isinstance(self.profile, SCurveProfile):
+            return self.plan_start_time is not None and self.profile.is_finished(current_time - self.plan_start_time)
         elapsed_time = current_time - (self.last_time if self.last_time else 0)
         return self.profile.is_finished(elapsed_time)
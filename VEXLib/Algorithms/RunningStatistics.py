@@ -0,0 +1,195 @@
+from array import array
+
+
+class _MonotonicQueue:
+    """
+    A fixed-capacity deque of (sequence number, value) pairs whose values are kept monotonic, so
+    the front is always the minimum (or maximum) of the values still in the window.
+
+    MicroPython's collections.deque cannot pop from the right, so this uses its own ring.
+    """
+
+    def __init__(self, capacity, keep_maximum):
+        self.capacity = capacity
+        self.keep_maximum = keep_maximum
+        self._sequence_numbers = array("l", [0] * capacity)
+        self._values = [0.0] * capacity
+        self.clear()
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    def push(self, sequence_number, value):
+        # Drop values from the back that can never be the extreme again
+        while self._count:
+            back = self._head + self._count - 1
+            if back >= self.capacity:
+                back -= self.capacity
+            if (self._values[back] <= value) if self.keep_maximum else (self._values[back] >= value):
+                self._count -= 1
+            else:
+                break
+        back = self._head + self._count
+        if back >= self.capacity:
+            back -= self.capacity
+        self._sequence_numbers[back] = sequence_number
+        self._values[back] = value
+        self._count += 1
+
+    def expire(self, oldest_sequence_number):
+        # Drop values from the front that have left the window
+        while self._count and self._sequence_numbers[self._head] < oldest_sequence_number:
+            self._head += 1
+            if self._head >= self.capacity:
+                self._head = 0
+            self._count -= 1
+
+    def front(self):
+        if not self._count:
+            return None
+        return self._values[self._head]
+
+
+class RunningStatistics:
+    """
+    Sum, mean, variance, minimum and maximum of the values in a Buffer, updated in constant time
+    per value.
+
+    The mean and variance use Welford's algorithm, extended to remove the value that leaves the
+    window. Alongside it, a second add-only Welford sum starts over at every pass through the
+    window; once it has seen a whole window it holds the window's exact statistics and replaces the
+    running ones. Rounding errors therefore cannot build up over a long match, and correcting them
+    costs one extra step per value instead of a periodic pass over the whole window. The minimum
+    and maximum come from monotonic queues, which amortize to a constant number of operations per
+    value.
+    """
+
+    def __init__(self, buffer):
+        """
+        Args:
+            buffer (Buffer): The window of values. Values already in it are included.
+        """
+        self.buffer = buffer
+        self._minimum = _MonotonicQueue(buffer.length, keep_maximum=False)
+        self._maximum = _MonotonicQueue(buffer.length, keep_maximum=True)
+        self.resync()
+
+    def resync(self):
+        """
+        Recompute all statistics from the values currently in the buffer, in time proportional to
+        its length. add keeps them exact without calling this.
+        """
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sequence_number = 0
+        self._clear_shadow()
+        self._minimum.clear()
+        self._maximum.clear()
+
+        count = 0
+        for value in self.buffer:
+            count += 1
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+            self._push_extremes(value)
+
+    def _clear_shadow(self):
+        # Add-only Welford sums of the values added since the shadow last started over
+        self._shadow_count = 0
+        self._shadow_mean = 0.0
+        self._shadow_m2 = 0.0
+
+    def _push_extremes(self, value):
+        # Expire first, so the queues never hold more than a window of values
+        oldest = self._sequence_number + 1 - self.buffer.length
+        self._minimum.expire(oldest)
+        self._maximum.expire(oldest)
+        self._minimum.push(self._sequence_number, value)
+        self._maximum.push(self._sequence_number, value)
+        self._sequence_number += 1
+
+    def add(self, value):
+        """
+        Add a value to the window, removing the oldest value if the window is full.
+
+        Args:
+            value: The new value
+        """
+        full = self.buffer.is_full()
+        removed = self.buffer.add(value)
+        # Use the stored value, so typed buffers remove exactly what they added
+        value = self.buffer[-1]
+
+        if full:
+            count = len(self.buffer)
+            old_mean = self._mean
+            self._mean += (value - removed) / count
+            self._m2 += (value - removed) * (value - self._mean + removed - old_mean)
+            if self._m2 < 0:
+                self._m2 = 0.0
+        else:
+            count = len(self.buffer)
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+
+        self._push_extremes(value)
+
+        self._shadow_count += 1
+        delta = value - self._shadow_mean
+        self._shadow_mean += delta / self._shadow_count
+        self._shadow_m2 += delta * (value - self._shadow_mean)
+        if self._shadow_count == self.buffer.length:
+            # The shadow has seen exactly the values in the window, with no removals to round off
+            self._mean = self._shadow_mean
+            self._m2 = self._shadow_m2
+            self._clear_shadow()
+
+    def reset(self):
+        """
+        Clear the buffer and all statistics.
+        """
+        self.buffer.clear()
+        self.resync()
+
+    def get_count(self):
+        return len(self.buffer)
+
+    def get_sum(self):
+        return self._mean * len(self.buffer)
+
+    def get_mean(self):
+        """
+        Returns:
+            The mean of the window, or 0 if it is empty
+        """
+        return self._mean
+
+    def get_variance(self):
+        """
+        Returns:
+            The sample variance of the window, or 0 if it holds fewer than two values
+        """
+        count = len(self.buffer)
+        if count < 2:
+            return 0.0
+        return self._m2 / (count - 1)
+
+    def get_standard_deviation(self):
+        return self.get_variance() ** 0.5
+
+    def get_min(self):
+        """
+        Returns:
+            The smallest value in the window, or None if it is empty
+        """
+        return self._minimum.front()
+
+    def get_max(self):
+        """
+        Returns:
+            The largest value in the window, or None if it is empty
+        """
+        return self._maximum.front()
@@ -0,0 +1,242 @@
+from math import sqrt
+
+from VEXLib.Algorithms.TrapezoidProfile import Constraints, State
+
+# Most steps of the search for the peak velocity, which usually converges in under ten
+PEAK_VELOCITY_ITERATIONS = 48
+# Distance error at which the search for the peak velocity stops, in the profile's units
+PEAK_VELOCITY_TOLERANCE = 1e-12
+
+
+class SCurveConstraints(Constraints):
+    max_jerk: float
+
+    def __init__(self, max_velocity, max_acceleration, max_jerk):
+        super().__init__(max_velocity, max_acceleration)
+        self.max_jerk = max_jerk
+
+    def __repr__(self):
+        return ("SCurveConstraints <max_velocity=" + str(self.max_velocity) + ", max_acceleration="
+                + str(self.max_acceleration) + ", max_jerk=" + str(self.max_jerk) + ">")
+
+
+class SCurveState(State):
+    acceleration: float
+
+    def __init__(self, position=0.0, velocity=0.0, acceleration=0.0):
+        super().__init__(position, velocity)
+        self.acceleration = acceleration
+
+    def __repr__(self):
+        return ("SCurveState(position=" + str(self.position) + ", velocity=" + str(self.velocity)
+                + ", acceleration=" + str(self.acceleration) + ")")
+
+
+def _velocity_change(velocity, acceleration, target_velocity, max_acceleration, max_jerk):
+    """
+    The fastest jerk-limited way to go from a velocity and acceleration to a target velocity with
+    zero acceleration: ramp the acceleration towards the limit, hold it, and ramp it back to zero.
+
+    Returns:
+        list[tuple[float, float]]: Up to three (duration, jerk) phases.
+    """
+    # Ramping the current acceleration straight to zero already changes the velocity by this much
+    coasting_velocity = velocity + acceleration * abs(acceleration) / (2 * max_jerk)
+    direction = 1 if target_velocity >= coasting_velocity else -1
+    change = (target_velocity - velocity) * direction
+
+    peak = max_acceleration
+    hold_time = (change - (2 * peak * peak - acceleration * acceleration) / (2 * max_jerk)) / peak
+    if hold_time < 0:
+        # The limit is never reached, the acceleration turns around at a lower peak
+        peak = sqrt(max(0.0, (2 * max_jerk * change + acceleration * acceleration) / 2))
+        hold_time = 0.0
+    return [
+        ((peak - direction * acceleration) / max_jerk, direction * max_jerk),
+        (hold_time, 0.0),
+        (peak / max_jerk, -direction * max_jerk),
+    ]
+
+
+def _advance(position, velocity, acceleration, jerk, t):
+    return (
+        position + t * (velocity + t * (acceleration / 2 + t * jerk / 6)),
+        velocity + t * (acceleration + t * jerk / 2),
+        acceleration + t * jerk,
+    )
+
+
+def _end_of(phases, position, velocity, acceleration):
+    for duration, jerk in phases:
+        position, velocity, acceleration = _advance(position, velocity, acceleration, jerk, duration)
+    return position, velocity, acceleration
+
+
+class SCurveProfile:
+    """
+    A jerk-limited motion profile: the acceleration ramps up and down at a limited rate instead of
+    jumping, which is gentler on the drivetrain and less likely to make the wheels slip than a
+    trapezoid profile with the same acceleration limit.
+
+    plan works out the up to seven phases of constant jerk once per goal, along with the state at
+    the start of each phase, so sample(t) only has to find the phase and evaluate one cubic. The
+    initial state may be moving and accelerating, which lets a profile be re-planned from its
+    current state partway through a motion.
+
+    The profile is the fastest one that first changes to a peak velocity, cruises at it and then
+    changes to the goal velocity. If the goal cannot be reached without overshooting it, the profile
+    overshoots and comes back.
+    """
+
+    def __init__(self, constraints):
+        """
+        Args:
+            constraints (SCurveConstraints): Velocity, acceleration and jerk limits, all positive.
+        """
+        self.constraints = constraints
+        self.initial = SCurveState()
+        self.goal = SCurveState()
+        # Parallel lists, one entry per phase of non-zero length
+        self.phase_start_times = []
+        self.phase_start_states = []
+        self.phase_jerks = []
+        self.end_time = 0.0
+
+    def _phases_through(self, peak_velocity, cruise_time, velocity, acceleration, goal_velocity):
+        constraints = self.constraints
+        return (
+            _velocity_change(velocity, acceleration, peak_velocity, constraints.max_acceleration, constraints.max_jerk)
+            + [(cruise_time, 0.0)]
+            + _velocity_change(peak_velocity, 0.0, goal_velocity, constraints.max_acceleration, constraints.max_jerk)
+        )
+
+    def plan(self, initial_state, goal_state):
+        """
+        Plan a profile from an initial state to a goal, replacing any previous plan.
+
+        Args:
+            initial_state (State | SCurveState): Where the motion starts. A plain State starts with zero acceleration.
+            goal_state (State): Where the motion ends. It ends with zero acceleration.
+        """
+        constraints = self.constraints
+        max_velocity = constraints.max_velocity
+        velocity = min(max(initial_state.velocity, -max_velocity), max_velocity)
+        acceleration = getattr(initial_state, "acceleration", 0.0)
+        acceleration = min(max(acceleration, -constraints.max_acceleration), constraints.max_acceleration)
+        goal_velocity = min(max(goal_state.velocity, -max_velocity), max_velocity)
+        self.initial = SCurveState(initial_state.position, velocity, acceleration)
+        self.goal = SCurveState(goal_state.position, goal_velocity)
+
+        distance = goal_state.position - initial_state.position
+
+        def distance_through(peak_velocity):
+            phases = self._phases_through(peak_velocity, 0.0, velocity, acceleration, goal_velocity)
+            return _end_of(phases, 0.0, velocity, acceleration)[0]
+
+        # The distance covered grows with the peak velocity, so cruise at a limit if even that is
+        # not enough, and otherwise search for the peak that covers the distance exactly
+        fastest = distance_through(max_velocity)
+        slowest = distance_through(-max_velocity)
+        if fastest <= distance:
+            peak_velocity = max_velocity
+            cruise_time = (distance - fastest) / max_velocity
+        elif slowest >= distance:
+            peak_velocity = -max_velocity
+            cruise_time = (slowest - distance) / max_velocity
+        else:
+            # Illinois false position: interpolate within the bracket, halving the weight of an end
+            # that is kept twice in a row so the bracket keeps shrinking from both sides
+            low = -max_velocity
+            high = max_velocity
+            low_error = slowest - distance
+            high_error = fastest - distance
+            side = 0
+            peak_velocity = 0.0
+            for _ in range(PEAK_VELOCITY_ITERATIONS):
+                peak_velocity = (low * high_error - high * low_error) / (high_error - low_error)
+                error = distance_through(peak_velocity) - distance
+                if abs(error) <= PEAK_VELOCITY_TOLERANCE:
+                    break
+                if error < 0:
+                    low = peak_velocity
+                    low_error = error
+                    if side == -1:
+                        high_error /= 2
+                    side = -1
+                else:
+                    high = peak_velocity
+                    high_error = error
+                    if side == 1:
+                        low_error /= 2
+                    side = 1
+            cruise_time = 0.0
+
+        phases = self._phases_through(peak_velocity, cruise_time, velocity, acceleration, goal_velocity)
+        self.phase_start_times = []
+        self.phase_start_states = []
+        self.phase_jerks = []
+        t = 0.0
+        state = (initial_state.position, velocity, acceleration)
+        for duration, jerk in phases:
+            if duration <= 0:
+                continue
+            self.phase_start_times.append(t)
+            self.phase_start_states.append(state)
+            self.phase_jerks.append(jerk)
+            state = _advance(state[0], state[1], state[2], jerk, duration)
+            t += duration
+        self.end_time = t
+
+    def replan(self, t, goal_state=None):
+        """
+        Plan again from the state at time t of the current plan, towards a new goal or the same one.
+        Times passed to sample afterwards are measured from the re-plan.
+
+        Args:
+            t (float): Seconds since the start of the current plan.
+            goal_state (State, optional): New goal, or None to keep the current goal.
+
+        Returns:
+            SCurveState: The state the new plan starts from.
+        """
+        current = self.sample(t)
+        self.plan(current, self.goal if goal_state is None else goal_state)
+        return current
+
+    def sample(self, t):
+        """
+        Get the state at a time of the current plan.
+
+        Args:
+            t (float): Seconds since the start of the plan. Times past the end give the goal.
+
+        Returns:
+            SCurveState: The position, velocity and acceleration at that time.
+        """
+        if t >= self.end_time:
+            return SCurveState(self.goal.position, self.goal.velocity)
+        if t <= 0:
+            return SCurveState(self.initial.position, self.initial.velocity, self.initial.acceleration)
+        # At most seven phases, searched from the end
+        index = len(self.phase_start_times) - 1
+        while self.phase_start_times[index] > t:
+            index -= 1
+        position, velocity, acceleration = self.phase_start_states[index]
+        return SCurveState(*_advance(position, velocity, acceleration, self.phase_jerks[index],
+                                     t - self.phase_start_times[index]))
+
+    def calculate(self, t, initial_state, goal_state):
+        """
+        TrapezoidProfile-style interface: plan if the initial state or goal changed, then sample.
+        """
+        if (initial_state.position != self.initial.position or initial_state.velocity != self.initial.velocity
+                or getattr(initial_state, "acceleration", 0.0) != self.initial.acceleration
+                or goal_state.position != self.goal.position or goal_state.velocity != self.goal.velocity):
+            self.plan(initial_state, goal_state)
+        return self.sample(t)
+
+    def total_time(self):
+        return self.end_time
+
+    def is_finished(self, t):
+        return t >= self.total_time()
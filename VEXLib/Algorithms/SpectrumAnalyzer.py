@@ -0,0 +1,289 @@
+"""
+Streaming spectral analysis for motor and IMU signals, built on FastFourierTransform:
+- Goertzel evaluation of single frequencies over a block of samples
+- Sliding DFT bins updated in constant time per sample
+- Windowed, overlapping short-time Fourier transform frames from a ring buffer
+"""
+
+import math
+from array import array
+
+from VEXLib.Algorithms.FastFourierTransform import rfft
+
+
+# ============================================================
+# Windows and single-frequency evaluation
+# ============================================================
+
+def hann_window(size):
+    """
+    Periodic Hann window, which overlaps cleanly at 50% hop sizes.
+
+    :param size: Number of samples in the window
+    :return: List of window weights
+    """
+    return [0.5 - 0.5 * math.cos(2 * math.pi * i / size) for i in range(size)]
+
+
+def goertzel(samples, frequency, sample_rate):
+    """
+    Evaluate the DFT of a block of samples at a single frequency with the Goertzel algorithm.
+
+    Cheaper than a full FFT when only a few frequencies are of interest, and the
+    frequency does not need to fall on an FFT bin.
+
+    :param samples: Real time-domain samples
+    :param frequency: Frequency to evaluate in Hz
+    :param sample_rate: Sampling rate in Hz
+    :return: Complex DFT value, matching bin k of an FFT when frequency = k * sample_rate / len(samples)
+    """
+    omega = 2 * math.pi * frequency / sample_rate
+    coefficient = 2 * math.cos(omega)
+    s_prev = 0.0
+    s_prev2 = 0.0
+    for sample in samples:
+        s = sample + coefficient * s_prev - s_prev2
+        s_prev2 = s_prev
+        s_prev = s
+    # Phase reference is the first sample, like the FFT
+    n = len(samples)
+    value = complex(s_prev - s_prev2 * math.cos(omega), s_prev2 * math.sin(omega))
+    return value * complex(math.cos(-omega * (n - 1)), math.sin(-omega * (n - 1)))
+
+
+# ============================================================
+# Sliding DFT
+# ============================================================
+
+class SlidingDFT:
+    """
+    Track the amplitude of a few frequencies over the most recent window of samples.
+
+    Every sample updates each tracked bin with one complex multiply-add, so the cost per
+    sample does not depend on the window size. The frequencies are rounded to the nearest
+    DFT bin of the window, see bin_frequencies.
+
+    A damping factor slightly below 1 keeps rounding errors from accumulating forever,
+    at the cost of slightly under-reporting amplitudes.
+    """
+
+    def __init__(self, window_size, sample_rate, frequencies, windowed=True, damping=0.9999):
+        """
+        :param window_size: Number of samples in the analysis window
+        :param sample_rate: Sampling rate in Hz
+        :param frequencies: Frequencies to track in Hz
+        :param windowed: Apply a Hann window, computed from the two neighbouring bins, to reduce leakage
+        :param damping: Per sample decay of the bin state, 1 for an exact but undamped DFT
+        """
+        self.window_size = window_size
+        self.sample_rate = sample_rate
+        self.windowed = windowed
+        self.damping = damping
+        self._damping_n = damping ** window_size
+
+        self.bins = [
+            min(window_size // 2, max(0, int(round(frequency * window_size / sample_rate))))
+            for frequency in frequencies
+        ]
+        self.bin_frequencies = [k * sample_rate / window_size for k in self.bins]
+
+        # Every bin needed to compute the outputs, including neighbours for the Hann window
+        tracked = []
+        for k in self.bins:
+            for neighbour in ((k - 1, k, k + 1) if windowed else (k,)):
+                neighbour %= window_size
+                if neighbour not in tracked:
+                    tracked.append(neighbour)
+        self._tracked = tracked
+        self._slots = {k: i for i, k in enumerate(tracked)}
+        self._rotations = [
+            damping * complex(math.cos(2 * math.pi * k / window_size), math.sin(2 * math.pi * k / window_size))
+            for k in tracked
+        ]
+        self._history = array("f", [0.0] * window_size)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the window and all bin state.
+        """
+        self._state = [0j] * len(self._tracked)
+        for i in range(self.window_size):
+            self._history[i] = 0.0
+        self._index = 0
+        self.sample_count = 0
+
+    def add_sample(self, sample):
+        """
+        Slide the window forward by one sample.
+
+        :param sample: The newest sample
+        """
+        oldest = self._history[self._index]
+        self._history[self._index] = sample
+        # Use the stored value, so the sample removed later is exactly the one added now
+        sample = self._history[self._index]
+        self._index += 1
+        if self._index >= self.window_size:
+            self._index = 0
+        self.sample_count += 1
+
+        delta = sample - self._damping_n * oldest
+        state = self._state
+        rotations = self._rotations
+        for i in range(len(state)):
+            state[i] = (state[i] + delta) * rotations[i]
+
+    def is_full(self):
+        return self.sample_count >= self.window_size
+
+    def get_bin(self, index):
+        """
+        :param index: Index into the tracked frequencies
+        :return: Complex DFT value of the current window for that frequency
+        """
+        k = self.bins[index]
+        value = self._state[self._slots[k]]
+        if self.windowed:
+            n = self.window_size
+            lower = self._state[self._slots[(k - 1) % n]]
+            upper = self._state[self._slots[(k + 1) % n]]
+            value = 0.5 * value - 0.25 * (lower + upper)
+        return value
+
+    def get_amplitude(self, index):
+        """
+        :param index: Index into the tracked frequencies
+        :return: Amplitude of a sinusoid at that frequency in the current window
+        """
+        k = self.bins[index]
+        # Window coherent gain, and the energy split between positive and negative frequencies
+        scale = self.window_size * (0.5 if self.windowed else 1.0)
+        if 0 < k < self.window_size / 2:
+            scale /= 2
+        return abs(self.get_bin(index)) / scale
+
+    def get_amplitudes(self):
+        return [self.get_amplitude(i) for i in range(len(self.bins))]
+
+    def get_dominant(self):
+        """
+        :return: (frequency, amplitude) of the tracked frequency with the largest amplitude
+        """
+        amplitudes = self.get_amplitudes()
+        index = amplitudes.index(max(amplitudes))
+        return self.bin_frequencies[index], amplitudes[index]
+
+
+# ============================================================
+# Short-time Fourier transform
+# ============================================================
+
+class ShortTimeFourierTransform:
+    """
+    Compute windowed, overlapping FFT frames of a stream of samples.
+
+    Samples are written to a fixed ring buffer in constant time. Every hop_size samples,
+    once the ring is full, the frame is unrolled, windowed and transformed with rfft, so
+    the transform cost is spread over hop_size samples.
+    """
+
+    def __init__(self, frame_size, hop_size, sample_rate, window=None):
+        """
+        :param frame_size: Samples per frame, a power of 2
+        :param hop_size: Samples between the starts of consecutive frames
+        :param sample_rate: Sampling rate in Hz
+        :param window: Window weights of length frame_size, a Hann window by default
+        """
+        if frame_size < 2 or frame_size & (frame_size - 1):
+            raise ValueError("Frame size must be a power of 2, got " + str(frame_size))
+        if not 0 < hop_size <= frame_size:
+            raise ValueError("Hop size must be between 1 and the frame size, got " + str(hop_size))
+
+        self.frame_size = frame_size
+        self.hop_size = hop_size
+        self.sample_rate = sample_rate
+        self.window = hann_window(frame_size) if window is None else list(window)
+        # The sum of the window weights, to turn bin magnitudes into amplitudes
+        self._window_gain = sum(self.window)
+
+        self._ring = array("f", [0.0] * frame_size)
+        self._frame = [0.0] * frame_size
+        self.frequencies = [k * sample_rate / frame_size for k in range(frame_size // 2 + 1)]
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the ring buffer and the last frame.
+        """
+        for i in range(self.frame_size):
+            self._ring[i] = 0.0
+        self._index = 0
+        self._samples_until_frame = self.frame_size
+        self.frame_count = 0
+        self.spectrum = None
+
+    def add_sample(self, sample):
+        """
+        Add a sample, computing a new frame if one is due.
+
+        :param sample: The newest sample
+        :return: True if a new frame was computed
+        """
+        self._ring[self._index] = sample
+        self._index += 1
+        if self._index >= self.frame_size:
+            self._index = 0
+
+        self._samples_until_frame -= 1
+        if self._samples_until_frame > 0:
+            return False
+        self._samples_until_frame = self.hop_size
+        self._compute_frame()
+        return True
+
+    def _compute_frame(self):
+        ring = self._ring
+        frame = self._frame
+        window = self.window
+        n = self.frame_size
+        # The oldest sample is at the write index
+        start = self._index
+        for i in range(n):
+            j = start + i
+            if j >= n:
+                j -= n
+            frame[i] = ring[j] * window[i]
+        self.spectrum = rfft(frame)
+        self.frame_count += 1
+
+    def get_amplitudes(self):
+        """
+        :return: Amplitude of each frequency in frequencies for the last frame, or None before the first frame
+        """
+        if self.spectrum is None:
+            return None
+        last = len(self.spectrum) - 1
+        return [
+            abs(value) / self._window_gain * (1 if k == 0 or k == last else 2)
+            for k, value in enumerate(self.spectrum)
+        ]
+
+    def get_dominant(self, minimum_frequency=0.0):
+        """
+        :param minimum_frequency: Ignore frequencies below this, for example to skip a DC offset, which the
+            window spreads into the first bin as well
+        :return: (frequency, amplitude) of the strongest frequency in the last frame, or None before the first frame
+        """
+        amplitudes = self.get_amplitudes()
+        if amplitudes is None:
+            return None
+        best = None
+        for k, amplitude in enumerate(amplitudes):
+            if self.frequencies[k] < minimum_frequency:
+                continue
+            if best is None or amplitude > amplitudes[best]:
+                best = k
+        if best is None:
+            return None
+        return self.frequencies[best], amplitudes[best]
@@ -0,0 +1,180 @@
+import struct
+from array import array
+
+# Binary trajectory files: a header, then each field as one little endian float32 per sample.
+# Storing each field contiguously lets a whole field be unpacked with a single call on the brain.
+TRAJECTORY_MAGIC = b"TRAJ"
+TRAJECTORY_VERSION = 1
+TRAJECTORY_FILE_SUFFIX = ".traj"
+# Magic, version, number of fields, number of samples, seconds between samples
+HEADER_FORMAT = "<4sHHIf"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Per-sample fields, in file order. Distances are in meters, angles in radians and times in seconds.
+# The heading is unwrapped, so it changes continuously and may leave [-pi, pi].
+FIELDS = (
+    "x",
+    "y",
+    "heading",
+    "velocity",
+    "acceleration",
+    "curvature",
+    "left_velocity",
+    "right_velocity",
+)
+
+
+class TrajectoryState:
+    """
+    The planned state of the robot at one time along a trajectory.
+
+    Attributes:
+        time (float): Seconds since the start of the trajectory.
+        x (float): Field x position in meters.
+        y (float): Field y position in meters.
+        heading (float): Direction of travel in radians, counterclockwise from the x axis.
+        velocity (float): Forward speed in meters per second.
+        acceleration (float): Forward acceleration in meters per second squared.
+        curvature (float): Path curvature in 1/meters, positive when turning counterclockwise.
+        left_velocity (float): Left wheel speed in meters per second.
+        right_velocity (float): Right wheel speed in meters per second.
+    """
+
+    def __init__(self, time=0.0, x=0.0, y=0.0, heading=0.0, velocity=0.0, acceleration=0.0, curvature=0.0,
+                 left_velocity=0.0, right_velocity=0.0):
+        self.time = time
+        self.x = x
+        self.y = y
+        self.heading = heading
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.curvature = curvature
+        self.left_velocity = left_velocity
+        self.right_velocity = right_velocity
+
+    def __repr__(self):
+        return ("TrajectoryState(time=" + str(self.time) + ", x=" + str(self.x) + ", y=" + str(self.y)
+                + ", heading=" + str(self.heading) + ", velocity=" + str(self.velocity) + ")")
+
+
+class Trajectory:
+    """
+    A drive path sampled at a fixed time step, compiled ahead of time by util/TrajectoryCompiler.py.
+
+    Because the samples are evenly spaced in time, looking up the state at any time is a division
+    and an interpolation between two samples, whatever the length of the trajectory.
+
+    Attributes:
+        time_step (float): Seconds between samples.
+        fields (dict[str, array]): One float32 array per name in FIELDS, all the same length.
+    """
+
+    def __init__(self, time_step=0.01, fields=None):
+        """
+        Args:
+            time_step (float): Seconds between samples.
+            fields (dict[str, iterable[float]], optional): Values for every name in FIELDS. Empty if None.
+
+        Raises:
+            ValueError: If a field is missing or the fields have different lengths.
+        """
+        self.time_step = time_step
+        self.fields = {}
+        for name in FIELDS:
+            self.fields[name] = array("f", fields[name] if fields is not None else [])
+        lengths = [len(values) for values in self.fields.values()]
+        if min(lengths) != max(lengths):
+            raise ValueError("Trajectory fields must all have the same number of samples")
+
+    def __len__(self):
+        return len(self.fields["x"])
+
+    def total_time(self):
+        """
+        Returns:
+            float: Seconds from the first sample to the last.
+        """
+        return max(0, len(self) - 1) * self.time_step
+
+    def sample(self, time):
+        """
+        Get the planned state at a time, interpolating linearly between the neighbouring samples.
+
+        Args:
+            time (float): Seconds since the start. Times outside the trajectory give the first or last sample.
+
+        Returns:
+            TrajectoryState: The state at that time.
+        """
+        count = len(self)
+        if count == 0:
+            raise ValueError("Trajectory is empty")
+        position = time / self.time_step
+        if position <= 0:
+            index = 0
+            fraction = 0.0
+        elif position >= count - 1:
+            index = count - 1
+            fraction = 0.0
+        else:
+            index = int(position)
+            fraction = position - index
+
+        state = TrajectoryState(min(max(time, 0.0), self.total_time()))
+        for name in FIELDS:
+            values = self.fields[name]
+            value = values[index]
+            if fraction:
+                value += (values[index + 1] - value) * fraction
+            setattr(state, name, value)
+        return state
+
+    def to_bytes(self):
+        """
+        Serialize the trajectory into the binary format read by from_bytes.
+        """
+        data = bytearray(struct.pack(HEADER_FORMAT, TRAJECTORY_MAGIC, TRAJECTORY_VERSION, len(FIELDS), len(self),
+                                     self.time_step))
+        field_format = "<" + str(len(self)) + "f"
+        for name in FIELDS:
+            data += struct.pack(field_format, *self.fields[name])
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Read a trajectory written by to_bytes.
+
+        Args:
+            data (bytes): The file contents.
+
+        Returns:
+            Trajectory: The trajectory.
+
+        Raises:
+            ValueError: If the data is not a trajectory of this version or is truncated.
+        """
+        if len(data) < HEADER_SIZE:
+            raise ValueError("Trajectory data is too short")
+        magic, version, field_count, sample_count, time_step = struct.unpack_from(HEADER_FORMAT, data, 0)
+        if magic != TRAJECTORY_MAGIC or version != TRAJECTORY_VERSION or field_count != len(FIELDS):
+            raise ValueError("Not a version " + str(TRAJECTORY_VERSION) + " trajectory")
+        if len(data) != HEADER_SIZE + 4 * field_count * sample_count:
+            raise ValueError("Trajectory data has the wrong length")
+
+        trajectory = cls(time_step)
+        field_format = "<" + str(sample_count) + "f"
+        offset = HEADER_SIZE
+        for name in FIELDS:
+            trajectory.fields[name] = array("f", struct.unpack_from(field_format, data, offset))
+            offset += 4 * sample_count
+        return trajectory
+
+    @classmethod
+    def load_from_file(cls, file_object):
+        with file_object as f:
+            return cls.from_bytes(f.read())
+
+    def save_to_file(self, file_object):
+        with file_object as f:
+            f.write(self.to_bytes())
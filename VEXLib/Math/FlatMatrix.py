@@ -0,0 +1,427 @@
+from array import array
+
+from VEXLib.Math.Matrix import Matrix, Shape
+
+
+class FlatMatrix:
+    """
+    A matrix stored row by row in one flat array of doubles, with in-place operations that write
+    into preallocated matrices.
+
+    Matrix allocates a new list of lists for every +, -, * and transpose. A filter step built from
+    FlatMatrix operations can instead keep its scratch matrices between steps, so a fixed-size step
+    does not allocate any matrices. The operations add and multiply in the same order as Matrix, so
+    the results are bit-for-bit the same.
+
+    Methods ending in _into write their result into the out matrix and return it. The out matrix
+    must already have the right size, and for matmul_into and transpose_into it must not be one of
+    the inputs.
+
+    Attributes:
+        rows (int): Number of rows.
+        columns (int): Number of columns.
+        values (array): The elements, row by row, so element (r, c) is values[r * columns + c].
+    """
+
+    def __init__(self, rows, columns, values=None):
+        """
+        Initialize a FlatMatrix with a given size and optional values.
+
+        Args:
+            rows (int): Number of rows. Must be positive.
+            columns (int): Number of columns. Must be positive.
+            values (iterable[float], optional): rows * columns elements, row by row. If None, initializes to zeros.
+
+        Raises:
+            ValueError: If the size is not positive or the number of values does not match it.
+        """
+        if rows <= 0 or columns <= 0:
+            raise ValueError("Minimum matrix size is 1x1")
+        self.rows = rows
+        self.columns = columns
+        if values is None:
+            self.values = array("d", [0.0] * (rows * columns))
+        else:
+            self.values = array("d", values)
+            if len(self.values) != rows * columns:
+                raise ValueError("Expected " + str(rows * columns) + " values, got " + str(len(self.values)))
+        self._rows = None
+        self._column = None
+
+    # -------------------------------
+    # Conversion
+    # -------------------------------
+
+    @classmethod
+    def from_rows(cls, data):
+        """
+        Create a FlatMatrix from a list of rows, like Matrix.data.
+
+        Args:
+            data (list[list[float]]): Matrix values.
+
+        Returns:
+            FlatMatrix: A new matrix with those values.
+        """
+        return cls(len(data), len(data[0]), [value for row in data for value in row])
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Create a FlatMatrix with the size and values of a Matrix.
+
+        Args:
+            matrix (Matrix): Matrix to copy.
+
+        Returns:
+            FlatMatrix: A new matrix with those values.
+        """
+        return cls.from_rows(matrix.data)
+
+    @classmethod
+    def identity(cls, size):
+        """
+        Create an identity matrix of given size.
+
+        Args:
+            size (int): Number of rows and columns. Must be >= 1.
+
+        Returns:
+            FlatMatrix: Identity matrix of shape size x size.
+        """
+        if size < 1:
+            raise ValueError("Size must be at least 1")
+        matrix = cls(size, size)
+        matrix.set_identity()
+        return matrix
+
+    def to_rows(self):
+        """
+        Returns:
+            list[list[float]]: The values as a list of rows, like Matrix.data.
+        """
+        columns = self.columns
+        return [list(self.values[r * columns:(r + 1) * columns]) for r in range(self.rows)]
+
+    def to_matrix(self):
+        """
+        Returns:
+            Matrix: A Matrix with the same size and values.
+        """
+        return Matrix(self.shape, self.to_rows())
+
+    @property
+    def shape(self):
+        """Shape: The size as a Matrix Shape, with x_size columns and y_size rows."""
+        return Shape(self.columns, self.rows)
+
+    def __repr__(self):
+        return self.to_matrix().pretty()
+
+    def __str__(self):
+        return self.to_matrix().pretty()
+
+    def __eq__(self, other):
+        if not isinstance(other, FlatMatrix):
+            return NotImplemented
+        return self.rows == other.rows and self.columns == other.columns and self.values == other.values
+
+    # -------------------------------
+    # Data Manipulation
+    # -------------------------------
+
+    def is_square(self):
+        return self.rows == self.columns
+
+    def is_same_shape_as(self, other):
+        return self.rows == other.rows and self.columns == other.columns
+
+    def fill_with(self, value):
+        """
+        Set every element to a value.
+
+        Args:
+            value (float): Value to fill the matrix with.
+        """
+        values = self.values
+        for i in range(len(values)):
+            values[i] = value
+
+    def clear(self):
+        """Set all elements of the matrix to zero."""
+        self.fill_with(0.0)
+
+    def set_identity(self):
+        """Set a square matrix to the identity."""
+        if not self.is_square():
+            raise ValueError("Matrix must be square")
+        self.clear()
+        for i in range(0, self.rows * self.columns, self.columns + 1):
+            self.values[i] = 1.0
+
+    def copy(self):
+        """Return a copy of the matrix."""
+        return FlatMatrix(self.rows, self.columns, self.values)
+
+    def copy_from(self, other):
+        """
+        Overwrite this matrix with the values of another matrix of the same shape.
+
+        Args:
+            other (FlatMatrix): Matrix to copy from.
+
+        Returns:
+            FlatMatrix: This matrix.
+        """
+        if not self.is_same_shape_as(other):
+            raise ValueError("Shape mismatch")
+        values = self.values
+        other_values = other.values
+        for i in range(len(values)):
+            values[i] = other_values[i]
+        return self
+
+    # -------------------------------
+    # Element Access
+    # -------------------------------
+
+    def set_at(self, position, value):
+        """
+        Set a value at a specific row and column.
+
+        Args:
+            position (tuple[int, int]): (row, column) index.
+            value (float): Value to set.
+        """
+        row_number, column_number = position
+        self.values[row_number * self.columns + column_number] = value
+
+    def get_at(self, position):
+        """
+        Get a value at a specific row and column.
+
+        Args:
+            position (tuple[int, int]): (row, column) index.
+
+        Returns:
+            float: Value at the specified position.
+        """
+        row_number, column_number = position
+        return self.values[row_number * self.columns + column_number]
+
+    # -------------------------------
+    # In-place Arithmetic
+    # -------------------------------
+
+    def iadd(self, other):
+        """
+        Add another matrix of the same shape to this one.
+
+        Returns:
+            FlatMatrix: This matrix.
+        """
+        if not self.is_same_shape_as(other):
+            raise ValueError("Shape mismatch")
+        values = self.values
+        other_values = other.values
+        for i in range(len(values)):
+            values[i] += other_values[i]
+        return self
+
+    def isub(self, other):
+        """
+        Subtract another matrix of the same shape from this one.
+
+        Returns:
+            FlatMatrix: This matrix.
+        """
+        if not self.is_same_shape_as(other):
+            raise ValueError("Shape mismatch")
+        values = self.values
+        other_values = other.values
+        for i in range(len(values)):
+            values[i] -= other_values[i]
+        return self
+
+    def iscale(self, scalar):
+        """
+        Multiply every element by a scalar.
+
+        Returns:
+            FlatMatrix: This matrix.
+        """
+        values = self.values
+        for i in range(len(values)):
+            values[i] *= scalar
+        return self
+
+    def add_into(self, other, out):
+        """
+        Write self + other into out. Out may be one of the inputs.
+
+        Returns:
+            FlatMatrix: out
+        """
+        if not self.is_same_shape_as(other) or not self.is_same_shape_as(out):
+            raise ValueError("Shape mismatch")
+        a = self.values
+        b = other.values
+        result = out.values
+        for i in range(len(result)):
+            result[i] = a[i] + b[i]
+        return out
+
+    def sub_into(self, other, out):
+        """
+        Write self - other into out. Out may be one of the inputs.
+
+        Returns:
+            FlatMatrix: out
+        """
+        if not self.is_same_shape_as(other) or not self.is_same_shape_as(out):
+            raise ValueError("Shape mismatch")
+        a = self.values
+        b = other.values
+        result = out.values
+        for i in range(len(result)):
+            result[i] = a[i] - b[i]
+        return out
+
+    def _row_views(self):
+        # Views of each row, made once, so products can zip over rows without copying them
+        if self._rows is None:
+            view = memoryview(self.values)
+            columns = self.columns
+            self._rows = [view[r * columns:(r + 1) * columns] for r in range(self.rows)]
+        return self._rows
+
+    def matmul_into(self, other, out):
+        """
+        Write the matrix product self * other into out.
+
+        Each column of other is gathered into a scratch array kept by out, so repeated products
+        into the same out matrix do not allocate.
+
+        Args:
+            other (FlatMatrix): Right-hand matrix, with as many rows as self has columns.
+            out (FlatMatrix): Result matrix, with self's rows and other's columns. Must not be self or other.
+
+        Returns:
+            FlatMatrix: out
+        """
+        if self.columns != other.rows:
+            raise ValueError("Matrix size mismatch for multiplication")
+        if out.rows != self.rows or out.columns != other.columns:
+            raise ValueError("Output shape mismatch")
+        if out is self or out is other:
+            raise ValueError("Output must not be an input of the multiplication")
+
+        inner = self.columns
+        if out._column is None or len(out._column) != inner:
+            out._column = [0.0] * inner
+        column = out._column
+        b = other.values
+        result = out.values
+        rows = self._row_views()
+        columns = other.columns
+        for j in range(columns):
+            index = j
+            for k in range(inner):
+                column[k] = b[index]
+                index += columns
+            # Same plain loop and order of additions as Matrix.__mul__, so the sums are identical. A loop over
+            # range, which MicroPython compiles without allocating, instead of a generator and zip
+            out_index = j
+            for row in rows:
+                total = 0.0
+                for k in range(inner):
+                    total += row[k] * column[k]
+                result[out_index] = total
+                out_index += columns
+        return out
+
+    def matmul_transpose_into(self, other, out):
+        """
+        Write self * other^T into out without forming the transpose, for products like F P F^T.
+
+        Args:
+            other (FlatMatrix): Matrix with as many columns as self.
+            out (FlatMatrix): Result matrix, with self's rows and other's rows. Must not be self or other.
+
+        Returns:
+            FlatMatrix: out
+        """
+        if self.columns != other.columns:
+            raise ValueError("Matrix size mismatch for multiplication")
+        if out.rows != self.rows or out.columns != other.rows:
+            raise ValueError("Output shape mismatch")
+        if out is self or out is other:
+            raise ValueError("Output must not be an input of the multiplication")
+
+        result = out.values
+        other_rows = other._row_views()
+        inner = self.columns
+        out_index = 0
+        for row in self._row_views():
+            for other_row in other_rows:
+                total = 0.0
+                for k in range(inner):
+                    total += row[k] * other_row[k]
+                result[out_index] = total
+                out_index += 1
+        return out
+
+    def transpose_into(self, out):
+        """
+        Write the transpose of this matrix into out.
+
+        Args:
+            out (FlatMatrix): Result matrix, with self's columns as rows. Must not be self.
+
+        Returns:
+            FlatMatrix: out
+        """
+        if out.rows != self.columns or out.columns != self.rows:
+            raise ValueError("Output shape mismatch")
+        if out is self:
+            raise ValueError("Output must not be the matrix being transposed")
+        values = self.values
+        result = out.values
+        rows = self.rows
+        index = 0
+        for r in range(rows):
+            out_index = r
+            for _ in range(self.columns):
+                result[out_index] = values[index]
+                index += 1
+                out_index += rows
+        return out
+
+    # -------------------------------
+    # Allocating Operators
+    # -------------------------------
+
+    def __iadd__(self, other):
+        return self.iadd(other)
+
+    def __isub__(self, other):
+        return self.isub(other)
+
+    def __add__(self, other):
+        return self.add_into(other, FlatMatrix(self.rows, self.columns))
+
+    def __sub__(self, other):
+        return self.sub_into(other, FlatMatrix(self.rows, self.columns))
+
+    def __mul__(self, other):
+        if isinstance(other, FlatMatrix):
+            return self.matmul_into(other, FlatMatrix(self.rows, other.columns))
+        if isinstance(other, (int, float)):
+            return self.copy().iscale(other)
+        raise TypeError("Unsupported operand for multiplication")
+
+    def transpose(self):
+        """
+        Return the transposed matrix (rows and columns swapped).
+        """
+        return self.transpose_into(FlatMatrix(self.columns, self.rows))
@@ -252,16 +252,30 @@ class Matrix:
         if isinstance(other, (list, tuple)):
             if len(other) != self.shape.x_size:
                 raise ValueError("Vector length mismatch")
-            return [sum(a * b for a, b in zip(row, other)) for row in self.data]
+            result = []
+            for row in self.data:
+                total = 0.0
+                for k in range(len(other)):
+                    total += row[k] * other[k]
+                result.append(total)
+            return result
         if isinstance(other, Matrix):
             if self.shape.x_size != other.shape.y_size:
                 raise ValueError("Matrix size mismatch for multiplication")
 
-            result = [
-                [sum(self.data[i][k] * other.data[k][j] for k in range(self.shape.x_size))
-                 for j in range(other.shape.x_size)]
-                for i in range(self.shape.y_size)
-            ]
+            # Plain left to right sums rather than sum(), which compensates float sums on newer
+            # CPython, so products agree bit for bit with FlatMatrix and with MicroPython
+            inner = self.shape.x_size
+            other_data = other.data
+            result = []
+            for row in self.data:
+                result_row = []
+                for j in range(other.shape.x_size):
+                    total = 0.0
+                    for k in range(inner):
+                        total += row[k] * other_data[k][j]
+                    result_row.append(total)
+                result.append(result_row)
             return Matrix(Shape(other.shape.x_size, self.shape.y_size), result)
         elif isinstance(other, (int, float)):
             return Matrix(self.shape, [[x * other for x in row] for row in self.data])
@@ -414,6 +428,24 @@ class Matrix:
 
         return Matrix(Shape(n, n), I)
 
+    def solve(self, b, symmetric=False):
+        """
+        Solve self * x = b for x, which is cheaper and more accurate than multiplying by the inverse.
+
+        Args:
+            b (list[float] | Matrix): A vector, or a Matrix whose columns are each solved for.
+            symmetric (bool): Whether the matrix is symmetric positive definite, to use a Cholesky decomposition.
+
+        Returns:
+            list[float] | Matrix: x, the same type as b.
+
+        Raises:
+            ValueError: If the matrix is not square or is singular.
+        """
+        # Imported here because the decompositions are built on Matrix
+        from VEXLib.Math.MatrixDecomposition import solve
+        return solve(self, b, symmetric)
+
     def jacobian(self, func, epsilon=1e-6):
         """
         Compute the Jacobian matrix of a vector-valued function at the current matrix treated as a vector.
@@ -0,0 +1,295 @@
+import math
+
+from VEXLib.Math.Matrix import Matrix, Shape
+
+
+def _square_rows(matrix):
+    if not matrix.is_square():
+        raise ValueError("Matrix must be square")
+    return matrix.data, matrix.shape.x_size
+
+
+def _right_hand_side_columns(b, n):
+    """
+    Split a right-hand side into columns.
+
+    Returns:
+        tuple: (list of columns, whether b was a Matrix)
+    """
+    if isinstance(b, Matrix):
+        if b.shape.y_size != n:
+            raise ValueError("Right-hand side rows mismatch")
+        return [[row[c] for row in b.data] for c in range(b.shape.x_size)], True
+    if isinstance(b, (list, tuple)):
+        if len(b) != n:
+            raise ValueError("Vector length mismatch")
+        return [list(b)], False
+    raise TypeError("Right-hand side must be a list/tuple or Matrix")
+
+
+def _join_columns(columns, as_matrix):
+    if not as_matrix:
+        return columns[0]
+    n = len(columns[0])
+    return Matrix(Shape(len(columns), n), [[column[r] for column in columns] for r in range(n)])
+
+
+class LUDecomposition:
+    """
+    LU decomposition with partial pivoting, P A = L U, of a square matrix.
+
+    Factoring costs about n^3 / 3 multiplications, and each solve with the factors costs n^2, so
+    keeping the factorization and solving is much cheaper than forming the inverse, and more
+    accurate. Call factor again to reuse the storage for a new matrix of the same size.
+
+    Attributes:
+        size (int): Number of rows and columns.
+        lu (list[list[float]]): U on and above the diagonal, and L below it with an implicit unit diagonal.
+        pivots (list[int]): Row of the original matrix that ended up in each row of the factors.
+    """
+
+    def __init__(self, matrix):
+        """
+        Args:
+            matrix (Matrix): Square matrix to factor.
+
+        Raises:
+            ValueError: If the matrix is not square or is singular.
+        """
+        self.size = 0
+        self.lu = []
+        self.pivots = []
+        self.factor(matrix)
+
+    def factor(self, matrix):
+        """
+        Factor a new matrix, reusing the existing storage if it is the same size.
+
+        Args:
+            matrix (Matrix): Square matrix to factor.
+
+        Raises:
+            ValueError: If the matrix is not square or is singular.
+        """
+        data, n = _square_rows(matrix)
+        if n != self.size:
+            self.size = n
+            self.lu = [[0.0] * n for _ in range(n)]
+            self.pivots = [0] * n
+        lu = self.lu
+        pivots = self.pivots
+        for i in range(n):
+            lu[i][:] = data[i]
+            pivots[i] = i
+        self._swaps = 0
+
+        for k in range(n):
+            pivot = k
+            largest = abs(lu[k][k])
+            for i in range(k + 1, n):
+                if abs(lu[i][k]) > largest:
+                    largest = abs(lu[i][k])
+                    pivot = i
+            if largest == 0:
+                raise ValueError("Matrix is singular")
+            if pivot != k:
+                lu[k], lu[pivot] = lu[pivot], lu[k]
+                pivots[k], pivots[pivot] = pivots[pivot], pivots[k]
+                self._swaps += 1
+
+            pivot_row = lu[k]
+            pivot_value = pivot_row[k]
+            for i in range(k + 1, n):
+                row = lu[i]
+                factor = row[k] / pivot_value
+                row[k] = factor
+                if factor != 0:
+                    for j in range(k + 1, n):
+                        row[j] -= factor * pivot_row[j]
+
+    def _solve_column(self, b):
+        lu = self.lu
+        n = self.size
+        x = [b[p] for p in self.pivots]
+        # Forward substitution with the unit lower triangle
+        for i in range(1, n):
+            row = lu[i]
+            total = x[i]
+            for j in range(i):
+                total -= row[j] * x[j]
+            x[i] = total
+        # Back substitution with the upper triangle
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            total = x[i]
+            for j in range(i + 1, n):
+                total -= row[j] * x[j]
+            x[i] = total / row[i]
+        return x
+
+    def solve(self, b):
+        """
+        Solve A x = b for x.
+
+        Args:
+            b (list[float] | Matrix): A vector, or a Matrix whose columns are each solved for.
+
+        Returns:
+            list[float] | Matrix: x, the same type as b.
+        """
+        columns, as_matrix = _right_hand_side_columns(b, self.size)
+        return _join_columns([self._solve_column(column) for column in columns], as_matrix)
+
+    def determinant(self):
+        """
+        Returns:
+            float: The determinant of the factored matrix.
+        """
+        det = -1.0 if self._swaps % 2 else 1.0
+        for i in range(self.size):
+            det *= self.lu[i][i]
+        return det
+
+    def inverse(self):
+        """
+        Returns:
+            Matrix: The inverse of the factored matrix. Prefer solve when the inverse is only multiplied by something.
+        """
+        return self.solve(Matrix.identity(self.size))
+
+
+class CholeskyDecomposition:
+    """
+    Cholesky decomposition, A = L L^T, of a symmetric positive-definite matrix such as a covariance.
+
+    Takes half the work of LU and needs no pivoting. Only the lower triangle of the matrix is read.
+    Factoring fails for matrices that are not positive definite, which makes it a cheap check that a
+    covariance is still valid. Call factor again to reuse the storage for a new matrix of the same size.
+
+    Attributes:
+        size (int): Number of rows and columns.
+        lower (list[list[float]]): L, with zeros above the diagonal.
+    """
+
+    def __init__(self, matrix):
+        """
+        Args:
+            matrix (Matrix): Symmetric positive-definite matrix to factor.
+
+        Raises:
+            ValueError: If the matrix is not square or not positive definite.
+        """
+        self.size = 0
+        self.lower = []
+        self.factor(matrix)
+
+    def factor(self, matrix):
+        """
+        Factor a new matrix, reusing the existing storage if it is the same size.
+
+        Args:
+            matrix (Matrix): Symmetric positive-definite matrix to factor.
+
+        Raises:
+            ValueError: If the matrix is not square or not positive definite.
+        """
+        data, n = _square_rows(matrix)
+        if n != self.size:
+            self.size = n
+            self.lower = [[0.0] * n for _ in range(n)]
+        lower = self.lower
+
+        for j in range(n):
+            row_j = lower[j]
+            total = data[j][j]
+            for k in range(j):
+                total -= row_j[k] * row_j[k]
+            if total <= 0:
+                raise ValueError("Matrix is not positive definite")
+            diagonal = math.sqrt(total)
+            row_j[j] = diagonal
+            for k in range(j + 1, n):
+                row_j[k] = 0.0
+
+            for i in range(j + 1, n):
+                row_i = lower[i]
+                total = data[i][j]
+                for k in range(j):
+                    total -= row_i[k] * row_j[k]
+                row_i[j] = total / diagonal
+
+    def _solve_column(self, b):
+        lower = self.lower
+        n = self.size
+        x = list(b)
+        # Forward substitution with L
+        for i in range(n):
+            row = lower[i]
+            total = x[i]
+            for j in range(i):
+                total -= row[j] * x[j]
+            x[i] = total / row[i]
+        # Back substitution with L^T
+        for i in range(n - 1, -1, -1):
+            total = x[i]
+            for j in range(i + 1, n):
+                total -= lower[j][i] * x[j]
+            x[i] = total / lower[i][i]
+        return x
+
+    def solve(self, b):
+        """
+        Solve A x = b for x.
+
+        Args:
+            b (list[float] | Matrix): A vector, or a Matrix whose columns are each solved for.
+
+        Returns:
+            list[float] | Matrix: x, the same type as b.
+        """
+        columns, as_matrix = _right_hand_side_columns(b, self.size)
+        return _join_columns([self._solve_column(column) for column in columns], as_matrix)
+
+    def determinant(self):
+        """
+        Returns:
+            float: The determinant of the factored matrix.
+        """
+        det = 1.0
+        for i in range(self.size):
+            det *= self.lower[i][i]
+        return det * det
+
+    def log_determinant(self):
+        """
+        Returns:
+            float: The natural log of the determinant, which does not overflow for large covariances.
+        """
+        return 2 * sum(math.log(self.lower[i][i]) for i in range(self.size))
+
+    def inverse(self):
+        """
+        Returns:
+            Matrix: The inverse of the factored matrix. Prefer solve when the inverse is only multiplied by something.
+        """
+        return self.solve(Matrix.identity(self.size))
+
+
+def solve(a, b, symmetric=False):
+    """
+    Solve A x = b for x without forming the inverse of A.
+
+    Args:
+        a (Matrix): Square matrix.
+        b (list[float] | Matrix): A vector, or a Matrix whose columns are each solved for.
+        symmetric (bool): Whether A is symmetric positive definite, to use the cheaper Cholesky decomposition.
+
+    Returns:
+        list[float] | Matrix: x, the same type as b.
+
+    Raises:
+        ValueError: If A is singular, or not positive definite when symmetric is True.
+    """
+    if symmetric:
+        return CholeskyDecomposition(a).solve(b)
+    return LUDecomposition(a).solve(b)
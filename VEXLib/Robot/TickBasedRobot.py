@@ -1,9 +1,14 @@
 from vex import *
 import VEXLib.Util.time as time
+from VEXLib.Units import Units
 from VEXLib.Util import pass_function
+from VEXLib.Util.Logging import Logger
 from VEXLib.Robot.Constants import DRIVER_CONTROL, AUTONOMOUS_CONTROL, TARGET_TICK_DURATION_MS, \
     WARNING_TICK_DURATION_MS, ENABLED, DISABLED
 from VEXLib.Robot.RobotBase import RobotBase
+from VEXLib.Robot.TickPacer import TickPacer
+from VEXLib.Robot.TickProfiler import TickProfiler, PHASE_DRIVER_CONTROL_PERIODIC, PHASE_AUTONOMOUS_PERIODIC, \
+    PHASE_ENABLED_PERIODIC, PHASE_DISABLED_PERIODIC, PHASE_PERIODIC
 from collections import namedtuple
 
 GameState = namedtuple('GameState', ['mode', 'enabled'])
@@ -19,7 +24,13 @@ class TickBasedRobot(RobotBase):
     Combines a tick-based control system with state transitions for driver and autonomous control.
     """
 
-    def __init__(self, brain: Brain):
+    def __init__(self, brain: Brain, logger=None):
+        """
+        Args:
+            brain: The robot's brain
+            logger: The Logger the tick profile summary is written to when the robot is disabled,
+                defaults to a binlog at logs/tick_profile
+        """
         super().__init__(brain)
 
         self.autonomous_thread = Thread(pass_function)
@@ -33,9 +44,10 @@ class TickBasedRobot(RobotBase):
                             }
 
         # Tick-based control variables
-        self.next_tick_time = time.time_ms() + 1
         self._target_tick_duration_ms = TARGET_TICK_DURATION_MS
         self._warning_tick_duration_ms = WARNING_TICK_DURATION_MS
+        # Sleeps until each tick instead of busy-waiting, replace it in on_setup to change the catch up policy
+        self.tick_pacer = TickPacer(self._target_tick_duration_ms)
 
         self.restart_requested = False
 
@@ -44,6 +56,13 @@ class TickBasedRobot(RobotBase):
         self._current_time = time.time_ms()
         self._last_tick_time = time.time_ms()
 
+        self._phase_start_time = time.time_us()
+
+        if logger is None:
+            logger = Logger("logs/tick_profile")
+        # Per-phase tick timing, a summary is exported to the logger every time the robot is disabled
+        self.tick_profiler = TickProfiler(self._target_tick_duration_ms, logger=logger)
+
     def _on_autonomous_internal(self):
         self.autonomous_thread = Thread(self.on_autonomous)
 
@@ -55,6 +74,7 @@ class TickBasedRobot(RobotBase):
 
     def start(self):
         self.on_setup()
+        self.tick_pacer.reset()
         self._mainloop()
 
     def trigger_restart(self):
@@ -90,36 +110,38 @@ class TickBasedRobot(RobotBase):
 
     def _handle_periodic_callbacks(self):
         print("TW")
-        while True:
-            now = time.time_ms()
-            print("NOW:" + str(now))
-            print("NEXT:" + str(self.next_tick_time))
-            if now >= self.next_tick_time:
-                break
+        lateness_ms = Units.microseconds_to_milliseconds(self.tick_pacer.wait())
+        overran = lateness_ms > self._warning_tick_duration_ms - self._target_tick_duration_ms
+        self._phase_start_time = self.tick_profiler.start_tick(lateness_ms, overran)
         print("CL")
         self.control_loop()
+        self.tick_profiler.end_tick()
         print("PANIC_CHECK")
-        if now > self.next_tick_time + (self._warning_tick_duration_ms - self._target_tick_duration_ms):
-            time_overrun = now - self.next_tick_time
-            print("PANIC: Scheduler tick overran target period by " + str(time_overrun) + " ms")
-        print("INC")
-        self.next_tick_time += self._target_tick_duration_ms
+        if overran:
+            print("PANIC: Scheduler tick overran target period by " + str(lateness_ms) + " ms")
 
     def _handle_periodic_callbacks_internal(self):
+        profiler = self.tick_profiler
+        phase_start_time = self._phase_start_time
         if self.state.enabled:
             if self.state.mode == DRIVER_CONTROL:
                 print("DCP")
                 self.driver_control_periodic()
+                phase_start_time = profiler.record(PHASE_DRIVER_CONTROL_PERIODIC, phase_start_time)
             elif self.state.mode == AUTONOMOUS_CONTROL:
                 print("ACP")
                 self.autonomous_periodic()
+                phase_start_time = profiler.record(PHASE_AUTONOMOUS_PERIODIC, phase_start_time)
             print("EP")
             self.enabled_periodic()
+            phase_start_time = profiler.record(PHASE_ENABLED_PERIODIC, phase_start_time)
         else:
             print("DP")
             self.disabled_periodic()
+            phase_start_time = profiler.record(PHASE_DISABLED_PERIODIC, phase_start_time)
         print("P")
         self.periodic()
+        profiler.record(PHASE_PERIODIC, phase_start_time)
         print("NT")
         self._last_tick_time = time.time_ms()
 
@@ -132,6 +154,9 @@ class TickBasedRobot(RobotBase):
             self.on_enable()
         else:
             self.on_disable()
+            if self.state.enabled:
+                self.tick_profiler.export()
+                self.tick_profiler.reset()
 
         # The inspection doesn't seem to understand that this is a function pulled from a dictionary
         # noinspection PyArgumentList
@@ -0,0 +1,89 @@
+import VEXLib.Util.time as time
+
+# Late ticks run immediately one after another until the schedule is caught up
+CATCH_UP_BACK_TO_BACK = "back_to_back"
+# Late ticks run at a reduced minimum spacing until the schedule is caught up
+CATCH_UP_COMPRESS = "compress"
+# Missed ticks are dropped and the next tick waits for the next slot on the original schedule
+CATCH_UP_SKIP = "skip"
+
+CATCH_UP_POLICIES = (CATCH_UP_BACK_TO_BACK, CATCH_UP_COMPRESS, CATCH_UP_SKIP)
+
+
+class TickPacer:
+    """
+    Paces a fixed-period loop by sleeping for most of the time until the next tick and only
+    spinning on the clock for the last fraction of a millisecond.
+
+    Sleeping yields the CPU to other threads (autonomous routines, logging) instead of burning the
+    whole slice polling the clock, while the final short spin keeps the tick start precise.
+
+    Attributes:
+        skipped_ticks: The number of ticks dropped by the CATCH_UP_SKIP policy
+        late_ticks: The number of ticks that started at least one full period late
+    """
+
+    def __init__(self, period_ms, catch_up_policy=CATCH_UP_BACK_TO_BACK, spin_us=500, compress_ratio=0.5):
+        """
+        Args:
+            period_ms: The target time between ticks in milliseconds
+            catch_up_policy: One of CATCH_UP_BACK_TO_BACK, CATCH_UP_COMPRESS or CATCH_UP_SKIP
+            spin_us: How long before the tick to stop sleeping and spin on the clock instead
+            compress_ratio: For CATCH_UP_COMPRESS, the fraction of the period late ticks are spaced by
+        """
+        if catch_up_policy not in CATCH_UP_POLICIES:
+            raise ValueError("Invalid catch up policy: " + str(catch_up_policy))
+
+        self.period_us = int(period_ms * 1000)
+        self.catch_up_policy = catch_up_policy
+        self.spin_us = spin_us
+        self.min_spacing_us = int(self.period_us * compress_ratio)
+
+        self.skipped_ticks = 0
+        self.late_ticks = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Restart the schedule so the next tick is one period from now.
+        """
+        now = time.time_us()
+        self.next_tick_us = time.time_add_us(now, self.period_us)
+        self._last_tick_us = now
+
+    def time_until_next_tick_us(self):
+        return time.time_diff_us(self.next_tick_us, time.time_us())
+
+    def wait(self):
+        """
+        Block until the next tick is due and advance the schedule according to the catch up policy.
+
+        Returns:
+            How late the tick started relative to its scheduled time, in microseconds
+        """
+        target = self.next_tick_us
+        if self.catch_up_policy == CATCH_UP_COMPRESS:
+            earliest = time.time_add_us(self._last_tick_us, self.min_spacing_us)
+            if time.time_diff_us(earliest, target) > 0:
+                target = earliest
+
+        remaining = time.time_diff_us(target, time.time_us())
+        if remaining > self.spin_us:
+            time.sleep_us(remaining - self.spin_us)
+
+        now = time.time_us()
+        while time.time_diff_us(target, now) > 0:
+            now = time.time_us()
+
+        lateness = time.time_diff_us(now, self.next_tick_us)
+        self._last_tick_us = now
+        self.next_tick_us = time.time_add_us(self.next_tick_us, self.period_us)
+
+        if lateness >= self.period_us:
+            self.late_ticks += 1
+            if self.catch_up_policy == CATCH_UP_SKIP:
+                missed = lateness // self.period_us
+                self.next_tick_us = time.time_add_us(self.next_tick_us, missed * self.period_us)
+                self.skipped_ticks += missed
+
+        return lateness
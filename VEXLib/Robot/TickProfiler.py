@@ -0,0 +1,205 @@
+from array import array
+
+import VEXLib.Util.time as time
+
+PHASE_DRIVER_CONTROL_PERIODIC = 0
+PHASE_AUTONOMOUS_PERIODIC = 1
+PHASE_ENABLED_PERIODIC = 2
+PHASE_DISABLED_PERIODIC = 3
+PHASE_PERIODIC = 4
+PHASE_TICK = 5
+
+PHASE_NAMES = (
+    "driver_control_periodic",
+    "autonomous_periodic",
+    "enabled_periodic",
+    "disabled_periodic",
+    "periodic",
+    "tick",
+)
+
+
+class TickProfiler:
+    """
+    Records how long each phase of a scheduler tick takes and how late each tick starts.
+
+    Every phase keeps its most recent durations in a fixed-size ring buffer along with running
+    totals, so recording a sample never allocates. Tick start lateness is collected into a fixed
+    histogram and the deviation of the measured tick period from the target period is tracked as
+    jitter statistics.
+
+    Attributes:
+        logger: A VEXLib.Util.Logging.Logger that export writes the summary to, or None
+    """
+
+    def __init__(self, target_period_ms, history_length=128, histogram_bin_ms=1, histogram_bins=16, logger=None):
+        """
+        Args:
+            target_period_ms: The scheduled time between ticks in milliseconds
+            history_length: The number of recent samples kept per phase
+            histogram_bin_ms: The width of each lateness histogram bin in milliseconds
+            histogram_bins: The number of lateness histogram bins, the last bin collects everything later
+            logger: A Logger that export writes the summary to
+        """
+        self.target_period_us = int(target_period_ms * 1000)
+        self.history_length = history_length
+        self.histogram_bin_ms = histogram_bin_ms
+        self.histogram_bins = histogram_bins
+        self.logger = logger
+
+        phase_count = len(PHASE_NAMES)
+        self._history = [array("l", [0] * history_length) for _ in range(phase_count)]
+        self._history_index = array("l", [0] * phase_count)
+        self.counts = array("l", [0] * phase_count)
+        self.totals_us = array("d", [0] * phase_count)
+        self.max_us = array("l", [0] * phase_count)
+        self.lateness_histogram = array("l", [0] * histogram_bins)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all recorded statistics.
+        """
+        for phase in range(len(PHASE_NAMES)):
+            self._history_index[phase] = 0
+            self.counts[phase] = 0
+            self.totals_us[phase] = 0
+            self.max_us[phase] = 0
+        for i in range(self.histogram_bins):
+            self.lateness_histogram[i] = 0
+
+        self.overruns = 0
+        self.max_lateness_ms = 0
+
+        self._last_tick_start_us = None
+        self._tick_start_us = 0
+        # Welford's running mean and variance of (measured period - target period)
+        self.jitter_count = 0
+        self._jitter_mean = 0.0
+        self._jitter_m2 = 0.0
+        self.max_jitter_us = 0
+
+    def start_tick(self, lateness_ms, overran=False):
+        """
+        Mark the start of a tick.
+
+        Args:
+            lateness_ms: How long after its scheduled time the tick started
+            overran: Whether the scheduler considered this tick an overrun
+
+        Returns:
+            The current time from time.time_us, to pass to the first record call
+        """
+        now = time.time_us()
+        self._tick_start_us = now
+
+        if lateness_ms < 0:
+            lateness_ms = 0
+        bin_index = int(lateness_ms // self.histogram_bin_ms)
+        if bin_index >= self.histogram_bins:
+            bin_index = self.histogram_bins - 1
+        self.lateness_histogram[bin_index] += 1
+        if lateness_ms > self.max_lateness_ms:
+            self.max_lateness_ms = lateness_ms
+        if overran:
+            self.overruns += 1
+
+        if self._last_tick_start_us is not None:
+            deviation = time.time_diff_us(now, self._last_tick_start_us) - self.target_period_us
+            self.jitter_count += 1
+            delta = deviation - self._jitter_mean
+            self._jitter_mean += delta / self.jitter_count
+            self._jitter_m2 += delta * (deviation - self._jitter_mean)
+            if abs(deviation) > self.max_jitter_us:
+                self.max_jitter_us = abs(deviation)
+        self._last_tick_start_us = now
+        return now
+
+    def record(self, phase, start_us):
+        """
+        Record the duration of a phase that started at start_us and ends now.
+
+        Args:
+            phase: One of the PHASE_* constants
+            start_us: The time the phase started, from time.time_us
+
+        Returns:
+            The current time, so consecutive phases can be chained without another clock read
+        """
+        now = time.time_us()
+        duration = time.time_diff_us(now, start_us)
+
+        index = self._history_index[phase]
+        self._history[phase][index] = duration
+        index += 1
+        self._history_index[phase] = 0 if index >= self.history_length else index
+
+        self.counts[phase] += 1
+        self.totals_us[phase] += duration
+        if duration > self.max_us[phase]:
+            self.max_us[phase] = duration
+        return now
+
+    def end_tick(self):
+        """
+        Mark the end of a tick, recording the total duration of the tick.
+        """
+        self.record(PHASE_TICK, self._tick_start_us)
+
+    def recent(self, phase):
+        """
+        Get the recorded durations of a phase in the ring buffer, oldest first.
+
+        Args:
+            phase: One of the PHASE_* constants
+
+        Returns:
+            list: Durations in microseconds
+        """
+        count = min(self.counts[phase], self.history_length)
+        if count < self.history_length:
+            return list(self._history[phase][:count])
+        index = self._history_index[phase]
+        history = self._history[phase]
+        return list(history[index:]) + list(history[:index])
+
+    def jitter_standard_deviation_us(self):
+        if self.jitter_count < 2:
+            return 0.0
+        return (self._jitter_m2 / (self.jitter_count - 1)) ** 0.5
+
+    def summary(self):
+        """
+        Returns:
+            dict: Per phase mean, max and recent max durations, the lateness histogram and jitter statistics
+        """
+        phases = {}
+        for phase, name in enumerate(PHASE_NAMES):
+            count = self.counts[phase]
+            if not count:
+                continue
+            phases[name] = {
+                "count": count,
+                "mean_us": self.totals_us[phase] / count,
+                "max_us": self.max_us[phase],
+                "recent_max_us": max(self.recent(phase)),
+            }
+        return {
+            "phases": phases,
+            "overruns": self.overruns,
+            "max_lateness_ms": self.max_lateness_ms,
+            "lateness_histogram_bin_ms": self.histogram_bin_ms,
+            "lateness_histogram": list(self.lateness_histogram),
+            "jitter_mean_us": self._jitter_mean,
+            "jitter_standard_deviation_us": self.jitter_standard_deviation_us(),
+            "max_jitter_us": self.max_jitter_us,
+        }
+
+    def export(self):
+        """
+        Write the summary to the logger, if one is set, and flush it.
+        """
+        if self.logger is None:
+            return
+        self.logger.log_vars({"tick_profile": self.summary()})
+        self.logger.flush_logs()
@@ -57,6 +57,7 @@ class InputProcessor:
         In this case the InputProcessor is used to take input from the controller (along one axis from -1 to 1) and apply functions like deadzoning, tunable cubic filtering, and
         """
         self.pipeline = []
+        self.stick_pipeline = []
 
     def add_step(self, function):
         """
@@ -66,6 +67,15 @@ class InputProcessor:
         """
         self.pipeline.append(function)
 
+    def add_stick_step(self, function):
+        """
+        Add a processing step that needs both axes of a stick, like joystick calibration.
+        Stick steps run before the single axis steps.
+        Args:
+             function: A callable function that takes the x and y inputs and returns the processed (x, y) tuple.
+        """
+        self.stick_pipeline.append(function)
+
     def process(self, input_value):
         """
         Process the input through the pipeline.
@@ -78,6 +88,19 @@ class InputProcessor:
             input_value = step(input_value)
         return input_value
 
+    def process_stick(self, x, y):
+        """
+        Process both axes of a stick through the stick steps, then each axis through the pipeline.
+        Args:
+            x: The initial X input value.
+            y: The initial Y input value.
+        Returns
+            output (tuple): The processed (x, y) values.
+        """
+        for step in self.stick_pipeline:
+            x, y = step(x, y)
+        return self.process(x), self.process(y)
+
 
 class Controller(vex.Controller):
     def __init__(self, controller_type=vex.ControllerType.PRIMARY):
@@ -103,6 +126,14 @@ class Controller(vex.Controller):
         """
         self.input_processor.add_step(lambda x: cubic_filter(x, linearity))
 
+    def add_calibration_step(self, calibration):
+        """Adds a joystick calibration step to the input processor pipeline, it runs before all single axis steps and applies to both sticks
+
+        Args:
+            calibration (JoystickCalibration): The calibration to apply, for example JoystickCalibration.load_from_file()
+        """
+        self.input_processor.add_stick_step(calibration.normalize)
+
     @staticmethod
     def _get_raw_axis_value(axis):
         """
@@ -125,12 +156,35 @@ class Controller(vex.Controller):
         """
         return self.input_processor.process(self._get_raw_axis_value(axis))
 
+    def _get_processed_stick_position(self, x_axis, y_axis):
+        """
+        Get the processed position of a stick.
+
+        Args:
+            x_axis (vex.): The horizontal axis of the stick
+            y_axis (vex.): The vertical axis of the stick
+        """
+        return self.input_processor.process_stick(self._get_raw_axis_value(x_axis), self._get_raw_axis_value(y_axis))
+
+    def _get_processed_stick_value(self, x_axis, y_axis, index):
+        """
+        Get one processed axis of a stick, only reading the other axis when a stick step needs it.
+
+        Args:
+            x_axis (vex.): The horizontal axis of the stick
+            y_axis (vex.): The vertical axis of the stick
+            index (int): 0 for the X value, 1 for the Y value
+        """
+        if not self.input_processor.stick_pipeline:
+            return self._get_processed_axis_value(y_axis if index else x_axis)
+        return self._get_processed_stick_position(x_axis, y_axis)[index]
+
     # ----- Joystick Methods -----
     def left_stick_x(self):
         """
         Get the PROCESSED X-axis value of the left stick (horizontal movement, range -1 to +1 unless one of your InputProcessor steps scales it to a different range).
         """
-        return self._get_processed_axis_value(self.axis4)
+        return self._get_processed_stick_value(self.axis4, self.axis3, 0)
 
     def left_stick_x_raw(self):
         """
@@ -142,7 +196,7 @@ class Controller(vex.Controller):
         """
         Get the PROCESSED Y-axis value of the left stick (vertical movement, range -1 to +1 unless one of your InputProcessor steps scales it to a different range).
         """
-        return self._get_processed_axis_value(self.axis3)
+        return self._get_processed_stick_value(self.axis4, self.axis3, 1)
 
     def left_stick_y_raw(self):
         """
@@ -154,7 +208,7 @@ class Controller(vex.Controller):
         """
         Get the PROCESSED X-axis value of the right stick (horizontal movement, range -1 to +1 unless one of your InputProcessor steps scales it to a different range).
         """
-        return self._get_processed_axis_value(self.axis1)
+        return self._get_processed_stick_value(self.axis1, self.axis2, 0)
 
     def right_stick_x_raw(self):
         """
@@ -166,7 +220,7 @@ class Controller(vex.Controller):
         """
         Get the PROCESSED Y-axis value of the right stick (vertical movement, range -1 to +1 unless one of your InputProcessor steps scales it to a different range).
         """
-        return self._get_processed_axis_value(self.axis2)
+        return self._get_processed_stick_value(self.axis1, self.axis2, 1)
 
     def right_stick_y_raw(self):
         """
@@ -181,7 +235,7 @@ class Controller(vex.Controller):
         Returns:
             tuple: A tuple containing the processed X and Y values of the left stick.
         """
-        return self.left_stick_x(), self.left_stick_y()
+        return self._get_processed_stick_position(self.axis4, self.axis3)
 
     def left_stick_position_raw(self):
         """
@@ -199,7 +253,7 @@ class Controller(vex.Controller):
         Returns:
             tuple: A tuple containing the processed X and Y values of the right stick.
         """
-        return self.right_stick_x(), self.right_stick_y()
+        return self._get_processed_stick_position(self.axis1, self.axis2)
 
     def right_stick_position_raw(self):
         """
@@ -217,11 +271,13 @@ class Controller(vex.Controller):
         Returns:
             processed_values: A dictionary with processed left and right stick X/Y values.
         """
+        left_stick_x, left_stick_y = self.left_stick_position()
+        right_stick_x, right_stick_y = self.right_stick_position()
         return {
-            "left_stick_x": self.left_stick_x(),
-            "left_stick_y": self.left_stick_y(),
-            "right_stick_x": self.right_stick_x(),
-            "right_stick_y": self.right_stick_y(),
+            "left_stick_x": left_stick_x,
+            "left_stick_y": left_stick_y,
+            "right_stick_x": right_stick_x,
+            "right_stick_y": right_stick_y,
         }
 
     def stick_values_raw(self):
@@ -343,8 +399,9 @@ class Controller(vex.Controller):
             left_speed = self.left_stick_y()
             right_speed = self.right_stick_y()
         elif control_style == ControlStyles.ARCADE:
-            forward_speed = self.left_stick_y() * drive_speed
-            turn_speed = self.left_stick_x() * turn_speed
+            left_stick_x, left_stick_y = self.left_stick_position()
+            forward_speed = left_stick_y * drive_speed
+            turn_speed = left_stick_x * turn_speed
             left_speed = forward_speed + turn_speed
             right_speed = forward_speed - turn_speed
         elif control_style == ControlStyles.SPLIT_ARCADE:
@@ -0,0 +1,114 @@
+import math
+import struct
+from array import array
+
+CALIBRATION_RECORD_FORMAT = "ff"  # (r, theta) of one point on the rim of the stick's travel
+CALIBRATION_RECORD_LENGTH = struct.calcsize(CALIBRATION_RECORD_FORMAT)
+DEFAULT_CALIBRATION_FILE = "assets/calibration_coefficients.bin"
+# Evenly spaced angles in the lookup table, about as many as a calibration run records
+DEFAULT_BIN_COUNT = 512
+
+
+class JoystickCalibration:
+    """
+    Scales joystick positions so that pushing the stick against the edge of its travel gives a radius of 1 in
+    every direction, which corrects sticks whose travel is not a perfect circle (most have a squarish gate).
+
+    The calibration samples are resampled once into a table of the rim's radius at evenly spaced angles, so
+    normalizing a position only has to index the table by its angle and interpolate between two entries,
+    however many samples the calibration had.
+    """
+
+    def __init__(self, polar_coordinates, bin_count=DEFAULT_BIN_COUNT):
+        """
+        Args:
+            polar_coordinates (list[tuple[float, float]]): (r, theta) samples of the rim, theta in radians from -pi to pi, in any order.
+            bin_count (int): Number of evenly spaced angles in the lookup table.
+
+        Raises:
+            ValueError: If there are no samples.
+        """
+        if not polar_coordinates:
+            raise ValueError("A joystick calibration needs at least one sample")
+        samples = sorted(polar_coordinates, key=lambda sample: sample[1])
+        count = len(samples)
+        self.bin_count = bin_count
+        self.bins_per_radian = bin_count / (2 * math.pi)
+        # One extra entry repeats the first so interpolating in the last bin wraps around without a check
+        self.radii = array("f", [0.0] * (bin_count + 1))
+
+        # Walk the sorted samples alongside the table, wrapping the neighbours around at +-pi
+        next_index = 0
+        for i in range(bin_count):
+            angle = -math.pi + i / self.bins_per_radian
+            while next_index < count and samples[next_index][1] < angle:
+                next_index += 1
+            if next_index == 0:
+                r_1, theta_1 = samples[-1]
+                theta_1 -= 2 * math.pi
+            else:
+                r_1, theta_1 = samples[next_index - 1]
+            if next_index == count:
+                r_2, theta_2 = samples[0]
+                theta_2 += 2 * math.pi
+            else:
+                r_2, theta_2 = samples[next_index]
+
+            if theta_2 - theta_1 <= 0:
+                self.radii[i] = r_2
+            else:
+                self.radii[i] = r_1 + (r_2 - r_1) * (angle - theta_1) / (theta_2 - theta_1)
+        self.radii[bin_count] = self.radii[0]
+
+    @classmethod
+    def from_bytes(cls, data, bin_count=DEFAULT_BIN_COUNT):
+        """
+        Build a calibration from packed (r, theta) records, as written by sim/create_joystick_calibration.py.
+
+        Raises:
+            ValueError: If the data is not a whole number of records.
+        """
+        if len(data) % CALIBRATION_RECORD_LENGTH:
+            raise ValueError("Calibration data is not a whole number of records")
+        polar_coordinates = []
+        for offset in range(0, len(data), CALIBRATION_RECORD_LENGTH):
+            polar_coordinates.append(struct.unpack_from(CALIBRATION_RECORD_FORMAT, data, offset))
+        return cls(polar_coordinates, bin_count)
+
+    @classmethod
+    def load_from_file(cls, file_path=DEFAULT_CALIBRATION_FILE, bin_count=DEFAULT_BIN_COUNT):
+        with open(file_path, "rb") as file:
+            return cls.from_bytes(file.read(), bin_count)
+
+    def rim_radius(self, theta):
+        """
+        Get the radius of the rim of the stick's travel in a direction.
+
+        Args:
+            theta (float): Direction in radians, from -pi to pi.
+        """
+        position = (theta + math.pi) * self.bins_per_radian
+        index = int(position)
+        if index >= self.bin_count:
+            index = self.bin_count - 1
+        elif index < 0:
+            index = 0
+        radius = self.radii[index]
+        return radius + (self.radii[index + 1] - radius) * (position - index)
+
+    def normalize(self, x, y):
+        """
+        Scale a stick position by the rim's radius in its direction.
+
+        Args:
+            x (float): Raw X position, from -1 to 1.
+            y (float): Raw Y position, from -1 to 1.
+
+        Returns:
+            tuple[float, float]: The calibrated position, with a radius of 1 at the edge of the stick's travel. Positions
+            past the calibrated rim are kept at a radius of 1 so later steps still see values from -1 to 1.
+        """
+        scalar = max(self.rim_radius(math.atan2(y, x)), math.sqrt(x * x + y * y))
+        if scalar == 0:
+            return 0.0, 0.0
+        return x / scalar, y / scalar
@@ -0,0 +1,291 @@
+import math
+from array import array
+
+from VEXLib.Math.MathUtil import angle_modulus
+
+
+class RamseteController:
+    """
+    Tracks a trajectory in time with the RAMSETE nonlinear feedback law.
+
+    At each tick the robot is compared with where the trajectory says it should be at that time, and
+    the planned speed and turn rate are corrected for the along-track, cross-track and heading errors.
+    Looking up the planned state is one interpolation, so every tick costs the same.
+    """
+
+    def __init__(self, b=2.0, zeta=0.7):
+        """
+        Args:
+            b (float): Aggressiveness of the correction, larger converges faster. Must be positive.
+            zeta (float): Damping of the correction, between 0 and 1.
+        """
+        self.b = b
+        self.zeta = zeta
+        self.trajectory = None
+
+    def prepare(self, trajectory):
+        pass
+
+    def discard_prepared(self):
+        pass
+
+    def start(self, trajectory):
+        self.trajectory = trajectory
+
+    def is_finished(self, time):
+        return time >= self.trajectory.total_time()
+
+    def calculate(self, x, y, heading, time):
+        """
+        Args:
+            x (float): Robot x position in meters.
+            y (float): Robot y position in meters.
+            heading (float): Robot heading in radians, counterclockwise.
+            time (float): Seconds since the start of the trajectory.
+
+        Returns:
+            tuple[float, float]: Forward speed in meters per second and turn rate in radians per second.
+        """
+        reference = self.trajectory.sample(time)
+        reference_velocity = reference.velocity
+        reference_turn_rate = reference.velocity * reference.curvature
+
+        # Error in the robot's frame
+        dx = reference.x - x
+        dy = reference.y - y
+        cos_heading = math.cos(heading)
+        sin_heading = math.sin(heading)
+        along_error = cos_heading * dx + sin_heading * dy
+        cross_error = -sin_heading * dx + cos_heading * dy
+        heading_error = angle_modulus(reference.heading - heading)
+
+        gain = 2 * self.zeta * math.sqrt(reference_turn_rate * reference_turn_rate
+                                         + self.b * reference_velocity * reference_velocity)
+        if abs(heading_error) < 1e-6:
+            sinc = 1.0
+        else:
+            sinc = math.sin(heading_error) / heading_error
+
+        velocity = reference_velocity * math.cos(heading_error) + gain * along_error
+        turn_rate = reference_turn_rate + gain * heading_error + self.b * reference_velocity * sinc * cross_error
+        return velocity, turn_rate
+
+
+class PurePursuitController:
+    """
+    Follows the path of a trajectory by steering towards a point a fixed distance ahead of the robot.
+
+    When a trajectory is queued, the distance along the path of every sample is precomputed, along
+    with the index of the sample one lookahead distance further on. Each tick then only searches a few
+    samples past the previous closest one and reads the lookahead sample from the table, so the work
+    does not grow with the length of the path. The speed is the planned speed at the closest sample.
+    """
+
+    def __init__(self, lookahead_distance=0.3, search_window=10, minimum_velocity=0.05):
+        """
+        Args:
+            lookahead_distance (float): Meters ahead of the closest sample to steer towards.
+            search_window (int): How many samples past the previous closest sample are searched each tick.
+            minimum_velocity (float): Speed used while the planned speed is lower, so the robot does not stall at the start.
+        """
+        self.lookahead_distance = lookahead_distance
+        self.search_window = search_window
+        self.minimum_velocity = minimum_velocity
+        self.trajectory = None
+        self.distances = None
+        self.lookahead_indices = None
+        self.closest_index = 0
+        # Precomputed (distances, lookahead indices) for each queued trajectory. Keyed by the trajectory
+        # itself, which keeps it alive so its entry can never be mistaken for a newer object's
+        self._tables = {}
+
+    def prepare(self, trajectory):
+        """
+        Precompute the lookahead table for a trajectory, so starting it later costs nothing extra.
+        """
+        if trajectory in self._tables:
+            return
+        xs = trajectory.fields["x"]
+        ys = trajectory.fields["y"]
+        count = len(trajectory)
+
+        distances = array("f", [0.0] * count)
+        for i in range(1, count):
+            distances[i] = distances[i - 1] + math.sqrt((xs[i] - xs[i - 1]) ** 2 + (ys[i] - ys[i - 1]) ** 2)
+
+        # Distances only increase, so the lookahead index only moves forwards
+        lookahead_indices = array("H" if count < 65536 else "I", [0] * count)
+        j = 0
+        for i in range(count):
+            target = distances[i] + self.lookahead_distance
+            while j < count - 1 and distances[j] < target:
+                j += 1
+            lookahead_indices[i] = j
+        self._tables[trajectory] = (distances, lookahead_indices)
+
+    def discard_prepared(self):
+        """
+        Drop the tables of trajectories that were queued but will not be started.
+        """
+        self._tables = {}
+
+    def start(self, trajectory):
+        self.prepare(trajectory)
+        self.trajectory = trajectory
+        self.distances, self.lookahead_indices = self._tables.pop(trajectory)
+        self.closest_index = 0
+
+    def is_finished(self, time):
+        return self.closest_index >= len(self.trajectory) - 1
+
+    def _update_closest_index(self, x, y):
+        xs = self.trajectory.fields["x"]
+        ys = self.trajectory.fields["y"]
+        best = self.closest_index
+        best_distance = (xs[best] - x) ** 2 + (ys[best] - y) ** 2
+        for i in range(best + 1, min(best + 1 + self.search_window, len(self.trajectory))):
+            distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+            if distance < best_distance:
+                best = i
+                best_distance = distance
+        self.closest_index = best
+
+    def calculate(self, x, y, heading, time):
+        """
+        Args:
+            x (float): Robot x position in meters.
+            y (float): Robot y position in meters.
+            heading (float): Robot heading in radians, counterclockwise.
+            time (float): Seconds since the start of the trajectory, unused.
+
+        Returns:
+            tuple[float, float]: Forward speed in meters per second and turn rate in radians per second.
+        """
+        self._update_closest_index(x, y)
+        fields = self.trajectory.fields
+        target = self.lookahead_indices[self.closest_index]
+
+        dx = fields["x"][target] - x
+        dy = fields["y"][target] - y
+        # Sideways offset of the lookahead point in the robot's frame
+        lateral = -math.sin(heading) * dx + math.cos(heading) * dy
+        distance_squared = dx * dx + dy * dy
+
+        velocity = fields["velocity"][self.closest_index]
+        if self.closest_index < len(self.trajectory) - 1:
+            velocity = max(velocity, self.minimum_velocity)
+        if distance_squared == 0:
+            return velocity, 0.0
+        # Curvature of the arc through the robot and the lookahead point
+        return velocity, velocity * 2 * lateral / distance_squared
+
+
+class PathFollower:
+    """
+    Drives a tank drivetrain along a chain of precompiled trajectories without stopping between them.
+
+    Trajectories are followed one after another. When one finishes, the next starts from where the
+    last one's clock ended, so segments compiled with matching end and start speeds join smoothly.
+    Positions and headings are in the odometry frame used when the trajectories were compiled.
+    """
+
+    def __init__(self, controller, track_width, max_wheel_velocity=None):
+        """
+        Args:
+            controller (RamseteController | PurePursuitController): Controller for each trajectory.
+            track_width (float): Distance between the left and right wheels in meters.
+            max_wheel_velocity (float, optional): Wheel speeds are scaled down together to stay within this.
+        """
+        self.controller = controller
+        self.track_width = track_width
+        self.max_wheel_velocity = max_wheel_velocity
+        self.queue = []
+        self.current = None
+        self.segment_start_time = 0.0
+
+    def follow(self, trajectories, start_time):
+        """
+        Replace any trajectories being followed and start the first one.
+
+        Args:
+            trajectories (list[Trajectory]): Segments to follow in order.
+            start_time (float): Current time in seconds.
+        """
+        self.controller.discard_prepared()
+        self.queue = list(trajectories)
+        for trajectory in self.queue:
+            self.controller.prepare(trajectory)
+        self.current = None
+        self.segment_start_time = start_time
+        self._next_segment()
+
+    def append(self, trajectory, start_time=None):
+        """
+        Chain another trajectory after the ones already queued.
+
+        Args:
+            trajectory (Trajectory): The segment to follow after the queued ones.
+            start_time (float, optional): Current time in seconds, used when nothing is being followed so the
+                trajectory starts now. If None, it starts at the next update.
+        """
+        self.controller.prepare(trajectory)
+        if self.current is None:
+            self.current = trajectory
+            self.segment_start_time = start_time
+            self.controller.start(trajectory)
+        else:
+            self.queue.append(trajectory)
+
+    def _next_segment(self):
+        if self.queue:
+            self.current = self.queue.pop(0)
+            self.controller.start(self.current)
+        else:
+            self.current = None
+
+    def is_finished(self):
+        return self.current is None
+
+    def wheel_velocities(self, velocity, turn_rate):
+        """
+        Convert a forward speed and turn rate into left and right wheel speeds.
+
+        Returns:
+            tuple[float, float]: Left and right wheel speeds in meters per second.
+        """
+        half_track = self.track_width / 2
+        left = velocity - turn_rate * half_track
+        right = velocity + turn_rate * half_track
+        if self.max_wheel_velocity is not None:
+            largest = max(abs(left), abs(right))
+            if largest > self.max_wheel_velocity:
+                scale = self.max_wheel_velocity / largest
+                left *= scale
+                right *= scale
+        return left, right
+
+    def update(self, x, y, heading, time):
+        """
+        Compute the wheel speeds for this tick.
+
+        Args:
+            x (float): Robot x position in meters.
+            y (float): Robot y position in meters.
+            heading (float): Robot heading in radians, counterclockwise.
+            time (float): Current time in seconds.
+
+        Returns:
+            tuple[float, float]: Left and right wheel speeds in meters per second, zero once finished.
+        """
+        if self.current is None:
+            return 0.0, 0.0
+        if self.segment_start_time is None:
+            self.segment_start_time = time
+        if self.controller.is_finished(time - self.segment_start_time):
+            # Carry the clock over so a time-based controller continues without a jump
+            self.segment_start_time = min(time, self.segment_start_time + self.current.total_time())
+            self._next_segment()
+            if self.current is None:
+                return 0.0, 0.0
+        velocity, turn_rate = self.controller.calculate(x, y, heading, time - self.segment_start_time)
+        return self.wheel_velocities(velocity, turn_rate)
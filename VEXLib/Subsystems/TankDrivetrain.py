@@ -15,7 +15,9 @@ from VEXLib.Geometry.Rotation2d import Rotation2d
 from VEXLib.Geometry.Translation1d import Translation1d, Distance
 from VEXLib.Geometry.Translation2d import Translation2d
 from VEXLib.Geometry.Velocity1d import Velocity1d
+from VEXLib.Kinematics.Trajectory import Trajectory, TRAJECTORY_FILE_SUFFIX
 from VEXLib.Motor import Motor
+from VEXLib.Subsystems.PathFollower import PathFollower, RamseteController
 from VEXLib.Units import Units
 from VEXLib.Util import time
 from VEXLib.Util.Logging import Logger, TimeSeriesLogger
@@ -113,6 +115,79 @@ class Drivetrain:
         self.target_pose = Pose2d(Translation2d(), self.odometry.zero_rotation)
         self.log.debug("Target pose initialized to", self.target_pose)
 
+        # Trajectories compiled offline by util/TrajectoryCompiler.py, by name
+        self.trajectories = {}
+        self.path_follower = PathFollower(
+            RamseteController(),
+            DrivetrainProperties.TRACK_WIDTH.to_meters(),
+            DrivetrainProperties.MAX_ACHIEVABLE_SPEED.to_meters_per_second(),
+        )
+
+    def load_trajectory(self, name, directory="assets"):
+        """
+        Load a compiled trajectory from the SD card so it is ready before autonomous starts.
+
+        Args:
+            name (str): Name the trajectory was compiled under.
+            directory (str): Directory holding the trajectory files.
+
+        Returns:
+            Trajectory: The loaded trajectory, also kept in self.trajectories.
+        """
+        self.log.trace("Entering load_trajectory")
+        trajectory = Trajectory.load_from_file(open(directory + "/" + name + TRAJECTORY_FILE_SUFFIX, "rb"))
+        self.trajectories[name] = trajectory
+        self.log.debug("Loaded trajectory", name, "with", len(trajectory), "samples over", trajectory.total_time(), "s")
+        return trajectory
+
+    def load_trajectories(self, names, directory="assets"):
+        for name in names:
+            self.load_trajectory(name, directory)
+
+    def follow_trajectories(self, trajectories, follower=None, commands=None):
+        """
+        Drive along a chain of compiled trajectories without stopping between them.
+
+        Args:
+            trajectories (list[str | Trajectory]): Segments in order, by loaded name or as Trajectory objects.
+            follower (PathFollower, optional): Follower to use, self.path_follower (RAMSETE) if None.
+            commands (list[TimeBasedCommand], optional): Commands run once their time since the start has passed.
+        """
+        self.log.trace("Entering follow_trajectories")
+        if follower is None:
+            follower = self.path_follower
+        if commands is None:
+            commands = []
+        trajectories = [self.trajectories[t] if isinstance(t, str) else t for t in trajectories]
+
+        start_time = time.time()
+        follower.follow(trajectories, start_time)
+        while not follower.is_finished():
+            self.update_odometry()
+            current_time = time.time()
+            for command in commands:
+                if command.time <= current_time - start_time:
+                    command.execute_once()
+
+            pose = self.odometry.get_pose()
+            left_speed, right_speed = follower.update(
+                pose.translation.x_component.to_meters(),
+                pose.translation.y_component.to_meters(),
+                pose.rotation.to_radians(),
+                current_time,
+            )
+            self.set_speed(
+                Velocity1d.from_meters_per_second(left_speed),
+                Velocity1d.from_meters_per_second(right_speed),
+            )
+            self.update_powers()
+
+        self.log.debug("Finished trajectories in", time.time() - start_time, "s")
+        self.set_speed_zero_to_one(0, 0)
+        self.set_powers(0, 0)
+        self.left_drivetrain_PID.reset()
+        self.right_drivetrain_PID.reset()
+
     def set_angles_inverted(self, inverted):
         self.log.debug("Set angles to inverted: ", inverted)
         self.ANGLE_DIRECTION = -1 if inverted else 1
@@ -88,6 +88,10 @@ def microseconds_to_milliseconds(microseconds):
     return microseconds / microseconds_per_millisecond
 
 
+def seconds_to_microseconds(seconds):
+    return seconds * microseconds_per_millisecond * milliseconds_per_second
+
+
 def milliseconds_to_seconds(milliseconds):
     return milliseconds / milliseconds_per_second
 
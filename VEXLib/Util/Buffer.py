@@ -1,10 +1,17 @@
+from array import array
+
+
 class Buffer:
     """
     A class to represent a circular buffer with a fixed length.
 
+    Elements are stored in a preallocated ring with a head index and a count, so adding an element
+    never moves the others. With a typecode the ring is an array of that type, which stores numbers
+    without allocating an object per element; otherwise it is a list that can hold anything.
+
     Attributes:
         length (int): The maximum number of elements the buffer can hold.
-        buffer (list): The list storing the elements of the buffer.
+        buffer (list): A copy of the elements of the buffer, oldest first.
 
     Methods:
         add(data):
@@ -17,15 +24,32 @@ class Buffer:
             Fills the buffer with a specified value, up to its maximum length.
     """
 
-    def __init__(self, length):
+    def __init__(self, length, typecode=None):
         """
         Initializes the Buffer instance with a specified length.
 
         Args:
             length (int): The maximum number of elements the buffer can hold.
+            typecode (str): An array typecode such as "f" or "l" to store numbers in typed storage,
+                or None to store any objects.
+
+        Raises:
+            ValueError: If length is less than 1.
         """
+        if length < 1:
+            raise ValueError("Buffer length must be at least 1, got " + str(length))
         self.length = length
-        self.buffer = []
+        self.typecode = typecode
+        if typecode is None:
+            self._storage = [None] * length
+        else:
+            self._storage = array(typecode, [0] * length)
+        self._head = 0
+        self._count = 0
+
+    @property
+    def buffer(self):
+        return self.get()
 
     def add(self, data):
         """
@@ -33,25 +57,74 @@ class Buffer:
 
         Args:
             data: The element to add to the buffer.
+
+        Returns:
+            The element that was removed to make space, or None if the buffer was not full.
         """
-        if len(self.buffer) >= self.length:
-            self.buffer.pop(0)
-        self.buffer.append(data)
+        if self._count < self.length:
+            index = self._head + self._count
+            if index >= self.length:
+                index -= self.length
+            self._storage[index] = data
+            self._count += 1
+            return None
+
+        removed = self._storage[self._head]
+        self._storage[self._head] = data
+        self._head += 1
+        if self._head >= self.length:
+            self._head = 0
+        return removed
 
     def get(self):
         """
         Retrieves the current contents of the buffer.
 
         Returns:
-            list: The elements currently in the buffer.
+            list: The elements currently in the buffer, oldest first.
         """
-        return self.buffer
+        end = self._head + self._count
+        if end <= self.length:
+            return list(self._storage[self._head:end])
+        return list(self._storage[self._head:]) + list(self._storage[:end - self.length])
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """
+        Iterate over the elements oldest first, without copying them.
+        """
+        storage = self._storage
+        index = self._head
+        for _ in range(self._count):
+            yield storage[index]
+            index += 1
+            if index >= self.length:
+                index = 0
+
+    def __getitem__(self, index):
+        """
+        Get an element by its position, where 0 is the oldest and -1 is the newest element.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Buffer index out of range")
+        index += self._head
+        if index >= self.length:
+            index -= self.length
+        return self._storage[index]
+
+    def is_full(self):
+        return self._count >= self.length
 
     def clear(self):
         """
         Clears all elements from the buffer.
         """
-        self.buffer = []
+        self._head = 0
+        self._count = 0
 
     def initialize(self, value):
         """
@@ -60,4 +133,7 @@ class Buffer:
         Args:
             value: The value to fill the buffer with.
         """
-        self.buffer = [value] * self.length
\ No newline at end of file
+        for i in range(self.length):
+            self._storage[i] = value
+        self._head = 0
+        self._count = self.length
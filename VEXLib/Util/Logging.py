@@ -4,7 +4,7 @@ import sys
 from VEXLib.Util.Shelf import Shelf
 
 from VEXLib.Util import time
-from vex import Brain
+from vex import Brain, Thread
 
 
 class LogLevel:
@@ -25,6 +25,13 @@ LOG_LEVELS = {
     LogLevel.FATAL: 6,
 }
 
+# Record types stored in the level byte of a binlog record, above the text log levels
+CHANNEL_SCHEMA_RECORD = 0x80
+CHANNEL_SAMPLE_RECORD = 0x81
+
+# Struct codes MicroPython's struct supports, log booleans as "B"
+CHANNEL_FIELD_CODES = "bBhHiIlLqQfd"
+
 
 def file_exists(filename):
     if sys.platform == "linux":
@@ -36,10 +43,92 @@ def file_exists(filename):
     return Brain().sdcard.filesize(filename)
 
 
+class Channel:
+    """
+    A typed telemetry channel registered with a Logger.
+
+    The channel's schema (field names and struct codes) is written to the log once when the
+    channel is registered, after that each sample only stores the packed binary values tagged with
+    the channel's schema id, instead of a JSON encoded dictionary.
+
+    Use Logger.register_channel to create a channel.
+    """
+
+    def __init__(self, logger, schema_id, name, fields):
+        """
+        Args:
+            logger (Logger): The logger the channel writes to
+            schema_id (int): The id samples of this channel are tagged with
+            name (str): The name of the channel
+            fields (list[tuple[str, str]]): (field name, struct code) pairs
+        """
+        self.logger = logger
+        self.schema_id = schema_id
+        self.name = name
+        self.fields = fields
+        self.field_names = [field_name for field_name, _ in fields]
+        self.value_format = "".join(code for _, code in fields)
+        self.payload_length = 1 + struct.calcsize("<" + self.value_format)
+        self._record_format = "<fBIB" + self.value_format
+
+    def schema_bytes(self):
+        """
+        Returns:
+            bytes: The schema description stored in the channel's schema record
+        """
+        return (
+            self.name + "|" + ",".join(field_name + ":" + code for field_name, code in self.fields)
+        ).encode("utf-8")
+
+    def log(self, *values):
+        """
+        Log one sample, the values must be given in the order of the channel's fields.
+        """
+        try:
+            self.logger._append(
+                struct.pack(
+                    self._record_format,
+                    float(time.time()),
+                    CHANNEL_SAMPLE_RECORD,
+                    self.payload_length,
+                    self.schema_id,
+                    *values
+                )
+            )
+        except MemoryError:
+            self.logger.log_buffer = []
+
+    def log_dict(self, values):
+        """
+        Log one sample from a dictionary keyed by field name.
+        """
+        self.log(*[values[field_name] for field_name in self.field_names])
+
+
 class Logger:
-    def __init__(self, log_name, index=None, flush_threshold=512):
+    def __init__(
+        self,
+        log_name,
+        index=None,
+        flush_threshold=512,
+        background_flush=False,
+        max_buffer_size=8192,
+        flush_interval_ms=10,
+    ):
+        """
+        Args:
+            log_name: The path of the log without the index and extension
+            index: The index appended to the log name, defaults to the startup count
+            flush_threshold: The number of buffered bytes that triggers a flush
+            background_flush: If True, the buffer is handed to a dedicated flush thread which writes
+                it through a file handle that stays open, so logging never waits on the SD card
+            max_buffer_size: In background mode, the size the active buffer may grow to while the
+                flush thread is still writing the previous one, records beyond it are dropped
+            flush_interval_ms: In background mode, how long the flush thread sleeps when idle
+        """
         self.flush_threshold = flush_threshold
         self.log_buffer = bytearray()
+        self.channels = {}
         self.current_index = (
             index
             if index is not None
@@ -49,6 +138,30 @@ class Logger:
             log_name=log_name, index=self.current_index
         )
 
+        self.background_flush = background_flush
+        self.max_buffer_size = max_buffer_size
+        self.flush_interval_ms = flush_interval_ms
+
+        # Background flush state, the pending buffer is owned by the flush thread until it is set back to None
+        self._pending_buffer = None
+        self._log_file = None
+        self._flush_thread = None
+        self._running = False
+        # True while the flush thread is inside its loop, close waits for it to go back to False
+        self._flush_thread_active = False
+
+        self.dropped_records = 0
+        self.dropped_bytes = 0
+        self.overflow_count = 0
+        self.flush_count = 0
+        self.last_flush_latency_ms = 0
+        self.max_flush_latency_ms = 0
+        self.total_flush_latency_ms = 0
+
+        if background_flush:
+            self._running = True
+            self._flush_thread = Thread(self._flush_loop)
+
     def log(self, *parts, log_level=LogLevel.INFO):
         try:
             if log_level not in LOG_LEVELS:
@@ -63,16 +176,160 @@ class Logger:
                 len(message_bytes),
                 message_bytes
             )
-            self.log_buffer.extend(log_entry)
-            if len(self.log_buffer) >= self.flush_threshold:
-                self.flush_logs()
+            self._append(log_entry)
         except MemoryError:
             self.log_buffer = []
 
+    def _append(self, log_entry):
+        if self.background_flush:
+            if self._pending_buffer is not None and len(self.log_buffer) + len(log_entry) > self.max_buffer_size:
+                # The flush thread has not caught up and the active buffer is full, drop the record
+                self.dropped_records += 1
+                self.dropped_bytes += len(log_entry)
+                return
+            self.log_buffer.extend(log_entry)
+            if len(self.log_buffer) >= self.flush_threshold:
+                self._swap_buffers()
+            return
+
+        self.log_buffer.extend(log_entry)
+        if len(self.log_buffer) >= self.flush_threshold:
+            self.flush_logs()
+
+    def _swap_buffers(self):
+        if self._pending_buffer is not None:
+            self.overflow_count += 1
+            return False
+        self._pending_buffer = self.log_buffer
+        self.log_buffer = bytearray()
+        return True
+
+    def _flush_loop(self):
+        self._flush_thread_active = True
+        try:
+            while self._running:
+                if not self._drain():
+                    time.sleep_ms(self.flush_interval_ms)
+        finally:
+            self._flush_thread_active = False
+
+    def _drain(self):
+        """
+        Write the pending buffer through the open log file, called from the flush thread.
+
+        Returns:
+            bool: True if a buffer was written
+        """
+        buffer = self._pending_buffer
+        if buffer is None:
+            return False
+
+        start_time = time.time_ms()
+        try:
+            if self._log_file is None:
+                self._log_file = open(self.log_file_path, "ab")
+            self._log_file.write(buffer if isinstance(buffer, (bytes, bytearray)) else bytes(buffer))
+            self._log_file.flush()
+        except OSError:
+            self.dropped_bytes += len(buffer)
+        latency = time.time_ms() - start_time
+
+        self.flush_count += 1
+        self.last_flush_latency_ms = latency
+        self.total_flush_latency_ms += latency
+        if latency > self.max_flush_latency_ms:
+            self.max_flush_latency_ms = latency
+
+        self._pending_buffer = None
+        return True
+
+    def get_flush_stats(self):
+        """
+        Returns:
+            dict: Counters describing the background flush thread's health
+        """
+        return {
+            "flush_count": self.flush_count,
+            "dropped_records": self.dropped_records,
+            "dropped_bytes": self.dropped_bytes,
+            "overflow_count": self.overflow_count,
+            "last_flush_latency_ms": self.last_flush_latency_ms,
+            "max_flush_latency_ms": self.max_flush_latency_ms,
+            "average_flush_latency_ms": self.total_flush_latency_ms / self.flush_count if self.flush_count else 0,
+        }
+
+    def close(self):
+        """
+        Stop the flush thread and synchronously write everything that is still buffered.
+        """
+        if not self.background_flush:
+            self.flush_logs()
+            return
+        # Let the flush thread exit on its own rather than stopping it in the middle of a write, and
+        # wait for it to finish any drain it already started before touching the buffers and file
+        self._running = False
+        while self._flush_thread_active:
+            time.sleep_ms(self.flush_interval_ms)
+        self._flush_thread = None
+        self._drain()
+        if self.log_buffer:
+            self._swap_buffers()
+            self._drain()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
     def log_vars(self, vars_dict, log_level=LogLevel.INFO):
         self.log(json.dumps(vars_dict), log_level=log_level)
 
+    def register_channel(self, name, fields):
+        """
+        Register a typed telemetry channel and write its schema to the log.
+
+        Logging a sample through the returned channel only packs the values, which is much cheaper
+        and smaller than log_vars. util/log_reader.py decodes whole channels into NumPy arrays.
+
+        Args:
+            name (str): The name of the channel, must not contain "|"
+            fields (list[tuple[str, str]]): (field name, struct code) pairs, for example
+                [("x", "f"), ("y", "f"), ("heading", "f")]. Field names must not contain "," or ":"
+
+        Returns:
+            Channel: The registered channel, registering the same name again returns the existing channel
+        """
+        if name in self.channels:
+            return self.channels[name]
+        if len(self.channels) > 0xFF:
+            raise ValueError("Too many channels registered")
+        if "|" in name:
+            raise ValueError("Invalid channel name: " + name)
+        for field_name, code in fields:
+            if "," in field_name or ":" in field_name:
+                raise ValueError("Invalid field name: " + field_name)
+            if len(code) != 1 or code not in CHANNEL_FIELD_CODES:
+                raise ValueError("Invalid struct code for field " + field_name + ": " + str(code))
+
+        channel = Channel(self, len(self.channels), name, list(fields))
+        self.channels[name] = channel
+
+        schema = bytes([channel.schema_id]) + channel.schema_bytes()
+        self._append(
+            struct.pack(
+                "<fBI{}s".format(len(schema)),
+                float(time.time()),
+                CHANNEL_SCHEMA_RECORD,
+                len(schema),
+                schema,
+            )
+        )
+        return channel
+
     def flush_logs(self):
+        if self.background_flush:
+            # Hand the buffer to the flush thread instead of writing from the caller
+            if self.log_buffer:
+                self._swap_buffers()
+            return
         if self.log_buffer:
             try:
                 with open(self.log_file_path, "ab") as f:
@@ -238,6 +495,9 @@ class NoLogger(Logger):
     def log(self, *parts, log_level=LogLevel.INFO):
         pass
 
+    def _append(self, log_entry):
+        pass
+
 def format_time(seconds):
     millis = int((seconds % 1) * 1000)
     seconds = int(seconds)
@@ -1,15 +1,48 @@
+import struct
+
+from VEXLib.Algorithms.DistanceTransform import squared_distance_transform
+
 BYTES_FOR_SIZE = 8
 
+# Optional sections stored after the obstacle bitmap, each a 4 byte tag, a 4 byte little endian
+# payload length and the payload. Files without sections are the original format.
+SECTION_HEADER_FORMAT = "<4sI"
+SECTION_HEADER_SIZE = 8
+# Payload: float32 robot radius in tiles, then a bitmap packed like the obstacle bitmap
+INFLATED_SECTION_TAG = b"INFL"
+# Payload: uint8 units per tile, then one uint8 per tile of the distance to the nearest obstacle
+DISTANCE_SECTION_TAG = b"DIST"
+
+# Distances are stored in quarter tiles, saturating at 255 / 4 = 63.75 tiles
+DISTANCE_SCALE = 4
+MAX_STORED_DISTANCE = 255
+
+
+def _pack_bits(values):
+    packed = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value:
+            packed[index >> 3] |= 0x80 >> (index & 7)
+    return packed
+
 
 class PathfindingEnvironment:
     def __init__(self):
         self.obstacle_list = []
         self.width = None
+        self.height = None
+        # Precomputed by build_clearance or loaded from a file, None when not available
+        self.inflation_radius = None
+        self.inflated_list = None
+        self.distance_scale = DISTANCE_SCALE
+        self.distance_list = None
 
     def load_from_file(self, file_object):
         with file_object as f:
             file_contents = f.read()
-            length_list = [ord(char) for char in file_contents[:BYTES_FOR_SIZE]]
+            if isinstance(file_contents, str):
+                file_contents = bytes([ord(char) for char in file_contents])
+            length_list = list(file_contents[:BYTES_FOR_SIZE])
             length_byte = 0
             for byte in reversed(length_list):
                 length_byte <<= 8
@@ -17,11 +50,87 @@ class PathfindingEnvironment:
 
             self.width = length_byte
             print(f"Set width to {self.width}")
-            self.obstacle_list = [ord(char) for char in file_contents[BYTES_FOR_SIZE:]]
+
+            # Maps saved with sections are square, anything else after the header is the bitmap
+            bitmap_end = BYTES_FOR_SIZE + (self.width * self.width + 7) // 8
+            if not self._load_sections(file_contents, bitmap_end):
+                bitmap_end = len(file_contents)
+            self.obstacle_list = list(file_contents[BYTES_FOR_SIZE:bitmap_end])
+            self.height = (len(self.obstacle_list) * 8) // self.width
+
+    def _load_sections(self, file_contents, offset):
+        sections = {}
+        while offset + SECTION_HEADER_SIZE <= len(file_contents):
+            tag, length = struct.unpack_from(SECTION_HEADER_FORMAT, file_contents, offset)
+            offset += SECTION_HEADER_SIZE
+            if tag not in (INFLATED_SECTION_TAG, DISTANCE_SECTION_TAG) or offset + length > len(file_contents):
+                return False
+            sections[tag] = file_contents[offset:offset + length]
+            offset += length
+        if offset != len(file_contents) or not sections:
+            return False
+
+        if INFLATED_SECTION_TAG in sections:
+            payload = sections[INFLATED_SECTION_TAG]
+            self.inflation_radius = struct.unpack_from("<f", payload, 0)[0]
+            self.inflated_list = list(payload[4:])
+        if DISTANCE_SECTION_TAG in sections:
+            payload = sections[DISTANCE_SECTION_TAG]
+            self.distance_scale = payload[0]
+            self.distance_list = bytearray(payload[1:])
+        return True
 
     def load_from_list(self, obstacle_list, width):
         self.obstacle_list = obstacle_list
         self.width = width
+        self.height = (len(obstacle_list) * 8) // width
+
+    def build_clearance(self, robot_radius):
+        """
+        Precompute the distance from every tile to the nearest obstacle and an obstacle map inflated
+        by the robot radius, so clearance checks are a single lookup.
+
+        Args:
+            robot_radius: The radius of the robot footprint in tiles. Tiles whose center is within
+                this distance of an obstacle tile's center are blocked in the inflated map.
+        """
+        width = self.width
+        height = self.height
+        blocked = [self.get_at(index % width, index // width) for index in range(width * height)]
+        squared_distances = squared_distance_transform(blocked, width, height)
+
+        radius_squared = robot_radius * robot_radius
+        self.inflation_radius = robot_radius
+        self.inflated_list = list(_pack_bits([distance <= radius_squared for distance in squared_distances]))
+
+        self.distance_scale = DISTANCE_SCALE
+        distance_list = bytearray(width * height)
+        for index, squared_distance in enumerate(squared_distances):
+            # Rounding down keeps the stored clearance conservative
+            distance_list[index] = min(MAX_STORED_DISTANCE, int(squared_distance ** 0.5 * DISTANCE_SCALE))
+        self.distance_list = distance_list
+
+    def to_bytes(self):
+        """
+        Serialize the environment into the binary map format read by load_from_file, including the
+        inflated map and distance field if they have been built.
+        """
+        data = bytearray(struct.pack("<Q", self.width))
+        data += bytes(self.obstacle_list)
+        if self.inflated_list is not None or self.distance_list is not None:
+            # Sections are only read back from square maps, see load_from_file
+            assert self.width == self.height, "Only square maps can be saved with clearance data"
+        if self.inflated_list is not None:
+            payload = struct.pack("<f", self.inflation_radius) + bytes(self.inflated_list)
+            data += struct.pack(SECTION_HEADER_FORMAT, INFLATED_SECTION_TAG, len(payload)) + payload
+        if self.distance_list is not None:
+            payload = bytes([self.distance_scale]) + bytes(self.distance_list)
+            data += struct.pack(SECTION_HEADER_FORMAT, DISTANCE_SECTION_TAG, len(payload)) + payload
+        return bytes(data)
+
+    def save_to_file(self, file_object):
+        with file_object as f:
+            f.write(self.to_bytes())
 
     def get_at(self, x, y):
         bit_index = (y * self.width) + x
@@ -36,6 +145,17 @@ class PathfindingEnvironment:
 
         return bool(target_bit)
 
+    def get_inflated_at(self, x, y):
+        bit_index = (y * self.width) + x
+        return bool(self.inflated_list[bit_index >> 3] & (0x80 >> (bit_index & 7)))
+
+    def get_clearance(self, x, y):
+        """
+        Returns:
+            The distance in tiles from (x, y) to the nearest obstacle, saturating at 63.75 tiles
+        """
+        return self.distance_list[(y * self.width) + x] / self.distance_scale
+
     def set_at(self, x, y, value):
         value = bool(value)
 
@@ -64,3 +184,11 @@ class PathfindingEnvironment:
 
     def is_collision(self, position):
         return self.get_at(*position)
+
+    def is_inflated_collision(self, position):
+        """
+        Check a position against the inflated map, falling back to the obstacle map if it has not been built.
+        """
+        if self.inflated_list is None:
+            return self.get_at(*position)
+        return self.get_inflated_at(*position)
@@ -11,6 +11,13 @@ try:
 except Exception:
     _thread = None
 
+try:
+    import os
+except Exception:
+    os = None
+
+JOURNAL_SUFFIX = ".journal"
+
 
 def _quote_field(s):
     if s is None:
@@ -117,6 +124,35 @@ def _write_file(path, contents):
             pass
 
 
+def _read_journal_lines(path):
+    try:
+        f = open(path, "r")
+    except Exception:
+        return []
+    try:
+        contents = f.read()
+    finally:
+        try:
+            f.close()
+        except Exception:
+            pass
+    lines = contents.split("\n")
+    # The last entry is either empty or a partial line from an interrupted append, skip it
+    return lines[:-1]
+
+
+def _append_line(path, line):
+    f = open(path, "a")
+    try:
+        f.write(line + "\n")
+        f.flush()
+    finally:
+        try:
+            f.close()
+        except Exception:
+            pass
+
+
 def _parse_csv_line(line):
     fields = []
     i = 0
@@ -156,8 +192,23 @@ def _parse_csv_line(line):
 
 
 class Shelf(object):
-    def __init__(self, path, create=True):
+    def __init__(self, path, create=True, cached=False, compact_threshold=64):
+        """
+        Args:
+            path: The path of the CSV file backing the shelf
+            create: Create the file if it does not exist
+            cached: Load the file once and serve reads from memory. Mutations are appended to a
+                journal next to the file ("<path>.journal") instead of rewriting it, and the journal
+                is replayed on load, so an interrupted write never loses earlier values
+            compact_threshold: In cached mode, the number of journal entries after which the
+                journal is folded back into the main file
+        """
         self.path = path
+        self.cached = cached
+        self.compact_threshold = compact_threshold
+        self.journal_path = path + JOURNAL_SUFFIX
+        self._cache = None
+        self._journal_length = 0
         if _thread is not None:
             try:
                 self._lock = _thread.allocate_lock()
@@ -185,10 +236,87 @@ class Shelf(object):
                     f.close()
                 except Exception:
                     pass
+        if cached:
+            self._load()
+
+    def _load(self):
+        d = self._read_file()
+        if os is not None:
+            temporary_path = self.path + ".tmp"
+            temporary_lines = _read_journal_lines(temporary_path)
+            if not d and temporary_lines:
+                # Compaction was interrupted after removing the main file, recover from the temporary
+                # file (without a possibly partial last line), the journal below fills in the rest
+                d = self._parse_lines(temporary_lines)
+                self._write_dict(d)
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+        journal = _read_journal_lines(self.journal_path)
+        for ln in journal:
+            if not ln:
+                continue
+            k, v = _parse_csv_line(ln)
+            k = _unquote_field(k)
+            if v == "":
+                # An empty value marks a deletion, serialized values are never empty
+                d.pop(k, None)
+            else:
+                d[k] = _unquote_field(v)
+        self._cache = d
+        self._journal_length = len(journal)
+
+    def _journal(self, key, serialized_value):
+        line = _quote_field(key) + "," + ("" if serialized_value is None else _quote_field(serialized_value))
+        try:
+            _append_line(self.journal_path, line)
+        except Exception:
+            # Fall back to rewriting the main file so the mutation is not lost
+            self._compact()
+            return
+        self._journal_length += 1
+        if self._journal_length >= self.compact_threshold:
+            self._compact()
+
+    def _compact(self):
+        if os is None:
+            self._write_dict(self._cache)
+        else:
+            temporary_path = self.path + ".tmp"
+            self._write_dict(self._cache, temporary_path)
+            try:
+                os.rename(temporary_path, self.path)
+            except OSError:
+                # Some filesystems cannot rename over an existing file, _load recovers if interrupted here
+                os.remove(self.path)
+                os.rename(temporary_path, self.path)
+        # Replaying a journal on top of the compacted file is harmless, so truncate it last
+        _write_file(self.journal_path, [])
+        self._journal_length = 0
+
+    def compact(self):
+        """
+        Fold the journal back into the main file. Only has an effect in cached mode.
+        """
+        if not self.cached:
+            return
+        self._lock.acquire()
+        try:
+            self._compact()
+        finally:
+            self._lock.release()
 
     def _read_dict(self):
+        if self.cached:
+            return self._cache
+        return self._read_file()
+
+    def _read_file(self):
+        return self._parse_lines(_read_lines(self.path))
+
+    def _parse_lines(self, lines):
         d = {}
-        lines = _read_lines(self.path)
         for ln in lines:
             if not ln:
                 continue
@@ -196,7 +324,7 @@ class Shelf(object):
             d[_unquote_field(k)] = _unquote_field(v)
         return d
 
-    def _write_dict(self, d):
+    def _write_dict(self, d, path=None):
         contents = []
         keys = list(d.keys())
         try:
@@ -207,14 +335,17 @@ class Shelf(object):
             kval = _quote_field(k)
             vfield = _quote_field(d[k])
             contents.append(kval + "," + vfield)
-        _write_file(self.path, contents)
+        _write_file(self.path if path is None else path, contents)
 
     def set(self, key, value):
         self._lock.acquire()
         try:
             d = self._read_dict()
             d[key] = _serialize_value(value)
-            self._write_dict(d)
+            if self.cached:
+                self._journal(key, d[key])
+            else:
+                self._write_dict(d)
         finally:
             self._lock.release()
 
@@ -234,7 +365,10 @@ class Shelf(object):
             d = self._read_dict()
             if key in d:
                 del d[key]
-                self._write_dict(d)
+                if self.cached:
+                    self._journal(key, None)
+                else:
+                    self._write_dict(d)
                 return True
             return False
         finally:
@@ -38,6 +38,42 @@ def time_ms():
         return Units.seconds_to_milliseconds(time_module.time())
 
 
+def time_us():
+    """
+    Get the current time.
+    Returns:
+        - MicroPython: The elapsed time since robot startup in microseconds, this value wraps around, use time_diff_us to compare values.
+        - Standard Python: The current time in microseconds since the epoch.
+    """
+    if IS_MICROPYTHON:
+        # noinspection PyUnresolvedReferences
+        return time_module.ticks_us()
+    else:
+        return int(Units.seconds_to_microseconds(time_module.time()))
+
+
+def time_diff_us(end_us, start_us):
+    """
+    Get the number of microseconds between two values returned by time_us, accounting for wraparound.
+    """
+    if IS_MICROPYTHON:
+        # noinspection PyUnresolvedReferences
+        return time_module.ticks_diff(end_us, start_us)
+    else:
+        return end_us - start_us
+
+
+def time_add_us(start_us, delta_us):
+    """
+    Get the value time_us will return delta_us microseconds after start_us, accounting for wraparound.
+    """
+    if IS_MICROPYTHON:
+        # noinspection PyUnresolvedReferences
+        return time_module.ticks_add(start_us, delta_us)
+    else:
+        return start_us + delta_us
+
+
 def sleep(time_seconds):
     """
     Sleep for the specified amount of time in seconds.
@@ -54,6 +90,18 @@ def sleep_ms(time_milliseconds):
     time_module.sleep(Units.milliseconds_to_seconds(time_milliseconds))
 
 
+def sleep_us(time_microseconds):
+    """
+    Sleep for the specified amount of time in microseconds.
+    Works in both MicroPython and standard Python.
+    """
+    if IS_MICROPYTHON:
+        # noinspection PyUnresolvedReferences
+        time_module.sleep_us(int(time_microseconds))
+    else:
+        time_module.sleep(Units.microseconds_to_seconds(time_microseconds))
+
+
 def wait_until(condition_function, delay_ms=5):
     while not condition_function():
         sleep_ms(delay_ms)
@@ -20,3 +20,6 @@ FIND_VEX_DISK_TIME_BETWEEN_ATTEMPTS = config.getfloat(
     "Drive", "FIND_VEX_DISK_TIME_BETWEEN_ATTEMPTS"
 )
 DEPLOY_EXCLUDE_REGEX = config.get("Deploy", "DEPLOY_EXCLUDE_REGEX")
+DEPLOY_MANIFEST_NAME = config.get("Deploy", "DEPLOY_MANIFEST_NAME")
+DEPLOY_STAT_CACHE = os.path.join(PROJECT_ROOT, config.get("Deploy", "DEPLOY_STAT_CACHE"))
+DEPLOY_MAX_WORKERS = config.getint("Deploy", "DEPLOY_MAX_WORKERS")
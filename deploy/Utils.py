@@ -1,11 +1,14 @@
 import hashlib
+import json
 import math
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
 import ast
 
 from deploy import POSIX_MOUNT_POINT_DIR, DEPLOY_EXCLUDE_REGEX
@@ -13,6 +16,9 @@ from deploy import POSIX_MOUNT_POINT_DIR, DEPLOY_EXCLUDE_REGEX
 __all__ = [
     "get_checksum",
     "copy_if_changed",
+    "StatCache",
+    "DeployManifest",
+    "copy_if_changed_incremental",
     "RemovableDisk",
     "get_removable_disks",
     "unmount_drive",
@@ -106,6 +112,236 @@ def copy_if_changed(
     return deployed_count, deployed_size_bytes
 
 
+class StatCache:
+    """
+    A local cache mapping a file's (mtime, size) to its MD5 checksum.
+
+    Source files whose modification time and size have not changed since the last deploy
+    reuse the cached checksum instead of being read and hashed again.
+
+    Attributes:
+        path (str): The path of the JSON file the cache is persisted to.
+        entries (dict): Maps absolute file paths to [mtime_ns, size, checksum].
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a StatCache instance, loading any existing cache from disk.
+
+        Args:
+            path: The path of the JSON file the cache is persisted to.
+        """
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get_checksum(self, file_path: str) -> str:
+        """
+        Get the MD5 checksum of a file, only reading the file if its mtime or size changed.
+
+        Args:
+            file_path: The path of the file.
+
+        Returns:
+            str: The checksum of the file.
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            with self._lock:
+                self.hits += 1
+            return entry[2]
+
+        checksum = get_checksum(file_path)
+        with self._lock:
+            self.misses += 1
+            self.entries[key] = [stat.st_mtime_ns, stat.st_size, checksum]
+        return checksum
+
+    def save(self) -> None:
+        """
+        Write the cache back to disk.
+        """
+        with self._lock:
+            _write_json_atomically(self.path, self.entries)
+
+
+class DeployManifest:
+    """
+    A manifest stored in a deploy target directory that records what was last copied there.
+
+    Each entry maps a path relative to the target directory to the checksum of the source file
+    that was copied and the size and mtime of the resulting target file. A target whose size and
+    mtime still match its entry is assumed to still hold that checksum, so it never has to be read.
+
+    Attributes:
+        path (str): The path of the manifest file on the target.
+        entries (dict): Maps relative paths to {"md5", "size", "mtime_ns"}.
+    """
+
+    def __init__(self, target_directory: str, manifest_name: str):
+        """
+        Initializes a DeployManifest instance, loading the manifest from the target if present.
+
+        Args:
+            target_directory: The deploy target directory.
+            manifest_name: The file name of the manifest inside the target directory.
+        """
+        self.path = os.path.join(target_directory, manifest_name)
+        self.entries = {}
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def is_current(self, relative_path: str, target_path: str, checksum: str) -> bool:
+        """
+        Check whether the target file is recorded as holding the given checksum, using only a stat.
+
+        Args:
+            relative_path: The path of the file relative to the target directory.
+            target_path: The full path of the file on the target.
+            checksum: The checksum of the source file.
+
+        Returns:
+            bool: True if the target is known to match the source, otherwise False.
+        """
+        with self._lock:
+            entry = self.entries.get(relative_path)
+        if not entry or entry.get("md5") != checksum:
+            return False
+        try:
+            stat = os.stat(target_path)
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    def record(self, relative_path: str, target_path: str, checksum: str) -> None:
+        """
+        Record that the target file now holds the given checksum.
+
+        Args:
+            relative_path: The path of the file relative to the target directory.
+            target_path: The full path of the file on the target.
+            checksum: The checksum of the source file that was copied.
+        """
+        stat = os.stat(target_path)
+        with self._lock:
+            self.entries[relative_path] = {
+                "md5": checksum,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+
+    def save(self) -> None:
+        """
+        Write the manifest back to the target.
+        """
+        with self._lock:
+            _write_json_atomically(self.path, self.entries)
+
+
+def _write_json_atomically(path: str, data: dict) -> None:
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(data, file)
+        file.flush()
+    os.replace(temporary_path, path)
+
+
+def copy_if_changed_incremental(
+    files_to_copy: list[str],
+    target_directory: str,
+    base_folder_to_copy_from: str,
+    stat_cache: StatCache,
+    manifest_name: str,
+    max_workers: int = 4,
+    dry_run: bool = False,
+    on_file_done: Optional[Callable[[str, bool], None]] = None,
+) -> tuple[int, int, int]:
+    """
+    Copy files from source to target if they have changed, using a manifest on the target and a
+    local stat cache so unchanged files are skipped without reading either copy.
+
+    Changed files are hashed and copied by a bounded thread pool.
+
+    Args:
+        files_to_copy: List of file paths to copy.
+        target_directory: The target directory for copying files.
+        base_folder_to_copy_from: The base folder to compare file paths against.
+        stat_cache: The local stat cache used to avoid re-hashing unchanged source files.
+        manifest_name: The file name of the manifest inside the target directory.
+        max_workers: The maximum number of files hashed and copied concurrently (default is 4).
+        dry_run: If True, no actual copying will happen (default is False).
+        on_file_done: Optional callback called with (file, copied) as each file finishes.
+
+    Returns:
+        tuple: A tuple containing three values:
+            - The number of deployed files.
+            - The total deployed size in bytes.
+            - The number of bytes that did not have to be read because the file was unchanged.
+    """
+    if not os.path.exists(target_directory) and not dry_run:
+        os.makedirs(target_directory)
+
+    manifest = DeployManifest(target_directory, manifest_name)
+
+    def deploy_file(file):
+        relative_path = os.path.relpath(file, base_folder_to_copy_from)
+        target_path = os.path.join(target_directory, relative_path)
+        checksum = stat_cache.get_checksum(file)
+
+        if manifest.is_current(relative_path, target_path, checksum):
+            return file, False, 0, os.path.getsize(file) + os.path.getsize(target_path)
+
+        if dry_run:
+            return file, True, os.path.getsize(file), 0
+
+        target_dir = os.path.dirname(target_path)
+        os.makedirs(target_dir, exist_ok=True)
+
+        if os.path.isdir(target_path):
+            print(f"{target_path} exists as a folder, removing it")
+            shutil.rmtree(target_path)
+        elif os.path.isfile(target_path):
+            os.remove(target_path)
+
+        shutil.copy(file, target_path)
+        manifest.record(relative_path, target_path, checksum)
+        return file, True, os.path.getsize(file), 0
+
+    deployed_count = 0
+    deployed_size_bytes = 0
+    skipped_size_bytes = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(deploy_file, file) for file in files_to_copy]
+        for future in as_completed(futures):
+            file, copied, size_bytes, skipped_bytes = future.result()
+            if copied:
+                deployed_count += 1
+                deployed_size_bytes += size_bytes
+            skipped_size_bytes += skipped_bytes
+            if on_file_done is not None:
+                on_file_done(file, copied)
+
+    if not dry_run:
+        manifest.save()
+
+    return deployed_count, deployed_size_bytes, skipped_size_bytes
+
+
 class RemovableDisk:
     """
     A class representing a removable disk.
@@ -36,6 +36,22 @@ parser.add_argument(
     "--clear-local-logs", action="store_true", help="Clear the logs from the local logs directory before pulling new logs"
 )
 parser.add_argument("--no-pull-logs", action="store_true", help="Skip pulling logs")
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Skip unchanged files using a manifest on the SD card and a local stat cache, and copy changed files in parallel",
+)
+parser.add_argument(
+    "--jobs",
+    type=int,
+    default=DEPLOY_MAX_WORKERS,
+    help="Maximum number of files copied at the same time with --incremental",
+)
+parser.add_argument(
+    "--compare-full-hash",
+    action="store_true",
+    help="After an incremental push, time a dry run of the full-hash path over the same files and report the time saved",
+)
 parser.add_argument(
     "--verbose", action="store_true", help="Enable verbose/debug output"
 )
@@ -80,6 +96,34 @@ def copy_files_and_update_count(
             progress.update(task, advance=1)
 
 
+# Function to handle the incremental file copy process and update counts
+def copy_files_incremental_and_update_count(
+    source_files, destination_folder, base_folder, update_fn, stat_cache
+):
+    verbose_print(f"Files to copy: {source_files}")
+    with Progress() as progress:
+        task = progress.add_task(
+            f"[cyan]Copying changed files to {destination_folder}...", total=len(source_files)
+        )
+
+        def on_file_done(file, copied):
+            if copied:
+                progress.console.print(f"[cyan]Copied: {file}[/cyan]")
+            progress.update(task, advance=1)
+
+        deployed_count, deployed_size_bytes, skipped_size_bytes = copy_if_changed_incremental(
+            source_files,
+            destination_folder,
+            base_folder,
+            stat_cache,
+            DEPLOY_MANIFEST_NAME,
+            max_workers=args.jobs,
+            on_file_done=on_file_done,
+        )
+        update_fn(deployed_count, deployed_size_bytes)
+        return skipped_size_bytes
+
+
 def clear_robot_logs(directory):
     print(f"removing files recursively from directory: {directory}")
 
@@ -153,33 +197,81 @@ def main():
             update_pulled_count_and_size,
         )
 
+    push_targets = []
     if not args.no_push_src:
-        src_objects = scan_directory(SRC_DIRECTORY, exclude_from_deploy)
-        copy_files_and_update_count(
-            src_objects,
-            str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path)),
-            SRC_DIRECTORY,
-            update_deployed_count_and_size,
+        push_targets.append(
+            (
+                scan_directory(SRC_DIRECTORY, exclude_from_deploy),
+                str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path)),
+                SRC_DIRECTORY,
+            )
         )
 
     if not args.no_push_lib:
-        library_objects = scan_directory(VEXLIB_DIRECTORY, exclude_from_deploy)
-        copy_files_and_update_count(
-            library_objects,
-            str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "VEXlib")),
-            VEXLIB_DIRECTORY,
-            update_deployed_count_and_size,
+        push_targets.append(
+            (
+                scan_directory(VEXLIB_DIRECTORY, exclude_from_deploy),
+                str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "VEXlib")),
+                VEXLIB_DIRECTORY,
+            )
         )
 
     if not args.no_push_assets:
-        deploy_objects = scan_directory(ASSETS_DIRECTORY, exclude_from_deploy)
-        copy_files_and_update_count(
-            deploy_objects,
-            str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "assets")),
-            ASSETS_DIRECTORY,
-            update_deployed_count_and_size,
+        push_targets.append(
+            (
+                scan_directory(ASSETS_DIRECTORY, exclude_from_deploy),
+                str(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "assets")),
+                ASSETS_DIRECTORY,
+            )
         )
 
+    if args.incremental:
+        if args.compare_full_hash:
+            # Run the full-hash check first, so it sees the same changed files as the push
+            # and its reads do not come from a cache the push warmed up
+            full_hash_start_time = time.perf_counter()
+            for source_files, destination_folder, base_folder in push_targets:
+                copy_if_changed(
+                    source_files,
+                    destination_folder,
+                    base_folder_to_copy_from=base_folder,
+                    dry_run=True,
+                )
+            full_hash_time = time.perf_counter() - full_hash_start_time
+
+        push_start_time = time.perf_counter()
+        stat_cache = StatCache(DEPLOY_STAT_CACHE)
+        total_bytes_skipped = 0
+        for source_files, destination_folder, base_folder in push_targets:
+            total_bytes_skipped += copy_files_incremental_and_update_count(
+                source_files,
+                destination_folder,
+                base_folder,
+                update_deployed_count_and_size,
+                stat_cache,
+            )
+        stat_cache.save()
+        push_time = time.perf_counter() - push_start_time
+        console.print(
+            f"[bold green]Incremental push took {round(push_time, 2)} seconds, "
+            f"skipped reading {convert_size(total_bytes_skipped)} "
+            f"({stat_cache.hits} cached checksums, {stat_cache.misses} hashed)[/bold green]"
+        )
+
+        if args.compare_full_hash:
+            console.print(
+                f"[bold green]Full-hash check of the same files took {round(full_hash_time, 2)} seconds, "
+                f"saved {round(full_hash_time - push_time, 2)} seconds[/bold green]"
+            )
+    else:
+        for source_files, destination_folder, base_folder in push_targets:
+            copy_files_and_update_count(
+                source_files,
+                destination_folder,
+                base_folder,
+                update_deployed_count_and_size,
+            )
+
     # Ensure the 'logs' directory exists
     if not os.path.isdir(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "logs")):
         os.mkdir(os.path.join(POSIX_MOUNT_POINT_DIR, vex_disk_path, "logs"))
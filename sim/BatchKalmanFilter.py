@@ -0,0 +1,532 @@
+# python
+"""
+Host-only batched Kalman filters for Monte Carlo tuning studies.
+
+Every filter steps a whole ensemble of trajectories at once, with states of shape (batch, n) and
+covariances of shape (batch, n, n), so a sweep over Q and R scales is a handful of NumPy calls per
+time step instead of one Python filter per trajectory. Q, R and P0 may be given per ensemble member
+as (batch, n, n) arrays, which lets one batch hold every configuration of a sweep.
+
+The models match sim/KalmanFilter.KalmanFilter and sim/ExtendedKalmanFilter.PoseEKF, which remain
+the reference single-trajectory implementations. BatchPoseEKF.update_linear fuses any linear
+measurement of the pose, as ekf_linear_update does in sim/TwoSourcePoseFusionSimulation, so the
+two-rate fusion of that simulation can be swept too.
+"""
+import time
+
+import numpy as np
+
+
+def wrap_angle(a):
+    # normalize to [-pi, pi), like PoseEKF._wrap_angle
+    return (a + np.pi) % (2.0 * np.pi) - np.pi
+
+
+def _batched(matrix, batch, size):
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim == 2:
+        matrix = np.broadcast_to(matrix, (batch, size, size))
+    if matrix.shape != (batch, size, size):
+        raise ValueError(f"Expected shape ({batch}, {size}, {size}) or ({size}, {size}), got {matrix.shape}")
+    return matrix
+
+
+class BatchKalmanFilter:
+    """
+    Discrete linear Kalman filter for an ensemble of trajectories, with the same equations as
+    sim/KalmanFilter.KalmanFilter:
+      x = F x + B u
+      P = F P F^T + Q
+      y = z - H x
+      S = H P H^T + R
+      K = P H^T S^{-1}
+      x = x + K y
+      P = (I - K H) P
+    """
+
+    def __init__(self, F, H, Q, R, P0, x0, batch):
+        """
+        Args:
+          F (array n x n): state transition
+          H (array m x n): measurement matrix
+          Q (array n x n or batch x n x n): process noise
+          R (array m x m or batch x m x m): measurement noise
+          P0 (array n x n or batch x n x n): initial covariance
+          x0 (array n or batch x n): initial state
+          batch (int): number of trajectories
+        """
+        self.F = np.asarray(F, dtype=float)
+        self.H = np.asarray(H, dtype=float)
+        self.n = self.F.shape[0]
+        self.m = self.H.shape[0]
+        self.batch = int(batch)
+        self.Q = _batched(Q, self.batch, self.n)
+        self.R = _batched(R, self.batch, self.m)
+        self.P = _batched(P0, self.batch, self.n).copy()
+        self.x = np.array(np.broadcast_to(np.asarray(x0, dtype=float), (self.batch, self.n)))
+
+    def predict(self, u=None, B=None):
+        self.x = self.x @ self.F.T
+        if u is not None:
+            self.x = self.x + np.asarray(u, dtype=float) @ np.asarray(B, dtype=float).T
+        self.P = self.F @ self.P @ self.F.T + self.Q
+
+    def innovation(self, z):
+        """
+        Returns:
+          (y, S): innovations (batch, m) and their covariances (batch, m, m) before the update
+        """
+        y = np.asarray(z, dtype=float) - self.x @ self.H.T
+        S = self.H @ self.P @ self.H.T + self.R
+        return y, S
+
+    def update(self, z):
+        """
+        Returns:
+          array (batch,): normalized innovation squared of each trajectory
+        """
+        y, S = self.innovation(z)
+        HP = self.H @ self.P
+        # K^T = S^{-1} H P, since P and S are symmetric
+        K = np.swapaxes(np.linalg.solve(S, HP), 1, 2)
+        Sinv_y = np.linalg.solve(S, y[..., None])[..., 0]
+        self.x = self.x + np.einsum("bij,bj->bi", K, y)
+        self.P = self.P - K @ HP
+        return np.einsum("bi,bi->b", y, Sinv_y)
+
+
+class BatchPoseEKF:
+    """
+    PoseEKF for an ensemble of trajectories.
+    State: [x, y, theta, v, omega] per row of x (batch, 5)
+    Measurements: [x, y, theta] (direct)
+    """
+
+    n = 5
+    m = 3
+
+    def __init__(self, Q, R, P0, x0, batch):
+        self.batch = int(batch)
+        self.Q = _batched(Q, self.batch, self.n)
+        self.R = _batched(R, self.batch, self.m)
+        self.P = _batched(P0, self.batch, self.n).copy()
+        self.x = np.array(np.broadcast_to(np.asarray(x0, dtype=float), (self.batch, self.n)))
+        self.H = np.eye(self.m, self.n)
+        self._F = np.broadcast_to(np.eye(self.n), (self.batch, self.n, self.n)).copy()
+
+    def predict(self, dt):
+        x, y, th, v, w = self.x.T
+        cos_th = np.cos(th)
+        sin_th = np.sin(th)
+
+        # Jacobian F, only the entries that depend on the state change between steps
+        F = self._F
+        F[:, 0, 2] = -v * sin_th * dt
+        F[:, 0, 3] = cos_th * dt
+        F[:, 1, 2] = v * cos_th * dt
+        F[:, 1, 3] = sin_th * dt
+        F[:, 2, 4] = dt
+
+        self.x = np.stack([x + v * cos_th * dt, y + v * sin_th * dt, wrap_angle(th + w * dt), v, w], axis=1)
+        self.P = F @ self.P @ np.swapaxes(F, 1, 2) + self.Q
+
+    def innovation(self, z):
+        y = np.asarray(z, dtype=float) - self.x[:, :self.m]
+        y[:, 2] = wrap_angle(y[:, 2])
+        S = self.P[:, :self.m, :self.m] + self.R
+        return y, S
+
+    def update(self, z):
+        """
+        Returns:
+          array (batch,): normalized innovation squared of each trajectory
+        """
+        y, S = self.innovation(z)
+        # H selects the first m states, so H P is the first m rows of P
+        HP = self.P[:, :self.m, :]
+        K = np.swapaxes(np.linalg.solve(S, HP), 1, 2)
+        Sinv_y = np.linalg.solve(S, y[..., None])[..., 0]
+        self.x = self.x + np.einsum("bij,bj->bi", K, y)
+        self.x[:, 2] = wrap_angle(self.x[:, 2])
+        self.P = self.P - K @ HP
+        return np.einsum("bi,bi->b", y, Sinv_y)
+
+    def update_linear(self, H, z, R, angle_measurement_indices=()):
+        """
+        Fuse a linear measurement z = H x, like ekf_linear_update in TwoSourcePoseFusionSimulation.
+
+        Args:
+          H (array k x 5): measurement matrix
+          z (array batch x k): measurements
+          R (array k x k or batch x k x k): measurement noise
+          angle_measurement_indices: measurement entries that are angles, whose innovation is wrapped
+
+        Returns:
+          array (batch,): normalized innovation squared of each trajectory
+        """
+        H = np.asarray(H, dtype=float)
+        R = _batched(R, self.batch, H.shape[0])
+        y = np.asarray(z, dtype=float) - self.x @ H.T
+        for index in angle_measurement_indices:
+            y[:, index] = wrap_angle(y[:, index])
+        HP = H @ self.P
+        S = HP @ H.T + R
+        K = np.swapaxes(np.linalg.solve(S, HP), 1, 2)
+        Sinv_y = np.linalg.solve(S, y[..., None])[..., 0]
+        self.x = self.x + np.einsum("bij,bj->bi", K, y)
+        self.x[:, 2] = wrap_angle(self.x[:, 2])
+        self.P = self.P - K @ HP
+        return np.einsum("bi,bi->b", y, Sinv_y)
+
+
+# --------------------
+# Monte Carlo
+# --------------------
+def simulate_pose_truth(batch, steps, dt, x0, process_std, measurement_std, rng):
+    """
+    Sample true trajectories from the PoseEKF motion model with random accelerations, and noisy
+    [x, y, theta] measurements of them.
+
+    Args:
+      process_std (array 5): standard deviation of the noise added to each state per step
+      measurement_std (array 3): standard deviation of the measurement noise
+      rng (numpy.random.Generator): source of randomness, for reproducible ensembles
+
+    Returns:
+      (truth, measurements): arrays (steps, batch, 5) and (steps, batch, 3)
+    """
+    truth = np.empty((steps, batch, 5))
+    measurements = np.empty((steps, batch, 3))
+    state = np.array(np.broadcast_to(np.asarray(x0, dtype=float), (batch, 5)))
+    process_std = np.asarray(process_std, dtype=float)
+    measurement_std = np.asarray(measurement_std, dtype=float)
+    for k in range(steps):
+        x, y, th, v, w = state.T
+        state = np.stack([x + v * np.cos(th) * dt, y + v * np.sin(th) * dt, th + w * dt, v, w], axis=1)
+        state = state + rng.standard_normal((batch, 5)) * process_std
+        state[:, 2] = wrap_angle(state[:, 2])
+        truth[k] = state
+        measurements[k] = state[:, :3] + rng.standard_normal((batch, 3)) * measurement_std
+        measurements[k, :, 2] = wrap_angle(measurements[k, :, 2])
+    return truth, measurements
+
+
+def run_pose_monte_carlo(kf, truth, measurements, dt):
+    """
+    Run a batched PoseEKF over pre-sampled trajectories.
+
+    Returns:
+      dict with arrays over time steps:
+        'errors': (steps, batch, 5) estimate minus truth after each update
+        'nees': (steps, batch) normalized estimation error squared, averaging 5 when consistent
+        'nis': (steps, batch) normalized innovation squared, averaging 3 when consistent
+    """
+    steps, batch, n = truth.shape
+    errors = np.empty((steps, batch, n))
+    nees = np.empty((steps, batch))
+    nis = np.empty((steps, batch))
+    for k in range(steps):
+        kf.predict(dt)
+        nis[k] = kf.update(measurements[k])
+        error = kf.x - truth[k]
+        error[:, 2] = wrap_angle(error[:, 2])
+        errors[k] = error
+        nees[k] = np.einsum("bi,bi->b", error, np.linalg.solve(kf.P, error[..., None])[..., 0])
+    return {"errors": errors, "nees": nees, "nis": nis}
+
+
+H_POSITION = np.eye(2, 5)
+H_POSE = np.eye(3, 5)
+
+
+def run_two_source_monte_carlo(kf, truth, position_measurements, pose_measurements, R_position, R_pose, dt,
+                               position_rate, pose_rate):
+    """
+    Run a batched PoseEKF fusing a slow [x, y] sensor and a faster [x, y, theta] sensor, each updating on
+    the same schedule as two_source_fusion_experiment in sim/SweepRunner.
+
+    Args:
+      position_measurements (array steps x batch x 2), pose_measurements (array steps x batch x 3):
+        a measurement of each sensor at every step, of which only the ones at the sensor's rate are used
+      R_position, R_pose (array k x k or batch x k x k): noise of each sensor
+      position_rate, pose_rate (float): measurements per second of each sensor
+
+    Returns:
+      dict with arrays over time steps, NaN in steps a sensor did not update:
+        'errors': (steps, batch, 5) estimate minus truth
+        'nees': (steps, batch) normalized estimation error squared, averaging 5 when consistent
+        'nis_position': (steps, batch) normalized innovation squared, averaging 2 when consistent
+        'nis_pose': (steps, batch) normalized innovation squared, averaging 3 when consistent
+    """
+    steps, batch, n = truth.shape
+    errors = np.empty((steps, batch, n))
+    nees = np.empty((steps, batch))
+    nis_position = np.full((steps, batch), np.nan)
+    nis_pose = np.full((steps, batch), np.nan)
+    position_dt = 1.0 / position_rate
+    pose_dt = 1.0 / pose_rate
+    position_time = 0.0
+    pose_time = 0.0
+    for k in range(steps):
+        kf.predict(dt)
+        position_time += dt
+        pose_time += dt
+        if position_time >= position_dt:
+            nis_position[k] = kf.update_linear(H_POSITION, position_measurements[k], R_position)
+            position_time -= position_dt
+        if pose_time >= pose_dt:
+            nis_pose[k] = kf.update_linear(H_POSE, pose_measurements[k], R_pose, angle_measurement_indices=(2,))
+            pose_time -= pose_dt
+        error = kf.x - truth[k]
+        error[:, 2] = wrap_angle(error[:, 2])
+        errors[k] = error
+        nees[k] = np.einsum("bi,bi->b", error, np.linalg.solve(kf.P, error[..., None])[..., 0])
+    return {"errors": errors, "nees": nees, "nis_position": nis_position, "nis_pose": nis_pose}
+
+
+def summarize(results, groups, burn_in=0):
+    """
+    Reduce Monte Carlo results to one row per configuration.
+
+    Args:
+      results: output of run_pose_monte_carlo or run_two_source_monte_carlo
+      groups (array batch): configuration index of each trajectory
+      burn_in (int): initial steps to leave out while the filter converges
+
+    Returns:
+      list of dict: per configuration, 'rmse' per state and the mean of every other result ('nees',
+      'nis', ...) over time and trajectories, skipping steps without that result
+    """
+    groups = np.asarray(groups)
+    errors = results["errors"][burn_in:]
+    rows = []
+    for group in np.unique(groups):
+        members = groups == group
+        row = {"group": int(group), "rmse": np.sqrt(np.mean(errors[:, members] ** 2, axis=(0, 1)))}
+        for name, values in results.items():
+            if name != "errors":
+                row[name] = float(np.nanmean(values[burn_in:, members]))
+        rows.append(row)
+    return rows
+
+
+def sweep_pose_noise(q_scales, r_scales, trajectories=500, steps=300, dt=1.0 / 30.0, seed=0):
+    """
+    Evaluate a PoseEKF on the same ensemble of true trajectories for every combination of Q and R
+    scales, all in a single batch.
+
+    Returns:
+      list of dict: one row per (q_scale, r_scale) with 'rmse', 'nees' and 'nis'
+    """
+    process_std = np.array([1e-3, 1e-3, 1e-3, 2e-2, 2e-2])
+    measurement_std = np.array([0.15, 0.15, 0.15])
+    x0 = np.array([0.0, 0.0, 0.0, 0.6, 0.4])
+
+    rng = np.random.default_rng(seed)
+    truth, measurements = simulate_pose_truth(trajectories, steps, dt, x0, process_std, measurement_std, rng)
+
+    configurations = [(q, r) for q in q_scales for r in r_scales]
+    batch = trajectories * len(configurations)
+    Q = np.repeat(np.stack([np.diag(process_std ** 2) * q for q, _ in configurations]), trajectories, axis=0)
+    R = np.repeat(np.stack([np.diag(measurement_std ** 2) * r for _, r in configurations]), trajectories, axis=0)
+    groups = np.repeat(np.arange(len(configurations)), trajectories)
+
+    kf = BatchPoseEKF(Q=Q, R=R, P0=np.diag([1e-2, 1e-2, 1e-2, 1e-1, 1e-1]), x0=x0, batch=batch)
+    tile = (1, len(configurations), 1)
+    results = run_pose_monte_carlo(kf, np.tile(truth, tile), np.tile(measurements, tile), dt)
+
+    rows = summarize(results, groups, burn_in=steps // 5)
+    for row in rows:
+        row["q_scale"], row["r_scale"] = configurations[row["group"]]
+    return rows
+
+
+def sweep_two_source_noise(q_scales, position_r_scales, pose_r_scales, trajectories=500, steps=300, dt=1.0 / 30.0,
+                           position_rate=5.0, pose_rate=15.0, seed=0):
+    """
+    Evaluate the two-rate PoseEKF fusion on the same ensemble of true trajectories for every combination
+    of Q and per-sensor R scales, all in a single batch.
+
+    Returns:
+      list of dict: one row per (q_scale, position_r_scale, pose_r_scale) with 'rmse', 'nees',
+      'nis_position' and 'nis_pose'
+    """
+    process_std = np.array([1e-3, 1e-3, 1e-3, 2e-2, 2e-2])
+    position_std = np.array([0.2, 0.2])
+    pose_std = np.array([0.12, 0.12, 0.08])
+    x0 = np.array([0.0, 0.0, 0.0, 0.6, 0.4])
+
+    rng = np.random.default_rng(seed)
+    truth, pose_measurements = simulate_pose_truth(trajectories, steps, dt, x0, process_std, pose_std, rng)
+    position_measurements = truth[..., :2] + rng.standard_normal((steps, trajectories, 2)) * position_std
+
+    configurations = [(q, ra, rb) for q in q_scales for ra in position_r_scales for rb in pose_r_scales]
+    batch = trajectories * len(configurations)
+    Q = np.repeat(np.stack([np.diag(process_std ** 2) * q for q, _, _ in configurations]), trajectories, axis=0)
+    R_position = np.repeat(np.stack([np.diag(position_std ** 2) * ra for _, ra, _ in configurations]),
+                           trajectories, axis=0)
+    R_pose = np.repeat(np.stack([np.diag(pose_std ** 2) * rb for _, _, rb in configurations]), trajectories, axis=0)
+    groups = np.repeat(np.arange(len(configurations)), trajectories)
+
+    kf = BatchPoseEKF(Q=Q, R=R_pose, P0=np.diag([1e-2, 1e-2, 1e-2, 1e-1, 1e-1]), x0=x0, batch=batch)
+    tile = (1, len(configurations), 1)
+    results = run_two_source_monte_carlo(kf, np.tile(truth, tile), np.tile(position_measurements, tile),
+                                         np.tile(pose_measurements, tile), R_position, R_pose, dt,
+                                         position_rate, pose_rate)
+
+    rows = summarize(results, groups, burn_in=steps // 5)
+    for row in rows:
+        row["q_scale"], row["position_r_scale"], row["pose_r_scale"] = configurations[row["group"]]
+    return rows
+
+
+def compare_with_kalman_filter(steps=100, seed=1):
+    """
+    Returns:
+      float: largest state difference between BatchKalmanFilter and the reference KalmanFilter on
+      one constant velocity trajectory
+    """
+    from VEXLib.Math.Matrix import Matrix, Shape
+    from sim.KalmanFilter import KalmanFilter
+
+    dt = 0.1
+    F = np.array([[1.0, dt], [0.0, 1.0]])
+    H = np.array([[1.0, 0.0]])
+    Q = np.diag([1e-4, 1e-3])
+    R = np.array([[0.05]])
+    x0 = [0.0, 1.0]
+    rng = np.random.default_rng(seed)
+
+    def to_matrix(array):
+        return Matrix(Shape(array.shape[1], array.shape[0]), array.tolist())
+
+    reference = KalmanFilter(n=2, m=1, F=to_matrix(F), H=to_matrix(H), Q=to_matrix(Q), R=to_matrix(R),
+                             P=Matrix.identity(2), x0=x0)
+    batched = BatchKalmanFilter(F=F, H=H, Q=Q, R=R, P0=np.eye(2), x0=x0, batch=1)
+    difference = 0.0
+    for k in range(steps):
+        z = [k * dt + rng.normal(0.0, 0.2)]
+        reference.predict()
+        reference.update(z)
+        batched.predict()
+        batched.update(np.array([z]))
+        difference = max(difference, np.max(np.abs(np.array(reference.state()) - batched.x[0])))
+    return difference
+
+
+def compare_with_two_source_fusion(steps=100, dt=1.0 / 30.0, seed=1):
+    """
+    Returns:
+      float: largest state difference between BatchPoseEKF.update_linear and ekf_linear_update from
+      sim/TwoSourcePoseFusionSimulation on one trajectory fused from both sensors
+    """
+    from VEXLib.Math.Matrix import Matrix, Shape
+    from sim.ExtendedKalmanFilter import PoseEKF
+    from sim.TwoSourcePoseFusionSimulation import ekf_linear_update
+
+    Q = np.diag([1e-3] * 5)
+    R_position = np.diag([0.04] * 2)
+    R_pose = np.diag([0.0144, 0.0144, 0.0064])
+    x0 = [0.0, 0.0, 0.0, 0.6, 0.4]
+    rng = np.random.default_rng(seed)
+    truth, pose_measurements = simulate_pose_truth(1, steps, dt, x0, [1e-3, 1e-3, 1e-3, 2e-2, 2e-2],
+                                                   [0.12, 0.12, 0.08], rng)
+    position_measurements = truth[..., :2] + rng.standard_normal((steps, 1, 2)) * 0.2
+
+    def to_matrix(array):
+        return Matrix(Shape(array.shape[1], array.shape[0]), array.tolist())
+
+    reference = PoseEKF(Q=to_matrix(Q), R=to_matrix(R_pose), x0=x0)
+    batched = BatchPoseEKF(Q=Q, R=R_pose, P0=np.eye(5), x0=x0, batch=1)
+    difference = 0.0
+    for k in range(steps):
+        reference.predict(dt)
+        batched.predict(dt)
+        if k % 6 == 0:
+            ekf_linear_update(reference, to_matrix(H_POSITION), list(position_measurements[k, 0]),
+                              to_matrix(R_position))
+            batched.update_linear(H_POSITION, position_measurements[k], R_position)
+        if k % 2 == 0:
+            ekf_linear_update(reference, to_matrix(H_POSE), list(pose_measurements[k, 0]), to_matrix(R_pose),
+                              angle_meas_indices=[2])
+            batched.update_linear(H_POSE, pose_measurements[k], R_pose, angle_measurement_indices=(2,))
+        difference = max(difference, np.max(np.abs(np.array(reference.state()) - batched.x[0])))
+    return difference
+
+
+def compare_with_pose_ekf(steps=100, dt=1.0 / 30.0, seed=1):
+    """
+    Returns:
+      (difference, seconds): largest state difference between BatchPoseEKF and the reference
+      PoseEKF on one trajectory, and PoseEKF's time per step
+    """
+    from VEXLib.Math.Matrix import Matrix, Shape
+    from sim.ExtendedKalmanFilter import PoseEKF
+
+    Q = np.diag([1e-3] * 5)
+    R = np.diag([1e-2] * 3)
+    x0 = [0.0, 0.0, 0.0, 0.6, 0.4]
+    rng = np.random.default_rng(seed)
+    _, measurements = simulate_pose_truth(1, steps, dt, x0, [1e-3, 1e-3, 1e-3, 2e-2, 2e-2], [0.1] * 3, rng)
+
+    reference = PoseEKF(Q=Matrix(Shape(5, 5), Q.tolist()), R=Matrix(Shape(3, 3), R.tolist()), x0=x0)
+    batched = BatchPoseEKF(Q=Q, R=R, P0=np.eye(5), x0=x0, batch=1)
+    difference = 0.0
+    reference_time = 0.0
+    for z in measurements[:, 0]:
+        start_time = time.perf_counter()
+        reference.predict(dt)
+        reference.update(list(z))
+        reference_time += time.perf_counter() - start_time
+        batched.predict(dt)
+        batched.update(z[None, :])
+        difference = max(difference, np.max(np.abs(np.array(reference.state()) - batched.x[0])))
+    return difference, reference_time / steps
+
+
+def main():
+    q_scales = [0.1, 1.0, 10.0]
+    r_scales = [0.25, 1.0, 4.0]
+    trajectories = 500
+    steps = 300
+
+    start_time = time.perf_counter()
+    rows = sweep_pose_noise(q_scales, r_scales, trajectories=trajectories, steps=steps)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"PoseEKF Q/R sweep: {len(rows)} configurations x {trajectories} trajectories x {steps} steps "
+          f"in {elapsed:.2f}s")
+    print("NEES should average 5 and NIS 3 when the filter's Q and R match the simulated noise (scale 1)")
+    print(f"{'q_scale':>7} {'r_scale':>7} | {'rmse x':>8} {'rmse y':>8} {'rmse th':>8} {'rmse v':>8} "
+          f"{'rmse w':>8} | {'NEES':>7} {'NIS':>6}")
+    for row in rows:
+        rmse = row["rmse"]
+        print(f"{row['q_scale']:>7} {row['r_scale']:>7} | {rmse[0]:>8.4f} {rmse[1]:>8.4f} {rmse[2]:>8.4f} "
+              f"{rmse[3]:>8.4f} {rmse[4]:>8.4f} | {row['nees']:>7.2f} {row['nis']:>6.2f}")
+
+    start_time = time.perf_counter()
+    rows = sweep_two_source_noise([0.1, 1.0, 10.0], [0.25, 1.0, 4.0], [0.25, 1.0, 4.0], trajectories=200,
+                                  steps=steps)
+    elapsed_two_source = time.perf_counter() - start_time
+    print(f"\nTwo-rate fusion sweep: {len(rows)} configurations x 200 trajectories x {steps} steps "
+          f"in {elapsed_two_source:.2f}s")
+    print(f"{'q_scale':>7} {'r_pos':>5} {'r_pose':>6} | {'rmse x':>8} {'rmse y':>8} {'rmse th':>8} | "
+          f"{'NEES':>7} {'NIS pos':>7} {'NIS pose':>8}")
+    for row in rows:
+        rmse = row["rmse"]
+        print(f"{row['q_scale']:>7} {row['position_r_scale']:>5} {row['pose_r_scale']:>6} | {rmse[0]:>8.4f} "
+              f"{rmse[1]:>8.4f} {rmse[2]:>8.4f} | {row['nees']:>7.2f} {row['nis_position']:>7.2f} "
+              f"{row['nis_pose']:>8.2f}")
+
+    difference, reference_time = compare_with_pose_ekf()
+    batched_time = elapsed / (len(q_scales) * len(r_scales) * trajectories * steps)
+    print(f"\nLargest state difference from PoseEKF on one trajectory: {difference:.1e}")
+    print(f"Largest state difference from KalmanFilter on one trajectory: {compare_with_kalman_filter():.1e}")
+    print(f"Largest state difference from ekf_linear_update on one trajectory: "
+          f"{compare_with_two_source_fusion():.1e}")
+    print(f"Time per trajectory step: PoseEKF {reference_time * 1e6:.0f}us, batched {batched_time * 1e6:.2f}us "
+          f"({reference_time / batched_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
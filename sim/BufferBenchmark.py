@@ -0,0 +1,45 @@
+import time
+
+from VEXLib.Util.Buffer import Buffer
+
+WINDOW_SIZES = [10, 100, 1000, 10000]
+ADDS = 100000
+
+
+class ListBuffer:
+    """The previous Buffer implementation, which shifts the whole list once it is full."""
+
+    def __init__(self, length):
+        self.length = length
+        self.buffer = []
+
+    def add(self, data):
+        if len(self.buffer) >= self.length:
+            self.buffer.pop(0)
+        self.buffer.append(data)
+
+
+def time_adds(buffer):
+    # Fill the buffer first so every timed add has to remove the oldest element
+    for i in range(buffer.length):
+        buffer.add(float(i))
+    start_time = time.perf_counter()
+    for i in range(ADDS):
+        buffer.add(i * 0.5)
+    return (time.perf_counter() - start_time) / ADDS
+
+
+def main():
+    print(f"{ADDS} adds to a full buffer, time per add")
+    print(f"{'window':>7} | {'list pop(0)':>12} {'ring':>10} {'typed ring':>11}")
+    for window in WINDOW_SIZES:
+        list_time = time_adds(ListBuffer(window))
+        ring_time = time_adds(Buffer(window))
+        typed_time = time_adds(Buffer(window, "d"))
+        print(
+            f"{window:>7} | {list_time * 1e9:>10.0f}ns {ring_time * 1e9:>8.0f}ns {typed_time * 1e9:>9.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
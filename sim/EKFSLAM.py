@@ -2,7 +2,6 @@
 # File: sim/EKFSLAMSimulation.py
 import math
 import random
-import pygame
 from VEXLib.Math.Matrix import Matrix, Shape
 
 # -----------------------
@@ -64,6 +63,7 @@ def eig2(a, b, c, d):
     return l1, l2, v1
 
 def draw_cov_ellipse(surface, center_px, cov_2x2, scale, color=(80,140,255,60)):
+    import pygame
     a = cov_2x2[0][0]; b = cov_2x2[0][1]; c = cov_2x2[1][0]; d = cov_2x2[1][1]
     l1, l2, v1 = eig2(a, b, c, d)
     chi2_95 = 5.991
@@ -345,6 +345,13 @@ class EKFSLAM:
     def state(self):
         return [self.x.data[i][0] for i in range(self.dim)]
 
+    def landmark(self, i):
+        return self.x.data[3 + 2 * i][0], self.x.data[3 + 2 * i + 1][0]
+
+    def landmark_covariance(self, i):
+        a = 3 + 2 * i
+        return [[self.P.data[a][a], self.P.data[a][a + 1]], [self.P.data[a + 1][a], self.P.data[a + 1][a + 1]]]
+
     def _ensure_col(self, v, expected_rows=None):
         if isinstance(v, Matrix):
             if expected_rows is not None and v.shape.y_size != expected_rows:
@@ -363,6 +370,230 @@ class EKFSLAM:
         transposed = [[mat.data[r][c] for r in range(rows)] for c in range(cols)]
         return Matrix(Shape(rows, cols), transposed)
 
+class BlockEKFSLAM:
+    """
+    Range-only EKF-SLAM (2D) with the same model, gating and landmark handling as EKFSLAM, but with
+    the covariance kept in blocks so every step only touches the blocks it changes:
+      * P_rr: 3x3 robot-robot block
+      * P_rl: 3 x 2N robot-landmark block (the landmark-robot block is its transpose)
+      * P_ll: 2N x 2N landmark-landmark block
+    Costs per step, for N landmarks:
+      * predict only moves the robot, so it updates P_rr and P_rl in O(N) and leaves P_ll alone
+      * a range measurement only involves the robot position and one landmark, so the innovation
+        of each candidate landmark is O(1) and gating a beam is O(N)
+      * the accepted update is a rank-1 correction, O(N^2), instead of EKFSLAM's O(N^3)
+      * initializing a landmark adds one row and column of blocks in O(N)
+    """
+    def __init__(self, Q=None, P0=None, max_landmarks=60, min_init_range=0.1):
+        self.n_robot = 3
+        self.robot = [0.0, 0.0, 0.0]
+        self.landmarks = []
+        if P0 is None:
+            P0 = Matrix.identity(self.n_robot)
+        self.P_rr = [[float(value) for value in row] for row in P0.data]
+        self.P_rl = [[] for _ in range(self.n_robot)]
+        self.P_ll = []
+        if Q is None:
+            Q = diag_matrix(self.n_robot, 1e-3)
+        self.Q = Q
+        self.num_landmarks = 0
+        self.max_landmarks = int(max_landmarks)
+        self.min_init_range = float(min_init_range)
+
+    @property
+    def dim(self):
+        return self.n_robot + len(self.landmarks)
+
+    @property
+    def x(self):
+        """Full state column, built on demand for code written against EKFSLAM."""
+        return Matrix(Shape(1, self.dim), [[value] for value in self.state()])
+
+    @property
+    def P(self):
+        """Full covariance, built on demand for code written against EKFSLAM. O(N^2)."""
+        rows = [self.P_rr[i] + self.P_rl[i] for i in range(self.n_robot)]
+        for j, row in enumerate(self.P_ll):
+            rows.append([self.P_rl[0][j], self.P_rl[1][j], self.P_rl[2][j]] + row)
+        return Matrix(Shape(self.dim, self.dim), rows)
+
+    def state(self):
+        return self.robot + self.landmarks
+
+    def landmark(self, i):
+        return self.landmarks[2 * i], self.landmarks[2 * i + 1]
+
+    def landmark_covariance(self, i):
+        a = 2 * i
+        return [[self.P_ll[a][a], self.P_ll[a][a + 1]], [self.P_ll[a + 1][a], self.P_ll[a + 1][a + 1]]]
+
+    def predict(self, v, w, dt):
+        xr, yr, th = self.robot
+        self.robot = [xr + v * math.cos(th) * dt, yr + v * math.sin(th) * dt, wrap_angle(th + w * dt)]
+
+        # F is the identity apart from the robot block: rows 0 and 1 depend on theta
+        f02 = -v * math.sin(th) * dt
+        f12 = v * math.cos(th) * dt
+
+        # P_rl <- F_rr P_rl, and P_ll is unchanged
+        r0, r1, r2 = self.P_rl
+        if f02 != 0.0:
+            self.P_rl[0] = [a + f02 * c for a, c in zip(r0, r2)]
+        if f12 != 0.0:
+            self.P_rl[1] = [b + f12 * c for b, c in zip(r1, r2)]
+
+        # P_rr <- F_rr P_rr F_rr^T + Q
+        P = self.P_rr
+        FP = [
+            [P[0][j] + f02 * P[2][j] for j in range(3)],
+            [P[1][j] + f12 * P[2][j] for j in range(3)],
+            list(P[2]),
+        ]
+        Q = self.Q.data
+        self.P_rr = [
+            [FP[i][0] + FP[i][2] * f02 + Q[i][0], FP[i][1] + FP[i][2] * f12 + Q[i][1], FP[i][2] + Q[i][2]]
+            for i in range(3)
+        ]
+
+    def update_ranges(self, ranges, bearings, R_range, gating_thresh=3.84):
+        """
+        Sequentially process range beams. Default gating is 3.84 (1-DOF ~95%).
+        Avoids initializing landmarks when range < min_init_range or when cap reached.
+        """
+        for r_meas, b in zip(ranges, bearings):
+            if r_meas <= 0.0 or r_meas < self.min_init_range:
+                continue
+
+            xr, yr = self.robot[0], self.robot[1]
+            P_rr = self.P_rr
+            P_rl0, P_rl1 = self.P_rl[0], self.P_rl[1]
+            P_ll = self.P_ll
+            landmarks = self.landmarks
+            # Robot position variances, shared by every candidate
+            pxx, pxy, pyy = P_rr[0][0], P_rr[0][1], P_rr[1][1]
+
+            best_idx = None
+            best_mahal = float('inf')
+            best = None
+            for li in range(self.num_landmarks):
+                a = 2 * li
+                dx = landmarks[a] - xr
+                dy = landmarks[a + 1] - yr
+                dist = math.hypot(dx, dy)
+                if dist < 1e-6:
+                    dist = 1e-6
+                # H is (-ux, -uy, 0) on the robot and (ux, uy) on this landmark
+                ux = dx / dist
+                uy = dy / dist
+
+                # S = H P H^T + R from the four covariance entries H touches
+                robot_part = ux * ux * pxx + 2 * ux * uy * pxy + uy * uy * pyy
+                row_a = P_ll[a]
+                row_b = P_ll[a + 1]
+                landmark_part = ux * ux * row_a[a] + 2 * ux * uy * row_a[a + 1] + uy * uy * row_b[a + 1]
+                cross_part = ux * (ux * P_rl0[a] + uy * P_rl0[a + 1]) + uy * (ux * P_rl1[a] + uy * P_rl1[a + 1])
+                Sval = robot_part + landmark_part - 2 * cross_part + R_range
+
+                y = r_meas - dist
+                mahal = float('inf') if Sval <= 0.0 else (y * y) / Sval
+                if mahal < best_mahal:
+                    best_mahal = mahal
+                    best_idx = li
+                    best = (ux, uy, Sval, dist)
+
+            if best_idx is None or best_mahal > gating_thresh:
+                if self.num_landmarks >= self.max_landmarks:
+                    continue
+                self._initialize_landmark_from_range(r_meas, b, R_range)
+                if self.num_landmarks > self.max_landmarks:
+                    self._prune_oldest(self.num_landmarks - self.max_landmarks)
+                continue
+
+            ux, uy, Sval, dist = best
+            if Sval <= 0.0:
+                continue
+            self._update_range(2 * best_idx, ux, uy, Sval, r_meas - dist)
+
+    def _update_range(self, a, ux, uy, Sval, innovation):
+        # u = P H^T, split into the robot and landmark parts, reading only the columns H touches
+        P_rr = self.P_rr
+        P_rl = self.P_rl
+        u_r = [
+            -ux * P_rr[i][0] - uy * P_rr[i][1] + ux * P_rl[i][a] + uy * P_rl[i][a + 1]
+            for i in range(3)
+        ]
+        column_a = P_rl[0]
+        column_b = P_rl[1]
+        u_l = [
+            -ux * pa - uy * pb + ux * row[a] + uy * row[a + 1]
+            for pa, pb, row in zip(column_a, column_b, self.P_ll)
+        ]
+
+        # x <- x + K y with K = u / S
+        scale = innovation / Sval
+        self.robot = [value + k * scale for value, k in zip(self.robot, u_r)]
+        self.robot[2] = wrap_angle(self.robot[2])
+        self.landmarks = [value + k * scale for value, k in zip(self.landmarks, u_l)]
+
+        # P <- P - u u^T / S, one block at a time
+        inverse_S = 1.0 / Sval
+        k_r = [value * inverse_S for value in u_r]
+        self.P_rr = [[p - k * u for p, u in zip(row, u_r)] for row, k in zip(P_rr, k_r)]
+        self.P_rl = [[p - k * u for p, u in zip(row, u_l)] for row, k in zip(P_rl, k_r)]
+        self.P_ll = [
+            [p - k * u for p, u in zip(row, u_l)]
+            for row, k in zip(self.P_ll, [value * inverse_S for value in u_l])
+        ]
+
+    def _initialize_landmark_from_range(self, r, bearing, R_range):
+        xr, yr, th = self.robot
+        phi = wrap_angle(th + bearing)
+        self.landmarks += [xr + r * math.cos(phi), yr + r * math.sin(phi)]
+        self.num_landmarks += 1
+
+        # The new landmark depends only on the robot pose, through J = d(l)/d(robot)
+        j02 = -r * math.sin(phi)
+        j12 = r * math.cos(phi)
+
+        # Cross covariance of every existing variable with the new landmark: P[:, robot] J^T
+        P_rr = self.P_rr
+        P_rl = self.P_rl
+        for i in range(3):
+            row = P_rr[i]
+            P_rl[i] += [row[0] + row[2] * j02, row[1] + row[2] * j12]
+        new_x = []
+        new_y = []
+        for j, row in enumerate(self.P_ll):
+            p0, p1, p2 = P_rl[0][j], P_rl[1][j], P_rl[2][j]
+            cx = p0 + p2 * j02
+            cy = p1 + p2 * j12
+            row += [cx, cy]
+            new_x.append(cx)
+            new_y.append(cy)
+
+        # J P_rr J^T plus a small initial uncertainty
+        a = len(self.landmarks) - 2
+        lxx = P_rl[0][a] + j02 * P_rl[2][a] + 1e-2
+        lxy = P_rl[0][a + 1] + j02 * P_rl[2][a + 1]
+        lyx = P_rl[1][a] + j12 * P_rl[2][a]
+        lyy = P_rl[1][a + 1] + j12 * P_rl[2][a + 1] + 1e-2
+        self.P_ll.append(new_x + [lxx, lxy])
+        self.P_ll.append(new_y + [lyx, lyy])
+
+    def _prune_oldest(self, count=1):
+        """Remove `count` oldest landmarks (simple FIFO)."""
+        count = int(max(1, count))
+        for _ in range(count):
+            if self.num_landmarks == 0:
+                return
+            del self.landmarks[0:2]
+            for row in self.P_rl:
+                del row[0:2]
+            del self.P_ll[0:2]
+            for row in self.P_ll:
+                del row[0:2]
+            self.num_landmarks -= 1
+
 # -----------------------
 # Environment raycast helpers
 # -----------------------
@@ -396,6 +627,9 @@ def raycast_walls(rx, ry, angle, walls, max_range=10.0):
 # Simulation
 # -----------------------
 def main():
+    # Only the visualisation needs pygame, so the filters can be imported without it
+    import pygame
+
     pygame.init()
     W, H = 1000, 800
     screen = pygame.display.set_mode((W, H))
@@ -425,7 +659,7 @@ def main():
     R_range = sensor_noise**2
 
     # EKF-SLAM
-    slam = EKFSLAM(Q=diag_matrix(3, 1e-4))
+    slam = BlockEKFSLAM(Q=diag_matrix(3, 1e-4))
     # optionally pre-seed a landmark (none)
     running = True
     sim_dt = 1.0 / 30.0
@@ -499,17 +733,12 @@ def main():
 
         # draw landmarks
         for i in range(slam.num_landmarks):
-            lx = slam.x.data[3 + 2*i][0]
-            ly = slam.x.data[3 + 2*i + 1][0]
+            lx, ly = slam.landmark(i)
             px = origin[0] + lx*scale
             py = origin[1] - ly*scale
             pygame.draw.circle(screen, (255,200,60), (int(px), int(py)), 5)
             # draw covariance ellipse for landmark
-            a = slam.P.data[3+2*i][3+2*i]
-            b = slam.P.data[3+2*i][3+2*i+1] if 3+2*i+1 < slam.dim else 0.0
-            c = slam.P.data[3+2*i+1][3+2*i] if 3+2*i+1 < slam.dim else 0.0
-            d = slam.P.data[3+2*i+1][3+2*i+1] if 3+2*i+1 < slam.dim else 0.0
-            cov = [[a, b], [c, d]]
+            cov = slam.landmark_covariance(i)
             draw_cov_ellipse(screen, (int(px), int(py)), cov, scale, color=(255,200,60,60))
 
         # HUD
@@ -0,0 +1,91 @@
+import math
+import random
+import time
+
+from sim.EKFSLAM import BlockEKFSLAM, EKFSLAM, diag_matrix
+
+LANDMARK_COUNTS = [10, 25, 50, 100, 200]
+# The dense filter's update is cubic in the state size, so it is only timed up to this many landmarks
+REFERENCE_MAX_LANDMARKS = 50
+BEAMS = 4
+STEPS = 3
+R_RANGE = 0.05 ** 2
+DT = 1.0 / 30.0
+
+
+def build(filter_class, landmark_count):
+    """A filter that has already initialized landmark_count landmarks around the robot."""
+    slam = filter_class(Q=diag_matrix(3, 1e-4), max_landmarks=landmark_count)
+    rng = random.Random(landmark_count)
+    for _ in range(landmark_count):
+        slam.predict(0.3, 0.1, DT)
+        slam._initialize_landmark_from_range(rng.uniform(1.0, 6.0), rng.uniform(-math.pi, math.pi), R_RANGE)
+    return slam
+
+
+def measurements(slam, rng):
+    """Noisy ranges to a few existing landmarks, along their current bearings."""
+    state = slam.state()
+    xr, yr, th = state[0], state[1], state[2]
+    ranges = []
+    bearings = []
+    for i in rng.sample(range(slam.num_landmarks), BEAMS):
+        dx = state[3 + 2 * i] - xr
+        dy = state[3 + 2 * i + 1] - yr
+        ranges.append(math.hypot(dx, dy) + rng.gauss(0.0, 0.05))
+        bearings.append(math.atan2(dy, dx) - th)
+    return ranges, bearings
+
+
+def run_steps(slam, landmark_count):
+    rng = random.Random(landmark_count + 1)
+    predict_time = 0.0
+    update_time = 0.0
+    for _ in range(STEPS):
+        ranges, bearings = measurements(slam, rng)
+        start_time = time.perf_counter()
+        slam.predict(0.3, 0.1, DT)
+        predict_time += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        slam.update_ranges(ranges, bearings, R_RANGE, gating_thresh=6.63)
+        update_time += time.perf_counter() - start_time
+    return predict_time / STEPS, update_time / STEPS
+
+
+def largest_difference(a, b):
+    state_difference = max(abs(x - y) for x, y in zip(a.state(), b.state()))
+    covariance_difference = max(
+        abs(x - y) for row_a, row_b in zip(a.P.data, b.P.data) for x, y in zip(row_a, row_b)
+    )
+    return max(state_difference, covariance_difference)
+
+
+def main():
+    print(f"Time per step of predict and a {BEAMS}-beam update_ranges")
+    print(
+        f"{'landmarks':>9} {'dim':>4} | {'dense predict':>13} {'dense update':>12} | "
+        f"{'block predict':>13} {'block update':>12} | {'speedup':>7} {'difference':>10}"
+    )
+    for landmark_count in LANDMARK_COUNTS:
+        block = build(BlockEKFSLAM, landmark_count)
+        block_predict, block_update = run_steps(block, landmark_count)
+        row = f"{landmark_count:>9} {block.dim:>4} | "
+
+        if landmark_count <= REFERENCE_MAX_LANDMARKS:
+            dense = build(EKFSLAM, landmark_count)
+            dense_predict, dense_update = run_steps(dense, landmark_count)
+            speedup = (dense_predict + dense_update) / (block_predict + block_update)
+            row += f"{dense_predict * 1e3:>11.2f}ms {dense_update * 1e3:>10.2f}ms | "
+        else:
+            row += f"{'-':>13} {'-':>12} | "
+
+        row += f"{block_predict * 1e3:>11.3f}ms {block_update * 1e3:>10.2f}ms | "
+        if landmark_count <= REFERENCE_MAX_LANDMARKS:
+            row += f"{speedup:>6.0f}x {largest_difference(block, dense):>10.1e}"
+        else:
+            row += f"{'-':>7} {'-':>10}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # python
 import math
 from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition
 
 class PoseEKF:
     """
@@ -32,6 +33,8 @@ class PoseEKF:
             [0.0, 0.0, 1.0, 0.0, 0.0],  # theta
         ]
         self.H = Matrix(Shape(self.n, self.m), H_data)
+        # Factorization of the innovation covariance, reused between updates
+        self._S_factor = None
 
     # --------------------
     # Public API
@@ -93,11 +96,15 @@ class PoseEKF:
         y.data[2][0] = self._wrap_angle(y.data[2][0])
 
         # S = H P H^T + R
-        S = (self.H * self.P * self._transpose(self.H)) + self.R
-        S_inv = S.inverse()
-
-        # K = P H^T S^{-1}
-        K = self.P * self._transpose(self.H) * S_inv
+        PHt = self.P * self._transpose(self.H)
+        S = (self.H * PHt) + self.R
+
+        # K = P H^T S^{-1}, solved as S K^T = (P H^T)^T since S is symmetric
+        if self._S_factor is None:
+            self._S_factor = CholeskyDecomposition(S)
+        else:
+            self._S_factor.factor(S)
+        K = self._transpose(self._S_factor.solve(self._transpose(PHt)))
 
         # x = x + K y
         self.x = self.x + (K * y)
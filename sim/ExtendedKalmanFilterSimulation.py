@@ -3,6 +3,7 @@ import math
 import random
 import pygame
 from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition
 from sim.ExtendedKalmanFilter import PoseEKF
 
 # --- helper: build diagonal matrix ---
@@ -175,10 +176,9 @@ def main():
         y = z_col - pred_meas
         S = (kf.H * kf.P * transpose(kf.H)) + kf.R
         try:
-            S_inv = S.inverse()
-            yT = transpose(y)
-            nis_mat = (yT * S_inv * y)
-            nis = float(nis_mat.data[0][0])
+            # y^T S^-1 y, solving with S instead of inverting it
+            S_inv_y = CholeskyDecomposition(S).solve(y)
+            nis = sum(y.data[i][0] * S_inv_y.data[i][0] for i in range(len(y.data)))
         except Exception:
             nis = float('nan')
 
@@ -3,68 +3,7 @@ import random
 
 import matplotlib.pyplot as plt
 
-
-def pad_to_power_of_2(signal):
-    """Pads the signal to the next power of 2 with zeros if necessary."""
-    n = len(signal)
-    target_size = 1 << (n - 1).bit_length()  # Next power of 2
-    return signal + [0] * (target_size - n)
-
-
-def fft(signal):
-    """
-    Compute the Fast Fourier Transform (FFT) using the Cooley-Tukey algorithm.
-    Works for any input length by padding to the next power of 2.
-
-    :param signal: List of real or complex numbers representing the input signal.
-    :return: List of complex numbers representing the frequency domain of the signal.
-    """
-    n = len(signal)
-    if n <= 1:
-        return signal
-
-    if not (n & (n - 1)) == 0:  # If not a power of 2, pad it
-        signal = pad_to_power_of_2(signal)
-        n = len(signal)
-
-    even_fft = fft(signal[0::2])
-    odd_fft = fft(signal[1::2])
-
-    result = [0] * n
-    for k in range(n // 2):
-        t = (
-            complex(math.cos(-2 * math.pi * k / n), math.sin(-2 * math.pi * k / n))
-            * odd_fft[k]
-        )
-        result[k] = even_fft[k] + t
-        result[k + n // 2] = even_fft[k] - t
-
-    return result
-
-
-def ifft(freq_data):
-    """
-    Compute the Inverse Fast Fourier Transform (IFFT).
-    :param freq_data: List of complex numbers representing the frequency spectrum.
-    :return: List of real numbers representing the reconstructed time-domain signal.
-    """
-    n = len(freq_data)
-    if n <= 1:
-        return freq_data
-
-    even_ifft = ifft(freq_data[0::2])
-    odd_ifft = ifft(freq_data[1::2])
-
-    result = [0] * n
-    for k in range(n // 2):
-        t = (
-            complex(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n))
-            * odd_ifft[k]
-        )
-        result[k] = (even_ifft[k] + t) / 2  # Normalize
-        result[k + n // 2] = (even_ifft[k] - t) / 2  # Normalize
-
-    return result
+from VEXLib.Algorithms.FastFourierTransform import fft, ifft
 
 
 def notch_filter(fft_data, sample_rate, notch_freq, bandwidth=1):
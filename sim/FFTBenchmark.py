@@ -0,0 +1,42 @@
+import random
+import time
+
+from VEXLib.Algorithms.FastFourierTransform import fft, ifft, rfft, fft_recursive, ifft_recursive
+
+SIZES = [64, 256, 1024, 4096, 8192]
+SEED = 0
+
+
+def time_call(function, argument, repeats):
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        function(argument)
+    return (time.perf_counter() - start_time) / repeats
+
+
+def main():
+    rng = random.Random(SEED)
+    print(f"{'size':>6} | {'recursive':>10} {'iterative':>10} {'rfft':>10} | {'ifft rec.':>10} {'ifft':>10} | speedup")
+    for n in SIZES:
+        signal = [rng.uniform(-1, 1) for _ in range(n)]
+        repeats = max(1, 8192 // n)
+
+        # Warm the twiddle caches so the iterative numbers are the steady state cost
+        spectrum = fft(signal)
+        rfft(signal)
+
+        recursive_time = time_call(fft_recursive, signal, repeats)
+        iterative_time = time_call(fft, signal, repeats)
+        real_time = time_call(rfft, signal, repeats)
+        inverse_recursive_time = time_call(ifft_recursive, spectrum, repeats)
+        inverse_time = time_call(ifft, spectrum, repeats)
+
+        print(
+            f"{n:>6} | {recursive_time * 1000:>8.2f}ms {iterative_time * 1000:>8.2f}ms {real_time * 1000:>8.2f}ms"
+            f" | {inverse_recursive_time * 1000:>8.2f}ms {inverse_time * 1000:>8.2f}ms"
+            f" | fft {recursive_time / iterative_time:.1f}x, rfft {recursive_time / real_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
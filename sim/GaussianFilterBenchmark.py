@@ -0,0 +1,54 @@
+import math
+import random
+import time
+
+import numpy as np
+
+from VEXLib.Algorithms.GuassianFilter import RealTimeGaussianSmoother, RecursiveGaussianSmoother, \
+    default_kernel_size, gaussian_smooth_batch, recursive_gaussian_smooth
+
+SIGMAS = [1, 2, 4, 8, 16]
+SAMPLES = 20000
+
+
+def time_per_sample(smoother, samples):
+    start_time = time.perf_counter()
+    for sample in samples:
+        smoother.smooth(sample)
+    return (time.perf_counter() - start_time) / len(samples)
+
+
+def main():
+    rng = random.Random(0)
+    samples = [math.sin(i / 40) + rng.gauss(0, 0.2) for i in range(SAMPLES)]
+
+    print(f"{SAMPLES} samples, streaming time per sample, offline time per trace, max error against the centered FIR away from the ends")
+    print(
+        f"{'sigma':>5} {'kernel':>6} | {'FIR':>8} {'IIR':>8} | "
+        f"{'FIR loop':>9} {'numpy':>8} {'IIR 2-pass':>10} | {'IIR error':>9}"
+    )
+    for sigma in SIGMAS:
+        kernel_size = default_kernel_size(sigma)
+        fir_time = time_per_sample(RealTimeGaussianSmoother(sigma, kernel_size), samples)
+        iir_time = time_per_sample(RecursiveGaussianSmoother(sigma), samples)
+
+        start_time = time.perf_counter()
+        batch = gaussian_smooth_batch(samples, sigma, kernel_size, centered=True)
+        batch_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        recursive = recursive_gaussian_smooth(samples, sigma)
+        recursive_time = time.perf_counter() - start_time
+
+        # The two handle the ends of the trace differently, so only compare the middle
+        margin = 4 * kernel_size
+        error = np.max(np.abs(np.array(recursive) - batch)[margin:-margin])
+        print(
+            f"{sigma:>5} {kernel_size:>6} | {fir_time * 1e6:>6.2f}us {iir_time * 1e6:>6.2f}us | "
+            f"{fir_time * SAMPLES * 1e3:>7.1f}ms {batch_time * 1e3:>6.2f}ms {recursive_time * 1e3:>8.1f}ms | "
+            f"{error:>9.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
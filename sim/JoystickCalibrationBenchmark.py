@@ -0,0 +1,79 @@
+import math
+import random
+import struct
+import time
+
+from VEXLib.Math import apply_deadband, cubic_filter
+from VEXLib.Sensors.Controller import InputProcessor
+from VEXLib.Sensors.JoystickCalibration import CALIBRATION_RECORD_FORMAT, JoystickCalibration
+
+CALIBRATION_FILE = "assets/calibration_coefficients.bin"
+TICKS = 20000
+BIN_COUNTS = [128, 512, 2048]
+
+
+def linear_scan_radius(polar_coordinates, theta):
+    """The rim radius as the previous util/JoystickCalibration.normalize_joystick_input found it, searching every sample."""
+    for i in range(len(polar_coordinates) - 1):
+        r_1, theta_1 = polar_coordinates[i]
+        r_2, theta_2 = polar_coordinates[i + 1]
+        if theta_1 <= theta <= theta_2:
+            return r_1 + (r_2 - r_1) * (theta - theta_1) / (theta_2 - theta_1)
+    return polar_coordinates[-1][0]
+
+
+def linear_scan_normalize(polar_coordinates, x, y):
+    interpolated_r = linear_scan_radius(polar_coordinates, math.atan2(y, x))
+    return x / interpolated_r, y / interpolated_r
+
+
+def make_processor(stick_step):
+    processor = InputProcessor()
+    processor.add_stick_step(stick_step)
+    processor.add_step(lambda x: apply_deadband(x, 0.05, 1))
+    processor.add_step(lambda x: cubic_filter(x, 0.5))
+    return processor
+
+
+def time_ticks(processor, readings):
+    """Process both sticks once per tick, as the driver control loop does every 20 ms."""
+    start_time = time.perf_counter()
+    for left_x, left_y, right_x, right_y in readings:
+        processor.process_stick(left_x, left_y)
+        processor.process_stick(right_x, right_y)
+    return (time.perf_counter() - start_time) / len(readings)
+
+
+def worst_difference(calibration, polar_coordinates, readings):
+    worst = 0.0
+    for x, y, _, _ in readings:
+        theta = math.atan2(y, x)
+        worst = max(worst, abs(calibration.rim_radius(theta) - linear_scan_radius(polar_coordinates, theta)))
+    return worst
+
+
+def main():
+    with open(CALIBRATION_FILE, "rb") as file:
+        polar_coordinates = list(struct.iter_unpack(CALIBRATION_RECORD_FORMAT, file.read()))
+    rng = random.Random(0)
+    # Stick positions are reported in whole percent
+    readings = [tuple(rng.randint(-100, 100) / 100 for _ in range(4)) for _ in range(TICKS)]
+
+    scan_time = time_ticks(make_processor(lambda x, y: linear_scan_normalize(polar_coordinates, x, y)), readings)
+    print(f"{len(polar_coordinates)} calibration samples, {TICKS} ticks reading both sticks, time per tick")
+    print(f"{'method':>12} | {'load':>8} | {'tick':>8} | {'max radius diff':>8}")
+    print(f"{'linear scan':>12} | {'':>8} | {scan_time * 1e6:>6.1f}us | {'':>15}")
+    for bin_count in BIN_COUNTS:
+        start_time = time.perf_counter()
+        calibration = JoystickCalibration(polar_coordinates, bin_count)
+        load_time = time.perf_counter() - start_time
+        tick_time = time_ticks(make_processor(calibration.normalize), readings)
+        difference = worst_difference(calibration, polar_coordinates, readings)
+        print(
+            f"{str(bin_count) + ' bins':>12} | {load_time * 1e3:>6.2f}ms | {tick_time * 1e6:>6.1f}us | "
+            f"{difference:>15.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
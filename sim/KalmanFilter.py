@@ -1,6 +1,7 @@
 # python
 import math
 from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition
 
 class KalmanFilter:
     """
@@ -70,10 +71,10 @@ class KalmanFilter:
         # y = z - H * x
         y = z_col - (self.H * self.x)
         # S = H P H^T + R
-        S = (self.H * self.P * self._transpose(self.H)) + self.R
-        # K = P H^T S^{-1}
-        S_inv = S.inverse()
-        K = self.P * self._transpose(self.H) * S_inv
+        PHt = self.P * self._transpose(self.H)
+        S = (self.H * PHt) + self.R
+        # K = P H^T S^{-1}, solved as S K^T = (P H^T)^T since S is symmetric
+        K = self._transpose(CholeskyDecomposition(S).solve(self._transpose(PHt)))
         # x = x + K y
         self.x = self.x + (K * y)
         # P = (I - K H) P
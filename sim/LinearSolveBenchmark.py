@@ -0,0 +1,53 @@
+import random
+import time
+
+from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition, LUDecomposition
+
+SIZES = [3, 5, 11, 23, 63]
+REPEATS = 5
+
+
+def random_covariance(size, rng):
+    a = Matrix(Shape(size, size), [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)])
+    return a * a.transpose() + Matrix.identity(size) * 0.1
+
+
+def average_time(function):
+    start_time = time.perf_counter()
+    for _ in range(REPEATS):
+        result = function()
+    return result, (time.perf_counter() - start_time) / REPEATS
+
+
+def residual(a, x, b):
+    return max(abs(value - expected) for value, expected in zip(a * x, b))
+
+
+def main():
+    rng = random.Random(0)
+    print("Solving S x = b for a covariance S, time per solve and largest residual")
+    print(
+        f"{'size':>5} | {'inverse':>10} {'residual':>9} | {'LU':>10} {'residual':>9} | "
+        f"{'Cholesky':>10} {'residual':>9} | {'cached':>10}"
+    )
+    for size in SIZES:
+        S = random_covariance(size, rng)
+        b = [rng.uniform(-1, 1) for _ in range(size)]
+
+        x_inverse, inverse_time = average_time(lambda: S.inverse() * b)
+        x_lu, lu_time = average_time(lambda: LUDecomposition(S).solve(b))
+        x_cholesky, cholesky_time = average_time(lambda: CholeskyDecomposition(S).solve(b))
+        factorization = CholeskyDecomposition(S)
+        _, cached_time = average_time(lambda: factorization.solve(b))
+
+        print(
+            f"{size:>5} | {inverse_time * 1e3:>8.3f}ms {residual(S, x_inverse, b):>9.1e} | "
+            f"{lu_time * 1e3:>8.3f}ms {residual(S, x_lu, b):>9.1e} | "
+            f"{cholesky_time * 1e3:>8.3f}ms {residual(S, x_cholesky, b):>9.1e} | "
+            f"{cached_time * 1e3:>8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import random
+import time
+import tracemalloc
+
+from VEXLib.Math.FlatMatrix import FlatMatrix
+from VEXLib.Math.Matrix import Matrix, Shape
+
+SIZES = [3, 5, 11, 23, 63]
+STEPS = 20
+
+
+def random_matrix(size, rng):
+    return Matrix(Shape(size, size), [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)])
+
+
+def matrix_steps(F, P, Q, steps):
+    for _ in range(steps):
+        P = F * P * F.transpose() + Q
+    return P
+
+
+class FlatCovarianceStep:
+    """P = F P F^T + Q with scratch matrices allocated once."""
+
+    def __init__(self, F, P, Q):
+        self.F = FlatMatrix.from_matrix(F)
+        self.P = FlatMatrix.from_matrix(P)
+        self.Q = FlatMatrix.from_matrix(Q)
+        self.scratch = FlatMatrix(self.P.rows, self.P.columns)
+
+    def run(self, steps):
+        for _ in range(steps):
+            self.F.matmul_into(self.P, self.scratch)
+            self.scratch.matmul_transpose_into(self.F, self.P)
+            self.P.iadd(self.Q)
+        return self.P
+
+
+def time_per_step(run):
+    start_time = time.perf_counter()
+    result = run(STEPS)
+    return result, (time.perf_counter() - start_time) / STEPS
+
+
+def peak_memory(run):
+    tracemalloc.start()
+    run(1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    rng = random.Random(0)
+    print(f"P = F P F^T + Q, time per step and peak memory of one step")
+    print(f"{'size':>5} | {'Matrix':>10} {'peak':>9} | {'FlatMatrix':>10} {'peak':>9} | {'speedup':>7} {'identical':>9}")
+    for size in SIZES:
+        F = random_matrix(size, rng)
+        # Keep the covariance from growing without bound over the steps
+        F = F * (0.9 / size ** 0.5)
+        P = random_matrix(size, rng)
+        Q = random_matrix(size, rng)
+
+        expected, matrix_time = time_per_step(lambda steps: matrix_steps(F, P, Q, steps))
+        matrix_peak = peak_memory(lambda steps: matrix_steps(F, P, Q, steps))
+
+        step = FlatCovarianceStep(F, P, Q)
+        result, flat_time = time_per_step(step.run)
+        # Measured once the row views and column scratch exist, as in a running filter
+        warm_step = FlatCovarianceStep(F, P, Q)
+        warm_step.run(1)
+        flat_peak = peak_memory(warm_step.run)
+
+        # matmul_transpose_into sums in the same order as multiplying by the transpose
+        identical = result.to_rows() == expected.data
+        print(
+            f"{size:>5} | {matrix_time * 1e3:>8.3f}ms {matrix_peak / 1024:>7.1f}KiB | "
+            f"{flat_time * 1e3:>8.3f}ms {flat_peak / 1024:>7.1f}KiB | "
+            f"{matrix_time / flat_time:>6.2f}x {str(identical):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import time
+
+from VEXLib.Algorithms.SCurveProfile import SCurveConstraints, SCurveProfile
+from VEXLib.Algorithms.TrapezoidProfile import Constraints, State, TrapezoidProfile
+
+MAX_VELOCITY = 2.2
+MAX_ACCELERATION = 4.0
+MAX_JERKS = [20.0, 40.0, 80.0]
+DISTANCES = [0.3, 1.0, 3.0]
+CALLS = 20000
+TICK = 0.01
+
+
+def per_call(function):
+    start_time = time.perf_counter()
+    for i in range(CALLS):
+        function(i)
+    return (time.perf_counter() - start_time) / CALLS
+
+
+def peak_jerk(sample, total_time):
+    accelerations = []
+    previous = sample(0).velocity
+    t = TICK
+    while t <= total_time:
+        velocity = sample(t).velocity
+        accelerations.append((velocity - previous) / TICK)
+        previous = velocity
+        t += TICK
+    return max(abs(b - a) / TICK for a, b in zip(accelerations[:-1], accelerations[1:]))
+
+
+def main():
+    initial = State(0, 0)
+    print(f"Limits: {MAX_VELOCITY} m/s, {MAX_ACCELERATION} m/s^2; jerk measured from {TICK * 1e3:.0f} ms samples")
+    print(
+        f"{'distance':>8} {'max jerk':>8} | {'trapezoid':>9} {'jerk':>8} {'calculate':>9} | "
+        f"{'S-curve':>9} {'jerk':>8} {'plan':>8} {'sample':>8}"
+    )
+    for distance in DISTANCES:
+        goal = State(distance, 0)
+        trapezoid = TrapezoidProfile(Constraints(MAX_VELOCITY, MAX_ACCELERATION))
+        trapezoid.calculate(0, initial, goal)
+        trapezoid_total = trapezoid.total_time()
+        calculate_time = per_call(lambda i: trapezoid.calculate(i * 1e-4, initial, goal))
+        trapezoid_jerk = peak_jerk(lambda t: trapezoid.calculate(t, initial, goal), trapezoid_total)
+
+        for max_jerk in MAX_JERKS:
+            profile = SCurveProfile(SCurveConstraints(MAX_VELOCITY, MAX_ACCELERATION, max_jerk))
+            start_time = time.perf_counter()
+            profile.plan(initial, goal)
+            plan_time = time.perf_counter() - start_time
+            sample_time = per_call(lambda i: profile.sample(i * 1e-4))
+            print(
+                f"{distance:>7.1f}m {max_jerk:>8.0f} | {trapezoid_total:>8.3f}s {trapezoid_jerk:>8.0f} "
+                f"{calculate_time * 1e6:>7.2f}us | {profile.total_time():>8.3f}s "
+                f"{peak_jerk(profile.sample, profile.total_time()):>8.1f} {plan_time * 1e6:>6.0f}us "
+                f"{sample_time * 1e6:>6.2f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
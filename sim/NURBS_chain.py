@@ -15,11 +15,11 @@ def make_curve(curve_type, pts, weights=None, degree=2):
         raise ValueError("Unsupported curve type")
 
 def draw_curvature_comb(crv, to_screen, screen, steps=200, scale=80):
-    pts = crv.sample(steps)
-    tangents = [crv.derivative(t) for t in [i/(steps-1) for i in range(steps)]]
-    d2s = [crv.second_derivative(t) for t in [i/(steps-1) for i in range(steps)]]
+    # teeth spaced evenly along the curve, each from a single evaluation of point and derivatives
+    table = crv.arc_length_table()
     comb_ends = []
-    for i, (p, d1, d2) in enumerate(zip(pts, tangents, d2s)):
+    for t in table.uniform_parameters(table.length / (steps - 1)):
+        p, d1, d2 = crv.evaluate_with_derivatives(t)
         dx, dy = d1
         ddx, ddy = d2
         denom = (dx*dx + dy*dy)**1.5
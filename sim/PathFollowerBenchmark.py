@@ -0,0 +1,80 @@
+import math
+import time
+
+from VEXLib.Subsystems.PathFollower import PathFollower, PurePursuitController, RamseteController
+from sim.splines import CatmullRom
+from util.TrajectoryCompiler import TrajectoryConstraints, compile_trajectory
+
+TICK = 0.02
+# Waypoints in meters, a zig-zag across the field like an autonomous routine
+WAYPOINTS = [(0.0, 0.0), (0.6, 0.3), (1.2, 0.2), (1.6, 0.8), (1.2, 1.4), (0.6, 1.5), (0.3, 2.1), (0.9, 2.6)]
+# Turn-in-place speed used for the stop-and-turn estimate, in radians per second
+TURN_RATE = 4.0
+
+
+def trapezoid_time(distance, max_velocity, max_acceleration):
+    ramp = max_velocity / max_acceleration
+    if distance < max_velocity * ramp:
+        return 2 * math.sqrt(distance / max_acceleration)
+    return distance / max_velocity + ramp
+
+
+def stop_and_turn_time(waypoints, constraints):
+    total = 0.0
+    heading = None
+    for (x0, y0), (x1, y1) in zip(waypoints[:-1], waypoints[1:]):
+        direction = math.atan2(y1 - y0, x1 - x0)
+        if heading is not None:
+            total += abs(math.remainder(direction - heading, 2 * math.pi)) / TURN_RATE
+        heading = direction
+        total += trapezoid_time(math.hypot(x1 - x0, y1 - y0), constraints.max_velocity, constraints.max_acceleration)
+    return total
+
+
+def run(follower, trajectories, start_pose, track_width):
+    x, y, heading = start_pose
+    follower.follow(trajectories, 0.0)
+    sim_time = 0.0
+    worst_tick = 0.0
+    ticks = 0
+    start_time = time.perf_counter()
+    while not follower.is_finished() and sim_time < 60:
+        tick_start = time.perf_counter()
+        left, right = follower.update(x, y, heading, sim_time)
+        worst_tick = max(worst_tick, time.perf_counter() - tick_start)
+        velocity = (left + right) / 2
+        x += velocity * math.cos(heading) * TICK
+        y += velocity * math.sin(heading) * TICK
+        heading += (right - left) / track_width * TICK
+        sim_time += TICK
+        ticks += 1
+    return sim_time, (time.perf_counter() - start_time) / ticks, worst_tick, (x, y)
+
+
+def main():
+    constraints = TrajectoryConstraints(max_velocity=1.5, max_acceleration=2.5, max_centripetal_acceleration=2.5)
+    whole = compile_trajectory(CatmullRom(WAYPOINTS), constraints)
+    halves = [
+        compile_trajectory(CatmullRom(WAYPOINTS[:5]), constraints, end_velocity=0.8),
+        compile_trajectory(CatmullRom(WAYPOINTS[4:]), constraints, start_velocity=0.8),
+    ]
+    start = whole.sample(0)
+    start_pose = (start.x, start.y, start.heading)
+    end = whole.sample(whole.total_time())
+
+    print(f"Stop and turn at every waypoint: {stop_and_turn_time(WAYPOINTS, constraints):.2f} s")
+    print(f"Compiled trajectory: {whole.total_time():.2f} s, {len(whole)} samples")
+    print()
+    print(f"{'controller':>12} | {'segments':>8} | {'time':>7} | {'mean tick':>9} | {'worst tick':>10} | {'end error':>9}")
+    for name, make_controller in (("RAMSETE", RamseteController), ("pure pursuit", PurePursuitController)):
+        for trajectories in ([whole], halves):
+            follower = PathFollower(make_controller(), constraints.track_width, constraints.max_velocity)
+            total, mean_tick, worst_tick, (x, y) = run(follower, trajectories, start_pose, constraints.track_width)
+            print(
+                f"{name:>12} | {len(trajectories):>8} | {total:>6.2f}s | {mean_tick * 1e6:>7.1f}us | "
+                f"{worst_tick * 1e6:>8.1f}us | {math.hypot(x - end.x, y - end.y) * 100:>7.2f}cm"
+            )
+
+
+if __name__ == "__main__":
+    main()
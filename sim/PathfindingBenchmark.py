@@ -0,0 +1,144 @@
+import contextlib
+import io
+import random
+import time
+import tracemalloc
+
+from VEXLib.Algorithms.AStarPathfinding import AStarPathfinding, ASTAR, JUMP_POINT
+from VEXLib.Algorithms.DijkstraPathfinding import DijkstraPathfinding
+from VEXLib.Algorithms.GridSearchStorage import GridSearchStorage
+from VEXLib.Util.PathfindingEnvironment import PathfindingEnvironment
+
+# One tile per inch of a 12 ft field
+GRID_SIZE = 144
+QUERIES = 5
+SEED = 0
+MOVES = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def empty_map(size, rng):
+    return [[0] * size for _ in range(size)]
+
+
+def random_map(size, rng, density=0.2):
+    return [[1 if rng.random() < density else 0 for _ in range(size)] for _ in range(size)]
+
+
+def walls_map(size, rng):
+    """Long walls with a single gap each, similar to field elements the robot must drive around."""
+    grid = empty_map(size, rng)
+    for wall_x in range(size // 6, size, size // 6):
+        gap = rng.randrange(2, size - 4)
+        for y in range(size):
+            if not gap <= y < gap + 3:
+                grid[y][wall_x] = 1
+    return grid
+
+
+MAPS = [("empty", empty_map), ("random 20%", random_map), ("walls", walls_map)]
+
+
+def add_border(grid):
+    # The field perimeter. The planners bounds check through GridSearchStorage, so this is not needed for
+    # correctness, but it keeps the maps, and so the benchmark numbers, the same as in earlier runs
+    size = len(grid)
+    for i in range(size):
+        grid[0][i] = grid[size - 1][i] = grid[i][0] = grid[i][size - 1] = 1
+    return grid
+
+
+def pack_grid(grid):
+    bits = [value for row in grid for value in row]
+    bits += [0] * (-len(bits) % 8)
+    obstacle_list = []
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for bit in bits[i:i + 8]:
+            byte = (byte << 1) | bit
+        obstacle_list.append(byte)
+    return obstacle_list
+
+
+def map_file(grid):
+    """The map in the binary format PathfindingEnvironment.load_from_file reads."""
+    width = len(grid[0])
+    header = "".join(chr((width >> (8 * i)) & 0xFF) for i in range(8))
+    return io.StringIO(header + "".join(chr(byte) for byte in pack_grid(grid)))
+
+
+def pick_queries(grid, rng):
+    free = [(x, y) for y in range(len(grid)) for x in range(len(grid[0])) if not grid[y][x]]
+    # Long queries from the left of the field to the right, the worst case for replanning
+    left = [point for point in free if point[0] < len(grid[0]) // 8]
+    right = [point for point in free if point[0] > len(grid[0]) * 7 // 8]
+    return [(rng.choice(left), rng.choice(right)) for _ in range(QUERIES)]
+
+
+def measure_peak_memory(search):
+    """Run a search under tracemalloc, returning the peak bytes allocated while it ran."""
+    tracemalloc.start()
+    search()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_dijkstra(dijkstra, start, goal):
+    start_time = time.perf_counter()
+    path, visited_tiles = dijkstra.find_path(start, goal)
+    elapsed = time.perf_counter() - start_time
+    peak = measure_peak_memory(lambda: dijkstra.find_path(start, goal))
+    return elapsed, len(visited_tiles), len(path), peak
+
+
+def run_planner(planner, start, goal):
+    start_time = time.perf_counter()
+    path = planner.find_path(start, goal)
+    elapsed = time.perf_counter() - start_time
+    peak = measure_peak_memory(lambda: planner.find_path(start, goal))
+    return elapsed, planner.nodes_expanded, len(path), peak
+
+
+def main():
+    rng = random.Random(SEED)
+    print(f"{GRID_SIZE}x{GRID_SIZE} grid, {QUERIES} left-to-right queries per map, mean per query")
+    storage_size = GridSearchStorage(GRID_SIZE, GRID_SIZE).memory_usage() + GRID_SIZE * GRID_SIZE
+    print(f"Preallocated per planner: {storage_size / 1024:.1f} KiB, peak is allocation during a reused search")
+    print(f"{'map':>12} {'planner':>12} | {'expanded':>9} {'time (ms)':>10} {'speedup':>8} {'peak (KiB)':>11}")
+    for map_name, make_map in MAPS:
+        grid = add_border(make_map(GRID_SIZE, rng))
+        queries = pick_queries(grid, rng)
+
+        environment = PathfindingEnvironment()
+        environment.load_from_list(pack_grid(grid), GRID_SIZE)
+        with contextlib.redirect_stdout(io.StringIO()):
+            dijkstra = DijkstraPathfinding(queries[0][0], queries[0][1], map_file(grid), MOVES)
+        planners = [
+            ("A*", AStarPathfinding(environment, MOVES, mode=ASTAR)),
+            ("jump point", AStarPathfinding(environment, MOVES, mode=JUMP_POINT)),
+        ]
+
+        results = {"Dijkstra": [], "A*": [], "jump point": []}
+        for start, goal in queries:
+            try:
+                results["Dijkstra"].append(run_dijkstra(dijkstra, start, goal))
+            except AssertionError:
+                continue
+            for name, planner in planners:
+                results[name].append(run_planner(planner, start, goal))
+
+        baseline_time = sum(result[0] for result in results["Dijkstra"])
+        for name, runs in results.items():
+            if not runs:
+                continue
+            total_time = sum(result[0] for result in runs)
+            expanded = sum(result[1] for result in runs) / len(runs)
+            peak = max(result[3] for result in runs)
+            print(
+                f"{map_name:>12} {name:>12} | {expanded:>9.0f} {total_time / len(runs) * 1000:>10.2f}"
+                f" {baseline_time / total_time:>7.1f}x {peak / 1024:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import time
+
+from VEXLib.Util.Shelf import Shelf
+
+KEY_COUNTS = [10, 100, 250, 500, 1000]
+OPERATIONS = 200
+
+
+def time_operations(shelf, key_count):
+    start_time = time.perf_counter()
+    for i in range(OPERATIONS):
+        shelf.get("key" + str(i % key_count))
+    get_time = (time.perf_counter() - start_time) / OPERATIONS
+
+    start_time = time.perf_counter()
+    for i in range(OPERATIONS):
+        shelf.set("key" + str(i % key_count), i * 0.5)
+    set_time = (time.perf_counter() - start_time) / OPERATIONS
+
+    return get_time, set_time
+
+
+def benchmark(key_count, cached):
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "shelf.csv")
+
+    shelf = Shelf(path)
+    for i in range(key_count):
+        shelf.set("key" + str(i), {"value": i, "name": "preference " + str(i)})
+
+    if cached:
+        shelf = Shelf(path, cached=True)
+
+    get_time, set_time = time_operations(shelf, key_count)
+    directory.cleanup()
+    return get_time, set_time
+
+
+def main():
+    print(f"{'keys':>6} | {'get (us)':>10} {'cached get':>11} | {'set (us)':>10} {'cached set':>11}")
+    for key_count in KEY_COUNTS:
+        get_time, set_time = benchmark(key_count, cached=False)
+        cached_get_time, cached_set_time = benchmark(key_count, cached=True)
+        print(
+            f"{key_count:>6} | {get_time * 1e6:>10.1f} {cached_get_time * 1e6:>11.1f} | "
+            f"{set_time * 1e6:>10.1f} {cached_set_time * 1e6:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import math
+import random
+import time
+
+from sim.splines import NURBS, BSpline, cox_de_boor
+
+DEGREES = [2, 3, 4, 5]
+CONTROL_POINTS = 12
+SAMPLES = 200
+EPS = 1e-5
+
+
+def random_curve(degree, rng):
+    control = [(i * 10.0, rng.uniform(-20, 20)) for i in range(CONTROL_POINTS)]
+    weights = [rng.uniform(0.5, 2.0) for _ in range(CONTROL_POINTS)]
+    return NURBS(control, weights, degree)
+
+
+def recursive_evaluate(curve, t):
+    # The previous NURBS.evaluate: every basis function from the recursive Cox-de Boor formula
+    u_min = curve.knot[curve.order - 1]
+    u_max = curve.knot[-curve.order]
+    u = u_min + (u_max - u_min) * t
+    num_x = 0.0
+    num_y = 0.0
+    den = 0.0
+    for i, P in enumerate(curve.control):
+        wN = curve.weights[i] * cox_de_boor(u, i, curve.order, curve.knot)
+        num_x += wN * P[0]
+        num_y += wN * P[1]
+        den += wN
+    return num_x / den, num_y / den
+
+
+def recursive_evaluate_with_derivatives(curve, t):
+    # The previous derivatives: finite differences of recursive evaluations
+    p0 = recursive_evaluate(curve, max(0.0, t - EPS))
+    p1 = recursive_evaluate(curve, t)
+    p2 = recursive_evaluate(curve, min(1.0, t + EPS))
+    d1 = ((p2[0] - p0[0]) / (2 * EPS), (p2[1] - p0[1]) / (2 * EPS))
+    d2 = ((p2[0] - 2 * p1[0] + p0[0]) / EPS ** 2, (p2[1] - 2 * p1[1] + p0[1]) / EPS ** 2)
+    return [p1, d1, d2]
+
+
+def timed(function, parameters):
+    start_time = time.perf_counter()
+    results = [function(t) for t in parameters]
+    return results, (time.perf_counter() - start_time) / len(parameters)
+
+
+def largest_difference(a, b):
+    return max(math.hypot(p[0] - q[0], p[1] - q[1]) for p, q in zip(a, b))
+
+
+def main():
+    rng = random.Random(0)
+    # stay away from the ends, where the old finite differences were one-sided
+    parameters = [0.01 + 0.98 * i / (SAMPLES - 1) for i in range(SAMPLES)]
+
+    print(f"NURBS with {CONTROL_POINTS} control points, time per parameter and largest difference")
+    print(
+        f"{'degree':>6} | {'recursive':>10} {'iterative':>10} {'point diff':>10} | "
+        f"{'rec + FD':>10} {'one pass':>10} {'d1 diff':>9} {'d2 diff':>9}"
+    )
+    for degree in DEGREES:
+        curve = random_curve(degree, rng)
+        recursive_points, recursive_time = timed(lambda t: recursive_evaluate(curve, t), parameters)
+        points, iterative_time = timed(curve.evaluate, parameters)
+        old, old_time = timed(lambda t: recursive_evaluate_with_derivatives(curve, t), parameters)
+        new, new_time = timed(curve.evaluate_with_derivatives, parameters)
+        print(
+            f"{degree:>6} | {recursive_time * 1e6:>8.1f}us {iterative_time * 1e6:>8.1f}us "
+            f"{largest_difference(recursive_points, points):>10.1e} | "
+            f"{old_time * 1e6:>8.1f}us {new_time * 1e6:>8.1f}us "
+            f"{largest_difference([o[1] for o in old], [n[1] for n in new]):>9.1e} "
+            f"{largest_difference([o[2] for o in old], [n[2] for n in new]):>9.1e}"
+        )
+
+    # analytic derivatives against finite differences of the new evaluate, with a step that suits them
+    curve = BSpline([(i * 10.0, rng.uniform(-20, 20)) for i in range(CONTROL_POINTS)], 3)
+    h = 1e-6
+    worst = 0.0
+    for t in parameters:
+        a = curve.evaluate(t - h)
+        b = curve.evaluate(t + h)
+        d1 = curve.evaluate_with_derivatives(t, 1)[1]
+        worst = max(worst, math.hypot((b[0] - a[0]) / (2 * h) - d1[0], (b[1] - a[1]) / (2 * h) - d1[1]))
+    print(f"Cubic B-spline first derivative against central differences: {worst:.1e}")
+
+    print()
+    print("Sampling at uniform distance, spread of the chords between consecutive samples")
+    print(f"{'degree':>6} | {'length':>8} | {'uniform t':>10} | {'table':>10} | {'build':>9} | {'lookup':>9}")
+    for degree in DEGREES:
+        curve = random_curve(degree, rng)
+        start_time = time.perf_counter()
+        table = curve.arc_length_table()
+        build_time = time.perf_counter() - start_time
+        count = 100
+        uniform_t = curve.sample(count + 1)
+        start_time = time.perf_counter()
+        uniform_s = table.sample_uniform(table.length / count)
+        lookup_time = (time.perf_counter() - start_time) / len(uniform_s)
+
+        def spread(points):
+            gaps = [math.dist(p, q) for p, q in zip(points[:-1], points[1:])]
+            return (max(gaps) - min(gaps)) / (table.length / count)
+
+        print(
+            f"{degree:>6} | {table.length:>8.2f} | {spread(uniform_t):>9.1%} | {spread(uniform_s):>9.1e} | "
+            f"{build_time * 1e3:>7.2f}ms | {lookup_time * 1e6:>7.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
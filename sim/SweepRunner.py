@@ -0,0 +1,511 @@
+# python
+"""
+Headless parameter sweeps over the sim/ filters.
+
+Each experiment is a plain function of (params, rng) returning a dict of metrics, with the same
+motion and sensor models as the interactive pygame script it is named after. run_sweep expands a
+parameter grid, gives every run a seed derived from its parameters, fans the runs out over a
+ProcessPoolExecutor and caches each result under a hash of (experiment, params, seed) and of the
+experiment's code, so rerunning a sweep only computes the configurations that changed, and editing
+an experiment, the filter it runs or the VEXLib code under it invalidates its cached results. Cached rows
+are marked, since their wall-clock timings come from the run that computed them.
+
+Example:
+    PYTHONPATH=. python sim/SweepRunner.py pose_ekf --grid q_scale=0.1,1,10 --grid r_scale=0.5,1,2 \\
+        --replicates 8 --output sim/results/pose_ekf.csv
+"""
+import argparse
+import ast
+import csv
+import hashlib
+import importlib.util
+import inspect
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sweep_cache")
+# Modules under this directory are hashed into the cache key, the standard library and installed packages are not
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+# --------------------
+# Experiments
+# --------------------
+def diag_matrix(size, values):
+    return Matrix(Shape(size, size), data=[[values[i] if i == j else 0.0 for j in range(size)] for i in range(size)])
+
+
+def advance_true_pose(pose, t, dt, vx=0.6, vy=0.2, omega=0.6):
+    # The true motion shared by the filter simulations
+    pose[0] += vx * dt * math.cos(0.2 * t) - vy * dt * math.sin(0.1 * t)
+    pose[1] += vx * dt * math.sin(0.2 * t) + vy * dt * math.cos(0.1 * t)
+    pose[2] += omega * dt * 0.6
+
+
+def normalized_innovation_squared(H, P, R, y):
+    S = (H * P * H.transpose()) + R
+    return sum(a * b for a, b in zip(y, CholeskyDecomposition(S).solve(y)))
+
+
+def wrap_angle(a):
+    return (a + math.pi) % (2.0 * math.pi) - math.pi
+
+
+def rms(values):
+    return math.sqrt(sum(value * value for value in values) / len(values)) if values else float("nan")
+
+
+KALMAN_FILTER_DEFAULTS = {"q": 1e-3, "r_std": 0.15, "q_scale": 1.0, "r_scale": 1.0, "steps": 600, "dt": 1.0 / 30.0}
+
+
+def kalman_filter_experiment(params, rng):
+    """Linear KalmanFilter tracking [x, y, theta] from direct measurements, as in KalmanFilterSimulation."""
+    from sim.KalmanFilter import KalmanFilter
+
+    n = 3
+    Q = diag_matrix(n, [params["q"] * params["q_scale"]] * n)
+    R = diag_matrix(n, [params["r_std"] ** 2 * params["r_scale"]] * n)
+    kf = KalmanFilter(n=n, m=n, Q=Q, R=R, P=Matrix.identity(n), x0=[0.0, 0.0, 0.0])
+
+    true_pose = [0.0, 0.0, 0.0]
+    errors = [[], [], []]
+    nis = []
+    dt = params["dt"]
+    for step in range(params["steps"]):
+        advance_true_pose(true_pose, step * dt, dt)
+        z = [value + rng.gauss(0.0, params["r_std"]) for value in true_pose]
+        kf.predict()
+        y = [a - b for a, b in zip(z, kf.state())]
+        nis.append(normalized_innovation_squared(kf.H, kf.P, kf.R, y))
+        kf.update(z)
+        for i, value in enumerate(kf.state()):
+            errors[i].append(value - true_pose[i])
+    return {"rmse_x": rms(errors[0]), "rmse_y": rms(errors[1]), "rmse_theta": rms(errors[2]),
+            "mean_nis": sum(nis) / len(nis)}
+
+
+POSE_EKF_DEFAULTS = {"q": 1e-3, "r_std": 0.15, "q_scale": 1.0, "r_scale": 1.0, "steps": 600, "dt": 1.0 / 30.0}
+
+
+def pose_ekf_experiment(params, rng):
+    """PoseEKF with constant velocity and yaw rate, as in ExtendedKalmanFilterSimulation."""
+    from sim.ExtendedKalmanFilter import PoseEKF
+
+    Q = diag_matrix(5, [params["q"] * params["q_scale"]] * 5)
+    R = diag_matrix(3, [params["r_std"] ** 2 * params["r_scale"]] * 3)
+    kf = PoseEKF(Q=Q, R=R, P=Matrix.identity(5), x0=[0.0, 0.0, 0.0, math.hypot(0.6, 0.2), 0.6])
+
+    true_pose = [0.0, 0.0, 0.0]
+    errors = [[], [], []]
+    nis = []
+    dt = params["dt"]
+    for step in range(params["steps"]):
+        advance_true_pose(true_pose, step * dt, dt)
+        z = [value + rng.gauss(0.0, params["r_std"]) for value in true_pose]
+        kf.predict(dt)
+        y = [a - b for a, b in zip(z, kf.state()[:3])]
+        y[2] = wrap_angle(y[2])
+        nis.append(normalized_innovation_squared(kf.H, kf.P, kf.R, y))
+        kf.update(z)
+        state = kf.state()
+        errors[0].append(state[0] - true_pose[0])
+        errors[1].append(state[1] - true_pose[1])
+        errors[2].append(wrap_angle(state[2] - true_pose[2]))
+    return {"rmse_x": rms(errors[0]), "rmse_y": rms(errors[1]), "rmse_theta": rms(errors[2]),
+            "mean_nis": sum(nis) / len(nis)}
+
+
+TWO_SOURCE_FUSION_DEFAULTS = {
+    "q": 1e-3, "q_scale": 1.0,
+    "sensor_a_rate": 5.0, "sensor_a_std": 0.2, "r_a_scale": 1.0,
+    "sensor_b_rate": 15.0, "sensor_b_std_xy": 0.12, "sensor_b_std_theta": 0.08, "r_b_scale": 1.0,
+    "steps": 600, "dt": 1.0 / 30.0,
+}
+
+
+def two_source_fusion_experiment(params, rng):
+    """PoseEKF fusing a slow position sensor and a fast pose sensor, as in TwoSourcePoseFusionSimulation."""
+    from sim.ExtendedKalmanFilter import PoseEKF
+    from sim.TwoSourcePoseFusionSimulation import ekf_linear_update
+
+    Q = diag_matrix(5, [params["q"] * params["q_scale"]] * 5)
+    R_A = diag_matrix(2, [params["sensor_a_std"] ** 2 * params["r_a_scale"]] * 2)
+    R_B = diag_matrix(3, [params["sensor_b_std_xy"] ** 2 * params["r_b_scale"]] * 2
+                      + [params["sensor_b_std_theta"] ** 2 * params["r_b_scale"]])
+    kf = PoseEKF(Q=Q, R=R_B, P=Matrix.identity(5), x0=[0.0, 0.0, 0.0, math.hypot(0.6, 0.2), 0.6])
+    H_A = Matrix(Shape(5, 2), [[1.0, 0.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0, 0.0]])
+    H_B = Matrix(Shape(5, 3), [[1.0, 0.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0]])
+
+    true_pose = [0.0, 0.0, 0.0]
+    position_errors = []
+    theta_errors = []
+    nis_a = []
+    nis_b = []
+    dt = params["dt"]
+    sensor_a_dt = 1.0 / params["sensor_a_rate"]
+    sensor_b_dt = 1.0 / params["sensor_b_rate"]
+    time_a = 0.0
+    time_b = 0.0
+    for step in range(params["steps"]):
+        advance_true_pose(true_pose, step * dt, dt)
+        kf.predict(dt)
+        time_a += dt
+        time_b += dt
+        if time_a >= sensor_a_dt:
+            z = [true_pose[0] + rng.gauss(0.0, params["sensor_a_std"]),
+                 true_pose[1] + rng.gauss(0.0, params["sensor_a_std"])]
+            nis_a.append(ekf_linear_update(kf, H_A, z, R_A))
+            time_a -= sensor_a_dt
+        if time_b >= sensor_b_dt:
+            z = [true_pose[0] + rng.gauss(0.0, params["sensor_b_std_xy"]),
+                 true_pose[1] + rng.gauss(0.0, params["sensor_b_std_xy"]),
+                 true_pose[2] + rng.gauss(0.0, params["sensor_b_std_theta"])]
+            nis_b.append(ekf_linear_update(kf, H_B, z, R_B, angle_meas_indices=[2]))
+            time_b -= sensor_b_dt
+        state = kf.state()
+        position_errors.append(math.hypot(state[0] - true_pose[0], state[1] - true_pose[1]))
+        theta_errors.append(wrap_angle(state[2] - true_pose[2]))
+    return {"rmse_position": rms(position_errors), "rmse_theta": rms(theta_errors),
+            "mean_nis_a": sum(nis_a) / len(nis_a) if nis_a else float("nan"),
+            "mean_nis_b": sum(nis_b) / len(nis_b) if nis_b else float("nan")}
+
+
+EKF_SLAM_DEFAULTS = {"sensor_noise": 0.05, "gating_thresh": 6.63, "max_landmarks": 60, "q": 1e-4,
+                     "steps": 300, "dt": 1.0 / 30.0}
+
+
+def ekf_slam_experiment(params, rng):
+    """Range-only BlockEKFSLAM in the walled room of the EKFSLAM simulation."""
+    from sim.EKFSLAM import BlockEKFSLAM, raycast_walls
+
+    walls = [(-4.0, -3.0, 4.0, -3.0), (4.0, -3.0, 4.0, 3.0), (4.0, 3.0, -4.0, 3.0), (-4.0, 3.0, -4.0, -3.0),
+             (-1.0, -1.0, 2.5, -1.0)]
+    bearings = [wrap_angle(b + math.pi) for b in [0.0, math.pi / 2.0, math.pi, -math.pi / 2.0]]
+    slam = BlockEKFSLAM(Q=diag_matrix(3, [params["q"]] * 3), max_landmarks=params["max_landmarks"])
+    slam.robot = [-2.0, 0.0, 0.0]
+
+    rx, ry, rth = -2.0, 0.0, 0.0
+    v_cmd, w_cmd = 0.6, 0.2
+    dt = params["dt"]
+    position_errors = []
+    start_time = time.perf_counter()
+    for _ in range(params["steps"]):
+        rx += v_cmd * math.cos(rth) * dt
+        ry += v_cmd * math.sin(rth) * dt
+        rth = wrap_angle(rth + w_cmd * dt)
+        ranges = [
+            max(0.0, min(10.0, raycast_walls(rx, ry, rth + b, walls) + rng.gauss(0.0, params["sensor_noise"])))
+            for b in bearings
+        ]
+        slam.predict(v_cmd, w_cmd, dt)
+        slam.update_ranges(ranges, bearings, params["sensor_noise"] ** 2, gating_thresh=params["gating_thresh"])
+        position_errors.append(math.hypot(slam.robot[0] - rx, slam.robot[1] - ry))
+    elapsed = time.perf_counter() - start_time
+    return {"rmse_position": rms(position_errors), "final_position_error": position_errors[-1],
+            "landmarks": slam.num_landmarks, "ms_per_step": elapsed / params["steps"] * 1e3}
+
+
+EXPERIMENTS = {
+    "kalman_filter": (kalman_filter_experiment, KALMAN_FILTER_DEFAULTS),
+    "pose_ekf": (pose_ekf_experiment, POSE_EKF_DEFAULTS),
+    "two_source_fusion": (two_source_fusion_experiment, TWO_SOURCE_FUSION_DEFAULTS),
+    "ekf_slam": (ekf_slam_experiment, EKF_SLAM_DEFAULTS),
+}
+
+
+# --------------------
+# Sweep runner
+# --------------------
+def expand_grid(grid):
+    """
+    Every combination of a parameter grid, in the order of its keys.
+
+    Args:
+      grid (dict): parameter name -> list of values
+
+    Returns:
+      list of dict: one parameter set per combination
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def _code_names(code):
+    """Global and imported names used by a code object and the functions and lambdas nested in it."""
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if inspect.iscode(constant):
+            names |= _code_names(constant)
+    return names
+
+
+def _project_module_file(name):
+    """Source file of a module in this repository, or None for the standard library, installed packages and others."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        return None
+    origin = os.path.realpath(spec.origin)
+    if os.path.commonpath([origin, PROJECT_ROOT]) != PROJECT_ROOT:
+        return None
+    return origin
+
+
+def _imported_module_names(path):
+    """Names of the modules a source file imports anywhere in it, including the parents of dotted names."""
+    with open(path, "rb") as file:
+        tree = ast.parse(file.read(), path)
+    package = os.path.relpath(os.path.dirname(path), PROJECT_ROOT).replace(os.sep, ".")
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            if node.level:
+                try:
+                    module = importlib.util.resolve_name(module, package)
+                except (ImportError, ValueError):
+                    continue
+            names.add(module)
+            # "from package import module" imports a submodule
+            names.update(module + "." + alias.name for alias in node.names)
+    for name in list(names):
+        parts = name.split(".")
+        names.update(".".join(parts[:i]) for i in range(1, len(parts)))
+    return names
+
+
+def _experiment_functions(experiment):
+    """The experiment function and the helpers in this file it calls, with the names of everything else they use."""
+    function, _ = EXPERIMENTS[experiment]
+    functions = []
+    module_names = set()
+    seen = set()
+    stack = [function]
+    while stack:
+        current = stack.pop()
+        if current.__name__ in seen:
+            continue
+        seen.add(current.__name__)
+        functions.append(current)
+        for name in sorted(_code_names(current.__code__), reverse=True):
+            value = current.__globals__.get(name)
+            if inspect.isfunction(value) and value.__module__ == current.__module__:
+                stack.append(value)
+            elif inspect.ismodule(value):
+                module_names.add(value.__name__)
+            elif value is not None and getattr(value, "__module__", current.__module__) != current.__module__:
+                module_names.add(value.__module__)
+            elif value is None:
+                # Imported inside the function, or an attribute name, which does not resolve to a file
+                module_names.add(name)
+    return functions, module_names
+
+
+def experiment_code_files(experiment):
+    """
+    Source files of every module in this repository an experiment runs, following imports transitively,
+    so edits to the filters and to the VEXLib code under them are both seen.
+    """
+    _, module_names = _experiment_functions(experiment)
+    files = set()
+    pending = sorted(module_names)
+    checked = set()
+    while pending:
+        name = pending.pop()
+        if name in checked:
+            continue
+        checked.add(name)
+        path = _project_module_file(name)
+        if path is None or path in files:
+            continue
+        files.add(path)
+        pending.extend(sorted(_imported_module_names(path) - checked))
+    return sorted(files)
+
+
+def _source_bytes(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def experiment_code_hash(experiment):
+    """
+    Hash of the code an experiment runs: its function, the helpers in this file it calls, and the
+    source of every module in this repository they import, directly or not.
+    """
+    functions, _ = _experiment_functions(experiment)
+    digest = hashlib.sha256()
+    for function in functions:
+        digest.update(inspect.getsource(function).encode())
+    for path in experiment_code_files(experiment):
+        digest.update(os.path.relpath(path, PROJECT_ROOT).encode())
+        digest.update(_source_bytes(path))
+    return digest.hexdigest()[:16]
+
+
+def config_hash(experiment, params, seed, code_hash=""):
+    """Stable hash of a run, independent of key order and of the process computing it."""
+    text = json.dumps({"experiment": experiment, "params": params, "seed": seed, "code": code_hash}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def derive_seed(base_seed, experiment, params, replicate):
+    """Seed for one run, so results do not depend on run order or the number of workers."""
+    text = json.dumps({"base_seed": base_seed, "experiment": experiment, "params": params,
+                       "replicate": replicate}, sort_keys=True)
+    return int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+
+
+def run_one(experiment, params, seed):
+    """Run a single configuration. Top level so a process pool can pickle it."""
+    function, _ = EXPERIMENTS[experiment]
+    start_time = time.perf_counter()
+    metrics = function(params, random.Random(seed))
+    metrics["run_seconds"] = time.perf_counter() - start_time
+    return metrics
+
+
+def run_sweep(experiment, grid, replicates=1, base_seed=0, workers=None, cache_directory=DEFAULT_CACHE_DIRECTORY):
+    """
+    Run every configuration of a parameter grid, in parallel, reusing cached results.
+
+    Args:
+      experiment (str): name in EXPERIMENTS
+      grid (dict): parameter name -> list of values, overriding the experiment's defaults
+      replicates (int): runs per configuration, each with its own seed
+      base_seed (int): changes every derived seed, for an independent repetition of the sweep
+      workers (int|None): processes to use, all cores by default
+      cache_directory (str|None): where results are cached, or None to always recompute
+
+    Returns:
+      list of dict: one tidy row per run, with the parameters, replicate, seed, hash, whether it came from
+      the cache and metrics. The wall-clock timings of a cached row (run_seconds, ms_per_step) are the
+      ones measured when it was computed, not on this machine now.
+    """
+    if experiment not in EXPERIMENTS:
+        raise ValueError(f"Unknown experiment {experiment!r}, expected one of {sorted(EXPERIMENTS)}")
+    _, defaults = EXPERIMENTS[experiment]
+    unknown = set(grid) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {experiment}: {sorted(unknown)}")
+
+    code_hash = experiment_code_hash(experiment)
+    runs = []
+    for overrides in expand_grid(grid):
+        params = dict(defaults, **overrides)
+        for replicate in range(replicates):
+            seed = derive_seed(base_seed, experiment, params, replicate)
+            runs.append({"params": params, "replicate": replicate, "seed": seed,
+                         "hash": config_hash(experiment, params, seed, code_hash)})
+
+    if cache_directory is not None:
+        cache_directory = os.path.join(cache_directory, experiment)
+        os.makedirs(cache_directory, exist_ok=True)
+
+    results = {}
+    cached = set()
+    pending = []
+    for run in runs:
+        path = None if cache_directory is None else os.path.join(cache_directory, run["hash"] + ".json")
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                results[run["hash"]] = json.load(file)
+            cached.add(run["hash"])
+        else:
+            pending.append((run, path))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (run, path, executor.submit(run_one, experiment, run["params"], run["seed"])) for run, path in pending
+            ]
+            for run, path, future in futures:
+                metrics = future.result()
+                results[run["hash"]] = metrics
+                if path is not None:
+                    with open(path, "w") as file:
+                        json.dump(metrics, file)
+
+    rows = []
+    for run in runs:
+        row = {name: run["params"][name] for name in grid}
+        row.update({"replicate": run["replicate"], "seed": run["seed"], "hash": run["hash"],
+                    "cached": run["hash"] in cached})
+        row.update(results[run["hash"]])
+        rows.append(row)
+    return rows
+
+
+def write_table(rows, path):
+    """Write sweep rows as one CSV table with a column per parameter and metric."""
+    columns = []
+    for row in rows:
+        for name in row:
+            if name not in columns:
+                columns.append(name)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_table(rows):
+    if not rows:
+        return ""
+    columns = [name for name in rows[0] if name not in ("seed", "hash")]
+    cells = [[f"{row[name]:.4g}" if isinstance(row[name], float) else str(row[name]) for name in columns]
+             for row in rows]
+    widths = [max(len(name), *(len(line[i]) for line in cells)) for i, name in enumerate(columns)]
+    lines = [" ".join(f"{name:>{width}}" for name, width in zip(columns, widths))]
+    lines += [" ".join(f"{cell:>{width}}" for cell, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def parse_grid_argument(text):
+    name, _, values = text.partition("=")
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"Expected name=value1,value2,... got {text!r}")
+    return name, [json.loads(value) for value in values.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a parameter sweep over one of the sim/ filters.")
+    parser.add_argument("experiment", choices=sorted(EXPERIMENTS))
+    parser.add_argument("--grid", type=parse_grid_argument, action="append", default=[],
+                        help="parameter values to sweep, as name=value1,value2; repeat for more parameters")
+    parser.add_argument("--replicates", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0, help="base seed that all run seeds are derived from")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use, all cores by default")
+    parser.add_argument("--output", help="CSV file for the results table")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every run")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    rows = run_sweep(args.experiment, dict(args.grid), replicates=args.replicates, base_seed=args.seed,
+                     workers=args.workers, cache_directory=None if args.no_cache else DEFAULT_CACHE_DIRECTORY)
+    elapsed = time.perf_counter() - start_time
+
+    print(format_table(rows))
+    print(f"\n{len(rows)} runs in {elapsed:.2f}s on {args.workers or os.cpu_count()} workers")
+    if args.output:
+        write_table(rows, args.output)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import statistics
+import time
+
+import VEXLib.Util.time as vex_time
+from VEXLib.Robot.TickPacer import TickPacer
+
+TICK_COUNT = 200
+PERIODS_MS = [20, 10]
+WORK_MS = 2
+# Desktop operating systems overshoot sleeps by more than the brain does, so try a wider spin window too
+SPIN_WINDOWS_US = [500, 2000]
+
+
+def simulated_work():
+    # Stand-in for the periodic callbacks
+    end = time.perf_counter() + WORK_MS / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def busy_wait_loop(period_ms):
+    """The previous TickBasedRobot behaviour: poll the clock until the next tick."""
+    starts = []
+    next_tick_time = vex_time.time_ms() + period_ms
+    for _ in range(TICK_COUNT):
+        while True:
+            now = vex_time.time_ms()
+            if now >= next_tick_time:
+                break
+        starts.append(time.perf_counter())
+        simulated_work()
+        next_tick_time += period_ms
+    return starts
+
+
+def paced_loop(period_ms, spin_us):
+    starts = []
+    pacer = TickPacer(period_ms, spin_us=spin_us)
+    for _ in range(TICK_COUNT):
+        pacer.wait()
+        starts.append(time.perf_counter())
+        simulated_work()
+    return starts
+
+
+def measure(loop, period_ms):
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    starts = loop(period_ms)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    deviations_us = [
+        ((second - first) - period_ms / 1000) * 1e6 for first, second in zip(starts, starts[1:])
+    ]
+    return cpu_time / wall_time, statistics.pstdev(deviations_us), max(abs(d) for d in deviations_us)
+
+
+def main():
+    print(f"{TICK_COUNT} ticks with {WORK_MS} ms of work per tick")
+    print(f"{'period':>7} {'loop':>16} | {'CPU used':>9} {'jitter std (us)':>16} {'max jitter (us)':>16}")
+    for period_ms in PERIODS_MS:
+        loops = [("busy-wait", busy_wait_loop)] + [
+            (f"paced spin={spin_us}us", lambda period, spin_us=spin_us: paced_loop(period, spin_us))
+            for spin_us in SPIN_WINDOWS_US
+        ]
+        for name, loop in loops:
+            cpu_fraction, jitter_std, jitter_max = measure(loop, period_ms)
+            print(
+                f"{period_ms:>5}ms {name:>16} | {cpu_fraction * 100:>8.1f}% {jitter_std:>16.1f} {jitter_max:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 # python
 import math
 import random
-import pygame
 from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import CholeskyDecomposition
 from sim.ExtendedKalmanFilter import PoseEKF
 
 # simple diagonal matrix helper
@@ -18,6 +18,7 @@ def transpose(mat):
 
 # draw small triangle for pose
 def draw_pose(surface, color, pose, scale, origin, size=8):
+    import pygame
     x, y, theta = pose
     sx = origin[0] + x * scale
     sy = origin[1] - y * scale
@@ -31,6 +32,7 @@ def draw_pose(surface, color, pose, scale, origin, size=8):
 
 # draw circle for position-only sensors
 def draw_pos_dot(surface, color, pos, scale, origin, radius=4):
+    import pygame
     sx = origin[0] + pos[0] * scale
     sy = origin[1] - pos[1] * scale
     pygame.draw.circle(surface, color, (int(sx), int(sy)), max(2, int(radius * scale / 30.0)))
@@ -53,6 +55,7 @@ def eig2(a, b, c, d):
     return l1, l2, v1
 
 def draw_cov_ellipse(surface, center_px, cov_2x2, scale, color=(80, 140, 255, 80)):
+    import pygame
     a = cov_2x2[0][0]; b = cov_2x2[0][1]; c = cov_2x2[1][0]; d = cov_2x2[1][1]
     l1, l2, v1 = eig2(a, b, c, d)
     chi2_95 = 5.991
@@ -74,10 +77,13 @@ def ekf_linear_update(kf, H, z, R, angle_meas_indices=None):
     if angle_meas_indices:
         for idx in angle_meas_indices:
             y.data[idx][0] = kf._wrap_angle(y.data[idx][0])
-    S = (H * kf.P * kf._transpose(H)) + R
+    PHt = kf.P * kf._transpose(H)
+    S = (H * PHt) + R
     try:
-        S_inv = S.inverse()
-        K = kf.P * kf._transpose(H) * S_inv
+        # Solve with S instead of inverting it, for the gain (S K^T = (P H^T)^T) and the NIS (y^T S^-1 y)
+        S_factor = CholeskyDecomposition(S)
+        K = kf._transpose(S_factor.solve(kf._transpose(PHt)))
+        S_inv_y = S_factor.solve(y)
         kf.x = kf.x + (K * y)
         # wrap state angle (assume index 2)
         try:
@@ -87,14 +93,15 @@ def ekf_linear_update(kf, H, z, R, angle_meas_indices=None):
         I = Matrix.identity(kf.n)
         kf.P = (I - (K * H)) * kf.P
         # NIS
-        yT = kf._transpose(y)
-        nis_mat = (yT * S_inv * y)
-        nis = float(nis_mat.data[0][0])
+        nis = sum(y.data[i][0] * S_inv_y.data[i][0] for i in range(len(y.data)))
     except Exception:
         nis = float('nan')
     return nis
 
 def main():
+    # Only the visualisation needs pygame, so the fusion helpers can be imported without it
+    import pygame
+
     pygame.init()
     W, H = 2000, 2000
     screen = pygame.display.set_mode((W, H))
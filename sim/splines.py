@@ -10,6 +10,9 @@ Includes a pygame_demo() for local interactive testing.
 
 Author: Derek Baier
 """
+import bisect
+import math
+
 
 def linear_interpolate(a, b, t):
     return a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t
@@ -32,6 +35,14 @@ class Curve:
     def second_derivative(self, t):
         raise NotImplementedError
 
+    def evaluate_with_derivatives(self, t, count=2):
+        """Return [point, first derivative, ...] up to `count` derivatives with respect to t."""
+        results = [self.evaluate(t), self.derivative(t), self.second_derivative(t)]
+        return results[:count + 1]
+
+    def arc_length_table(self, segments=200):
+        return ArcLengthTable(self, segments)
+
 
 # -----------------------
 # Bezier
@@ -72,19 +83,81 @@ class Bezier(Curve):
         n = self.degree
         if n < 2:
             return 0.0, 0.0
+        # hodograph control points; its derivative supplies the remaining (n - 1) factor
         d2pts = [
-            ((n - 1) * (b[0] - a[0]), (n - 1) * (b[1] - a[1]))
+            (n * (b[0] - a[0]), n * (b[1] - a[1]))
             for a, b in zip(self.control[:-1], self.control[1:])
         ]
         d2 = Bezier(d2pts).derivative(t)
         return d2
 
 
+# -----------------------
+# Catmull-Rom (interpolating)
+# -----------------------
+class CatmullRom(Curve):
+    """
+    Uniform Catmull-Rom spline through the given points, as drawn by util/PathWriter. The ends use
+    ghost points mirrored through the first and last points. t in [0,1] is split evenly between the
+    segments.
+    """
+
+    def __init__(self, points):
+        assert len(points) >= 2, "Catmull-Rom needs at least 2 points"
+        self.control = [tuple(p) for p in points]
+
+    def _segment(self, t):
+        pts = self.control
+        count = len(pts) - 1
+        i = min(max(int(t * count), 0), count - 1)
+        local_t = t * count - i
+        p0 = pts[i - 1] if i > 0 else (2 * pts[0][0] - pts[1][0], 2 * pts[0][1] - pts[1][1])
+        p3 = pts[i + 2] if i + 2 <= count else (2 * pts[-1][0] - pts[-2][0], 2 * pts[-1][1] - pts[-2][1])
+        p1 = pts[i]
+        p2 = pts[i + 1]
+        # polynomial coefficients of 2 * C(t) = a + b t + c t^2 + d t^3, per axis
+        coefficients = [
+            (
+                2 * p1[k],
+                p2[k] - p0[k],
+                2 * p0[k] - 5 * p1[k] + 4 * p2[k] - p3[k],
+                -p0[k] + 3 * p1[k] - 3 * p2[k] + p3[k],
+            )
+            for k in range(2)
+        ]
+        return coefficients, local_t, count
+
+    def evaluate_with_derivatives(self, t, count=2):
+        coefficients, u, scale = self._segment(t)
+        results = []
+        for a, b, c, d in coefficients:
+            results.append((
+                0.5 * (a + u * (b + u * (c + u * d))),
+                0.5 * scale * (b + u * (2 * c + 3 * u * d)),
+                0.5 * scale * scale * (2 * c + 6 * u * d),
+            ))
+        return [(results[0][k], results[1][k]) for k in range(count + 1)]
+
+    def evaluate(self, t):
+        return self.evaluate_with_derivatives(t, 0)[0]
+
+    def derivative(self, t):
+        return self.evaluate_with_derivatives(t, 1)[1]
+
+    def second_derivative(self, t):
+        return self.evaluate_with_derivatives(t, 2)[2]
+
+
 # -----------------------
 # B-Spline - Cox-de Boor basis
 # -----------------------
 def cox_de_boor(u, i, k, knot):
-    """Return basis function N_{i,k}(u), where k = order (degree+1)."""
+    """
+    Return basis function N_{i,k}(u), where k = order (degree+1).
+
+    Recursive reference implementation, exponential in the degree; the curves use
+    find_span and basis_function_derivatives instead.
+    """
     if k == 1:
         # N_{i,1}(u)
         left = knot[i]
@@ -106,6 +179,109 @@ def cox_de_boor(u, i, k, knot):
     return term1 + term2
 
 
+def find_span(u, degree, knot, control_count):
+    """
+    Knot span index i with knot[i] <= u < knot[i + 1], found by bisection.
+    The end of the domain belongs to the last non-empty span, as in cox_de_boor.
+    """
+    n = control_count - 1
+    if u >= knot[n + 1]:
+        # last span with non-zero length
+        i = n
+        while i > degree and knot[i] == knot[i + 1]:
+            i -= 1
+        return i
+    if u <= knot[degree]:
+        i = degree
+        while knot[i + 1] == knot[i]:
+            i += 1
+        return i
+    low = degree
+    high = n + 1
+    mid = (low + high) // 2
+    while u < knot[mid] or u >= knot[mid + 1]:
+        if u < knot[mid]:
+            high = mid
+        else:
+            low = mid
+        mid = (low + high) // 2
+    return mid
+
+
+def basis_functions(span, u, degree, knot):
+    """The degree + 1 non-zero basis functions N_{span-degree..span}(u), iteratively (NURBS Book A2.2)."""
+    basis = [1.0] + [0.0] * degree
+    left = [0.0] * (degree + 1)
+    right = [0.0] * (degree + 1)
+    for j in range(1, degree + 1):
+        left[j] = u - knot[span + 1 - j]
+        right[j] = knot[span + j] - u
+        saved = 0.0
+        for r in range(j):
+            temp = basis[r] / (right[r + 1] + left[j - r])
+            basis[r] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        basis[j] = saved
+    return basis
+
+
+def basis_function_derivatives(span, u, degree, knot, count):
+    """
+    The non-zero basis functions and their derivatives up to `count` in one pass (NURBS Book A2.3).
+    Returns ders[k][j], the k-th derivative of N_{span-degree+j}(u) with respect to u.
+    """
+    p = degree
+    ndu = [[0.0] * (p + 1) for _ in range(p + 1)]
+    ndu[0][0] = 1.0
+    left = [0.0] * (p + 1)
+    right = [0.0] * (p + 1)
+    for j in range(1, p + 1):
+        left[j] = u - knot[span + 1 - j]
+        right[j] = knot[span + j] - u
+        saved = 0.0
+        for r in range(j):
+            # lower triangle holds the knot differences, upper triangle the basis functions
+            ndu[j][r] = right[r + 1] + left[j - r]
+            temp = ndu[r][j - 1] / ndu[j][r]
+            ndu[r][j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j][j] = saved
+
+    ders = [[0.0] * (p + 1) for _ in range(count + 1)]
+    for j in range(p + 1):
+        ders[0][j] = ndu[j][p]
+
+    a = [[0.0] * (p + 1), [0.0] * (p + 1)]
+    for r in range(p + 1):
+        s1 = 0
+        s2 = 1
+        a[0][0] = 1.0
+        for k in range(1, min(count, p) + 1):
+            d = 0.0
+            rk = r - k
+            pk = p - k
+            if r >= k:
+                a[s2][0] = a[s1][0] / ndu[pk + 1][rk]
+                d = a[s2][0] * ndu[rk][pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k - 1 if r - 1 <= pk else p - r
+            for j in range(j1, j2 + 1):
+                a[s2][j] = (a[s1][j] - a[s1][j - 1]) / ndu[pk + 1][rk + j]
+                d += a[s2][j] * ndu[rk + j][pk]
+            if r <= pk:
+                a[s2][k] = -a[s1][k - 1] / ndu[pk + 1][r]
+                d += a[s2][k] * ndu[r][pk]
+            ders[k][r] = d
+            s1, s2 = s2, s1
+
+    factor = p
+    for k in range(1, min(count, p) + 1):
+        for j in range(p + 1):
+            ders[k][j] *= factor
+        factor *= p - k
+    return ders
+
+
 class BSpline(Curve):
     def __init__(self, control, degree, knot=None):
         assert degree >= 1, "degree must be >= 1"
@@ -127,35 +303,49 @@ class BSpline(Curve):
         assert len(knot) == len(control) + self.order, "knot vector size mismatch"
         self.knot = list(knot)
 
-    def evaluate(self, t):
+    def _parameter(self, t):
         # map t in [0,1] to knot domain [knot[order-1], knot[-order]]
         u_min = self.knot[self.order - 1]
         u_max = self.knot[-self.order]
-        u = u_min + (u_max - u_min) * t
+        return u_min + (u_max - u_min) * t, u_max - u_min
+
+    def evaluate(self, t):
+        u, _ = self._parameter(t)
+        span = find_span(u, self.degree, self.knot, len(self.control))
+        basis = basis_functions(span, u, self.degree, self.knot)
         x = 0.0
         y = 0.0
-        for i, P in enumerate(self.control):
-            N = cox_de_boor(u, i, self.order, self.knot)
+        first = span - self.degree
+        for j, N in enumerate(basis):
+            P = self.control[first + j]
             x += N * P[0]
             y += N * P[1]
         return x, y
 
+    def evaluate_with_derivatives(self, t, count=2):
+        """Point and derivatives with respect to t, from one span lookup and one basis evaluation."""
+        u, domain = self._parameter(t)
+        span = find_span(u, self.degree, self.knot, len(self.control))
+        ders = basis_function_derivatives(span, u, self.degree, self.knot, count)
+        first = span - self.degree
+        results = []
+        scale = 1.0
+        for k in range(count + 1):
+            x = 0.0
+            y = 0.0
+            for j, N in enumerate(ders[k]):
+                P = self.control[first + j]
+                x += N * P[0]
+                y += N * P[1]
+            results.append((x * scale, y * scale))
+            scale *= domain
+        return results
+
     def derivative(self, t):
-        # Numerical finite difference
-        eps = 1e-5
-        p1 = self.evaluate(max(0.0, t - eps))
-        p2 = self.evaluate(min(1.0, t + eps))
-        return (p2[0] - p1[0]) / (2 * eps), (p2[1] - p1[1]) / (2 * eps)
+        return self.evaluate_with_derivatives(t, 1)[1]
 
     def second_derivative(self, t):
-        eps = 1e-5
-        p0 = self.evaluate(max(0.0, t - eps))
-        p1 = self.evaluate(t)
-        p2 = self.evaluate(min(1.0, t + eps))
-        return (
-            (p2[0] - 2 * p1[0] + p0[0]) / (eps**2),
-            (p2[1] - 2 * p1[1] + p0[1]) / (eps**2),
-        )
+        return self.evaluate_with_derivatives(t, 2)[2]
 
 
 # -----------------------
@@ -172,16 +362,19 @@ class NURBS(Curve):
         temp = BSpline(control, degree, knot)
         self.knot = temp.knot
 
+    _parameter = BSpline._parameter
+
     def evaluate(self, t):
-        u_min = self.knot[self.order - 1]
-        u_max = self.knot[-self.order]
-        u = u_min + (u_max - u_min) * t
+        u, _ = self._parameter(t)
+        span = find_span(u, self.degree, self.knot, len(self.control))
+        basis = basis_functions(span, u, self.degree, self.knot)
         num_x = 0.0
         num_y = 0.0
         den = 0.0
-        for i, P in enumerate(self.control):
-            N = cox_de_boor(u, i, self.order, self.knot)
-            wN = self.weights[i] * N
+        first = span - self.degree
+        for j, N in enumerate(basis):
+            P = self.control[first + j]
+            wN = self.weights[first + j] * N
             num_x += wN * P[0]
             num_y += wN * P[1]
             den += wN
@@ -189,6 +382,48 @@ class NURBS(Curve):
             return 0.0, 0.0
         return num_x / den, num_y / den
 
+    def evaluate_with_derivatives(self, t, count=2):
+        """
+        Point and derivatives with respect to t, from the derivatives of the weighted curve A(u)
+        and the weight function w(u) (NURBS Book A4.2).
+        """
+        u, domain = self._parameter(t)
+        span = find_span(u, self.degree, self.knot, len(self.control))
+        ders = basis_function_derivatives(span, u, self.degree, self.knot, count)
+        first = span - self.degree
+
+        weighted = []
+        weight_ders = []
+        for k in range(count + 1):
+            ax = 0.0
+            ay = 0.0
+            w = 0.0
+            for j, N in enumerate(ders[k]):
+                P = self.control[first + j]
+                wN = self.weights[first + j] * N
+                ax += wN * P[0]
+                ay += wN * P[1]
+                w += wN
+            weighted.append((ax, ay))
+            weight_ders.append(w)
+        if weight_ders[0] == 0:
+            return [(0.0, 0.0)] * (count + 1)
+
+        results = []
+        for k in range(count + 1):
+            x, y = weighted[k]
+            for i in range(1, k + 1):
+                c = math.comb(k, i) * weight_ders[i]
+                x -= c * results[k - i][0]
+                y -= c * results[k - i][1]
+            results.append((x / weight_ders[0], y / weight_ders[0]))
+
+        scale = 1.0
+        for k in range(count + 1):
+            results[k] = (results[k][0] * scale, results[k][1] * scale)
+            scale *= domain
+        return results
+
     derivative = BSpline.derivative
     second_derivative = BSpline.second_derivative
 
@@ -207,44 +442,121 @@ class CompositeCurve(Curve):
             s = sum(param_lengths)
             self.param_lengths = [pl / s for pl in param_lengths]
 
-    def evaluate(self, t):
+    def _locate(self, t):
+        """
+        Find the segment containing t.
+
+        Returns:
+            (curve, local_t, scale) where scale is d(local_t)/dt, the factor each derivative with
+            respect to the segment's own parameter is multiplied by once per order.
+        """
         if t <= 0:
-            return self.curves[0].evaluate(0.0)
-        if t >= 1:
-            return self.curves[-1].evaluate(1.0)
-        acc = 0.0
-        for i, frac in enumerate(self.param_lengths):
-            if acc + frac >= t:
-                local_t = (t - acc) / frac if frac > 0 else 0.0
-                return self.curves[i].evaluate(local_t)
-            acc += frac
-        return self.curves[-1].evaluate(1.0)
+            index, local_t = 0, 0.0
+        elif t >= 1:
+            index, local_t = len(self.curves) - 1, 1.0
+        else:
+            index, local_t = len(self.curves) - 1, 1.0
+            acc = 0.0
+            for i, frac in enumerate(self.param_lengths):
+                if frac > 0 and acc + frac >= t:
+                    index, local_t = i, (t - acc) / frac
+                    break
+                acc += frac
+        frac = self.param_lengths[index]
+        return self.curves[index], local_t, 1.0 / frac if frac > 0 else 0.0
+
+    def evaluate(self, t):
+        curve, local_t, _ = self._locate(t)
+        return curve.evaluate(local_t)
 
     def derivative(self, t):
-        if t <= 0:
-            return self.curves[0].derivative(0.0)
-        if t >= 1:
-            return self.curves[-1].derivative(1.0)
-        acc = 0.0
-        for i, frac in enumerate(self.param_lengths):
-            if acc + frac >= t:
-                local_t = (t - acc) / frac if frac > 0 else 0.0
-                return self.curves[i].derivative(local_t)
-            acc += frac
-        return self.curves[-1].derivative(1.0)
+        curve, local_t, scale = self._locate(t)
+        dx, dy = curve.derivative(local_t)
+        return dx * scale, dy * scale
 
     def second_derivative(self, t):
-        if t <= 0:
-            return self.curves[0].second_derivative(0.0)
-        if t >= 1:
-            return self.curves[-1].second_derivative(1.0)
-        acc = 0.0
-        for i, frac in enumerate(self.param_lengths):
-            if acc + frac >= t:
-                local_t = (t - acc) / frac if frac > 0 else 0.0
-                return self.curves[i].second_derivative(local_t)
-            acc += frac
-        return self.curves[-1].second_derivative(1.0)
+        curve, local_t, scale = self._locate(t)
+        ddx, ddy = curve.second_derivative(local_t)
+        return ddx * scale * scale, ddy * scale * scale
+
+    def evaluate_with_derivatives(self, t, count=2):
+        curve, local_t, scale = self._locate(t)
+        results = list(curve.evaluate_with_derivatives(local_t, count))
+        factor = 1.0
+        for k in range(1, len(results)):
+            factor *= scale
+            results[k] = (results[k][0] * factor, results[k][1] * factor)
+        return results
+
+
+# -----------------------
+# Arc-length reparameterization
+# -----------------------
+# 5-point Gauss-Legendre nodes and weights on [0, 1]
+_GAUSS_NODES = [0.5 - 0.4530899229693320, 0.5 - 0.2692346550528416, 0.5,
+                0.5 + 0.2692346550528416, 0.5 + 0.4530899229693320]
+_GAUSS_WEIGHTS = [0.1184634425280945, 0.2393143352496832, 0.2844444444444444,
+                  0.2393143352496832, 0.1184634425280945]
+
+
+class ArcLengthTable:
+    """
+    Cumulative arc length of a curve at evenly spaced parameters, integrated with Gauss-Legendre
+    quadrature of the speed, so the curve can be sampled at uniform distances along it.
+
+    Built once per curve; parameter_at(distance) is then a bisection of the table plus one Newton
+    step. Rebuild it after moving control points.
+    """
+
+    def __init__(self, curve, segments=200):
+        self.curve = curve
+        self.segments = segments
+        self.parameters = [i / segments for i in range(segments + 1)]
+        self.lengths = [0.0]
+        total = 0.0
+        for t0, t1 in zip(self.parameters[:-1], self.parameters[1:]):
+            total += self._integrate(t0, t1)
+            self.lengths.append(total)
+
+    @property
+    def length(self):
+        return self.lengths[-1]
+
+    def _speed(self, t):
+        dx, dy = self.curve.evaluate_with_derivatives(t, 1)[1]
+        return math.hypot(dx, dy)
+
+    def _integrate(self, t0, t1):
+        span = t1 - t0
+        return span * sum(w * self._speed(t0 + span * x) for x, w in zip(_GAUSS_NODES, _GAUSS_WEIGHTS))
+
+    def parameter_at(self, distance):
+        """Curve parameter t at which the arc length from the start equals distance."""
+        if distance <= 0:
+            return 0.0
+        if distance >= self.length:
+            return 1.0
+        index = bisect.bisect_right(self.lengths, distance) - 1
+        t0 = self.parameters[index]
+        s0 = self.lengths[index]
+        s1 = self.lengths[index + 1]
+        t = t0 + (self.parameters[index + 1] - t0) * ((distance - s0) / (s1 - s0) if s1 > s0 else 0.0)
+        # one Newton step on s(t) - distance, using the speed as the derivative
+        speed = self._speed(t)
+        if speed > 0:
+            t -= (s0 + self._integrate(t0, t) - distance) / speed
+        return min(1.0, max(0.0, t))
+
+    def uniform_parameters(self, spacing):
+        """Parameters spaced `spacing` apart along the curve, including both ends."""
+        if spacing <= 0 or self.length == 0:
+            return [0.0, 1.0]
+        count = max(1, int(math.ceil(self.length / spacing)))
+        return [self.parameter_at(self.length * i / count) for i in range(count + 1)]
+
+    def sample_uniform(self, spacing):
+        """Points spaced `spacing` apart along the curve (the last gap may be slightly shorter)."""
+        return [self.curve.evaluate(t) for t in self.uniform_parameters(spacing)]
 
 
 def join_curves_c0(curve_a, curve_b):
@@ -0,0 +1,185 @@
+import contextlib
+import io
+import random
+import unittest
+
+from VEXLib.Algorithms.AStarPathfinding import AStarPathfinding, ASTAR, JUMP_POINT, EIGHT_CONNECTED_MOVES
+from VEXLib.Algorithms.DijkstraPathfinding import DijkstraPathfinding
+from VEXLib.Geometry.GeometryUtil import distance
+from VEXLib.Util.PathfindingEnvironment import PathfindingEnvironment
+
+FOUR_CONNECTED_MOVES = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def pack_grid(grid):
+    """Pack rows of 0/1 values into the bit-packed obstacle list used by PathfindingEnvironment."""
+    bits = [value for row in grid for value in row]
+    bits += [0] * (-len(bits) % 8)
+    obstacle_list = []
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for bit in bits[i:i + 8]:
+            byte = (byte << 1) | bit
+        obstacle_list.append(byte)
+    return obstacle_list
+
+
+def make_random_grid(size, density, seed):
+    """A random obstacle grid with a solid border, so Dijkstra never steps outside the map."""
+    rng = random.Random(seed)
+    return [
+        [1 if x in (0, size - 1) or y in (0, size - 1) or rng.random() < density else 0 for x in range(size)]
+        for y in range(size)
+    ]
+
+
+def make_environment(grid):
+    environment = PathfindingEnvironment()
+    environment.load_from_list(pack_grid(grid), len(grid[0]))
+    return environment
+
+
+def dijkstra_path(grid, start, goal, moves):
+    width = len(grid[0])
+    header = "".join(chr((width >> (8 * i)) & 0xFF) for i in range(8))
+    file_object = io.StringIO(header + "".join(chr(byte) for byte in pack_grid(grid)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        path, _ = DijkstraPathfinding(start, goal, file_object, moves).find_path()
+    return path
+
+
+def path_cost(path):
+    return sum(distance(a, b) for a, b in zip(path, path[1:]))
+
+
+class TestAStarPathfinding(unittest.TestCase):
+    def assertValidPath(self, grid, path, start, goal):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for a, b in zip(path, path[1:]):
+            self.assertLessEqual(max(abs(a[0] - b[0]), abs(a[1] - b[1])), 1)
+            self.assertEqual(grid[b[1]][b[0]], 0)
+
+    def test_empty_grid(self):
+        grid = make_random_grid(12, 0, 0)
+        for mode in (ASTAR, JUMP_POINT):
+            planner = AStarPathfinding(make_environment(grid), mode=mode)
+            path = planner.find_path((1, 1), (10, 6))
+            self.assertValidPath(grid, path, (1, 1), (10, 6))
+            self.assertAlmostEqual(path_cost(path), 4 + 5 * 2 ** 0.5, places=4)
+
+    def test_matches_dijkstra_cost(self):
+        for seed in range(10):
+            grid = make_random_grid(24, 0.25, seed)
+            environment = make_environment(grid)
+            planners = [AStarPathfinding(environment, mode=mode) for mode in (ASTAR, JUMP_POINT)]
+            free = [(x, y) for y in range(24) for x in range(24) if not grid[y][x]]
+            rng = random.Random(seed)
+            for _ in range(5):
+                start, goal = rng.sample(free, 2)
+                try:
+                    expected = path_cost(dijkstra_path(grid, start, goal, EIGHT_CONNECTED_MOVES))
+                except AssertionError:
+                    for planner in planners:
+                        with self.assertRaises(AssertionError):
+                            planner.find_path(start, goal)
+                    continue
+                for planner in planners:
+                    path = planner.find_path(start, goal)
+                    self.assertValidPath(grid, path, start, goal)
+                    self.assertAlmostEqual(path_cost(path), expected, places=3)
+
+    def test_four_connected(self):
+        grid = make_random_grid(16, 0.2, 3)
+        planner = AStarPathfinding(make_environment(grid), FOUR_CONNECTED_MOVES)
+        path = planner.find_path((1, 1), (14, 14))
+        expected = path_cost(dijkstra_path(grid, (1, 1), (14, 14), FOUR_CONNECTED_MOVES))
+        self.assertAlmostEqual(path_cost(path), expected, places=4)
+        for a, b in zip(path, path[1:]):
+            self.assertEqual(abs(a[0] - b[0]) + abs(a[1] - b[1]), 1)
+
+    def test_no_path(self):
+        grid = make_random_grid(10, 0, 0)
+        for y in range(10):
+            grid[y][5] = 1
+        for mode in (ASTAR, JUMP_POINT):
+            planner = AStarPathfinding(make_environment(grid), mode=mode)
+            with self.assertRaises(AssertionError):
+                planner.find_path((2, 2), (7, 7))
+
+    def test_blocked_endpoints(self):
+        grid = make_random_grid(10, 0, 0)
+        planner = AStarPathfinding(make_environment(grid))
+        with self.assertRaises(AssertionError):
+            planner.find_path((0, 0), (5, 5))
+        with self.assertRaises(AssertionError):
+            planner.find_path((5, 5), (20, 5))
+
+    def test_start_is_goal(self):
+        planner = AStarPathfinding(make_environment(make_random_grid(8, 0, 0)))
+        self.assertEqual(planner.find_path((3, 3), (3, 3)), [(3, 3)])
+
+    def test_reused_between_searches(self):
+        grid = make_random_grid(20, 0.2, 7)
+        environment = make_environment(grid)
+        reused = AStarPathfinding(environment)
+        for start, goal in [((1, 1), (18, 18)), ((18, 1), (1, 18)), ((1, 1), (18, 18))]:
+            try:
+                expected = AStarPathfinding(environment).find_path(start, goal)
+            except AssertionError:
+                continue
+            self.assertEqual(reused.find_path(start, goal), expected)
+
+    def test_jump_point_expands_fewer_nodes(self):
+        grid = make_random_grid(40, 0, 0)
+        environment = make_environment(grid)
+        astar = AStarPathfinding(environment, mode=ASTAR)
+        jump_point = AStarPathfinding(environment, mode=JUMP_POINT)
+        astar.find_path((1, 1), (38, 20))
+        jump_point.find_path((1, 1), (38, 20))
+        self.assertLess(jump_point.nodes_expanded, astar.nodes_expanded)
+        self.assertEqual(len(jump_point.get_visited()), jump_point.nodes_expanded)
+
+    def test_inflated_map(self):
+        grid = make_random_grid(20, 0, 0)
+        for y in range(1, 14):
+            grid[y][10] = 1
+        environment = make_environment(grid)
+        environment.build_clearance(2)
+        for mode in (ASTAR, JUMP_POINT):
+            path = AStarPathfinding(environment, mode=mode).find_path((4, 4), (16, 4))
+            for x, y in path:
+                self.assertFalse(environment.get_inflated_at(x, y))
+                self.assertGreaterEqual(environment.get_clearance(x, y), 2)
+            # Going around the end of the wall needs two tiles of clearance
+            self.assertGreaterEqual(max(y for _, y in path), 16)
+
+    def test_clearance_cost(self):
+        grid = make_random_grid(21, 0, 0)
+        for y in range(1, 10):
+            grid[y][10] = 1
+        environment = make_environment(grid)
+        environment.build_clearance(0)
+        plain = AStarPathfinding(environment).find_path((5, 5), (15, 5))
+        cautious = AStarPathfinding(environment, clearance_weight=2, clearance_distance=3).find_path((5, 5), (15, 5))
+        self.assertValidPath(grid, cautious, (5, 5), (15, 5))
+        self.assertGreater(path_cost(cautious), path_cost(plain))
+        self.assertGreater(
+            min(environment.get_clearance(x, y) for x, y in cautious[1:-1]),
+            min(environment.get_clearance(x, y) for x, y in plain[1:-1]),
+        )
+        with self.assertRaises(ValueError):
+            AStarPathfinding(environment, mode=JUMP_POINT, clearance_weight=1, clearance_distance=3)
+        with self.assertRaises(ValueError):
+            AStarPathfinding(make_environment(grid), clearance_weight=1, clearance_distance=3)
+
+    def test_invalid_configuration(self):
+        environment = make_environment(make_random_grid(8, 0, 0))
+        with self.assertRaises(ValueError):
+            AStarPathfinding(environment, mode="greedy")
+        with self.assertRaises(ValueError):
+            AStarPathfinding(environment, FOUR_CONNECTED_MOVES, mode=JUMP_POINT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import math
+import unittest
+
+from sim import BatchKalmanFilter
+
+
+class TestBatchMatchesReference(unittest.TestCase):
+    def test_linear_filter_matches_kalman_filter(self):
+        self.assertLess(BatchKalmanFilter.compare_with_kalman_filter(steps=50), 1e-12)
+
+    def test_pose_ekf_matches_pose_ekf(self):
+        difference, _ = BatchKalmanFilter.compare_with_pose_ekf(steps=50)
+        self.assertLess(difference, 1e-12)
+
+    def test_linear_update_matches_two_source_fusion(self):
+        self.assertLess(BatchKalmanFilter.compare_with_two_source_fusion(steps=50), 1e-12)
+
+
+class TestTwoSourceSweep(unittest.TestCase):
+    def test_rows_per_configuration(self):
+        rows = BatchKalmanFilter.sweep_two_source_noise([1.0], [1.0, 4.0], [1.0], trajectories=5, steps=30)
+        self.assertEqual([(row["position_r_scale"], row["pose_r_scale"]) for row in rows], [(1.0, 1.0), (4.0, 1.0)])
+        for row in rows:
+            self.assertEqual(len(row["rmse"]), 5)
+            # Steps without an update are skipped, not averaged in as NaN
+            for name in ("nees", "nis_position", "nis_pose"):
+                self.assertTrue(math.isfinite(row[name]), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,10 @@ class TestBuffer(unittest.TestCase):
         buffer = Buffer(3)
         self.assertEqual(buffer.length, 3)
         self.assertEqual(buffer.buffer, [])
+        with self.assertRaises(ValueError):
+            Buffer(0)
+        with self.assertRaises(ValueError):
+            Buffer(0, "f")
 
     def test_add(self):
         buffer = Buffer(3)
@@ -43,6 +47,44 @@ class TestBuffer(unittest.TestCase):
         buffer.initialize(5)
         self.assertEqual(buffer.get(), [5, 5, 5])
 
+    def test_add_returns_removed(self):
+        buffer = Buffer(2)
+        self.assertIsNone(buffer.add(1))
+        self.assertIsNone(buffer.add(2))
+        self.assertEqual(buffer.add(3), 1)
+        self.assertEqual(buffer.add(4), 2)
+
+    def test_iteration_and_indexing(self):
+        buffer = Buffer(4)
+        for value in range(7):
+            buffer.add(value)
+        self.assertEqual(list(buffer), [3, 4, 5, 6])
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer[0], 3)
+        self.assertEqual(buffer[-1], 6)
+        with self.assertRaises(IndexError):
+            buffer[4]
+
+    def test_typed_storage(self):
+        buffer = Buffer(3, "f")
+        for value in [0.5, 1.5, 2.5, 3.5]:
+            buffer.add(value)
+        self.assertEqual(buffer.get(), [1.5, 2.5, 3.5])
+        self.assertTrue(buffer.is_full())
+        buffer.clear()
+        self.assertEqual(buffer.get(), [])
+        self.assertFalse(buffer.is_full())
+        buffer.add(4.5)
+        self.assertEqual(buffer.get(), [4.5])
+
+    def test_initialize_after_wrapping(self):
+        buffer = Buffer(3)
+        for value in range(5):
+            buffer.add(value)
+        buffer.initialize(0)
+        buffer.add(1)
+        self.assertEqual(buffer.get(), [0, 0, 1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,159 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Importing the deploy package parses the command line, changes directory and needs $USER for
+# the mount point, so give it an empty command line and put the working directory back afterwards
+_working_directory = os.getcwd()
+with patch.object(sys, "argv", ["deploy"]), patch.dict(os.environ, {"USER": os.environ.get("USER") or "test"}):
+    from deploy.Utils import DeployManifest, StatCache, copy_if_changed_incremental
+os.chdir(_working_directory)
+
+MANIFEST_NAME = ".deploy_manifest.json"
+
+
+class DeployTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "src")
+        self.target = os.path.join(self.directory.name, "target")
+        self.cache_path = os.path.join(self.directory.name, "cache.json")
+        os.makedirs(os.path.join(self.source, "lib"))
+        self.files = [
+            self.write(os.path.join(self.source, "main.py"), "print('main')\n"),
+            self.write(os.path.join(self.source, "lib", "util.py"), "VALUE = 1\n"),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, path, text, mtime_ns=None):
+        with open(path, "w") as file:
+            file.write(text)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def read(self, path):
+        with open(path) as file:
+            return file.read()
+
+    def deploy(self):
+        copied = []
+        stat_cache = StatCache(self.cache_path)
+        result = copy_if_changed_incremental(
+            self.files,
+            self.target,
+            self.source,
+            stat_cache,
+            MANIFEST_NAME,
+            on_file_done=lambda file, was_copied: was_copied and copied.append(os.path.relpath(file, self.source)),
+        )
+        stat_cache.save()
+        return result, sorted(copied), stat_cache
+
+
+class TestStatCache(DeployTestCase):
+    def test_unchanged_file_not_rehashed(self):
+        path = self.files[0]
+        first = StatCache(self.cache_path)
+        checksum = first.get_checksum(path)
+        first.save()
+
+        second = StatCache(self.cache_path)
+        with patch("deploy.Utils.get_checksum") as get_checksum:
+            self.assertEqual(second.get_checksum(path), checksum)
+            get_checksum.assert_not_called()
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_changed_file_rehashed(self):
+        path = self.files[0]
+        stat_cache = StatCache(self.cache_path)
+        checksum = stat_cache.get_checksum(path)
+        # Same size, so only the new mtime shows the edit
+        self.write(path, "print('edit')\n", mtime_ns=os.stat(path).st_mtime_ns + 10**9)
+        self.assertNotEqual(stat_cache.get_checksum(path), checksum)
+        self.assertEqual((stat_cache.hits, stat_cache.misses), (0, 2))
+
+    def test_corrupt_cache_ignored(self):
+        self.write(self.cache_path, "{not json")
+        self.assertEqual(StatCache(self.cache_path).entries, {})
+
+
+class TestDeployManifest(DeployTestCase):
+    def test_recorded_file_is_current(self):
+        os.makedirs(self.target)
+        target_path = self.write(os.path.join(self.target, "main.py"), "print('main')\n")
+        manifest = DeployManifest(self.target, MANIFEST_NAME)
+        self.assertFalse(manifest.is_current("main.py", target_path, "abc"))
+        manifest.record("main.py", target_path, "abc")
+        manifest.save()
+
+        reloaded = DeployManifest(self.target, MANIFEST_NAME)
+        self.assertTrue(reloaded.is_current("main.py", target_path, "abc"))
+        self.assertFalse(reloaded.is_current("main.py", target_path, "def"))
+
+    def test_modified_or_missing_target_not_current(self):
+        os.makedirs(self.target)
+        target_path = self.write(os.path.join(self.target, "main.py"), "print('main')\n")
+        manifest = DeployManifest(self.target, MANIFEST_NAME)
+        manifest.record("main.py", target_path, "abc")
+
+        self.write(target_path, "print('main')\n", mtime_ns=os.stat(target_path).st_mtime_ns + 10**9)
+        self.assertFalse(manifest.is_current("main.py", target_path, "abc"))
+        os.remove(target_path)
+        self.assertFalse(manifest.is_current("main.py", target_path, "abc"))
+
+
+class TestCopyIfChangedIncremental(DeployTestCase):
+    def test_first_deploy_copies_everything(self):
+        (count, size, skipped), copied, stat_cache = self.deploy()
+        self.assertEqual(copied, [os.path.join("lib", "util.py"), "main.py"])
+        self.assertEqual(count, 2)
+        self.assertEqual(size, sum(os.path.getsize(file) for file in self.files))
+        self.assertEqual(skipped, 0)
+        self.assertEqual(self.read(os.path.join(self.target, "lib", "util.py")), "VALUE = 1\n")
+        self.assertTrue(os.path.exists(os.path.join(self.target, MANIFEST_NAME)))
+
+    def test_unchanged_files_skipped(self):
+        self.deploy()
+        with patch("deploy.Utils.get_checksum") as get_checksum:
+            (count, size, skipped), copied, stat_cache = self.deploy()
+            get_checksum.assert_not_called()
+        self.assertEqual(copied, [])
+        self.assertEqual((count, size), (0, 0))
+        self.assertEqual(skipped, 2 * sum(os.path.getsize(file) for file in self.files))
+        self.assertEqual((stat_cache.hits, stat_cache.misses), (2, 0))
+
+    def test_changed_source_copied(self):
+        self.deploy()
+        path = self.files[1]
+        self.write(path, "VALUE = 2\n", mtime_ns=os.stat(path).st_mtime_ns + 10**9)
+        (count, size, skipped), copied, stat_cache = self.deploy()
+        self.assertEqual(copied, [os.path.join("lib", "util.py")])
+        self.assertEqual(self.read(os.path.join(self.target, "lib", "util.py")), "VALUE = 2\n")
+        self.assertEqual((stat_cache.hits, stat_cache.misses), (1, 1))
+
+    def test_modified_target_copied_again(self):
+        self.deploy()
+        target_path = os.path.join(self.target, "main.py")
+        self.write(target_path, "print('changed on the card')\n")
+        (count, size, skipped), copied, stat_cache = self.deploy()
+        self.assertEqual(copied, ["main.py"])
+        self.assertEqual(self.read(target_path), "print('main')\n")
+
+        # The manifest now matches the restored file again
+        (count, size, skipped), copied, stat_cache = self.deploy()
+        self.assertEqual(copied, [])
+
+    def test_deleted_target_copied_again(self):
+        self.deploy()
+        os.remove(os.path.join(self.target, "lib", "util.py"))
+        (count, size, skipped), copied, stat_cache = self.deploy()
+        self.assertEqual(copied, [os.path.join("lib", "util.py")])
+
+
+if __name__ == "__main__":
+    unittest.main()
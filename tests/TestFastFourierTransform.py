@@ -0,0 +1,101 @@
+import cmath
+import random
+import unittest
+
+from VEXLib.Algorithms.FastFourierTransform import (
+    fft,
+    ifft,
+    rfft,
+    irfft,
+    fft_in_place,
+    fft_recursive,
+    ifft_recursive,
+    pad_to_power_of_2,
+    clear_caches,
+)
+
+
+def dft(signal):
+    n = len(signal)
+    return [sum(signal[t] * cmath.exp(-2j * cmath.pi * k * t / n) for t in range(n)) for k in range(n)]
+
+
+class TestFastFourierTransform(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(0)
+
+    def assertComplexListAlmostEqual(self, first, second, places=9):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(abs(complex(a) - complex(b)), 0, places=places)
+
+    def random_signal(self, n, complex_values=False):
+        if complex_values:
+            return [complex(self.rng.uniform(-1, 1), self.rng.uniform(-1, 1)) for _ in range(n)]
+        return [self.rng.uniform(-1, 1) for _ in range(n)]
+
+    def test_fft_matches_dft(self):
+        for n in [2, 4, 8, 32, 64]:
+            signal = self.random_signal(n, complex_values=True)
+            self.assertComplexListAlmostEqual(fft(signal), dft(signal))
+
+    def test_fft_matches_recursive(self):
+        for n in [1, 5, 16, 100, 512]:
+            signal = self.random_signal(n)
+            self.assertComplexListAlmostEqual(fft(signal), fft_recursive(signal))
+
+    def test_ifft_round_trip(self):
+        for n in [1, 2, 16, 128]:
+            signal = self.random_signal(n, complex_values=True)
+            self.assertComplexListAlmostEqual(ifft(fft(signal)), signal)
+            self.assertComplexListAlmostEqual(ifft(fft(signal)), ifft_recursive(fft(signal)))
+
+    def test_ifft_pads(self):
+        signal = self.random_signal(12)
+        self.assertComplexListAlmostEqual(ifft(fft(signal)), pad_to_power_of_2(signal))
+
+    def test_rfft_matches_fft(self):
+        for n in [1, 2, 4, 8, 30, 256]:
+            signal = self.random_signal(n)
+            full = fft(signal)
+            self.assertComplexListAlmostEqual(rfft(signal), full[:len(full) // 2 + 1])
+
+    def test_irfft_round_trip(self):
+        for n in [2, 8, 64, 256]:
+            signal = self.random_signal(n)
+            reconstructed = irfft(rfft(signal))
+            self.assertEqual(len(reconstructed), n)
+            for a, b in zip(reconstructed, signal):
+                self.assertAlmostEqual(a, b, places=9)
+
+    def test_irfft_rejects_non_power_of_2(self):
+        spectrum = rfft(self.random_signal(6))
+        with self.assertRaises(ValueError):
+            irfft(spectrum, 6)
+        with self.assertRaises(ValueError):
+            irfft(spectrum, 0)
+        # The padded length round trips the zero-padded signal
+        self.assertEqual(len(irfft(spectrum, 8)), 8)
+
+    def test_in_place(self):
+        signal = self.random_signal(16, complex_values=True)
+        expected = dft(signal)
+        data = list(signal)
+        self.assertIs(fft_in_place(data), data)
+        self.assertComplexListAlmostEqual(data, expected)
+        with self.assertRaises(ValueError):
+            fft_in_place([0j] * 12)
+
+    def test_clear_caches(self):
+        signal = self.random_signal(32)
+        before = fft(signal)
+        clear_caches()
+        self.assertComplexListAlmostEqual(fft(signal), before)
+
+    def test_empty(self):
+        self.assertEqual(fft([]), [])
+        self.assertEqual(ifft([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import random
+import unittest
+
+from VEXLib.Math.FlatMatrix import FlatMatrix
+from VEXLib.Math.Matrix import Matrix, Shape
+
+
+def random_matrix(rows, columns, rng):
+    return Matrix(Shape(columns, rows), [[rng.uniform(-10, 10) for _ in range(columns)] for _ in range(rows)])
+
+
+class TestFlatMatrix(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(42)
+
+    def test_conversion(self):
+        matrix = random_matrix(3, 5, self.rng)
+        flat = FlatMatrix.from_matrix(matrix)
+        self.assertEqual((flat.rows, flat.columns), (3, 5))
+        self.assertEqual(flat.get_at((2, 4)), matrix.get_at((2, 4)))
+        self.assertEqual(flat.to_matrix().data, matrix.data)
+        self.assertEqual(flat.shape.x_size, 5)
+        self.assertEqual(flat.shape.y_size, 3)
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            FlatMatrix(0, 3)
+        with self.assertRaises(ValueError):
+            FlatMatrix(2, 2, [1.0, 2.0, 3.0])
+
+    def test_matmul_matches_matrix(self):
+        for rows, inner, columns in [(1, 1, 1), (3, 3, 3), (5, 5, 3), (2, 7, 4), (9, 1, 6)]:
+            a = random_matrix(rows, inner, self.rng)
+            b = random_matrix(inner, columns, self.rng)
+            out = FlatMatrix(rows, columns)
+            FlatMatrix.from_matrix(a).matmul_into(FlatMatrix.from_matrix(b), out)
+            self.assertEqual(out.to_rows(), (a * b).data)
+
+    def test_matmul_transpose_matches_matrix(self):
+        a = random_matrix(4, 6, self.rng)
+        b = random_matrix(5, 6, self.rng)
+        out = FlatMatrix(4, 5)
+        FlatMatrix.from_matrix(a).matmul_transpose_into(FlatMatrix.from_matrix(b), out)
+        self.assertEqual(out.to_rows(), (a * b.transpose()).data)
+
+    def test_elementwise_matches_matrix(self):
+        a = random_matrix(4, 3, self.rng)
+        b = random_matrix(4, 3, self.rng)
+        flat_a = FlatMatrix.from_matrix(a)
+        flat_b = FlatMatrix.from_matrix(b)
+        self.assertEqual((flat_a + flat_b).to_rows(), (a + b).data)
+        self.assertEqual((flat_a - flat_b).to_rows(), (a - b).data)
+        self.assertEqual((flat_a * 0.3).to_rows(), (a * 0.3).data)
+
+        flat_a.iadd(flat_b)
+        self.assertEqual(flat_a.to_rows(), (a + b).data)
+        flat_a.isub(flat_b)
+        self.assertEqual(flat_a.to_rows(), ((a + b) - b).data)
+        flat_a.iscale(2.5)
+        self.assertEqual(flat_a.to_rows(), (((a + b) - b) * 2.5).data)
+
+    def test_into_may_alias_for_elementwise(self):
+        a = FlatMatrix(2, 2, [1, 2, 3, 4])
+        b = FlatMatrix(2, 2, [10, 20, 30, 40])
+        self.assertIs(a.add_into(b, a), a)
+        self.assertEqual(list(a.values), [11, 22, 33, 44])
+        b.sub_into(a, b)
+        self.assertEqual(list(b.values), [-1, -2, -3, -4])
+
+    def test_transpose(self):
+        matrix = random_matrix(3, 5, self.rng)
+        flat = FlatMatrix.from_matrix(matrix)
+        out = FlatMatrix(5, 3)
+        flat.transpose_into(out)
+        self.assertEqual(out.to_rows(), matrix.transpose().data)
+        self.assertEqual(flat.transpose(), out)
+
+    def test_shape_checks(self):
+        a = FlatMatrix(2, 3)
+        with self.assertRaises(ValueError):
+            a.iadd(FlatMatrix(3, 2))
+        with self.assertRaises(ValueError):
+            a.matmul_into(FlatMatrix(2, 3), FlatMatrix(2, 3))
+        with self.assertRaises(ValueError):
+            a.matmul_into(FlatMatrix(3, 4), FlatMatrix(2, 3))
+        square = FlatMatrix.identity(3)
+        with self.assertRaises(ValueError):
+            square.matmul_into(square, square)
+        with self.assertRaises(ValueError):
+            square.transpose_into(square)
+        with self.assertRaises(TypeError):
+            a * "2"
+
+    def test_covariance_step_matches_matrix(self):
+        # P = F P F^T + Q with reused scratch matrices, as in an EKF predict step
+        n = 5
+        F = random_matrix(n, n, self.rng)
+        P = random_matrix(n, n, self.rng)
+        Q = random_matrix(n, n, self.rng)
+        flat_F = FlatMatrix.from_matrix(F)
+        flat_P = FlatMatrix.from_matrix(P)
+        flat_Q = FlatMatrix.from_matrix(Q)
+        flat_Ft = FlatMatrix(n, n)
+        scratch = FlatMatrix(n, n)
+        values = flat_P.values
+        for _ in range(3):
+            P = F * P * F.transpose() + Q
+            flat_F.transpose_into(flat_Ft)
+            flat_F.matmul_into(flat_P, scratch)
+            scratch.matmul_into(flat_Ft, flat_P)
+            flat_P.iadd(flat_Q)
+            self.assertEqual(flat_P.to_rows(), P.data)
+        self.assertIs(flat_P.values, values)
+
+    def test_identity_and_copy(self):
+        identity = FlatMatrix.identity(3)
+        self.assertEqual(identity.to_rows(), Matrix.identity(3).data)
+        copied = identity.copy()
+        copied.set_at((0, 1), 5.0)
+        self.assertEqual(identity.get_at((0, 1)), 0.0)
+        identity.copy_from(copied)
+        self.assertEqual(identity, copied)
+
+
+if __name__ == '__main__':
+    unittest.main()
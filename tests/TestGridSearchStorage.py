@@ -0,0 +1,67 @@
+import unittest
+
+from VEXLib.Algorithms.GridSearchStorage import GridSearchStorage, unpack_obstacles
+from VEXLib.Util.PathfindingEnvironment import PathfindingEnvironment
+
+
+class TestGridSearchStorage(unittest.TestCase):
+    def setUp(self):
+        self.storage = GridSearchStorage(4, 3)
+
+    def test_relax_keeps_cheapest(self):
+        self.storage.start(0)
+        self.assertTrue(self.storage.relax(1, 2.0, 0))
+        self.assertFalse(self.storage.relax(1, 3.0, 5))
+        self.assertTrue(self.storage.relax(1, 1.0, 4))
+        self.assertEqual(self.storage.g_values[1], 1.0)
+        self.assertEqual(self.storage.parents[1], 4)
+        self.assertEqual(self.storage.touched_count, 2)
+
+    def test_extract_indices(self):
+        self.storage.start(0)
+        self.storage.relax(1, 1, 0)
+        self.storage.relax(6, 2, 1)
+        self.assertEqual(self.storage.extract_indices(0, 6), [0, 1, 6])
+        self.assertEqual(self.storage.to_position(6), (2, 1))
+
+    def test_start_resets_touched_nodes(self):
+        self.storage.start(0)
+        self.storage.relax(5, 1, 0)
+        self.storage.closed[5] = 1
+        self.storage.start(11)
+        self.assertEqual(self.storage.g_values[5], float("inf"))
+        self.assertEqual(self.storage.closed[5], 0)
+        self.assertEqual(self.storage.g_values[11], 0)
+
+    def test_visited(self):
+        self.storage.start(0)
+        self.storage.relax(5, 1, 0)
+        self.storage.relax(7, 1, 0)
+        self.storage.closed[0] = 1
+        self.storage.closed[7] = 1
+        visited = self.storage.visited()
+        self.assertEqual(list(visited), [(0, 0), (3, 1)])
+        self.assertEqual(len(visited), 2)
+        self.assertIn((3, 1), visited)
+        self.assertNotIn((1, 1), visited)
+        self.assertNotIn((9, 9), visited)
+        self.assertEqual(self.storage.visited_positions(), [(0, 0), (3, 1)])
+
+    def test_large_grid_uses_wide_parents(self):
+        storage = GridSearchStorage(300, 300)
+        storage.start(0)
+        storage.relax(89999, 1, 70000)
+        self.assertEqual(storage.parents[89999], 70000)
+
+    def test_unpack_obstacles(self):
+        environment = PathfindingEnvironment()
+        environment.load_from_list([0b10000001, 0b01000000], 4)
+        blocked = unpack_obstacles(environment)
+        self.assertEqual(len(blocked), 16)
+        for index in range(16):
+            y, x = divmod(index, 4)
+            self.assertEqual(bool(blocked[index]), environment.get_at(x, y))
+
+
+if __name__ == '__main__':
+    unittest.main()
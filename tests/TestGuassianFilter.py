@@ -4,7 +4,8 @@ import unittest
 
 import matplotlib.pyplot as plt
 
-from VEXLib.Algorithms.GuassianFilter import RealTimeGaussianSmoother, create_gaussian_kernel
+from VEXLib.Algorithms.GuassianFilter import RealTimeGaussianSmoother, create_gaussian_kernel, \
+    RecursiveGaussianSmoother, gaussian_smooth_batch, recursive_gaussian_smooth, recursive_gaussian_coefficients
 
 
 def generate_triangle_wave(length=200, period=50, amplitude=1, noise_level=0.1):
@@ -103,5 +104,84 @@ class TestCreateGaussianKernel(unittest.TestCase):
         self.assertEqual(kernel, kernel[::-1])
 
 
+class TestGaussianSmoothBatch(unittest.TestCase):
+    def test_matches_real_time_smoother(self):
+        raw_data = generate_triangle_wave(length=300)
+        for sigma, kernel_size in [(1.0, 3), (2.0, 13), (5.0, 31)]:
+            smoother = RealTimeGaussianSmoother(sigma, kernel_size)
+            expected = [smoother.smooth(point) for point in raw_data]
+            smoothed = gaussian_smooth_batch(raw_data, sigma, kernel_size)
+            self.assertEqual(len(smoothed), len(raw_data))
+            for a, b in zip(smoothed, expected):
+                self.assertAlmostEqual(a, b, places=9)
+
+    def test_centered_removes_delay(self):
+        raw_data = generate_triangle_wave(length=300)
+        delayed = gaussian_smooth_batch(raw_data, 2.0, 13)
+        centered = gaussian_smooth_batch(raw_data, 2.0, 13, centered=True)
+        self.assertEqual(len(centered), len(raw_data))
+        for i in range(6, len(raw_data) - 6):
+            self.assertAlmostEqual(centered[i], delayed[i + 6], places=9)
+
+    def test_constant_input(self):
+        for value in gaussian_smooth_batch([3.0] * 20, 2.0, centered=True):
+            self.assertAlmostEqual(value, 3.0, places=9)
+        self.assertEqual(len(gaussian_smooth_batch([], 2.0)), 0)
+
+
+class TestRecursiveGaussian(unittest.TestCase):
+    def test_coefficients_have_unit_gain(self):
+        for sigma in [0.5, 1.0, 2.4, 2.5, 10.0, 50.0]:
+            gain, b1, b2, b3 = recursive_gaussian_coefficients(sigma)
+            self.assertAlmostEqual(gain + b1 + b2 + b3, 1.0, places=12)
+        with self.assertRaises(ValueError):
+            recursive_gaussian_coefficients(0.4)
+
+    def test_impulse_response_is_gaussian(self):
+        for sigma in [2.0, 4.0, 8.0]:
+            impulse = [0.0] * 201
+            impulse[100] = 1.0
+            response = recursive_gaussian_smooth(impulse, sigma)
+            kernel = gaussian_smooth_batch(impulse, sigma, kernel_size=2 * int(6 * sigma) + 1, centered=True)
+            self.assertAlmostEqual(sum(response), 1.0, places=6)
+            peak = max(kernel)
+            for a, b in zip(response, kernel):
+                self.assertLess(abs(a - b), 0.1 * peak)
+
+    def test_matches_fir_smoothing(self):
+        raw_data = [math.sin(i / 20) + 0.3 * math.sin(i / 7) for i in range(600)]
+        for sigma in [1.0, 2.0, 4.0]:
+            recursive = recursive_gaussian_smooth(raw_data, sigma)
+            fir = gaussian_smooth_batch(raw_data, sigma, centered=True)
+            for a, b in zip(recursive[50:-50], fir[50:-50]):
+                self.assertLess(abs(a - b), 0.02)
+
+    def test_streaming_is_causal_pass(self):
+        raw_data = generate_triangle_wave(length=200)
+        smoother = RecursiveGaussianSmoother(3.0)
+        streamed = [smoother.smooth(point) for point in raw_data]
+        gain, b1, b2, b3 = recursive_gaussian_coefficients(3.0)
+        w1 = w2 = w3 = raw_data[0]
+        for point, value in zip(raw_data, streamed):
+            w = gain * point + b1 * w1 + b2 * w2 + b3 * w3
+            w3, w2, w1 = w2, w1, w
+            self.assertAlmostEqual(value, w, places=12)
+
+    def test_streaming_constant_and_reset(self):
+        smoother = RecursiveGaussianSmoother(4.0)
+        for _ in range(5):
+            self.assertAlmostEqual(smoother.smooth(2.0), 2.0, places=9)
+        smoother.reset()
+        self.assertAlmostEqual(smoother.smooth(-1.0), -1.0, places=9)
+
+    def test_streaming_reduces_noise(self):
+        rng = random.Random(0)
+        noise = [rng.gauss(0, 1) for _ in range(2000)]
+        smoother = RecursiveGaussianSmoother(4.0)
+        smoothed = [smoother.smooth(value) for value in noise][100:]
+        variance = sum(value * value for value in smoothed) / len(smoothed)
+        self.assertLess(variance, 0.2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
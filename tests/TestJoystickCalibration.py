@@ -0,0 +1,132 @@
+import math
+import os
+import random
+import struct
+import tempfile
+import unittest
+
+from VEXLib.Sensors.Controller import Controller, ControlStyles, InputProcessor
+from VEXLib.Sensors.JoystickCalibration import CALIBRATION_RECORD_FORMAT, JoystickCalibration
+
+
+def square_gate(count=600):
+    """Rim samples of a stick whose travel is a square with corners at radius sqrt(2)."""
+    samples = []
+    for i in range(count):
+        theta = -math.pi + 2 * math.pi * (i + 0.5) / count
+        samples.append((1 / max(abs(math.cos(theta)), abs(math.sin(theta))), theta))
+    return samples
+
+
+def linear_scan_radius(samples, theta):
+    """Interpolate the rim radius by searching the sorted samples, wrapping around at +-pi."""
+    samples = sorted(samples, key=lambda sample: sample[1])
+    extended = [(samples[-1][0], samples[-1][1] - 2 * math.pi)] + samples + [(samples[0][0], samples[0][1] + 2 * math.pi)]
+    for (r_1, theta_1), (r_2, theta_2) in zip(extended[:-1], extended[1:]):
+        if theta_1 <= theta <= theta_2:
+            return r_1 + (r_2 - r_1) * (theta - theta_1) / (theta_2 - theta_1)
+
+
+class FakeAxis:
+    def __init__(self, value=0.0):
+        self.value = value
+
+    def position(self):
+        return self.value
+
+
+class TestJoystickCalibration(unittest.TestCase):
+    def test_circular_rim_scales_evenly(self):
+        calibration = JoystickCalibration([(1.25, -math.pi + i * 0.1) for i in range(63)])
+        x, y = calibration.normalize(0.5, -1.0)
+        self.assertAlmostEqual(x, 0.4)
+        self.assertAlmostEqual(y, -0.8)
+
+    def test_matches_linear_scan(self):
+        samples = square_gate()
+        calibration = JoystickCalibration(samples, bin_count=2048)
+        rng = random.Random(2)
+        for _ in range(500):
+            theta = rng.uniform(-math.pi, math.pi)
+            self.assertAlmostEqual(calibration.rim_radius(theta), linear_scan_radius(samples, theta), delta=2e-3)
+
+    def test_square_gate_corners_reach_one(self):
+        calibration = JoystickCalibration(square_gate())
+        for x, y in ((1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (0, -1)):
+            normalized_x, normalized_y = calibration.normalize(x, y)
+            self.assertAlmostEqual(math.hypot(normalized_x, normalized_y), 1.0, delta=1e-2)
+
+    def test_wraps_around_at_pi(self):
+        calibration = JoystickCalibration(square_gate())
+        self.assertAlmostEqual(calibration.rim_radius(math.pi), calibration.rim_radius(-math.pi), places=6)
+        self.assertAlmostEqual(calibration.rim_radius(math.pi - 1e-9), calibration.rim_radius(-math.pi + 1e-9), places=5)
+
+    def test_centered_stick(self):
+        calibration = JoystickCalibration(square_gate())
+        self.assertEqual(calibration.normalize(0.0, 0.0), (0.0, 0.0))
+
+    def test_from_bytes_and_file(self):
+        samples = square_gate(50)
+        data = b"".join(struct.pack(CALIBRATION_RECORD_FORMAT, r, theta) for r, theta in samples)
+        calibration = JoystickCalibration.from_bytes(data, bin_count=64)
+        self.assertEqual(len(calibration.radii), 65)
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "calibration_coefficients.bin")
+            with open(file_path, "wb") as file:
+                file.write(data)
+            self.assertEqual(list(JoystickCalibration.load_from_file(file_path, 64).radii), list(calibration.radii))
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            JoystickCalibration([])
+        with self.assertRaises(ValueError):
+            JoystickCalibration.from_bytes(b"\x00" * 12)
+
+
+class TestInputProcessorStickSteps(unittest.TestCase):
+    def test_stick_steps_run_before_axis_steps(self):
+        processor = InputProcessor()
+        processor.add_step(lambda value: value + 1)
+        processor.add_stick_step(lambda x, y: (y, x * 2))
+        self.assertEqual(processor.process_stick(1.0, 3.0), (4.0, 3.0))
+
+    def test_without_stick_steps_matches_process(self):
+        processor = InputProcessor()
+        processor.add_step(lambda value: value * 3)
+        self.assertEqual(processor.process_stick(0.5, -0.25), (processor.process(0.5), processor.process(-0.25)))
+
+
+class TestControllerCalibration(unittest.TestCase):
+    def setUp(self):
+        self.controller = Controller()
+        self.controller.axis1 = FakeAxis(100)
+        self.controller.axis2 = FakeAxis(100)
+        self.controller.axis3 = FakeAxis(0)
+        self.controller.axis4 = FakeAxis(-100)
+
+    def test_calibration_applies_to_both_sticks(self):
+        self.controller.add_calibration_step(JoystickCalibration(square_gate()))
+        right_x, right_y = self.controller.right_stick_position()
+        self.assertAlmostEqual(right_x, math.sqrt(0.5), delta=1e-2)
+        self.assertAlmostEqual(right_y, math.sqrt(0.5), delta=1e-2)
+        self.assertAlmostEqual(self.controller.right_stick_y(), right_y)
+        self.assertAlmostEqual(self.controller.left_stick_x(), -1.0, delta=1e-2)
+        self.assertEqual(self.controller.right_stick_position_raw(), (1.0, 1.0))
+
+    def test_calibration_runs_before_deadband(self):
+        self.controller.add_calibration_step(JoystickCalibration(square_gate()))
+        self.controller.add_deadband_step(0.1)
+        self.assertEqual(self.controller.left_stick_y(), 0.0)
+        self.assertEqual(self.controller.stick_values()["left_stick_y"], 0.0)
+
+    def test_arcade_wheel_speeds(self):
+        self.controller.add_calibration_step(JoystickCalibration(square_gate()))
+        self.controller.axis3.value = 100
+        self.controller.axis4.value = 0
+        left_speed, right_speed = self.controller.get_wheel_speeds(ControlStyles.ARCADE)
+        self.assertAlmostEqual(left_speed, 1.0, delta=1e-2)
+        self.assertAlmostEqual(right_speed, 1.0, delta=1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()
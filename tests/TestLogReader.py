@@ -0,0 +1,71 @@
+import os
+import struct
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from util.log_reader import INDEX_SUFFIX, BinlogReader
+
+
+def record(timestamp, level, message):
+    body = message.encode("utf-8")
+    return struct.pack("<fBI", timestamp, level, len(body)) + body
+
+
+class TestBinlogReader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, "main-0.binlog")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_log(self, records, mode="wb"):
+        with open(self.log_file, mode) as file:
+            for timestamp, level, message in records:
+                file.write(record(timestamp, level, message))
+
+    def test_builds_index(self):
+        self.write_log([(0.5, 3, "start"), (1.0, 4, "warning"), (2.0, 3, "done")])
+        with BinlogReader(self.log_file) as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertEqual(reader[1].message, "warning")
+            self.assertEqual(reader.count(start_time=0.75), 2)
+            self.assertEqual([r.message for r in reader.records(min_level="WARN")], ["warning"])
+        self.assertTrue(os.path.exists(self.log_file + INDEX_SUFFIX))
+
+    def test_reopen_uses_saved_index(self):
+        self.write_log([(0.5, 3, "start"), (1.0, 3, "done")])
+        BinlogReader(self.log_file).close()
+        with patch.object(BinlogReader, "_extend_index") as extend_index:
+            with BinlogReader(self.log_file) as reader:
+                self.assertEqual(len(reader), 2)
+                self.assertEqual(reader[0].message, "start")
+            extend_index.assert_not_called()
+
+    def test_appended_records_extend_index(self):
+        self.write_log([(0.5, 3, "start")])
+        BinlogReader(self.log_file).close()
+        self.write_log([(1.0, 3, "more"), (1.5, 3, "end")], mode="ab")
+        with BinlogReader(self.log_file) as reader:
+            self.assertEqual([r.message for r in reader], ["start", "more", "end"])
+
+    def test_partial_record_not_indexed(self):
+        self.write_log([(0.5, 3, "start")])
+        with open(self.log_file, "ab") as file:
+            file.write(record(1.0, 3, "cut off")[:-3])
+        with BinlogReader(self.log_file) as reader:
+            self.assertEqual(len(reader), 1)
+
+    def test_stale_index_rebuilt_after_rewrite(self):
+        self.write_log([(0.5, 3, "aaaa"), (1.0, 3, "bbbb")])
+        BinlogReader(self.log_file).close()
+        # A new log with the same name that grows past the old size, with records at other offsets
+        self.write_log([(0.25, 5, "a much longer first message"), (0.75, 3, "x"), (3.0, 3, "last")])
+        with BinlogReader(self.log_file) as reader:
+            self.assertEqual([r.message for r in reader], ["a much longer first message", "x", "last"])
+            self.assertEqual(reader[0].level, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import os
+import struct
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from VEXLib.Util.Logging import Logger, CHANNEL_SCHEMA_RECORD, CHANNEL_SAMPLE_RECORD
+
+
+def read_records(path):
+    records = []
+    with open(path, "rb") as file:
+        data = file.read()
+    offset = 0
+    while offset < len(data):
+        timestamp, level, length = struct.unpack_from("<fBI", data, offset)
+        offset += 9
+        records.append((level, data[offset:offset + length]))
+        offset += length
+    return records
+
+
+class TestLoggerChannels(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(os.path.join(self.directory.name, "test"), index=0, flush_threshold=1 << 20)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_schema_written_once(self):
+        channel = self.logger.register_channel("pose", [("x", "f"), ("y", "f"), ("heading", "f")])
+        self.assertIs(self.logger.register_channel("pose", [("x", "f")]), channel)
+        self.logger.flush_logs()
+
+        records = read_records(self.logger.log_file_path)
+        self.assertEqual(len(records), 1)
+        level, body = records[0]
+        self.assertEqual(level, CHANNEL_SCHEMA_RECORD)
+        self.assertEqual(body[0], channel.schema_id)
+        self.assertEqual(body[1:], b"pose|x:f,y:f,heading:f")
+
+    def test_samples_round_trip(self):
+        pose = self.logger.register_channel("pose", [("x", "f"), ("y", "f"), ("heading", "f")])
+        state = self.logger.register_channel("state", [("mode", "B"), ("ticks", "I")])
+        pose.log(1.5, -2.0, 0.25)
+        state.log_dict({"mode": 3, "ticks": 123456})
+        self.logger.flush_logs()
+
+        records = read_records(self.logger.log_file_path)
+        self.assertEqual([level for level, _ in records], [
+            CHANNEL_SCHEMA_RECORD, CHANNEL_SCHEMA_RECORD, CHANNEL_SAMPLE_RECORD, CHANNEL_SAMPLE_RECORD
+        ])
+        self.assertEqual(records[2][1][0], pose.schema_id)
+        self.assertEqual(struct.unpack("<fff", records[2][1][1:]), (1.5, -2.0, 0.25))
+        self.assertEqual(records[3][1][0], state.schema_id)
+        self.assertEqual(struct.unpack("<BI", records[3][1][1:]), (3, 123456))
+
+    def test_samples_smaller_than_json(self):
+        fields = [("left_speed", "f"), ("right_speed", "f"), ("x", "f"), ("y", "f"), ("heading", "f")]
+        channel = self.logger.register_channel("drivetrain", fields)
+        self.logger.flush_logs()
+        schema_size = os.path.getsize(self.logger.log_file_path)
+
+        values = [12.345678, -11.987654, 101.23456, 45.678901, 1.5707963]
+        channel.log(*values)
+        self.logger.flush_logs()
+        sample_size = os.path.getsize(self.logger.log_file_path) - schema_size
+
+        self.logger.log_vars(dict(zip([name for name, _ in fields], values)))
+        self.logger.flush_logs()
+        json_size = os.path.getsize(self.logger.log_file_path) - schema_size - sample_size
+
+        self.assertLess(sample_size * 3, json_size)
+
+    def test_read_back_with_log_reader(self):
+        from util.log_reader import BinlogReader
+
+        pose = self.logger.register_channel("pose", [("x", "f"), ("y", "d"), ("ticks", "I")])
+        state = self.logger.register_channel("state", [("mode", "B"), ("enabled", "B")])
+        pose.log(1.5, -2.25, 7)
+        state.log(3, True)
+        self.logger.info("text between samples")
+        pose.log(2.0, 0.125, 8)
+        self.logger.flush_logs()
+
+        with BinlogReader(self.logger.log_file_path, save_index=False) as reader:
+            schemas = reader.channels()
+            self.assertEqual(schemas["pose"].fields, [("x", "f"), ("y", "d"), ("ticks", "I")])
+            self.assertEqual(schemas["state"].schema_id, state.schema_id)
+            samples = reader.channel_to_numpy("pose")
+            self.assertEqual(list(samples["x"]), [1.5, 2.0])
+            self.assertEqual(list(samples["y"]), [-2.25, 0.125])
+            self.assertEqual(list(samples["ticks"]), [7, 8])
+            states = reader.channel_to_numpy("state")
+            self.assertEqual((int(states["mode"][0]), int(states["enabled"][0])), (3, 1))
+
+    def test_invalid_schema(self):
+        with self.assertRaises(ValueError):
+            self.logger.register_channel("bad", [("x", "s")])
+        with self.assertRaises(ValueError):
+            self.logger.register_channel("bad", [("x", "?")])
+        with self.assertRaises(ValueError):
+            self.logger.register_channel("bad", [("x,y", "f")])
+        with self.assertRaises(ValueError):
+            self.logger.register_channel("a|b", [("x", "f")])
+
+
+class TestLoggerBackgroundFlush(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.logger = Logger(
+            os.path.join(self.directory.name, "test"),
+            index=0,
+            flush_threshold=64,
+            background_flush=True,
+            max_buffer_size=128,
+        )
+
+    def tearDown(self):
+        self.logger.close()
+        self.directory.cleanup()
+
+    def test_log_does_not_write(self):
+        for i in range(10):
+            self.logger.info("message", i)
+        self.assertFalse(os.path.exists(self.logger.log_file_path))
+        self.assertIsNotNone(self.logger._pending_buffer)
+
+        self.assertTrue(self.logger._drain())
+        self.assertIsNone(self.logger._pending_buffer)
+        self.assertFalse(self.logger._drain())
+        self.assertEqual(self.logger.get_flush_stats()["flush_count"], 1)
+
+    def test_overflow_drops_records(self):
+        for i in range(100):
+            self.logger.info("message", i)
+        stats = self.logger.get_flush_stats()
+        self.assertGreater(stats["dropped_records"], 0)
+        self.assertGreater(stats["overflow_count"], 0)
+        self.assertLessEqual(len(self.logger.log_buffer), 128)
+
+    def test_close_writes_everything_in_order(self):
+        for i in range(6):
+            self.logger.info("message", i)
+        self.logger._drain()
+        for i in range(6, 8):
+            self.logger.info("message", i)
+        self.logger.close()
+
+        records = read_records(self.logger.log_file_path)
+        self.assertEqual([body for _, body in records], [("message " + str(i)).encode() for i in range(8)])
+
+
+class TestLoggerBackgroundFlushThread(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_close_waits_for_running_drain(self):
+        drain_started = threading.Event()
+        release_drain = threading.Event()
+        threads = []
+
+        def start_thread(callback):
+            thread = threading.Thread(target=callback)
+            threads.append(thread)
+            thread.start()
+
+        with patch("VEXLib.Util.Logging.Thread", side_effect=start_thread):
+            logger = Logger(
+                os.path.join(self.directory.name, "test"),
+                index=0,
+                flush_threshold=64,
+                background_flush=True,
+                flush_interval_ms=1,
+            )
+        original_drain = logger._drain
+
+        def slow_drain():
+            if logger._pending_buffer is not None and not drain_started.is_set():
+                drain_started.set()
+                release_drain.wait(5)
+            return original_drain()
+
+        logger._drain = slow_drain
+        for i in range(8):
+            logger.info("message", i)
+        self.assertTrue(drain_started.wait(5))
+
+        closer = threading.Thread(target=logger.close)
+        closer.start()
+        closer.join(0.05)
+        # close must not drain or close the file while the flush thread is still writing
+        self.assertTrue(closer.is_alive())
+        release_drain.set()
+        closer.join(5)
+        threads[0].join(5)
+        self.assertFalse(closer.is_alive())
+        self.assertFalse(threads[0].is_alive())
+
+        records = read_records(logger.log_file_path)
+        self.assertEqual([body for _, body in records], [("message " + str(i)).encode() for i in range(8)])
+
+
+if __name__ == "__main__":
+    unittest.main()
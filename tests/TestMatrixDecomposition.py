@@ -0,0 +1,131 @@
+import math
+import random
+import unittest
+
+from VEXLib.Math.Matrix import Matrix, Shape
+from VEXLib.Math.MatrixDecomposition import LUDecomposition, CholeskyDecomposition, solve
+
+
+def random_matrix(rows, columns, rng):
+    return Matrix(Shape(columns, rows), [[rng.uniform(-1, 1) for _ in range(columns)] for _ in range(rows)])
+
+
+def random_covariance(size, rng):
+    a = random_matrix(size, size, rng)
+    return a * a.transpose() + Matrix.identity(size) * 0.1
+
+
+class TestLUDecomposition(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def assertVectorAlmostEqual(self, actual, expected, places=9):
+        self.assertEqual(len(actual), len(expected))
+        for a, b in zip(actual, expected):
+            self.assertAlmostEqual(a, b, places=places)
+
+    def test_solve_vector(self):
+        for size in [1, 2, 3, 8, 20]:
+            a = random_matrix(size, size, self.rng)
+            x = [self.rng.uniform(-5, 5) for _ in range(size)]
+            b = a * x
+            self.assertVectorAlmostEqual(LUDecomposition(a).solve(b), x)
+            self.assertVectorAlmostEqual(solve(a, b), x)
+
+    def test_solve_matrix(self):
+        a = random_matrix(6, 6, self.rng)
+        x = random_matrix(6, 3, self.rng)
+        result = LUDecomposition(a).solve(a * x)
+        self.assertIsInstance(result, Matrix)
+        self.assertEqual((result.shape.x_size, result.shape.y_size), (3, 6))
+        for r in range(6):
+            self.assertVectorAlmostEqual(result.data[r], x.data[r])
+
+    def test_needs_pivoting(self):
+        a = Matrix(Shape(3, 3), [[0, 2, 1], [1, 1, 1], [2, 0, 3]])
+        lu = LUDecomposition(a)
+        self.assertVectorAlmostEqual(lu.solve([3, 3, 5]), [1, 1, 1])
+        self.assertAlmostEqual(lu.determinant(), a.determinant())
+
+    def test_determinant_and_inverse_match_matrix(self):
+        a = random_matrix(5, 5, self.rng)
+        lu = LUDecomposition(a)
+        self.assertAlmostEqual(lu.determinant(), a.determinant(), places=9)
+        expected = a.inverse()
+        for r in range(5):
+            self.assertVectorAlmostEqual(lu.inverse().data[r], expected.data[r])
+
+    def test_singular(self):
+        with self.assertRaises(ValueError):
+            LUDecomposition(Matrix(Shape(3, 3), [[1, 2, 3], [2, 4, 6], [0, 0, 0]]))
+        with self.assertRaises(ValueError):
+            LUDecomposition(Matrix(Shape(3, 2)))
+
+    def test_refactor_reuses_storage(self):
+        a = random_matrix(4, 4, self.rng)
+        b = random_matrix(4, 4, self.rng)
+        lu = LUDecomposition(a)
+        storage = lu.lu
+        lu.factor(b)
+        self.assertIs(lu.lu, storage)
+        self.assertVectorAlmostEqual(lu.solve(b * [1, 2, 3, 4]), [1, 2, 3, 4])
+
+    def test_right_hand_side_checks(self):
+        lu = LUDecomposition(Matrix.identity(3))
+        with self.assertRaises(ValueError):
+            lu.solve([1, 2])
+        with self.assertRaises(TypeError):
+            lu.solve(3)
+
+
+class TestCholeskyDecomposition(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(11)
+
+    def test_factor_reconstructs_matrix(self):
+        a = random_covariance(6, self.rng)
+        cholesky = CholeskyDecomposition(a)
+        lower = Matrix(Shape(6, 6), cholesky.lower)
+        product = lower * lower.transpose()
+        for r in range(6):
+            for c in range(6):
+                self.assertAlmostEqual(product.data[r][c], a.data[r][c], places=9)
+                if c > r:
+                    self.assertEqual(cholesky.lower[r][c], 0.0)
+
+    def test_solve_matches_lu(self):
+        for size in [1, 3, 10, 30]:
+            a = random_covariance(size, self.rng)
+            b = [self.rng.uniform(-1, 1) for _ in range(size)]
+            expected = LUDecomposition(a).solve(b)
+            for x, y in zip(CholeskyDecomposition(a).solve(b), expected):
+                self.assertAlmostEqual(x, y, places=7)
+            for x, y in zip(solve(a, b, symmetric=True), expected):
+                self.assertAlmostEqual(x, y, places=7)
+            for x, y in zip(a.solve(b, symmetric=True), expected):
+                self.assertAlmostEqual(x, y, places=7)
+
+    def test_determinant(self):
+        a = random_covariance(4, self.rng)
+        cholesky = CholeskyDecomposition(a)
+        self.assertAlmostEqual(cholesky.determinant(), a.determinant(), places=9)
+        self.assertAlmostEqual(cholesky.log_determinant(), math.log(a.determinant()), places=9)
+
+    def test_not_positive_definite(self):
+        with self.assertRaises(ValueError):
+            CholeskyDecomposition(Matrix(Shape(2, 2), [[1, 2], [2, 1]]))
+        with self.assertRaises(ValueError):
+            CholeskyDecomposition(Matrix(Shape(2, 2), [[0, 0], [0, 1]]))
+
+    def test_refactor_reuses_storage(self):
+        cholesky = CholeskyDecomposition(random_covariance(5, self.rng))
+        storage = cholesky.lower
+        a = random_covariance(5, self.rng)
+        cholesky.factor(a)
+        self.assertIs(cholesky.lower, storage)
+        for x, y in zip(cholesky.solve(a * [1, 0, -1, 2, 0.5]), [1, 0, -1, 2, 0.5]):
+            self.assertAlmostEqual(x, y, places=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import math
+import unittest
+
+from VEXLib.Kinematics.Trajectory import FIELDS, Trajectory
+from VEXLib.Subsystems.PathFollower import PathFollower, PurePursuitController, RamseteController
+
+TRACK_WIDTH = 0.25
+TIME_STEP = 0.01
+
+
+def make_arc(duration, velocity, curvature, start=(0.0, 0.0, 0.0)):
+    """Constant speed along an arc (or a line when curvature is 0), starting at rest in the last sample."""
+    x0, y0, heading0 = start
+    fields = {name: [] for name in FIELDS}
+    count = int(round(duration / TIME_STEP)) + 1
+    for i in range(count):
+        distance = velocity * i * TIME_STEP
+        heading = heading0 + curvature * distance
+        if curvature == 0:
+            x = x0 + distance * math.cos(heading0)
+            y = y0 + distance * math.sin(heading0)
+        else:
+            x = x0 + (math.sin(heading) - math.sin(heading0)) / curvature
+            y = y0 - (math.cos(heading) - math.cos(heading0)) / curvature
+        fields["x"].append(x)
+        fields["y"].append(y)
+        fields["heading"].append(heading)
+        fields["velocity"].append(velocity)
+        fields["acceleration"].append(0.0)
+        fields["curvature"].append(curvature)
+        fields["left_velocity"].append(velocity * (1 - curvature * TRACK_WIDTH / 2))
+        fields["right_velocity"].append(velocity * (1 + curvature * TRACK_WIDTH / 2))
+    return Trajectory(TIME_STEP, fields)
+
+
+def simulate(follower, trajectories, start_pose, tick=0.02, max_time=20.0):
+    """Drive an ideal tank robot with the follower's wheel speeds, returning the poses it visited."""
+    x, y, heading = start_pose
+    follower.follow(trajectories, 0.0)
+    poses = [(x, y, heading)]
+    time = 0.0
+    while not follower.is_finished() and time < max_time:
+        left, right = follower.update(x, y, heading, time)
+        velocity = (left + right) / 2
+        turn_rate = (right - left) / TRACK_WIDTH
+        x += velocity * math.cos(heading) * tick
+        y += velocity * math.sin(heading) * tick
+        heading += turn_rate * tick
+        time += tick
+        poses.append((x, y, heading))
+    return poses, time
+
+
+class TestRamseteController(unittest.TestCase):
+    def test_on_path_gives_planned_speeds(self):
+        trajectory = make_arc(2.0, 0.5, 2.0)
+        controller = RamseteController()
+        controller.start(trajectory)
+        state = trajectory.sample(0.7)
+        velocity, turn_rate = controller.calculate(state.x, state.y, state.heading, 0.7)
+        self.assertAlmostEqual(velocity, 0.5, places=5)
+        self.assertAlmostEqual(turn_rate, 1.0, places=5)
+
+    def test_corrects_towards_path(self):
+        trajectory = make_arc(2.0, 0.5, 0.0)
+        controller = RamseteController()
+        controller.start(trajectory)
+        # Behind the reference speeds up, left of a path along x turns right
+        velocity, _ = controller.calculate(-0.1, 0.0, 0.0, 0.0)
+        self.assertGreater(velocity, 0.5)
+        _, turn_rate = controller.calculate(0.0, 0.1, 0.0, 0.0)
+        self.assertLess(turn_rate, 0.0)
+
+    def test_converges_from_offset_start(self):
+        trajectory = make_arc(4.0, 0.5, 0.5)
+        follower = PathFollower(RamseteController(), TRACK_WIDTH)
+        poses, _ = simulate(follower, [trajectory], (0.0, 0.15, 0.2))
+        errors = []
+        for tick, (x, y, _) in enumerate(poses):
+            reference = trajectory.sample(tick * 0.02)
+            errors.append(math.hypot(x - reference.x, y - reference.y))
+        # The error shrinks steadily once the heading has been corrected
+        self.assertLess(errors[-1], errors[0] / 5)
+        self.assertLess(errors[-1], errors[len(errors) // 2])
+
+
+class TestPurePursuitController(unittest.TestCase):
+    def test_lookahead_indices(self):
+        trajectory = make_arc(1.0, 0.5, 0.0)
+        controller = PurePursuitController(lookahead_distance=0.0975)
+        controller.start(trajectory)
+        # 0.5 m/s sampled every 10 ms is 5 mm per sample, so the first sample at least 0.0975 m on is 20 samples ahead
+        self.assertEqual(controller.lookahead_indices[0], 20)
+        self.assertEqual(controller.lookahead_indices[50], 70)
+        self.assertEqual(controller.lookahead_indices[len(trajectory) - 1], len(trajectory) - 1)
+
+    def test_search_is_bounded(self):
+        trajectory = make_arc(1.0, 0.5, 0.0)
+        controller = PurePursuitController(search_window=5)
+        controller.start(trajectory)
+        # Even far ahead along the path, the closest sample only moves through the search window
+        controller.calculate(0.4, 0.0, 0.0, 0.0)
+        self.assertEqual(controller.closest_index, 5)
+
+    def test_unstarted_tables_dropped(self):
+        controller = PurePursuitController()
+        follower = PathFollower(controller, TRACK_WIDTH)
+        follower.follow([make_arc(1.0, 0.5, 0.0), make_arc(1.0, 0.5, 0.0)], 0.0)
+        self.assertEqual(len(controller._tables), 1)
+        follower.follow([make_arc(1.0, 0.5, 0.0)], 0.0)
+        self.assertEqual(len(controller._tables), 0)
+
+    def test_follows_arc(self):
+        trajectory = make_arc(3.0, 0.5, 1.0)
+        follower = PathFollower(PurePursuitController(lookahead_distance=0.15), TRACK_WIDTH)
+        poses, _ = simulate(follower, [trajectory], (0.0, 0.0, 0.0))
+        worst = 0.0
+        for x, y, _ in poses:
+            # Distance from the circle of radius 1 centered at (0, 1)
+            worst = max(worst, abs(math.hypot(x, y - 1.0) - 1.0))
+        self.assertLess(worst, 0.03)
+
+
+class TestPathFollower(unittest.TestCase):
+    def test_wheel_velocities(self):
+        follower = PathFollower(RamseteController(), 0.5)
+        self.assertEqual(follower.wheel_velocities(1.0, 2.0), (0.5, 1.5))
+
+    def test_wheel_velocities_scaled_together(self):
+        follower = PathFollower(RamseteController(), 0.5, max_wheel_velocity=1.0)
+        left, right = follower.wheel_velocities(1.0, 2.0)
+        self.assertAlmostEqual(right, 1.0)
+        self.assertAlmostEqual(left, 1.0 / 3)
+
+    def test_finished_without_trajectories(self):
+        follower = PathFollower(RamseteController(), TRACK_WIDTH)
+        follower.follow([], 0.0)
+        self.assertTrue(follower.is_finished())
+        self.assertEqual(follower.update(0.0, 0.0, 0.0, 1.0), (0.0, 0.0))
+
+    def test_chains_segments_without_stopping(self):
+        first = make_arc(1.0, 0.5, 0.0)
+        end = first.sample(first.total_time())
+        second = make_arc(1.0, 0.5, 1.0, (end.x, end.y, end.heading))
+        follower = PathFollower(RamseteController(), TRACK_WIDTH)
+        follower.follow([first, second], 0.0)
+
+        speeds = []
+        time = 0.0
+        while not follower.is_finished() and time < 3.0:
+            state = follower.current.sample(time - follower.segment_start_time)
+            left, right = follower.update(state.x, state.y, state.heading, time)
+            speeds.append((left + right) / 2)
+            time += 0.02
+        self.assertTrue(follower.is_finished())
+        self.assertAlmostEqual(time, 2.0, delta=0.05)
+        # The robot keeps its speed across the join, and only stops on the tick the last segment ends
+        self.assertGreater(min(speeds[:-1]), 0.45)
+        self.assertEqual(speeds[-1], 0.0)
+
+    def test_append_after_finishing_starts_fresh(self):
+        follower = PathFollower(RamseteController(), TRACK_WIDTH)
+        follower.follow([make_arc(0.5, 0.5, 0.0)], 0.0)
+        follower.update(0.0, 0.0, 0.0, 1.0)
+        self.assertTrue(follower.is_finished())
+
+        follower.append(make_arc(0.5, 0.5, 0.0))
+        left, right = follower.update(0.0, 0.0, 0.0, 10.0)
+        self.assertFalse(follower.is_finished())
+        self.assertGreater((left + right) / 2, 0.4)
+        self.assertEqual(follower.segment_start_time, 10.0)
+
+        follower.update(0.25, 0.0, 0.0, 10.6)
+        follower.append(make_arc(0.5, 0.5, 0.0), start_time=20.0)
+        self.assertEqual(follower.segment_start_time, 20.0)
+        self.assertGreater(sum(follower.update(0.0, 0.0, 0.0, 20.1)), 0.8)
+
+    def test_append_chains(self):
+        follower = PathFollower(RamseteController(), TRACK_WIDTH)
+        trajectory = make_arc(0.5, 0.5, 0.0)
+        follower.append(trajectory)
+        self.assertIs(follower.current, trajectory)
+        follower.append(make_arc(0.5, 0.5, 0.0))
+        self.assertEqual(len(follower.queue), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
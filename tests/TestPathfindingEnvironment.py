@@ -0,0 +1,108 @@
+import io
+import random
+import unittest
+import unittest.mock
+
+from VEXLib.Algorithms.DistanceTransform import squared_distance_transform
+from VEXLib.Util.PathfindingEnvironment import PathfindingEnvironment, DISTANCE_SCALE
+
+
+def pack_grid(grid):
+    bits = [value for row in grid for value in row]
+    bits += [0] * (-len(bits) % 8)
+    obstacle_list = []
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for bit in bits[i:i + 8]:
+            byte = (byte << 1) | bit
+        obstacle_list.append(byte)
+    return obstacle_list
+
+
+def make_environment(grid):
+    environment = PathfindingEnvironment()
+    environment.load_from_list(pack_grid(grid), len(grid[0]))
+    return environment
+
+
+def brute_force_squared_distances(grid):
+    obstacles = [(x, y) for y, row in enumerate(grid) for x, value in enumerate(row) if value]
+    return [
+        min((x - ox) ** 2 + (y - oy) ** 2 for ox, oy in obstacles)
+        for y in range(len(grid)) for x in range(len(grid[0]))
+    ]
+
+
+class TestDistanceTransform(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        for width, height, density in [(9, 9, 0.1), (13, 7, 0.05), (6, 11, 0.3)]:
+            grid = [[1 if rng.random() < density else 0 for _ in range(width)] for _ in range(height)]
+            grid[rng.randrange(height)][rng.randrange(width)] = 1
+            blocked = [value for row in grid for value in row]
+            self.assertEqual(
+                squared_distance_transform(blocked, width, height),
+                brute_force_squared_distances(grid),
+            )
+
+    def test_no_obstacles(self):
+        distances = squared_distance_transform([0] * 12, 4, 3)
+        self.assertTrue(all(distance > 4 ** 2 + 3 ** 2 for distance in distances))
+
+
+class TestPathfindingEnvironmentClearance(unittest.TestCase):
+    def setUp(self):
+        self.grid = [[0] * 12 for _ in range(12)]
+        self.grid[6][6] = 1
+        self.environment = make_environment(self.grid)
+        self.environment.build_clearance(2)
+
+    def test_inflated_map(self):
+        self.assertTrue(self.environment.get_inflated_at(6, 6))
+        self.assertTrue(self.environment.get_inflated_at(8, 6))
+        self.assertTrue(self.environment.get_inflated_at(7, 7))
+        self.assertFalse(self.environment.get_inflated_at(8, 8))
+        self.assertFalse(self.environment.get_inflated_at(9, 6))
+        self.assertTrue(self.environment.is_inflated_collision((6, 8)))
+        # The raw obstacle map is unchanged
+        self.assertFalse(self.environment.get_at(8, 6))
+
+    def test_clearance(self):
+        self.assertEqual(self.environment.get_clearance(6, 6), 0)
+        self.assertEqual(self.environment.get_clearance(9, 6), 3)
+        # Stored distances are rounded down to the storage resolution
+        self.assertLessEqual(self.environment.get_clearance(8, 8), 8 ** 0.5)
+        self.assertGreater(self.environment.get_clearance(8, 8), 8 ** 0.5 - 1 / DISTANCE_SCALE)
+        # Distances saturate instead of overflowing
+        far_grid = [[0] * 80 for _ in range(80)]
+        far_grid[0][0] = 1
+        far_environment = make_environment(far_grid)
+        far_environment.build_clearance(1)
+        self.assertEqual(far_environment.get_clearance(79, 79), 255 / DISTANCE_SCALE)
+
+    def test_round_trip(self):
+        data = self.environment.to_bytes()
+        for file_object in [io.BytesIO(data), io.StringIO("".join(chr(byte) for byte in data))]:
+            loaded = PathfindingEnvironment()
+            with unittest.mock.patch("builtins.print"):
+                loaded.load_from_file(file_object)
+            self.assertEqual(loaded.width, 12)
+            self.assertEqual(loaded.height, 12)
+            self.assertEqual(loaded.obstacle_list, self.environment.obstacle_list)
+            self.assertEqual(loaded.inflation_radius, 2)
+            self.assertEqual(loaded.inflated_list, self.environment.inflated_list)
+            self.assertEqual(loaded.distance_list, self.environment.distance_list)
+
+    def test_load_original_format(self):
+        data = make_environment(self.grid).to_bytes()
+        loaded = PathfindingEnvironment()
+        with unittest.mock.patch("builtins.print"):
+            loaded.load_from_file(io.BytesIO(data))
+        self.assertEqual(loaded.obstacle_list, self.environment.obstacle_list)
+        self.assertIsNone(loaded.inflated_list)
+        self.assertIsNone(loaded.distance_list)
+        self.assertFalse(loaded.is_inflated_collision((8, 6)))
+
+
+if __name__ == '__main__':
+    unittest.main()
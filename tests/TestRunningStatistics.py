@@ -0,0 +1,123 @@
+import random
+import statistics
+import unittest
+from unittest.mock import patch
+
+from VEXLib.Algorithms.MovingWindowAverage import MovingWindowAverage
+from VEXLib.Algorithms.RunningStatistics import RunningStatistics
+from VEXLib.Util.Buffer import Buffer
+
+
+class TestRunningStatistics(unittest.TestCase):
+    def assertMatchesWindow(self, running, window):
+        self.assertEqual(running.get_count(), len(window))
+        self.assertAlmostEqual(running.get_mean(), statistics.fmean(window), places=9)
+        self.assertAlmostEqual(running.get_sum(), sum(window), places=6)
+        if len(window) > 1:
+            self.assertAlmostEqual(running.get_variance(), statistics.variance(window), places=6)
+        self.assertEqual(running.get_min(), min(window))
+        self.assertEqual(running.get_max(), max(window))
+
+    def test_matches_direct_computation(self):
+        rng = random.Random(0)
+        for window_size in [1, 2, 5, 50]:
+            running = RunningStatistics(Buffer(window_size))
+            values = []
+            for _ in range(300):
+                value = rng.uniform(-100, 100)
+                values.append(value)
+                running.add(value)
+                self.assertMatchesWindow(running, values[-window_size:])
+
+    def test_monotonic_inputs(self):
+        running = RunningStatistics(Buffer(4))
+        for value in range(20):
+            running.add(value)
+        self.assertEqual((running.get_min(), running.get_max()), (16, 19))
+        for value in range(20, 0, -1):
+            running.add(value)
+        self.assertEqual((running.get_min(), running.get_max()), (1, 4))
+
+    def test_empty(self):
+        running = RunningStatistics(Buffer(3))
+        self.assertEqual(running.get_mean(), 0)
+        self.assertEqual(running.get_variance(), 0)
+        self.assertIsNone(running.get_min())
+        self.assertIsNone(running.get_max())
+
+    def test_existing_buffer_contents(self):
+        buffer = Buffer(3)
+        buffer.initialize(2.0)
+        running = RunningStatistics(buffer)
+        self.assertEqual(running.get_mean(), 2.0)
+        running.add(5.0)
+        self.assertMatchesWindow(running, [2.0, 2.0, 5.0])
+
+    def test_reset(self):
+        running = RunningStatistics(Buffer(3))
+        for value in [1, 2, 3, 4]:
+            running.add(value)
+        running.reset()
+        self.assertEqual(running.get_count(), 0)
+        self.assertIsNone(running.get_max())
+        running.add(7)
+        self.assertMatchesWindow(running, [7])
+
+    def test_stable_over_long_runs(self):
+        rng = random.Random(1)
+        running = RunningStatistics(Buffer(20))
+        values = []
+        # A large offset with small variation is the worst case for cancellation
+        for _ in range(1000):
+            value = 1e6 + rng.gauss(0, 0.01)
+            values.append(value)
+            running.add(value)
+        self.assertAlmostEqual(running.get_variance(), statistics.variance(values[-20:]), delta=1e-7)
+
+    def test_add_never_resyncs(self):
+        running = RunningStatistics(Buffer(20))
+        rng = random.Random(3)
+        values = []
+        with patch.object(RunningStatistics, "resync") as resync:
+            for _ in range(500):
+                value = rng.uniform(-5, 5)
+                values.append(value)
+                running.add(value)
+            resync.assert_not_called()
+        # 500 values is a whole number of windows, so the shadow sums have just replaced the running
+        # ones and match a fresh pass over the window exactly
+        window = Buffer(20)
+        for value in values[-20:]:
+            window.add(value)
+        fresh = RunningStatistics(window)
+        self.assertEqual(running.get_mean(), fresh.get_mean())
+        self.assertEqual(running.get_variance(), fresh.get_variance())
+
+    def test_typed_buffer(self):
+        running = RunningStatistics(Buffer(10, "f"))
+        rng = random.Random(2)
+        for _ in range(1000):
+            running.add(rng.uniform(0, 1))
+        window = running.buffer.get()
+        self.assertAlmostEqual(running.get_mean(), statistics.fmean(window), places=9)
+
+
+class TestMovingWindowAverage(unittest.TestCase):
+    def test_average(self):
+        average = MovingWindowAverage(Buffer(3))
+        self.assertEqual(average.add_value(3), 3)
+        self.assertEqual(average.add_value(6), 4.5)
+        self.assertEqual(average.add_value(9), 6)
+        self.assertEqual(average.add_value(12), 9)
+        self.assertEqual(average.buffer.get(), [6, 9, 12])
+
+    def test_reset(self):
+        average = MovingWindowAverage(Buffer(3))
+        average.add_value(10)
+        average.reset()
+        self.assertEqual(average.buffer.get(), [])
+        self.assertEqual(average.add_value(4), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
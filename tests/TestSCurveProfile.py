@@ -0,0 +1,135 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from VEXLib.Algorithms.ProfiledPID import ProfiledPIDController
+from VEXLib.Algorithms.SCurveProfile import SCurveConstraints, SCurveProfile, SCurveState
+from VEXLib.Algorithms.TrapezoidProfile import Constraints, State, TrapezoidProfile
+
+
+def samples(profile, count=400):
+    total = profile.total_time()
+    return [profile.sample(total * i / count) for i in range(count + 1)]
+
+
+class TestSCurveProfile(unittest.TestCase):
+    def assertWithinLimits(self, profile, constraints, tolerance=1e-9):
+        for state in samples(profile):
+            self.assertLessEqual(abs(state.velocity), constraints.max_velocity + tolerance)
+            self.assertLessEqual(abs(state.acceleration), constraints.max_acceleration + tolerance)
+
+    def test_rest_to_rest_reaches_goal(self):
+        constraints = SCurveConstraints(1.5, 3.0, 15.0)
+        profile = SCurveProfile(constraints)
+        profile.plan(State(0, 0), State(1, 0))
+        end = profile.sample(profile.total_time() - 1e-12)
+        self.assertAlmostEqual(end.position, 1.0, places=9)
+        self.assertAlmostEqual(end.velocity, 0.0, places=9)
+        self.assertAlmostEqual(end.acceleration, 0.0, places=9)
+        self.assertWithinLimits(profile, constraints)
+
+    def test_full_profile_phase_times(self):
+        # Reaches 3 m/s^2 after 0.2 s and 1.5 m/s after 0.7 s, covering 0.525 m at each end
+        profile = SCurveProfile(SCurveConstraints(1.5, 3.0, 15.0))
+        profile.plan(State(0, 0), State(2, 0))
+        self.assertEqual(len(profile.phase_start_times), 7)
+        self.assertAlmostEqual(profile.total_time(), 0.7 + 0.95 / 1.5 + 0.7)
+        middle = profile.sample(profile.total_time() / 2)
+        self.assertAlmostEqual(middle.position, 1.0)
+        self.assertAlmostEqual(middle.velocity, 1.5)
+        self.assertAlmostEqual(middle.acceleration, 0.0)
+
+    def test_jerk_is_limited(self):
+        constraints = SCurveConstraints(1.0, 2.0, 8.0)
+        profile = SCurveProfile(constraints)
+        profile.plan(State(0, 0), State(0.7, 0))
+        dt = 1e-3
+        previous = profile.sample(0)
+        t = dt
+        while t < profile.total_time():
+            state = profile.sample(t)
+            self.assertLessEqual(abs(state.acceleration - previous.acceleration), constraints.max_jerk * dt + 1e-9)
+            previous = state
+            t += dt
+
+    def test_backwards(self):
+        constraints = SCurveConstraints(1.0, 2.0, 8.0)
+        profile = SCurveProfile(constraints)
+        profile.plan(State(1, 0), State(-0.5, 0))
+        self.assertAlmostEqual(profile.sample(profile.total_time() - 1e-12).position, -0.5, places=9)
+        self.assertLess(min(state.velocity for state in samples(profile)), -0.9)
+
+    def test_random_states_reach_goal(self):
+        rng = random.Random(4)
+        for _ in range(300):
+            constraints = SCurveConstraints(rng.uniform(0.5, 2), rng.uniform(0.5, 4), rng.uniform(1, 20))
+            velocity = rng.uniform(-constraints.max_velocity, constraints.max_velocity)
+            acceleration = rng.uniform(-constraints.max_acceleration, constraints.max_acceleration)
+            # Skip states that overshoot the velocity limit however hard they brake
+            if abs(velocity + acceleration * abs(acceleration) / (2 * constraints.max_jerk)) > constraints.max_velocity:
+                continue
+            goal = State(rng.uniform(-3, 3), rng.choice([0.0, rng.uniform(-1, 1) * constraints.max_velocity]))
+            profile = SCurveProfile(constraints)
+            profile.plan(SCurveState(rng.uniform(-2, 2), velocity, acceleration), goal)
+            end = profile.sample(profile.total_time() - 1e-12)
+            self.assertAlmostEqual(end.position, goal.position, places=6)
+            self.assertAlmostEqual(end.velocity, goal.velocity, places=6)
+            self.assertWithinLimits(profile, constraints)
+
+    def test_sample_outside_plan(self):
+        profile = SCurveProfile(SCurveConstraints(1.0, 2.0, 8.0))
+        profile.plan(SCurveState(0.5, 0.2, 0.1), State(1, 0))
+        start = profile.sample(-1)
+        self.assertEqual((start.position, start.velocity, start.acceleration), (0.5, 0.2, 0.1))
+        end = profile.sample(100)
+        self.assertEqual((end.position, end.velocity, end.acceleration), (1, 0, 0.0))
+        self.assertTrue(profile.is_finished(100))
+
+    def test_replan_is_continuous(self):
+        profile = SCurveProfile(SCurveConstraints(1.0, 2.0, 8.0))
+        profile.plan(State(0, 0), State(2, 0))
+        before = profile.sample(0.5)
+        start = profile.replan(0.5, State(1.2, 0))
+        after = profile.sample(0)
+        self.assertAlmostEqual(start.position, before.position)
+        self.assertAlmostEqual(after.position, before.position)
+        self.assertAlmostEqual(after.velocity, before.velocity)
+        self.assertAlmostEqual(after.acceleration, before.acceleration)
+        self.assertAlmostEqual(profile.sample(profile.total_time() - 1e-12).position, 1.2, places=9)
+
+    def test_calculate_matches_plan(self):
+        profile = SCurveProfile(SCurveConstraints(1.0, 2.0, 8.0))
+        initial = State(0, 0)
+        goal = State(1, 0)
+        state = profile.calculate(0.3, initial, goal)
+        times = list(profile.phase_start_times)
+        self.assertEqual(profile.calculate(0.3, initial, goal).position, state.position)
+        self.assertEqual(profile.phase_start_times, times)
+
+    def test_slower_than_trapezoid_with_same_limits(self):
+        trapezoid = TrapezoidProfile(Constraints(1.0, 2.0))
+        trapezoid.calculate(0, State(0, 0), State(2, 0))
+        profile = SCurveProfile(SCurveConstraints(1.0, 2.0, 8.0))
+        profile.plan(State(0, 0), State(2, 0))
+        # Ramping the acceleration costs a / j = 0.25 s at each end
+        self.assertAlmostEqual(profile.total_time(), trapezoid.total_time() + 0.25)
+
+
+class TestProfiledPIDWithSCurve(unittest.TestCase):
+    def test_setpoint_follows_plan(self):
+        with patch("VEXLib.Util.time.time") as mock_time:
+            mock_time.return_value = 10.0
+            controller = ProfiledPIDController(kp=1.0, t=0.0, max_velocity=1.0, max_acceleration=2.0, max_jerk=8.0)
+            controller.set_target_state(1.0, 0.0)
+            mock_time.return_value = 10.4
+            controller.update(0.0)
+            self.assertAlmostEqual(controller.setpoint, controller.profile.sample(0.4).position)
+            self.assertFalse(controller.is_finished())
+            mock_time.return_value = 20.0
+            controller.update(1.0)
+            self.assertAlmostEqual(controller.setpoint, 1.0)
+            self.assertTrue(controller.is_finished())
+
+
+if __name__ == "__main__":
+    unittest.main()
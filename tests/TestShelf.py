@@ -61,5 +61,80 @@ class TestShelf(unittest.TestCase):
         self.assertEqual(self.shelf.get("persist"), "value")
 
 
+class TestCachedShelf(unittest.TestCase):
+    def setUp(self):
+        self.temporary_file = tempfile.NamedTemporaryFile(delete=False)
+        self.path = self.temporary_file.name
+        self.temporary_file.close()
+        self.shelf = Shelf(self.path, cached=True, compact_threshold=8)
+
+    def tearDown(self):
+        for path in (self.path, self.path + ".journal", self.path + ".tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def test_set_and_get(self):
+        self.shelf.set("int_val", 42)
+        self.shelf.set("str_val", "Hello, \"world\"")
+        self.shelf.set("dict_val", {"a": 1, "b": 2})
+
+        self.assertEqual(self.shelf.get("int_val"), 42)
+        self.assertEqual(self.shelf.get("str_val"), 'Hello, "world"')
+        self.assertEqual(self.shelf.get("dict_val"), {"a": 1, "b": 2})
+        self.assertEqual(self.shelf.get("missing_key", "default"), "default")
+
+    def test_set_appends_to_journal(self):
+        self.shelf.set("a", 1)
+        self.shelf.set("b", 2)
+        with open(self.path) as file:
+            self.assertEqual(file.read(), "")
+        with open(self.path + ".journal") as file:
+            self.assertEqual(file.read(), "a,1\nb,2\n")
+
+    def test_persistence_replays_journal(self):
+        self.shelf.set("persist", "value")
+        self.shelf.set("overwritten", 1)
+        self.shelf.set("overwritten", 2)
+        self.shelf.set("deleted", True)
+        self.assertTrue(self.shelf.delete("deleted"))
+
+        reopened = Shelf(self.path, cached=True)
+        self.assertEqual(reopened.get("persist"), "value")
+        self.assertEqual(reopened.get("overwritten"), 2)
+        self.assertIsNone(reopened.get("deleted"))
+        self.assertEqual(sorted(reopened.keys()), ["overwritten", "persist"])
+
+    def test_compaction(self):
+        for i in range(20):
+            self.shelf.set("key" + str(i % 5), i)
+        self.assertLess(self.shelf._journal_length, 8)
+
+        uncached = Shelf(self.path)
+        self.shelf.compact()
+        self.assertEqual(dict(uncached.items()), {"key" + str(i): 15 + i for i in range(5)})
+        with open(self.path + ".journal") as file:
+            self.assertEqual(file.read(), "")
+
+    def test_partial_journal_line_is_ignored(self):
+        self.shelf.set("a", 1)
+        with open(self.path + ".journal", "a") as file:
+            file.write('b,"unterminated')
+
+        reopened = Shelf(self.path, cached=True)
+        self.assertEqual(dict(reopened.items()), {"a": 1})
+
+    def test_interrupted_compaction_recovers_temporary_file(self):
+        with open(self.path + ".tmp", "w") as file:
+            file.write("a,1\nb,2\n")
+        with open(self.path + ".journal", "w") as file:
+            file.write("b,3\n")
+
+        reopened = Shelf(self.path, cached=True)
+        self.assertEqual(dict(reopened.items()), {"a": 1, "b": 3})
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+
 if __name__ == "__main__":
     unittest.main()
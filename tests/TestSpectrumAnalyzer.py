@@ -0,0 +1,115 @@
+import cmath
+import math
+import random
+import unittest
+
+from VEXLib.Algorithms.FastFourierTransform import fft, rfft
+from VEXLib.Algorithms.SpectrumAnalyzer import goertzel, hann_window, SlidingDFT, ShortTimeFourierTransform
+
+SAMPLE_RATE = 100
+
+
+def sine(frequency, count, amplitude=1.0, offset=0.0):
+    return [offset + amplitude * math.sin(2 * math.pi * frequency * t / SAMPLE_RATE) for t in range(count)]
+
+
+class TestGoertzel(unittest.TestCase):
+    def test_matches_fft_bins(self):
+        rng = random.Random(0)
+        samples = [rng.uniform(-1, 1) for _ in range(64)]
+        spectrum = fft(samples)
+        for k in [0, 1, 7, 32]:
+            value = goertzel(samples, k * SAMPLE_RATE / 64, SAMPLE_RATE)
+            self.assertAlmostEqual(abs(value - spectrum[k]), 0, places=9)
+
+    def test_off_bin_frequency(self):
+        samples = sine(12.3, 128)
+        expected = sum(x * cmath.exp(-2j * cmath.pi * 12.3 * t / SAMPLE_RATE) for t, x in enumerate(samples))
+        self.assertAlmostEqual(abs(goertzel(samples, 12.3, SAMPLE_RATE) - expected), 0, places=9)
+
+
+class TestSlidingDFT(unittest.TestCase):
+    def test_matches_dft_of_window(self):
+        rng = random.Random(1)
+        samples = [rng.uniform(-1, 1) for _ in range(200)]
+        sliding = SlidingDFT(32, SAMPLE_RATE, [0, 12.5, 25, 50], windowed=False, damping=1.0)
+        for sample in samples:
+            sliding.add_sample(sample)
+        spectrum = fft(samples[-32:])
+        self.assertEqual(sliding.bins, [0, 4, 8, 16])
+        for index, k in enumerate(sliding.bins):
+            self.assertAlmostEqual(abs(sliding.get_bin(index) - spectrum[k]), 0, places=5)
+
+    def test_windowed_matches_windowed_dft(self):
+        rng = random.Random(2)
+        samples = [rng.uniform(-1, 1) for _ in range(100)]
+        sliding = SlidingDFT(32, SAMPLE_RATE, [12.5], damping=1.0)
+        for sample in samples:
+            sliding.add_sample(sample)
+        window = hann_window(32)
+        spectrum = fft([x * w for x, w in zip(samples[-32:], window)])
+        self.assertAlmostEqual(abs(sliding.get_bin(0) - spectrum[4]), 0, places=5)
+
+    def test_detects_oscillation(self):
+        sliding = SlidingDFT(64, SAMPLE_RATE, [5, 12.5, 25])
+        for sample in sine(12.5, 300, amplitude=0.8, offset=2.0):
+            sliding.add_sample(sample)
+        self.assertTrue(sliding.is_full())
+        frequency, amplitude = sliding.get_dominant()
+        self.assertAlmostEqual(frequency, 12.5)
+        self.assertAlmostEqual(amplitude, 0.8, delta=0.02)
+        self.assertLess(sliding.get_amplitude(0), 0.05)
+
+    def test_tracks_changes(self):
+        sliding = SlidingDFT(50, SAMPLE_RATE, [10, 20])
+        for sample in sine(10, 200) + sine(20, 100):
+            sliding.add_sample(sample)
+        self.assertEqual(sliding.get_dominant()[0], 20)
+
+    def test_reset(self):
+        sliding = SlidingDFT(16, SAMPLE_RATE, [25])
+        for sample in sine(25, 40):
+            sliding.add_sample(sample)
+        sliding.reset()
+        self.assertFalse(sliding.is_full())
+        self.assertEqual(sliding.get_amplitude(0), 0)
+
+
+class TestShortTimeFourierTransform(unittest.TestCase):
+    def test_frames_every_hop(self):
+        stft = ShortTimeFourierTransform(32, 8, SAMPLE_RATE)
+        ready = [stft.add_sample(0.0) for _ in range(64)]
+        self.assertEqual([i for i, is_ready in enumerate(ready) if is_ready], [31, 39, 47, 55, 63])
+        self.assertEqual(stft.frame_count, 5)
+
+    def test_frame_matches_windowed_rfft(self):
+        rng = random.Random(3)
+        samples = [rng.uniform(-1, 1) for _ in range(50)]
+        stft = ShortTimeFourierTransform(16, 16, SAMPLE_RATE)
+        for sample in samples:
+            stft.add_sample(sample)
+        # The last frame covers samples 32 to 47
+        window = hann_window(16)
+        expected = rfft([x * w for x, w in zip(samples[32:48], window)])
+        self.assertEqual(len(stft.spectrum), 9)
+        for a, b in zip(stft.spectrum, expected):
+            self.assertAlmostEqual(abs(a - b), 0, places=5)
+
+    def test_dominant_frequency(self):
+        stft = ShortTimeFourierTransform(64, 16, SAMPLE_RATE)
+        self.assertIsNone(stft.get_dominant())
+        for sample in sine(25, 100, amplitude=0.5, offset=1.0):
+            stft.add_sample(sample)
+        frequency, amplitude = stft.get_dominant(minimum_frequency=5)
+        self.assertAlmostEqual(frequency, 25)
+        self.assertAlmostEqual(amplitude, 0.5, delta=0.02)
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            ShortTimeFourierTransform(48, 8, SAMPLE_RATE)
+        with self.assertRaises(ValueError):
+            ShortTimeFourierTransform(32, 0, SAMPLE_RATE)
+
+
+if __name__ == '__main__':
+    unittest.main()
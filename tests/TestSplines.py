@@ -0,0 +1,31 @@
+import unittest
+
+from sim.splines import ArcLengthTable, Bezier, CompositeCurve
+
+
+class TestCompositeCurveArcLength(unittest.TestCase):
+    def setUp(self):
+        # Two 1 m lines, the second given three times as much of the parameter range
+        self.curve = CompositeCurve([Bezier([(0, 0), (1, 0)]), Bezier([(1, 0), (2, 0)])], param_lengths=[1, 3])
+
+    def test_derivatives_are_with_respect_to_global_parameter(self):
+        point, first, second = self.curve.evaluate_with_derivatives(0.1)
+        self.assertAlmostEqual(first[0], 4.0)
+        self.assertAlmostEqual(self.curve.derivative(0.1)[0], 4.0)
+        point, first, second = self.curve.evaluate_with_derivatives(0.5)
+        self.assertAlmostEqual(first[0], 4.0 / 3)
+        self.assertAlmostEqual(second[0], 0.0)
+
+    def test_length(self):
+        self.assertAlmostEqual(ArcLengthTable(self.curve).length, 2.0)
+
+    def test_uniform_parameters_are_evenly_spaced(self):
+        table = ArcLengthTable(self.curve)
+        xs = [self.curve.evaluate(t)[0] for t in table.uniform_parameters(0.25)]
+        self.assertEqual(len(xs), 9)
+        for i, x in enumerate(xs):
+            self.assertAlmostEqual(x, 0.25 * i, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
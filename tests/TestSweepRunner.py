@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sim import SweepRunner
+
+
+def edited_experiment(params, rng):
+    return {"rmse": SweepRunner.rms([rng.random()])}
+
+
+class TestSweepRunnerCache(unittest.TestCase):
+    def test_code_hash_is_stable(self):
+        self.assertEqual(SweepRunner.experiment_code_hash("pose_ekf"), SweepRunner.experiment_code_hash("pose_ekf"))
+
+    def test_editing_experiment_changes_hash(self):
+        original = SweepRunner.experiment_code_hash("kalman_filter")
+        defaults = SweepRunner.EXPERIMENTS["kalman_filter"][1]
+        with patch.dict(SweepRunner.EXPERIMENTS, {"kalman_filter": (edited_experiment, defaults)}):
+            edited = SweepRunner.experiment_code_hash("kalman_filter")
+        self.assertNotEqual(original, edited)
+
+    def test_config_hash_includes_code(self):
+        params = {"steps": 10}
+        self.assertNotEqual(
+            SweepRunner.config_hash("pose_ekf", params, 1, "a"), SweepRunner.config_hash("pose_ekf", params, 1, "b")
+        )
+
+    def test_vexlib_code_is_hashed(self):
+        files = SweepRunner.experiment_code_files("kalman_filter")
+        modules = [os.path.join("VEXLib", "Math", "Matrix.py"),
+                   os.path.join("VEXLib", "Math", "MatrixDecomposition.py"),
+                   os.path.join("sim", "KalmanFilter.py")]
+        for module in modules:
+            self.assertTrue(any(path.endswith(module) for path in files), module)
+        for path in files:
+            self.assertTrue(path.startswith(SweepRunner.PROJECT_ROOT), path)
+
+    def test_editing_matrix_changes_hash(self):
+        original = SweepRunner.experiment_code_hash("pose_ekf")
+        source_bytes = SweepRunner._source_bytes
+
+        def edited_source(path):
+            if path.endswith(os.path.join("VEXLib", "Math", "Matrix.py")):
+                return source_bytes(path) + b"\n# edited\n"
+            return source_bytes(path)
+
+        with patch.object(SweepRunner, "_source_bytes", edited_source):
+            self.assertNotEqual(original, SweepRunner.experiment_code_hash("pose_ekf"))
+
+    def test_cached_rows_marked(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            grid = {"steps": [5], "q_scale": [1.0, 2.0]}
+            first = SweepRunner.run_sweep("kalman_filter", grid, workers=1, cache_directory=cache_directory)
+            second = SweepRunner.run_sweep("kalman_filter", grid, workers=1, cache_directory=cache_directory)
+        self.assertEqual([row["cached"] for row in first], [False, False])
+        self.assertEqual([row["cached"] for row in second], [True, True])
+        self.assertEqual([row["rmse_x"] for row in first], [row["rmse_x"] for row in second])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,11 @@ from unittest.mock import Mock
 import vex
 from VEXLib.Robot.TickBasedRobot import (
     TickBasedRobot,
+    DRIVER_CONTROL_DISABLED,
     DRIVER_CONTROL_ENABLED,
     AUTONOMOUS_CONTROL_ENABLED,
 )
+from VEXLib.Util.Logging import Logger
 
 
 class TestNewTickBasedRobot(unittest.TestCase):
@@ -34,3 +36,19 @@ class TestNewTickBasedRobot(unittest.TestCase):
         # Assert the correct callbacks were triggered
         driver_callback.assert_called_once()
         # auto_callback.assert_called_once()
+
+
+class TestTickProfileExport(unittest.TestCase):
+    def test_profiler_logs_to_binlog_by_default(self):
+        robot = TickBasedRobot(vex.Brain())
+        self.assertIsInstance(robot.tick_profiler.logger, Logger)
+
+    def test_summary_exported_on_disable(self):
+        logger = Mock()
+        robot = TickBasedRobot(vex.Brain(), logger=logger)
+        robot.transition_to(DRIVER_CONTROL_ENABLED)
+        robot.tick_profiler.start_tick(0)
+        robot.transition_to(DRIVER_CONTROL_DISABLED)
+        logger.log_vars.assert_called_once()
+        self.assertIn("tick_profile", logger.log_vars.call_args[0][0])
+        logger.flush_logs.assert_called_once()
@@ -0,0 +1,155 @@
+import unittest
+from unittest.mock import patch
+
+from VEXLib.Robot import TickPacer as tick_pacer_module
+from VEXLib.Robot.TickPacer import TickPacer, CATCH_UP_BACK_TO_BACK, CATCH_UP_COMPRESS, CATCH_UP_SKIP
+
+
+class FakeClock:
+    def __init__(self):
+        self.now_us = 0
+        self.slept_us = 0
+        self.reads = 0
+
+    def time_us(self):
+        self.reads += 1
+        # Every clock read takes a little time, so spinning always terminates
+        self.now_us += 10
+        return self.now_us
+
+    def sleep_us(self, duration_us):
+        self.slept_us += duration_us
+        self.now_us += duration_us
+
+    @staticmethod
+    def time_diff_us(end_us, start_us):
+        return end_us - start_us
+
+    @staticmethod
+    def time_add_us(start_us, delta_us):
+        return start_us + delta_us
+
+
+class WrappingClock(FakeClock):
+    """A clock that wraps like MicroPython's ticks_us and only accepts values in the ticks range."""
+
+    TICKS_PERIOD = 1 << 30
+
+    def __init__(self, start_us):
+        super().__init__()
+        self.now_us = start_us
+
+    def time_us(self):
+        self.reads += 1
+        self.now_us = (self.now_us + 10) % self.TICKS_PERIOD
+        return self.now_us
+
+    def sleep_us(self, duration_us):
+        self.slept_us += duration_us
+        self.now_us = (self.now_us + duration_us) % self.TICKS_PERIOD
+
+    @classmethod
+    def check_ticks(cls, value):
+        if not 0 <= value < cls.TICKS_PERIOD:
+            raise ValueError("Not a ticks value: " + str(value))
+
+    @classmethod
+    def time_diff_us(cls, end_us, start_us):
+        cls.check_ticks(end_us)
+        cls.check_ticks(start_us)
+        half = cls.TICKS_PERIOD // 2
+        return (end_us - start_us + half) % cls.TICKS_PERIOD - half
+
+    @classmethod
+    def time_add_us(cls, start_us, delta_us):
+        cls.check_ticks(start_us)
+        return (start_us + delta_us) % cls.TICKS_PERIOD
+
+
+class TestTickPacer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch.object(tick_pacer_module, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_late_tick(self, pacer, delay_us, tick_count):
+        """Delay the loop once, then record the start time of the following ticks."""
+        pacer.wait()
+        self.clock.now_us += delay_us
+        starts = []
+        for _ in range(tick_count):
+            pacer.wait()
+            starts.append(self.clock.now_us)
+        return starts
+
+    def test_sleeps_most_of_the_period(self):
+        pacer = TickPacer(20, spin_us=500)
+        for _ in range(10):
+            lateness = pacer.wait()
+            self.assertGreaterEqual(lateness, 0)
+            self.assertLess(lateness, 100)
+        # Everything but the final spin window is spent sleeping
+        self.assertGreater(self.clock.slept_us, 10 * 19000)
+        self.assertLess(self.clock.reads, 10 * 100)
+
+    def test_ticks_are_evenly_spaced(self):
+        pacer = TickPacer(10)
+        starts = []
+        for _ in range(5):
+            pacer.wait()
+            starts.append(self.clock.now_us)
+        for first, second in zip(starts, starts[1:]):
+            self.assertAlmostEqual(second - first, 10000, delta=20)
+
+    def test_back_to_back(self):
+        pacer = TickPacer(10, catch_up_policy=CATCH_UP_BACK_TO_BACK)
+        starts = self.run_late_tick(pacer, 35000, 5)
+        # The late tick is 2.5 periods late, the two missed ticks run immediately after it
+        self.assertLess(starts[2] - starts[0], 100)
+        self.assertAlmostEqual(starts[3] - starts[2], 5000, delta=100)
+        self.assertEqual(pacer.skipped_ticks, 0)
+        self.assertEqual(pacer.late_ticks, 2)
+
+    def test_compress(self):
+        pacer = TickPacer(10, catch_up_policy=CATCH_UP_COMPRESS, compress_ratio=0.5)
+        starts = self.run_late_tick(pacer, 35000, 5)
+        # Missed ticks are spaced by half a period until the schedule is caught up
+        self.assertAlmostEqual(starts[1] - starts[0], 5000, delta=20)
+        self.assertAlmostEqual(starts[2] - starts[1], 5000, delta=20)
+        self.assertEqual(pacer.skipped_ticks, 0)
+
+    def test_skip(self):
+        pacer = TickPacer(10, catch_up_policy=CATCH_UP_SKIP)
+        first_start = self.clock.now_us
+        starts = self.run_late_tick(pacer, 35000, 3)
+        self.assertEqual(pacer.skipped_ticks, 2)
+        # The following ticks stay on the original 10 ms grid
+        for start in starts[1:]:
+            self.assertLess((start - first_start) % 10000, 100)
+        self.assertAlmostEqual(starts[2] - starts[1], 10000, delta=20)
+
+    def test_wraparound(self):
+        for policy in (CATCH_UP_BACK_TO_BACK, CATCH_UP_COMPRESS, CATCH_UP_SKIP):
+            clock = WrappingClock(WrappingClock.TICKS_PERIOD - 25000)
+            with patch.object(tick_pacer_module, "time", clock):
+                pacer = TickPacer(10, catch_up_policy=policy)
+                previous = None
+                for _ in range(6):
+                    lateness = pacer.wait()
+                    self.assertGreaterEqual(lateness, 0)
+                    self.assertLess(lateness, 100)
+                    if previous is not None:
+                        self.assertAlmostEqual(clock.time_diff_us(clock.now_us, previous), 10000, delta=20)
+                    previous = clock.now_us
+                # The ticks crossed the wraparound without spinning through the whole period
+                self.assertLess(clock.now_us, 50000)
+                self.assertLess(clock.reads, 6 * 100)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            TickPacer(10, catch_up_policy="sometimes")
+
+
+if __name__ == '__main__':
+    unittest.main()
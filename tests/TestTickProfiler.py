@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import Mock
+
+from VEXLib.Robot.TickProfiler import TickProfiler, PHASE_PERIODIC, PHASE_ENABLED_PERIODIC, PHASE_TICK
+
+
+class TestTickProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = TickProfiler(10, history_length=4, histogram_bin_ms=1, histogram_bins=5)
+
+    def test_record_durations(self):
+        self.profiler.record(PHASE_PERIODIC, 0)
+        self.assertEqual(self.profiler.counts[PHASE_PERIODIC], 1)
+        self.assertEqual(self.profiler.counts[PHASE_ENABLED_PERIODIC], 0)
+        self.assertGreater(self.profiler.max_us[PHASE_PERIODIC], 0)
+
+    def test_record_chains_time(self):
+        now = self.profiler.record(PHASE_ENABLED_PERIODIC, 0)
+        self.profiler.record(PHASE_PERIODIC, now)
+        self.assertLess(self.profiler.recent(PHASE_PERIODIC)[0], 1000000)
+
+    def test_ring_buffer_keeps_most_recent(self):
+        for start in range(10):
+            self.profiler.record(PHASE_PERIODIC, start * 1000)
+        recent = self.profiler.recent(PHASE_PERIODIC)
+        self.assertEqual(len(recent), 4)
+        # Later starts produce shorter durations, so the most recent samples are strictly decreasing
+        self.assertEqual(recent, sorted(recent, reverse=True))
+        self.assertEqual(self.profiler.counts[PHASE_PERIODIC], 10)
+
+    def test_lateness_histogram(self):
+        for lateness in [0, 0.5, 1.5, 3, 100, -2]:
+            self.profiler.start_tick(lateness)
+        self.assertEqual(list(self.profiler.lateness_histogram), [3, 1, 0, 1, 1])
+        self.assertEqual(self.profiler.max_lateness_ms, 100)
+
+    def test_overruns_and_jitter(self):
+        self.profiler.start_tick(0)
+        self.profiler.start_tick(0)
+        self.profiler.start_tick(5, overran=True)
+        self.assertEqual(self.profiler.overruns, 1)
+        self.assertEqual(self.profiler.jitter_count, 2)
+        # Back to back ticks are about one target period early
+        self.assertLess(self.profiler.summary()["jitter_mean_us"], 0)
+
+    def test_end_tick(self):
+        self.profiler.start_tick(0)
+        self.profiler.end_tick()
+        self.assertEqual(self.profiler.counts[PHASE_TICK], 1)
+
+    def test_summary_and_reset(self):
+        self.profiler.start_tick(2)
+        self.profiler.record(PHASE_PERIODIC, self.profiler.start_tick(0))
+        summary = self.profiler.summary()
+        self.assertEqual(list(summary["phases"].keys()), ["periodic"])
+        self.assertEqual(summary["phases"]["periodic"]["count"], 1)
+
+        self.profiler.reset()
+        summary = self.profiler.summary()
+        self.assertEqual(summary["phases"], {})
+        self.assertEqual(summary["lateness_histogram"], [0, 0, 0, 0, 0])
+
+    def test_export(self):
+        self.profiler.export()
+
+        logger = Mock()
+        self.profiler.logger = logger
+        self.profiler.export()
+        logger.log_vars.assert_called_once()
+        logger.flush_logs.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
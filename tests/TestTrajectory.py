@@ -0,0 +1,79 @@
+import io
+import math
+import unittest
+
+from VEXLib.Kinematics.Trajectory import FIELDS, HEADER_SIZE, Trajectory
+
+
+def make_trajectory(count=5, time_step=0.1):
+    fields = {name: [index * 0.5 + offset for index in range(count)] for offset, name in enumerate(FIELDS)}
+    return Trajectory(time_step, fields)
+
+
+class TestTrajectory(unittest.TestCase):
+    def test_length_and_total_time(self):
+        trajectory = make_trajectory(5, 0.1)
+        self.assertEqual(len(trajectory), 5)
+        self.assertAlmostEqual(trajectory.total_time(), 0.4)
+        self.assertEqual(Trajectory(0.1).total_time(), 0)
+
+    def test_mismatched_fields_raise(self):
+        fields = {name: [0.0, 1.0] for name in FIELDS}
+        fields["y"] = [0.0]
+        with self.assertRaises(ValueError):
+            Trajectory(0.1, fields)
+
+    def test_sample_at_sample_times(self):
+        trajectory = make_trajectory(5, 0.1)
+        state = trajectory.sample(0.2)
+        self.assertAlmostEqual(state.time, 0.2)
+        self.assertAlmostEqual(state.x, 1.0)
+        self.assertAlmostEqual(state.right_velocity, 1.0 + 7)
+
+    def test_sample_interpolates(self):
+        trajectory = make_trajectory(5, 0.1)
+        state = trajectory.sample(0.25)
+        self.assertAlmostEqual(state.x, 1.25, places=6)
+        self.assertAlmostEqual(state.heading, 2 + 1.25, places=6)
+
+    def test_sample_clamps_outside(self):
+        trajectory = make_trajectory(5, 0.1)
+        self.assertAlmostEqual(trajectory.sample(-1).x, 0.0)
+        end = trajectory.sample(10)
+        self.assertAlmostEqual(end.x, 2.0)
+        self.assertAlmostEqual(end.time, 0.4)
+
+    def test_sample_empty_raises(self):
+        with self.assertRaises(ValueError):
+            Trajectory(0.1).sample(0)
+
+    def test_bytes_round_trip(self):
+        trajectory = make_trajectory(7, 0.02)
+        trajectory.fields["heading"][3] = math.pi
+        data = trajectory.to_bytes()
+        self.assertEqual(len(data), HEADER_SIZE + 4 * len(FIELDS) * 7)
+        loaded = Trajectory.from_bytes(data)
+        self.assertAlmostEqual(loaded.time_step, 0.02)
+        for name in FIELDS:
+            self.assertEqual(list(loaded.fields[name]), list(trajectory.fields[name]))
+
+    def test_file_round_trip(self):
+        trajectory = make_trajectory(3)
+        buffer = io.BytesIO()
+        buffer.close = lambda: None
+        trajectory.save_to_file(buffer)
+        loaded = Trajectory.load_from_file(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(list(loaded.fields["x"]), list(trajectory.fields["x"]))
+
+    def test_rejects_bad_data(self):
+        data = make_trajectory(3).to_bytes()
+        with self.assertRaises(ValueError):
+            Trajectory.from_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(ValueError):
+            Trajectory.from_bytes(data[:-4])
+        with self.assertRaises(ValueError):
+            Trajectory.from_bytes(data[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import math
+import unittest
+
+from sim.splines import CatmullRom
+from util.TrajectoryCompiler import TrajectoryConstraints, check_constraints, compile_trajectory, velocity_profile
+
+WAYPOINTS = [(0.0, 0.0), (0.6, 0.3), (1.2, 0.2), (1.6, 0.8), (1.2, 1.4)]
+
+
+class TestCatmullRom(unittest.TestCase):
+    def test_passes_through_points(self):
+        curve = CatmullRom(WAYPOINTS)
+        for i, point in enumerate(WAYPOINTS):
+            x, y = curve.evaluate(i / (len(WAYPOINTS) - 1))
+            self.assertAlmostEqual(x, point[0])
+            self.assertAlmostEqual(y, point[1])
+
+    def test_derivative_matches_finite_difference(self):
+        curve = CatmullRom(WAYPOINTS)
+        h = 1e-6
+        for t in (0.1, 0.37, 0.8):
+            point, d1, d2 = curve.evaluate_with_derivatives(t)
+            before = curve.evaluate(t - h)
+            after = curve.evaluate(t + h)
+            self.assertAlmostEqual(d1[0], (after[0] - before[0]) / (2 * h), places=4)
+            self.assertAlmostEqual(d1[1], (after[1] - before[1]) / (2 * h), places=4)
+
+
+class TestVelocityProfile(unittest.TestCase):
+    def test_acceleration_limited_both_ways(self):
+        constraints = TrajectoryConstraints(max_velocity=2.0, max_acceleration=1.0)
+        step = 0.01
+        velocities = velocity_profile(step, [0.0] * 501, constraints)
+        self.assertEqual(velocities[0], 0.0)
+        self.assertEqual(velocities[-1], 0.0)
+        for v0, v1 in zip(velocities[:-1], velocities[1:]):
+            self.assertLessEqual(abs(v1 * v1 - v0 * v0), 2 * constraints.max_acceleration * step + 1e-12)
+        # Over 5 m at 1 m/s^2 the speed could reach sqrt(5) m/s halfway, so it is capped at the 2 m/s limit
+        self.assertAlmostEqual(max(velocities), 2.0)
+
+    def test_curvature_limits_speed(self):
+        constraints = TrajectoryConstraints(max_velocity=2.0, max_centripetal_acceleration=1.0)
+        velocities = velocity_profile(0.01, [2.0] * 100, constraints, start_velocity=5.0, end_velocity=5.0)
+        self.assertLessEqual(max(velocities), constraints.velocity_limit(2.0))
+
+
+class TestCompileTrajectory(unittest.TestCase):
+    def setUp(self):
+        self.constraints = TrajectoryConstraints(max_velocity=1.5, max_acceleration=2.5, max_centripetal_acceleration=2.5)
+
+    def test_compiled_path_within_constraints(self):
+        trajectory = compile_trajectory(CatmullRom(WAYPOINTS), self.constraints)
+        self.assertEqual(check_constraints(trajectory, self.constraints), [])
+        start = trajectory.sample(0)
+        end = trajectory.sample(trajectory.total_time())
+        self.assertAlmostEqual(start.x, 0.0, places=5)
+        self.assertAlmostEqual(start.y, 0.0, places=5)
+        self.assertAlmostEqual(end.x, WAYPOINTS[-1][0], places=3)
+        self.assertAlmostEqual(end.y, WAYPOINTS[-1][1], places=3)
+
+    def test_start_and_end_velocities(self):
+        trajectory = compile_trajectory(CatmullRom(WAYPOINTS), self.constraints, start_velocity=0.8, end_velocity=0.5)
+        velocities = trajectory.fields["velocity"]
+        self.assertAlmostEqual(velocities[0], 0.8, places=5)
+        self.assertAlmostEqual(velocities[-1], 0.5, places=2)
+        self.assertEqual(check_constraints(trajectory, self.constraints), [])
+
+        stopped = compile_trajectory(CatmullRom(WAYPOINTS), self.constraints)
+        self.assertEqual(stopped.fields["velocity"][0], 0.0)
+        self.assertAlmostEqual(stopped.fields["velocity"][-1], 0.0, places=2)
+        self.assertLess(trajectory.total_time(), stopped.total_time())
+
+    def test_broken_constraints_reported(self):
+        trajectory = compile_trajectory(CatmullRom(WAYPOINTS), self.constraints)
+        tighter = TrajectoryConstraints(max_velocity=1.0, max_acceleration=1.0, max_centripetal_acceleration=1.0)
+        self.assertEqual(len(check_constraints(trajectory, tighter)), 3)
+
+    def test_zero_length_path_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_trajectory(CatmullRom([(0.5, 0.5), (0.5, 0.5), (0.5, 0.5)]), self.constraints)
+
+    def test_path_shorter_than_distance_step(self):
+        trajectory = compile_trajectory(CatmullRom([(0.0, 0.0), (0.003, 0.0)]), self.constraints)
+        self.assertTrue(math.isfinite(trajectory.total_time()))
+        self.assertAlmostEqual(trajectory.sample(trajectory.total_time()).x, 0.003, places=5)
+        self.assertEqual(check_constraints(trajectory, self.constraints), [])
+
+    def test_repeated_waypoint_inside_path(self):
+        curve = CatmullRom([(0.0, 0.0), (1.0, 0.0), (1.0, 0.0), (2.0, 0.0)])
+        trajectory = compile_trajectory(curve, self.constraints)
+        self.assertTrue(math.isfinite(trajectory.total_time()))
+        self.assertAlmostEqual(trajectory.sample(trajectory.total_time()).x, 2.0, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
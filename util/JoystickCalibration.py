@@ -2,7 +2,7 @@ import math
 import struct
 
 from VEXLib.Geometry.GeometryUtil import hypotenuse
-from VEXLib.Math.MathUtil import interpolate_2d
+from VEXLib.Sensors.JoystickCalibration import JoystickCalibration
 
 PACKING_FORMAT_STRING = "ff"  # Packing/unpacking as two floats
 PACKING_FORMAT_RECORD_LENGTH = struct.calcsize(PACKING_FORMAT_STRING)
@@ -19,6 +19,9 @@ with open("assets/calibration_coefficients.bin", "rb") as file:
 r_values = [point[0] for point in polar_coordinates]
 theta_values = [point[1] for point in polar_coordinates]
 
+# Resampled once into evenly spaced angles, so each normalization is a table lookup instead of a search
+calibration = JoystickCalibration(polar_coordinates)
+
 print("Loaded {} polar coordinates from binary file.".format(len(polar_coordinates)))
 
 def cartesian_to_polar(x, y):
@@ -34,25 +37,4 @@ def polar_to_cartesian(r, theta):
 
 
 def normalize_joystick_input(x, y):
-    r, theta = cartesian_to_polar(x, y)
-
-    # Find the two closest theta values
-    for i in range(len(polar_coordinates) - 1):
-        r_1, theta_1 = polar_coordinates[i]
-        r_2, theta_2 = polar_coordinates[i + 1]
-
-        if theta_1 <= theta <= theta_2:
-            # Perform linear interpolation
-            interpolate_2d(theta_1, theta_2, r_1, r_2, theta, allow_extrapolation=False)
-            interpolated_r = r_1 + (r_2 - r_1) * (theta - theta_1) / (theta_2 - theta_1)
-            break
-    else:
-        # If theta is out of bounds, return a default value or handle the edge case
-        interpolated_r = polar_coordinates[-1][0]
-
-    # Normalize the input using the interpolated radius
-    scalar = interpolated_r
-    normalized_x = x / scalar
-    normalized_y = y / scalar
-
-    return normalized_x, normalized_y
+    return calibration.normalize(x, y)
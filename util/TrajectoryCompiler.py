@@ -0,0 +1,226 @@
+"""
+Compile a spline into a time-parameterized trajectory for the tank drivetrain.
+
+The path is sampled at small, even distances along its arc length. Each sample gets the fastest
+speed the drivetrain allows there: the top speed, reduced so that neither wheel exceeds it in a
+turn and so that the centripetal acceleration stays within its limit. A forward pass then limits
+how fast the robot may speed up and a backward pass how fast it must slow down, giving the
+velocity profile. Integrating it gives the time of every sample, and the result is resampled at a
+fixed time step and written to assets/ as a binary file that Drivetrain.load_trajectory reads.
+
+Usage:
+    python util/TrajectoryCompiler.py left_side_rush 0,0 0.6,0.2 1.2,0.9 --max-velocity 1.5
+"""
+import argparse
+import math
+import os
+
+from VEXLib.Kinematics.Trajectory import FIELDS, TRAJECTORY_FILE_SUFFIX, Trajectory
+from sim.splines import CatmullRom
+
+ASSETS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+
+class TrajectoryConstraints:
+    """
+    Limits of the drivetrain, in meters and seconds.
+
+    The defaults follow DrivetrainProperties in src/Constants.py, with the acceleration limits
+    left below what the wheels can hold without slipping.
+    """
+
+    def __init__(self, max_velocity=2.205, max_acceleration=3.0, max_centripetal_acceleration=3.0,
+                 track_width=0.25):
+        self.max_velocity = max_velocity
+        self.max_acceleration = max_acceleration
+        self.max_centripetal_acceleration = max_centripetal_acceleration
+        self.track_width = track_width
+
+    def velocity_limit(self, curvature):
+        """The fastest the robot center may go on a path with this curvature."""
+        curvature = abs(curvature)
+        # the outer wheel travels (1 + curvature * track_width / 2) times as fast as the center
+        limit = self.max_velocity / (1 + curvature * self.track_width / 2)
+        if curvature > 0:
+            limit = min(limit, math.sqrt(self.max_centripetal_acceleration / curvature))
+        return limit
+
+
+def _curvature(d1, d2):
+    speed_squared = d1[0] * d1[0] + d1[1] * d1[1]
+    if speed_squared == 0:
+        return 0.0
+    return (d1[0] * d2[1] - d1[1] * d2[0]) / speed_squared ** 1.5
+
+
+def _unwrap(angle, previous):
+    while angle - previous > math.pi:
+        angle -= 2 * math.pi
+    while angle - previous < -math.pi:
+        angle += 2 * math.pi
+    return angle
+
+
+def sample_path(curve, distance_step):
+    """
+    Sample a curve at even distances along it.
+
+    Returns:
+        tuple: (distance between samples, list of (x, y, unwrapped heading, curvature))
+
+    Raises:
+        ValueError: If the curve has no length, for example when every waypoint is the same point.
+    """
+    table = curve.arc_length_table()
+    if not table.length > 0:
+        raise ValueError("The path has zero length, check for repeated waypoints")
+    # At least two steps, so a path shorter than one step can still speed up and slow down again in the
+    # middle instead of being one step with zero speed at both ends
+    count = max(2, int(math.ceil(table.length / distance_step)))
+    step = table.length / count
+    samples = []
+    heading = 0.0
+    for i in range(count + 1):
+        point, d1, d2 = curve.evaluate_with_derivatives(table.parameter_at(step * i))
+        heading = _unwrap(math.atan2(d1[1], d1[0]), heading) if i else math.atan2(d1[1], d1[0])
+        samples.append((point[0], point[1], heading, _curvature(d1, d2)))
+    return step, samples
+
+
+def velocity_profile(step, curvatures, constraints, start_velocity=0.0, end_velocity=0.0):
+    """
+    The fastest speed at each of a list of evenly spaced samples that obeys the constraints.
+    """
+    velocities = [constraints.velocity_limit(curvature) for curvature in curvatures]
+    velocities[0] = min(velocities[0], start_velocity)
+    velocities[-1] = min(velocities[-1], end_velocity)
+    # v^2 grows by at most 2 a ds between samples, going forwards when speeding up and backwards when slowing down
+    reach = 2 * constraints.max_acceleration * step
+    for i in range(1, len(velocities)):
+        velocities[i] = min(velocities[i], math.sqrt(velocities[i - 1] ** 2 + reach))
+    for i in range(len(velocities) - 2, -1, -1):
+        velocities[i] = min(velocities[i], math.sqrt(velocities[i + 1] ** 2 + reach))
+    return velocities
+
+
+def compile_trajectory(curve, constraints=None, time_step=0.01, distance_step=0.005, start_velocity=0.0,
+                       end_velocity=0.0):
+    """
+    Turn a curve into a trajectory sampled every time_step seconds.
+
+    Args:
+        curve (sim.splines.Curve): The path, in meters.
+        constraints (TrajectoryConstraints): Drivetrain limits, the defaults if None.
+        time_step (float): Seconds between trajectory samples. Use the robot's tick length or less.
+        distance_step (float): Meters between path samples for the velocity profile.
+        start_velocity (float): Speed at the start, for chaining onto a previous trajectory.
+        end_velocity (float): Speed at the end.
+
+    Returns:
+        Trajectory: The compiled trajectory.
+
+    Raises:
+        ValueError: If the curve has no length.
+    """
+    if constraints is None:
+        constraints = TrajectoryConstraints()
+    step, path = sample_path(curve, distance_step)
+    velocities = velocity_profile(step, [sample[3] for sample in path], constraints, start_velocity, end_velocity)
+
+    # time at each path sample, with constant acceleration between samples
+    times = [0.0]
+    for v0, v1 in zip(velocities[:-1], velocities[1:]):
+        times.append(times[-1] + 2 * step / (v0 + v1))
+
+    fields = {name: [] for name in FIELDS}
+    half_track = constraints.track_width / 2
+    count = int(math.ceil(times[-1] / time_step - 1e-9)) + 1
+    segment = 0
+    for k in range(count):
+        t = min(k * time_step, times[-1])
+        while segment < len(times) - 2 and times[segment + 1] <= t:
+            segment += 1
+        v0 = velocities[segment]
+        v1 = velocities[segment + 1]
+        acceleration = (v1 * v1 - v0 * v0) / (2 * step)
+        elapsed = t - times[segment]
+        velocity = v0 + acceleration * elapsed
+        fraction = min(1.0, (v0 * elapsed + 0.5 * acceleration * elapsed * elapsed) / step)
+
+        start = path[segment]
+        end = path[segment + 1]
+        x, y, heading, curvature = (a + (b - a) * fraction for a, b in zip(start, end))
+        fields["x"].append(x)
+        fields["y"].append(y)
+        fields["heading"].append(heading)
+        fields["velocity"].append(velocity)
+        fields["acceleration"].append(acceleration)
+        fields["curvature"].append(curvature)
+        fields["left_velocity"].append(velocity * (1 - curvature * half_track))
+        fields["right_velocity"].append(velocity * (1 + curvature * half_track))
+    return Trajectory(time_step, fields)
+
+
+def check_constraints(trajectory, constraints, tolerance=1e-3):
+    """
+    List the ways a trajectory breaks the constraints, allowing for float32 rounding.
+
+    Returns:
+        list[str]: One message per broken limit, empty if the trajectory is within them.
+    """
+    fields = trajectory.fields
+    problems = []
+    wheel = max(max(abs(v) for v in fields["left_velocity"]), max(abs(v) for v in fields["right_velocity"]))
+    if wheel > constraints.max_velocity * (1 + tolerance):
+        problems.append(f"wheel speed {wheel:.3f} m/s exceeds {constraints.max_velocity} m/s")
+    acceleration = max(abs(a) for a in fields["acceleration"])
+    if acceleration > constraints.max_acceleration * (1 + tolerance):
+        problems.append(f"acceleration {acceleration:.3f} m/s^2 exceeds {constraints.max_acceleration} m/s^2")
+    centripetal = max(v * v * abs(c) for v, c in zip(fields["velocity"], fields["curvature"]))
+    if centripetal > constraints.max_centripetal_acceleration * (1 + tolerance):
+        problems.append(
+            f"centripetal acceleration {centripetal:.3f} m/s^2 exceeds {constraints.max_centripetal_acceleration} m/s^2"
+        )
+    return problems
+
+
+def parse_point(text):
+    x, y = text.split(",")
+    return float(x), float(y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a Catmull-Rom path through waypoints into a trajectory file.")
+    parser.add_argument("name", help=f"trajectory name, written to assets/<name>{TRAJECTORY_FILE_SUFFIX}")
+    parser.add_argument("waypoints", nargs="+", type=parse_point, help="x,y in meters, at least two")
+    parser.add_argument("--max-velocity", type=float, default=TrajectoryConstraints().max_velocity)
+    parser.add_argument("--max-acceleration", type=float, default=TrajectoryConstraints().max_acceleration)
+    parser.add_argument("--max-centripetal-acceleration", type=float,
+                        default=TrajectoryConstraints().max_centripetal_acceleration)
+    parser.add_argument("--track-width", type=float, default=TrajectoryConstraints().track_width)
+    parser.add_argument("--time-step", type=float, default=0.01)
+    parser.add_argument("--start-velocity", type=float, default=0.0)
+    parser.add_argument("--end-velocity", type=float, default=0.0)
+    parser.add_argument("--output-directory", default=ASSETS_DIRECTORY)
+    args = parser.parse_args()
+    if len(args.waypoints) < 2:
+        parser.error("at least two waypoints are needed")
+
+    constraints = TrajectoryConstraints(args.max_velocity, args.max_acceleration, args.max_centripetal_acceleration,
+                                        args.track_width)
+    try:
+        trajectory = compile_trajectory(CatmullRom(args.waypoints), constraints, args.time_step,
+                                        start_velocity=args.start_velocity, end_velocity=args.end_velocity)
+    except ValueError as error:
+        parser.error(str(error))
+    for problem in check_constraints(trajectory, constraints):
+        print(f"Warning: {problem}")
+
+    path = os.path.join(args.output_directory, args.name + TRAJECTORY_FILE_SUFFIX)
+    trajectory.save_to_file(open(path, "wb"))
+    print(f"Wrote {len(trajectory)} samples ({trajectory.total_time():.2f} s) to {path}, "
+          f"{os.path.getsize(path)} bytes")
+
+
+if __name__ == "__main__":
+    main()
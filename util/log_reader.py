@@ -1,11 +1,19 @@
+import bisect
+import mmap
+import os
 import struct
 import json
+import zlib
+from array import array
+from collections import namedtuple
+
 from rich.pretty import Pretty
 from rich.console import Console
 
 console = Console()
 
 LOG_LEVELS_REV = {1: "TRACE", 2: "DEBUG", 3: "INFO", 4: "WARN", 5: "ERROR", 6: "FATAL"}
+LOG_LEVELS = {name: level for level, name in LOG_LEVELS_REV.items()}
 LOG_LEVEL_COLORS = {
     "TRACE": "dim white",
     "DEBUG": "cyan",
@@ -15,35 +23,386 @@ LOG_LEVEL_COLORS = {
     "FATAL": "bold red"
 }
 
-def read_logs(log_file):
-    with open(log_file, 'rb') as f:
-        while True:
-            # Read header: float (4 bytes), unsigned char (1 byte), unsigned int (4 bytes)
-            header = f.read(9)
-            if not header or len(header) < 9:
-                break
+# Record header written by VEXLib.Util.Logging.Logger: timestamp, level, message length
+RECORD_HEADER = struct.Struct('<fBI')
+
+# Sidecar index header: magic, version, number of bytes of the log covered by the index, and a
+# CRC32 of the start and end of those bytes so an index is not reused for a rewritten log
+INDEX_HEADER = struct.Struct('<4sHQI')
+INDEX_MAGIC = b'BLIX'
+INDEX_VERSION = 2
+# Bytes hashed at each end of the indexed part of the log
+INDEX_FINGERPRINT_BYTES = 4096
+INDEX_SUFFIX = '.idx'
+
+# Record types written by VEXLib.Util.Logging.Channel, stored in the level byte
+CHANNEL_SCHEMA_RECORD = 0x80
+CHANNEL_SAMPLE_RECORD = 0x81
+
+STRUCT_CODE_DTYPES = {
+    'b': 'i1', 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4', 'l': '<i4', 'L': '<u4',
+    'q': '<i8', 'Q': '<u8', 'f': '<f4', 'd': '<f8', '?': '?',
+}
+
+LogRecord = namedtuple("LogRecord", ["timestamp", "level", "message"])
+ChannelSchema = namedtuple("ChannelSchema", ["schema_id", "name", "fields"])
+
+
+class BinlogReader:
+    """
+    Random-access reader for the binary logs written by VEXLib.Util.Logging.Logger.
+
+    The log is memory mapped and scanned once to build an index of record offsets, timestamps,
+    levels and message lengths. The index is saved next to the log (``<log>.idx``) and reused on
+    later opens; if the log has grown since, only the new records are scanned. An index whose
+    fingerprint of the indexed bytes no longer matches the log is rebuilt from scratch.
+
+    Timestamps, levels and counts are answered from the index alone, so message bodies are only
+    decoded for the records that are actually requested.
+
+    Example:
+        with BinlogReader("logs/main-12.binlog") as reader:
+            print(len(reader), "records")
+            for record in reader.records(start_time=30.0, end_time=45.0, min_level="WARN"):
+                print(record.timestamp, record.message)
+    """
+
+    def __init__(self, log_file, index_file=None, save_index=True):
+        """
+        Open a binlog and load or build its index.
+
+        :param log_file: Path to the binary log file
+        :param index_file: Path to the sidecar index, defaults to the log path with ".idx" appended
+        :param save_index: Whether to write the index back to disk after building or extending it
+        """
+        self.log_file = log_file
+        self.index_file = index_file if index_file is not None else log_file + INDEX_SUFFIX
+
+        self.offsets = array('Q')
+        self.timestamps = array('f')
+        self.levels = array('B')
+        self.lengths = array('I')
+        self.indexed_bytes = 0
+        self.is_monotonic = True
+
+        self._file = open(log_file, 'rb')
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else b''
+
+        loaded = self._load_index()
+        if not loaded or self.indexed_bytes < self._size:
+            self._extend_index()
+            if save_index:
+                self._save_index()
+
+    # ============================================================
+    # Index management
+    # ============================================================
 
-            timestamp, log_level, msg_len = struct.unpack('<fBI', header)
-            msg_bytes = f.read(msg_len)
-            if len(msg_bytes) < msg_len:
+    def _load_index(self):
+        try:
+            with open(self.index_file, 'rb') as f:
+                header = f.read(INDEX_HEADER.size)
+                if len(header) < INDEX_HEADER.size:
+                    return False
+                magic, version, indexed_bytes, fingerprint = INDEX_HEADER.unpack(header)
+                if magic != INDEX_MAGIC or version != INDEX_VERSION or indexed_bytes > self._size:
+                    return False
+                if fingerprint != self._fingerprint(indexed_bytes):
+                    # The log was rewritten since the index was saved
+                    return False
+
+                count = struct.unpack('<I', f.read(4))[0]
+                offsets, timestamps, levels, lengths = array('Q'), array('f'), array('B'), array('I')
+                for column in (offsets, timestamps, levels, lengths):
+                    column.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return False
+
+        self.offsets, self.timestamps, self.levels, self.lengths = offsets, timestamps, levels, lengths
+        self.indexed_bytes = indexed_bytes
+        self.is_monotonic = all(
+            self.timestamps[i] <= self.timestamps[i + 1] for i in range(len(self.timestamps) - 1)
+        )
+        return True
+
+    def _fingerprint(self, indexed_bytes):
+        """
+        CRC32 of the first and last INDEX_FINGERPRINT_BYTES of the indexed part of the log.
+        """
+        head = self._map[:min(indexed_bytes, INDEX_FINGERPRINT_BYTES)]
+        tail = self._map[max(0, indexed_bytes - INDEX_FINGERPRINT_BYTES):indexed_bytes]
+        return zlib.crc32(tail, zlib.crc32(head))
+
+    def _extend_index(self):
+        data = self._map
+        offset = self.indexed_bytes
+        header_size = RECORD_HEADER.size
+        unpack_from = RECORD_HEADER.unpack_from
+        last_timestamp = self.timestamps[-1] if self.timestamps else float('-inf')
+
+        while offset + header_size <= self._size:
+            timestamp, level, length = unpack_from(data, offset)
+            if offset + header_size + length > self._size:
+                # Partial record at the end of a log that is still being written
                 break
+            self.offsets.append(offset)
+            self.timestamps.append(timestamp)
+            self.levels.append(level)
+            self.lengths.append(length)
+            if timestamp < last_timestamp:
+                self.is_monotonic = False
+            last_timestamp = timestamp
+            offset += header_size + length
+
+        self.indexed_bytes = offset
+
+    def _save_index(self):
+        try:
+            with open(self.index_file, 'wb') as f:
+                f.write(INDEX_HEADER.pack(
+                    INDEX_MAGIC, INDEX_VERSION, self.indexed_bytes, self._fingerprint(self.indexed_bytes)
+                ))
+                f.write(struct.pack('<I', len(self.offsets)))
+                for column in (self.offsets, self.timestamps, self.levels, self.lengths):
+                    column.tofile(f)
+        except OSError:
+            pass
+
+    # ============================================================
+    # Access
+    # ============================================================
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._record(i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("record index out of range")
+        return self._record(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._record(i)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def _record(self, i):
+        return LogRecord(self.timestamps[i], self.levels[i], self.message(i))
+
+    def message_bytes(self, i):
+        """
+        Get the raw message body of a record without decoding it.
+
+        :param i: Record index
+        :return: The message bytes
+        """
+        start = self.offsets[i] + RECORD_HEADER.size
+        return bytes(self._map[start:start + self.lengths[i]])
 
+    def message(self, i):
+        """
+        Get the decoded message of a record.
+
+        :param i: Record index
+        :return: The message as a string
+        """
+        return self.message_bytes(i).decode('utf-8', errors='replace')
+
+    def index_at_time(self, timestamp):
+        """
+        Find the index of the first record logged at or after a timestamp in O(log n).
+
+        :param timestamp: Time in seconds, in the same clock the robot logged with
+        :return: Record index, len(self) if every record is earlier
+        """
+        if self.is_monotonic:
+            return bisect.bisect_left(self.timestamps, timestamp)
+        for i, record_timestamp in enumerate(self.timestamps):
+            if record_timestamp >= timestamp:
+                return i
+        return len(self)
+
+    def indices(self, start_time=None, end_time=None, min_level=None, levels=None):
+        """
+        Get the indices of the records matching a time range and level filter.
+
+        Only the index is consulted, no message bodies are read.
+
+        :param start_time: Inclusive start time in seconds, None for the start of the log
+        :param end_time: Exclusive end time in seconds, None for the end of the log
+        :param min_level: Lowest level to include, as a level name or number
+        :param levels: Collection of level names or numbers to include
+        :return: Iterator of record indices
+        """
+        if self.is_monotonic:
+            start = 0 if start_time is None else self.index_at_time(start_time)
+            stop = len(self) if end_time is None else self.index_at_time(end_time)
+            candidates = range(start, stop)
+        else:
+            candidates = (
+                i for i in range(len(self))
+                if (start_time is None or self.timestamps[i] >= start_time)
+                and (end_time is None or self.timestamps[i] < end_time)
+            )
+
+        min_level = _level_number(min_level) if min_level is not None else None
+        levels = {_level_number(level) for level in levels} if levels is not None else None
+        if min_level is None and levels is None:
+            return iter(candidates)
+
+        return (
+            i for i in candidates
+            if (min_level is None or min_level <= self.levels[i] < CHANNEL_SCHEMA_RECORD)
+            and (levels is None or self.levels[i] in levels)
+        )
+
+    def records(self, start_time=None, end_time=None, min_level=None, levels=None):
+        """
+        Lazily iterate over the records matching a time range and level filter.
+
+        :param start_time: Inclusive start time in seconds, None for the start of the log
+        :param end_time: Exclusive end time in seconds, None for the end of the log
+        :param min_level: Lowest level to include, as a level name or number
+        :param levels: Collection of level names or numbers to include
+        :return: Iterator of LogRecord
+        """
+        for i in self.indices(start_time, end_time, min_level, levels):
+            yield self._record(i)
+
+    def count(self, start_time=None, end_time=None, min_level=None, levels=None):
+        """
+        Count the records matching a time range and level filter without decoding any messages.
+
+        :return: Number of matching records
+        """
+        if min_level is None and levels is None and self.is_monotonic:
+            start = 0 if start_time is None else self.index_at_time(start_time)
+            stop = len(self) if end_time is None else self.index_at_time(end_time)
+            return max(0, stop - start)
+        return sum(1 for _ in self.indices(start_time, end_time, min_level, levels))
+
+    def to_numpy(self, start_time=None, end_time=None, min_level=None, levels=None, include_messages=True):
+        """
+        Export matching records to a NumPy structured array.
+
+        The array has the fields ``offset``, ``timestamp``, ``level`` and ``length``, plus an object
+        field ``message`` holding the decoded strings when include_messages is True.
+
+        :return: numpy.ndarray with one element per matching record
+        """
+        import numpy as np
+
+        fields = [('offset', '<u8'), ('timestamp', '<f4'), ('level', 'u1'), ('length', '<u4')]
+        if include_messages:
+            fields.append(('message', 'O'))
+
+        selected = np.fromiter(self.indices(start_time, end_time, min_level, levels), dtype=np.int64)
+        result = np.empty(len(selected), dtype=fields)
+        result['offset'] = np.frombuffer(self.offsets, dtype='<u8')[selected] if len(self) else []
+        result['timestamp'] = np.frombuffer(self.timestamps, dtype='<f4')[selected] if len(self) else []
+        result['level'] = np.frombuffer(self.levels, dtype='u1')[selected] if len(self) else []
+        result['length'] = np.frombuffer(self.lengths, dtype='<u4')[selected] if len(self) else []
+        if include_messages:
+            result['message'] = [self.message(int(i)) for i in selected]
+        return result
+
+    # ============================================================
+    # Telemetry channels
+    # ============================================================
+
+    def channels(self):
+        """
+        Get the telemetry channels registered in this log.
+
+        :return: Dict mapping channel name to ChannelSchema
+        """
+        schemas = {}
+        for i in self.indices(levels=[CHANNEL_SCHEMA_RECORD]):
+            body = self.message_bytes(i)
+            name, field_text = body[1:].decode('utf-8').split('|', 1)
+            fields = [tuple(field.split(':')) for field in field_text.split(',')] if field_text else []
+            schemas[name] = ChannelSchema(body[0], name, fields)
+        return schemas
+
+    def channel_to_numpy(self, name, start_time=None, end_time=None):
+        """
+        Decode every sample of a telemetry channel into a NumPy structured array.
+
+        The array has a ``timestamp`` field followed by one field per channel field.
+
+        :param name: Name of the channel
+        :param start_time: Inclusive start time in seconds, None for the start of the log
+        :param end_time: Exclusive end time in seconds, None for the end of the log
+        :return: numpy.ndarray with one element per sample
+        """
+        import numpy as np
+
+        schema = self.channels()[name]
+        value_dtype = np.dtype([(field, STRUCT_CODE_DTYPES[code]) for field, code in schema.fields])
+        payload_length = 1 + value_dtype.itemsize
+
+        selected = [
+            i for i in self.indices(start_time, end_time, levels=[CHANNEL_SAMPLE_RECORD])
+            if self.lengths[i] == payload_length
+            and self._map[self.offsets[i] + RECORD_HEADER.size] == schema.schema_id
+        ]
+
+        payload = b''.join(
+            self._map[self.offsets[i] + RECORD_HEADER.size + 1:self.offsets[i] + RECORD_HEADER.size + payload_length]
+            for i in selected
+        )
+        values = np.frombuffer(payload, dtype=value_dtype)
+
+        result = np.empty(len(selected), dtype=[('timestamp', '<f4')] + value_dtype.descr)
+        result['timestamp'] = np.frombuffer(self.timestamps, dtype='<f4')[selected] if selected else []
+        for field in value_dtype.names:
+            result[field] = values[field]
+        return result
+
+
+def _level_number(level):
+    if isinstance(level, str):
+        return LOG_LEVELS[level.upper()]
+    return int(level)
+
+
+def format_timestamp(timestamp):
+    # Convert float timestamp to minutes:seconds.ms
+    total_seconds = int(timestamp)
+    minutes = total_seconds // 60
+    seconds = total_seconds % 60
+    milliseconds = int((timestamp % 1) * 1000)
+    return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
+def read_logs(log_file, start_time=None, end_time=None, min_level=None):
+    min_level = _level_number(min_level) if min_level is not None else 0
+    text_levels = [level for level in LOG_LEVELS_REV if level >= min_level]
+    with BinlogReader(log_file) as reader:
+        for record in reader.records(start_time=start_time, end_time=end_time, levels=text_levels):
             try:
-                msg = msg_bytes.decode('utf-8')
                 try:
-                    msg_obj = json.loads(msg)
+                    msg_obj = json.loads(record.message)
                 except json.JSONDecodeError:
-                    msg_obj = msg
+                    msg_obj = record.message
 
-                level_name = LOG_LEVELS_REV.get(log_level, log_level)
+                level_name = LOG_LEVELS_REV.get(record.level, record.level)
                 color = LOG_LEVEL_COLORS.get(level_name, "white")
-
-                # Convert float timestamp to minutes:seconds.ms
-                total_seconds = int(timestamp)
-                minutes = total_seconds // 60
-                seconds = total_seconds % 60
-                milliseconds = int((timestamp % 1) * 1000)
-                ts_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+                ts_str = format_timestamp(record.timestamp)
 
                 if isinstance(msg_obj, dict):
                     console.print(f"[bold white]{ts_str}[/bold white] [{color}][{level_name}][/{color}]")
@@ -58,5 +417,8 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Read and pretty-print binary log files.")
     parser.add_argument("logfile", help="Path to the binary log file")
+    parser.add_argument("--start", type=float, default=None, help="Only show records logged at or after this time (seconds)")
+    parser.add_argument("--end", type=float, default=None, help="Only show records logged before this time (seconds)")
+    parser.add_argument("--level", default=None, choices=list(LOG_LEVELS), help="Only show records at or above this level")
     args = parser.parse_args()
-    read_logs(args.logfile)
\ No newline at end of file
+    read_logs(args.logfile, start_time=args.start, end_time=args.end, min_level=args.level)